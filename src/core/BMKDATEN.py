@@ -2,12 +2,13 @@ import json
 import logging
 import os
 import time
-from datetime import datetime
 from typing import Dict, Optional
 
-import pytz
 import requests
+from core.bmk_channels import BMK_CHANNELS, BmkSample, parse_sample
+from core.collectors import Collector
 from core.datastore import get_shared_datastore
+from core.time_utils import epoch_to_db_timestamp, sample_tick
 from core.utils import safe_float
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,8 @@ try:
 except Exception as e:
     logger.warning(f"Konnte BMK-Config nicht laden: {e}")
 
-BMK_URL = _bmk_config.get("url", "http://192.168.1.201/daqdata.cgi")
+# BMK_URL-Umgebungsvariable erlaubt z.B. den lokalen Geräte-Simulator (tools/device_simulator.py)
+BMK_URL = os.getenv("BMK_URL") or _bmk_config.get("url", "http://192.168.1.201/daqdata.cgi")
 BMK_TIMEOUT = _bmk_config.get("timeout_s", 5)
 
 
@@ -44,90 +46,14 @@ def _resilient_get(url, timeout):
 _last_bmk_timeout_log = 0
 _bmk_timeout_log_interval = 600  # Sekunden (10 Minuten)
 
-PP_INDEX_MAPPING = {
-    0: "Betriebsmodus",
-    1: "Kesseltemperatur",
-    2: "Außentemperatur",
-    3: "Wert_3",
-    4: "Puffer_Oben",
-    5: "Pufferspeicher_Mitte",
-    6: "Puffer_Unten",
-    7: "Wert_7",
-    8: "Kesselrücklauf",
-    9: "Rauchgastemperatur",
-    10: "Wert_10",
-    11: "Rauchgasauslastung",
-    12: "Warmwassertemperatur",
-    13: "Wert_13",
-    14: "Hysterese_14",
-    15: "Differenzial_15",
-    16: "Hysterese_16",
-    17: "Differenzial_17",
-    18: "Heizkreispumpe_EG",
-    19: "Solltemperatur_EG",
-    20: "Vorlauftemp_EG",
-    21: "Raumtemp_EG",
-    22: "Heizkreispumpe_OG",
-    23: "Solltemperatur_OG",
-    24: "Vorlauftemp_OG",
-    25: "Heizkreispumpe_DG",
-    26: "Heizkreispumpe_Boiler",
-    27: "Hysterese_EG",
-    28: "Hysterese_OG",
-    29: "Hysterese_DG",
-    30: "Reserve_Pumpe_Status",
-    31: "Hysterese_31",
-    32: "Ruecklauftemp_Heizkreis",
-    33: "Kesselpumpe_Status",
-    34: "Mischer_EG_Elektronisch",
-    35: "Hysterese_35",
-    36: "Hysterese_36",
-    37: "Grenzwert_37",
-    38: "Mischer_OG_Elektronisch",
-    39: "Hysterese_39",
-    40: "Temperatur_Sensor_40",
-    41: "Relais_41",
-    42: "Modus_Status",
-    43: "Brenner_Status",
-    44: "Brenner_Status_2",
-    45: "Wert_45",
-    46: "Relais_10_Status",
-    47: "Relais_11_Status",
-    48: "Relais_12_Status",
-    49: "Relais_13_Status",
-    50: "Relais_14_Status",
-    51: "Relais_15_Status",
-    52: "Tick_Counter",
-    53: "Betriebsstunden",
-    54: "Wert_54",
-    55: "Wert_55",
-    56: "Wert_56",
-    57: "Wert_57",
-    58: "Wert_58",
-    59: "Wert_59",
-    60: "Wert_60",
-    61: "Wert_61",
-    62: "Wert_62",
-    63: "Wert_63",
-    64: "Wert_64",
-    65: "Wert_65",
-    66: "Wert_66",
-    67: "Wert_67",
-    68: "Wert_68",
-    69: "Wert_69",
-    70: "Relais_16_Status",
-    71: "Relais_17_Status",
-    72: "Relais_18_Status",
-}
+PP_INDEX_MAPPING = dict(enumerate(BMK_CHANNELS))
 
 
-def abrufen_und_speichern() -> Optional[Dict[str, float]]:
-    """Ruft Daten von der Heizungs-API ab und legt sie in der CSV ab."""
-    url = BMK_URL
-
+def fetch_raw(url: str | None = None) -> Optional[str]:
+    """Holt den Rohtext der daqdata.cgi-Antwort (None bei HTTP-Fehler)."""
     global _last_bmk_timeout_log
     try:
-        response = _resilient_get(url, timeout=BMK_TIMEOUT)
+        response = _resilient_get(url or BMK_URL, timeout=BMK_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as exc:
         # Nur alle 10 Minuten loggen, wenn Timeout
@@ -139,69 +65,57 @@ def abrufen_und_speichern() -> Optional[Dict[str, float]]:
         else:
             logger.error(f"Fehler bei BMK HTTP-Request: {exc}")
         return None
+    return response.text
 
-    try:
-        values = [line.strip() for line in response.text.splitlines() if line.strip()]
-        # Lokale Zeit (Europe/Vienna) als ISO-8601-String mit expliziter Zeitzone
-        vienna = pytz.timezone("Europe/Vienna")
-        now_local = datetime.now(vienna)
-        zeitstempel = now_local.isoformat()
-        # logger.debug(f"BMK Response hat {len(values)} Werte")
-
-        daten_heizung = _extrahiere_alle_daten(values, zeitstempel)
-
-        def _get_field(name: str, *alts: str):
-            if not daten_heizung:
-                return ""
-            if name in daten_heizung:
-                return daten_heizung.get(name)
-            for alt in alts:
-                if alt in daten_heizung:
-                    return daten_heizung.get(alt)
-            return ""
-
-        daten_kurz = {
-            "Zeitstempel": zeitstempel,
-            "Kesseltemperatur": _get_field("Kesseltemperatur"),
-            "Außentemperatur": _get_field("Außentemperatur"),
-            "Pufferspeicher Oben": _get_field("Puffer_Oben", "Pufferspeicher Oben"),
-            "Pufferspeicher Mitte": _get_field("Pufferspeicher_Mitte", "Pufferspeicher Mitte"),
-            "Pufferspeicher Unten": _get_field("Puffer_Unten", "Pufferspeicher Unten"),
-            "Warmwasser": _get_field("Warmwassertemperatur", "Warmwasser"),
-        }
 
-        if daten_heizung:
-            daten_heizung.update(daten_kurz)
-            result = daten_heizung
-        else:
-            result = daten_kurz
-
-        _persist_to_datastore(result)
-
-        return result
-    except Exception as exc:
-        logger.error(f"Fehler bei BMK Verarbeitung: {exc}")
+def parse(text: Optional[str], zeitstempel: Optional[str] = None) -> Optional[BmkSample]:
+    """Parst eine Antwort; ohne ``zeitstempel`` mit dem aktuellen Tick der Abtastuhr (UTC)."""
+    if not text:
         return None
+    sample = parse_sample(text, zeitstempel or epoch_to_db_timestamp(sample_tick(10)))
+    if sample is None:
+        logger.warning("BMK-Antwort ohne Werte")
+    return sample
 
 
-def _extrahiere_alle_daten(values, zeitstempel):
-    """Erstellt ein Dict mit allen bekannten PP-Indizes."""
-    if not values:
+def abrufen_und_speichern() -> Optional[Dict[str, float]]:
+    """Ruft Daten von der Heizungs-API ab und legt sie in der Datenbank ab."""
+    text = fetch_raw()
+    if text is None:
         return None
 
     try:
-        daten = {"Zeitstempel": zeitstempel}
-        for idx in range(min(len(values), len(PP_INDEX_MAPPING))):
-            spalten_name = PP_INDEX_MAPPING.get(idx, f"Wert_{idx}")
-            wert = values[idx].strip() if idx < len(values) else ""
-            float_wert = safe_float(wert)
-            daten[spalten_name] = float_wert if float_wert is not None else wert
-        return daten
+        sample = parse(text)
+        if sample is None:
+            return None
+
+        _persist_to_datastore(sample)
+
+        return sample.to_dict()
     except Exception as exc:
-        logger.error(f"Fehler beim Extrahieren: {exc}")
+        logger.error(f"Fehler bei BMK Verarbeitung: {exc}")
         return None
 
 
+class BmkCollector(Collector):
+    """BMK-Heizung (Tabellen 'heating' + 'heating_channels')."""
+
+    name = "heating"
+    interval_s = 10.0
+
+    def fetch(self):
+        return fetch_raw()
+
+    def parse(self, raw):
+        return parse(raw, self.sample_timestamp())
+
+    def persist(self, store, record: BmkSample) -> None:
+        store.insert_heating_sample(record)
+
+    def payload(self, record: BmkSample) -> dict:
+        return record.to_dict()
+
+
 def _extrahiere_pufferdaten(values, zeitstempel):
     """Berechnet optionale Kenngrößen des Pufferspeichers."""
     if len(values) < 7:
@@ -243,14 +157,12 @@ def _bestimme_puffer_status(oben, mitte, unten):
     return "KALT"
 
 
-def _persist_to_datastore(payload: Dict[str, float]) -> None:
+def _persist_to_datastore(sample: BmkSample) -> None:
     try:
         store = get_shared_datastore()
-        logger.info("[DB] Speichere Heizungsdaten: ts=%s kessel=%s puffer_top=%s", 
-                    payload.get('Zeitstempel'), 
-                    payload.get('Kesseltemperatur'),
-                    payload.get('Pufferspeicher Oben') or payload.get('Puffer_Oben'))
-        store.insert_heating_record(payload)
+        logger.info("[DB] Speichere Heizungsdaten: ts=%s kessel=%s puffer_top=%s",
+                    sample.timestamp, sample.kessel, sample.puffer_oben)
+        store.insert_heating_sample(sample)
         logger.info("[DB] Heizungseintrag erfolgreich")
     except Exception as exc:
         logger.error(f"[DB] Heizungseintrag fehlgeschlagen: {exc}")
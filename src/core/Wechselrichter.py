@@ -1,13 +1,23 @@
 import requests
 import logging
-from datetime import datetime
+import math
+import os
 import time
 
+from core.collectors import PENDING, Collector
 from core.datastore import get_shared_datastore
+from core.time_utils import epoch_to_db_timestamp, sample_tick
+
+# FRONIUS_URL-Umgebungsvariable erlaubt z.B. den lokalen Geräte-Simulator (tools/device_simulator.py)
+FRONIUS_URL = os.getenv("FRONIUS_URL") or "http://192.168.1.202/solar_api/v1/GetPowerFlowRealtimeData.fcgi"
 
 # Reuse TCP connections across requests
 _session = requests.Session()
 
+# Throttle for timeout and warning logs
+_last_timeout_log = 0.0
+_last_warning_log = 0.0
+
 
 def _resilient_get(url, timeout):
     """GET with automatic session recovery on connection errors."""
@@ -19,56 +29,172 @@ def _resilient_get(url, timeout):
         return _session.get(url, timeout=timeout)
 
 
-def abrufen_und_speichern():
-    url = "http://192.168.1.202/solar_api/v1/GetPowerFlowRealtimeData.fcgi"
-    # Throttle for timeout and warning logs
-    if not hasattr(abrufen_und_speichern, "_last_timeout_log"):
-        abrufen_und_speichern._last_timeout_log = 0
-    if not hasattr(abrufen_und_speichern, "_last_warning_log"):
-        abrufen_und_speichern._last_warning_log = 0
+def fetch_raw(url: str | None = None):
+    """Hole die PowerFlow-JSON-Antwort (None bei Fehler / Status != 200)."""
+    global _last_timeout_log, _last_warning_log
     try:
-        response = _resilient_get(url, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            zeitstempel = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            pv_leistung = data["Body"]["Data"]["Site"]["P_PV"] / 1000
-            netz_leistung = data["Body"]["Data"]["Site"]["P_Grid"] / 1000
-            batterie_leistung = data["Body"]["Data"]["Site"]["P_Akku"] / 1000
-            hausverbrauch = data["Body"]["Data"]["Site"]["P_Load"] / 1000
-            batterieladestand = data["Body"]["Data"]["Inverters"]["1"]["SOC"]
-
-            daten = {
-                "Zeitstempel": zeitstempel,
-                "PV-Leistung (kW)": pv_leistung,
-                "Netz-Leistung (kW)": netz_leistung,
-                "Batterie-Leistung (kW)": batterie_leistung,
-                "Hausverbrauch (kW)": hausverbrauch,
-                "Batterieladestand (%)": batterieladestand
-            }
-            try:
-                store = get_shared_datastore()
-                store.insert_fronius_record(daten)
-            except Exception:
-                logging.exception("Fehler beim Speichern der Fronius-Daten")
-            return daten
-        return None
+        response = _resilient_get(url or FRONIUS_URL, timeout=5)
+        if response.status_code != 200:
+            return None
+        return response.json()
     except requests.exceptions.Timeout:
         now = time.time()
         # Only log timeout once every 60 seconds
-        if now - abrufen_und_speichern._last_timeout_log > 60:
+        if now - _last_timeout_log > 60:
             logging.warning("Wechselrichter Timeout beim Abruf (requests.get)")
-            abrufen_und_speichern._last_timeout_log = now
+            _last_timeout_log = now
         return None
     except requests.exceptions.RequestException as e:
         now = time.time()
         # Only log other request warnings once every 60 seconds
-        if now - abrufen_und_speichern._last_warning_log > 60:
+        if now - _last_warning_log > 60:
             logging.warning(f"Wechselrichter RequestException: {e}")
-            abrufen_und_speichern._last_warning_log = now
+            _last_warning_log = now
+        return None
+
+
+def parse(data, zeitstempel: str | None = None):
+    """Wandle die PowerFlow-JSON in den Fronius-Datensatz (kW / %).
+
+    Ohne ``zeitstempel`` wird der aktuelle 10-s-Tick der Abtastuhr (UTC) verwendet.
+    """
+    if not data:
         return None
+    site = data["Body"]["Data"]["Site"]
+    # Die Solar API liefert null statt 0 (z.B. P_PV nachts)
+    return {
+        "Zeitstempel": zeitstempel or epoch_to_db_timestamp(sample_tick(10)),
+        "PV-Leistung (kW)": (site["P_PV"] or 0.0) / 1000,
+        "Netz-Leistung (kW)": (site["P_Grid"] or 0.0) / 1000,
+        "Batterie-Leistung (kW)": (site["P_Akku"] or 0.0) / 1000,
+        "Hausverbrauch (kW)": (site["P_Load"] or 0.0) / 1000,
+        "Batterieladestand (%)": data["Body"]["Data"]["Inverters"]["1"]["SOC"],
+    }
+
+
+def abrufen_und_speichern():
+    try:
+        daten = parse(fetch_raw())
+        if daten is None:
+            return None
+        try:
+            store = get_shared_datastore()
+            store.insert_fronius_record(daten)
+        except Exception:
+            logging.exception("Fehler beim Speichern der Fronius-Daten")
+        return daten
     except Exception:
         logging.exception("Unerwarteter Fehler in abrufen_und_speichern")
         return None
+
+
+# Hochfrequenz-Modus: z.B. FRONIUS_SAMPLE_INTERVAL_S=1 liest jede Sekunde und
+# schreibt nur Aggregate (avg/min/max) je FRONIUS_BUCKET_S Sekunden.
+FRONIUS_SAMPLE_INTERVAL_S = float(os.getenv("FRONIUS_SAMPLE_INTERVAL_S", "10") or 10)
+FRONIUS_BUCKET_S = float(os.getenv("FRONIUS_BUCKET_S", "10") or 10)
+
+# Record-Schlüssel -> Präfix der min/max-Schlüssel (siehe DataStore.insert_fronius_record)
+_AGG_FIELDS = (
+    ("PV-Leistung (kW)", "pv"),
+    ("Netz-Leistung (kW)", "grid"),
+    ("Batterie-Leistung (kW)", "batt"),
+    ("Hausverbrauch (kW)", "load"),
+    ("Batterieladestand (%)", "soc"),
+)
+
+
+class FroniusAggregator:
+    """Sammelt Einzelmessungen und liefert pro Zeit-Bucket avg/min/max.
+
+    Buckets sind an der Wanduhr ausgerichtet (z.B. :00, :10, :20 s). Ein
+    Bucket wird abgeschlossen, sobald die erste Messung des nächsten eintrifft.
+    Fehlende Werte (None/NaN) zählen je Feld nicht mit – ein ausgefallener
+    SOC zieht weder Minimum noch Mittel auf 0.
+    """
+
+    def __init__(self, bucket_s: float = 10.0):
+        self.bucket_s = max(1.0, float(bucket_s))
+        self._bucket: int | None = None
+        self._count = 0
+        self._n = [0] * len(_AGG_FIELDS)
+        self._sum = [0.0] * len(_AGG_FIELDS)
+        self._min = [0.0] * len(_AGG_FIELDS)
+        self._max = [0.0] * len(_AGG_FIELDS)
+
+    def add(self, record: dict, epoch: float | None = None):
+        """Messung hinzufügen; gibt den abgeschlossenen Vorgänger-Bucket zurück (sonst None)."""
+        bucket = int((time.time() if epoch is None else epoch) // self.bucket_s)
+        done = None
+        if self._bucket is not None and bucket != self._bucket:
+            done = self.flush()
+        if self._count == 0:
+            self._bucket = bucket
+        for i, (key, _) in enumerate(_AGG_FIELDS):
+            try:
+                val = float(record.get(key))
+            except (TypeError, ValueError):
+                continue
+            if not math.isfinite(val):
+                continue
+            if self._n[i] == 0:
+                self._sum[i] = self._min[i] = self._max[i] = val
+            else:
+                self._sum[i] += val
+                if val < self._min[i]:
+                    self._min[i] = val
+                if val > self._max[i]:
+                    self._max[i] = val
+            self._n[i] += 1
+        self._count += 1
+        return done
+
+    def flush(self):
+        """Aktuellen Bucket abschließen (None wenn leer)."""
+        if self._count == 0 or self._bucket is None:
+            return None
+        out = {"Zeitstempel": epoch_to_db_timestamp(self._bucket * self.bucket_s), "samples": self._count}
+        for i, (key, prefix) in enumerate(_AGG_FIELDS):
+            n = self._n[i]
+            out[key] = self._sum[i] / n if n else None
+            out[f"{prefix}_min"] = self._min[i] if n else None
+            out[f"{prefix}_max"] = self._max[i] if n else None
+        self._count = 0
+        self._n = [0] * len(_AGG_FIELDS)
+        self._bucket = None
+        return out
+
+
+class FroniusCollector(Collector):
+    """Fronius PowerFlow-Realtime-Daten (Tabelle 'fronius').
+
+    Mit ``sample_interval_s`` < ``bucket_s`` wird hochfrequent gelesen und im
+    Speicher aggregiert; geschrieben wird nur eine Zeile pro Bucket.
+    """
+
+    name = "pv"
+
+    def __init__(self, sample_interval_s: float = FRONIUS_SAMPLE_INTERVAL_S, bucket_s: float = FRONIUS_BUCKET_S):
+        self.interval_s = max(0.5, float(sample_interval_s))
+        self._aggregator = FroniusAggregator(bucket_s) if self.interval_s < bucket_s else None
+
+    def fetch(self):
+        return fetch_raw()
+
+    def parse(self, raw):
+        record = parse(raw, self.sample_timestamp())
+        if record is None or self._aggregator is None:
+            return record
+        done = self._aggregator.add(record, self.sample_epoch())
+        return done if done is not None else PENDING
+
+    def persist(self, store, record) -> None:
+        store.insert_fronius_record(record)
+
+    def on_stop(self):
+        # Angefangenen Bucket nicht verlieren
+        return self._aggregator.flush() if self._aggregator is not None else None
+
+
 def run():
     while True:
         abrufen_und_speichern()
@@ -76,4 +202,4 @@ def run():
 
 # Nur ausführen, wenn die Datei direkt gestartet wird
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -0,0 +1,171 @@
+"""As-of Zeit-Join für unregelmäßige Messreihen (PV, Heizung, Collector).
+
+Reihen sind Paare ``(t, v)`` aus NumPy-Arrays: ``t`` UTC-Epoch-Sekunden
+(aufsteigend), ``v`` Messwerte. ``align_series`` holt für jeden Zeitpunkt
+der linken Reihe den passenden Wert der rechten Reihe (merge-as-of),
+``resample`` bzw. ``align_to_grid`` legen mehrere Reihen auf ein gemeinsames
+Raster. Fehlende Treffer (außerhalb der Toleranz) werden NaN.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .time_utils import normalize_db_timestamp
+
+Series = Tuple[np.ndarray, np.ndarray]
+
+_DIRECTIONS = ("nearest", "backward", "forward")
+
+
+def timestamps_to_epoch(timestamps: Sequence[str]) -> np.ndarray:
+    """DataStore-Zeitstempel (UTC) vektorisiert in Epoch-Sekunden (float64) wandeln."""
+    if len(timestamps) == 0:
+        return np.empty(0, dtype=np.float64)
+    values = list(timestamps)
+    # Schneller Pfad: kanonisches Format 'YYYY-MM-DD HH:MM:SS'; sonst einzeln normalisieren
+    if not all(isinstance(s, str) and len(s) == 19 for s in values):
+        values = [normalize_db_timestamp(s) or "NaT" for s in values]
+    epochs = np.array(values, dtype="datetime64[s]")
+    out = epochs.astype(np.int64).astype(np.float64)
+    out[np.isnat(epochs)] = np.nan
+    return out
+
+
+def series_from_rows(rows: Iterable[dict], key: str, ts_key: str = "timestamp") -> Series:
+    """Reihe ``(t, v)`` aus DataStore-Zeilen bauen (ohne Zeitstempel/Wert verworfen, sortiert)."""
+    ts: list = []
+    vals: list = []
+    for row in rows:
+        stamp = row.get(ts_key)
+        val = row.get(key)
+        if stamp and val is not None:
+            ts.append(stamp)
+            vals.append(val)
+    t = timestamps_to_epoch(ts)
+    v = np.asarray(vals, dtype=np.float64)
+    keep = ~np.isnan(t)
+    t, v = t[keep], v[keep]
+    if t.size > 1 and np.any(np.diff(t) < 0):
+        order = np.argsort(t, kind="stable")
+        t, v = t[order], v[order]
+    return t, v
+
+
+def _asof_index(right_t: np.ndarray, at: np.ndarray, direction: str) -> np.ndarray:
+    """Index des As-of-Partners in ``right_t`` je Zeitpunkt in ``at`` (-1 = keiner)."""
+    n = right_t.size
+    if direction == "backward":
+        return np.searchsorted(right_t, at, side="right") - 1
+    if direction == "forward":
+        idx = np.searchsorted(right_t, at, side="left")
+        idx[idx >= n] = -1
+        return idx
+    # nearest: Vorgänger vs. Nachfolger vergleichen
+    after = np.searchsorted(right_t, at, side="left")
+    before = after - 1
+    after_c = np.clip(after, 0, n - 1)
+    before_c = np.clip(before, 0, n - 1)
+    d_before = np.where(before >= 0, at - right_t[before_c], np.inf)
+    d_after = np.where(after < n, right_t[after_c] - at, np.inf)
+    return np.where(d_after < d_before, after_c, np.where(before >= 0, before_c, -1))
+
+
+def asof(right: Series, at: np.ndarray, tolerance: Optional[float] = None, direction: str = "nearest") -> np.ndarray:
+    """Werte von ``right`` an den Zeitpunkten ``at`` (As-of-Lookup, NaN ohne Treffer)."""
+    if direction not in _DIRECTIONS:
+        raise ValueError(f"direction muss eine von {_DIRECTIONS} sein: {direction!r}")
+    right_t, right_v = (np.asarray(a, dtype=np.float64) for a in right)
+    at = np.asarray(at, dtype=np.float64)
+    out = np.full(at.shape, np.nan)
+    if right_t.size == 0 or at.size == 0:
+        return out
+    idx = _asof_index(right_t, at, direction)
+    hit = idx >= 0
+    if tolerance is not None:
+        hit &= np.abs(right_t[np.clip(idx, 0, None)] - at) <= tolerance
+    out[hit] = right_v[idx[hit]]
+    return out
+
+
+def align_series(
+    left: Series,
+    right: Series,
+    tolerance: Optional[float] = None,
+    direction: str = "nearest",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge-as-of: rechte Reihe auf die Zeitpunkte der linken Reihe legen.
+
+    Args:
+        left: Referenzreihe ``(t, v)``; ihre Zeitpunkte bilden das Ergebnis.
+        right: Reihe, deren Werte zugeordnet werden.
+        tolerance: Maximaler Zeitabstand in Sekunden (None = unbegrenzt).
+        direction: ``nearest``, ``backward`` (letzter Wert <= t) oder ``forward``.
+
+    Returns:
+        ``(t, left_v, right_v)`` gleicher Länge; ``right_v`` ist NaN ohne Treffer.
+    """
+    left_t = np.asarray(left[0], dtype=np.float64)
+    left_v = np.asarray(left[1], dtype=np.float64)
+    return left_t, left_v, asof(right, left_t, tolerance, direction)
+
+
+def resample(
+    series: Series,
+    grid: np.ndarray,
+    tolerance: Optional[float] = None,
+    how: str = "backward",
+) -> np.ndarray:
+    """Reihe auf ein Raster legen.
+
+    ``how="mean"`` mittelt alle Werte im Intervall ``[g, g + step)``; sonst
+    As-of-Lookup mit der Richtung ``how`` (``backward`` = letzter bekannter Wert).
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    if how != "mean":
+        return asof(series, grid, tolerance, how)
+    t, v = (np.asarray(a, dtype=np.float64) for a in series)
+    out = np.full(grid.shape, np.nan)
+    if grid.size == 0 or t.size == 0:
+        return out
+    step = grid[1] - grid[0] if grid.size > 1 else np.inf
+    bins = np.searchsorted(grid, t, side="right") - 1
+    valid = (bins >= 0) & (t < grid[bins.clip(0)] + step) & ~np.isnan(v)
+    sums = np.bincount(bins[valid], weights=v[valid], minlength=grid.size)
+    counts = np.bincount(bins[valid], minlength=grid.size)
+    filled = counts > 0
+    out[filled] = sums[filled] / counts[filled]
+    return out
+
+
+def align_to_grid(
+    step_s: float,
+    *series: Series,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    tolerance: Optional[float] = None,
+    how: str = "backward",
+) -> Tuple[np.ndarray, list]:
+    """Mehrere Reihen auf ein gemeinsames Raster mit Schrittweite ``step_s`` legen.
+
+    Ohne ``start``/``end`` wird der gemeinsame Überlappungsbereich verwendet.
+    Das Raster ist an Vielfachen von ``step_s`` ausgerichtet (wie die Abtastuhr).
+
+    Returns:
+        ``(grid, [values, ...])`` – eine Werte-Array je Eingangsreihe.
+    """
+    if step_s <= 0:
+        raise ValueError("step_s muss > 0 sein")
+    non_empty = [np.asarray(s[0], dtype=np.float64) for s in series if len(s[0])]
+    if start is None:
+        start = max((t[0] for t in non_empty), default=None)
+    if end is None:
+        end = min((t[-1] for t in non_empty), default=None)
+    if start is None or end is None or end < start:
+        return np.empty(0, dtype=np.float64), [np.empty(0, dtype=np.float64) for _ in series]
+    first = np.ceil(start / step_s) * step_s
+    count = int(np.floor((end - first) / step_s)) + 1
+    grid = first + step_s * np.arange(max(0, count), dtype=np.float64)
+    return grid, [resample(s, grid, tolerance, how) for s in series]
@@ -0,0 +1,138 @@
+"""Vektorisiertes Binning für Zeitreihen-Charts (NumPy, NaN-fest).
+
+Bucket-ID ist ``floor(t / bucket_s)``; Summe und Anzahl je Bucket kommen
+aus ``np.bincount``, Minimum/Maximum aus ``np.minimum.reduceat`` bzw.
+``np.maximum.reduceat`` über sortierte IDs. NaN zählt als "fehlt" und
+verschwindet aus allen Statistiken – ein Bucket ohne gültigen Wert hat
+Anzahl 0 und Mittel/Min/Max NaN.
+
+Plausibilitätsregeln (``in_range``) und Energie-Integration
+(``trapezoid_energy``) arbeiten ebenso auf ganzen Arrays statt je Zeile.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Je Kanal: (Summe, Anzahl, Minimum, Maximum) pro Bucket
+Stats = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def sample_stats(values: np.ndarray) -> Stats:
+    """Einzelwerte als Ein-Sample-Statistik (NaN = fehlt)."""
+    v = np.asarray(values, dtype=float)
+    valid = np.isfinite(v)
+    return np.where(valid, v, 0.0), valid.astype(np.int64), v, v
+
+
+def group_stats(ids: np.ndarray, stats: Mapping[str, Stats]) -> Tuple[np.ndarray, Dict[str, Stats]]:
+    """Aufeinanderfolgende gleiche ``ids`` (sortiert) zusammenfassen.
+
+    Leere Buckets eines Kanals haben Anzahl 0 und Min/Max NaN.
+    """
+    ids = np.asarray(ids, dtype=np.int64)
+    if not len(ids):
+        return ids, {}
+    change = np.r_[False, ids[1:] != ids[:-1]]
+    starts = np.flatnonzero(np.r_[True, change[1:]])
+    group = np.cumsum(change)
+    out = {}
+    for name, (sums, counts, mins, maxs) in stats.items():
+        g_sum = np.bincount(group, weights=sums, minlength=len(starts))
+        g_count = np.bincount(group, weights=counts, minlength=len(starts)).astype(np.int64)
+        g_min = np.minimum.reduceat(np.where(np.isfinite(mins), mins, np.inf), starts)
+        g_max = np.maximum.reduceat(np.where(np.isfinite(maxs), maxs, -np.inf), starts)
+        empty = g_count == 0
+        g_min[empty] = np.nan
+        g_max[empty] = np.nan
+        out[name] = (g_sum, g_count, g_min, g_max)
+    return ids[starts], out
+
+
+def bucket_stats(t: np.ndarray, values: Mapping[str, np.ndarray], bucket_s: int) -> Tuple[np.ndarray, Dict[str, Stats]]:
+    """Sortierte Samples zu Buckets: Bucket-IDs und je Kanal (Summe, Anzahl, Min, Max)."""
+    ids = np.floor_divide(np.asarray(t, dtype=float), bucket_s).astype(np.int64)
+    return group_stats(ids, {name: sample_stats(v) for name, v in values.items()})
+
+
+@dataclass
+class Bins:
+    """Ergebnis von ``bin_series``; ``start`` in Sekunden, je Kanal ein Array pro Bucket."""
+
+    start: np.ndarray
+    mean: Dict[str, np.ndarray] = field(default_factory=dict)
+    min: Dict[str, np.ndarray] = field(default_factory=dict)
+    max: Dict[str, np.ndarray] = field(default_factory=dict)
+    count: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+
+def bin_series(t: np.ndarray, values: Mapping[str, np.ndarray], bucket_s: float) -> Bins:
+    """Samples (beliebige Reihenfolge) in ``bucket_s``-Buckets: Mittel, Min, Max, Anzahl je Kanal.
+
+    Es entstehen nur Buckets, in denen mindestens ein Sample liegt; ein
+    Kanal ohne gültigen Wert im Bucket bekommt dort NaN.
+    """
+    t = np.asarray(t, dtype=float)
+    cols = {name: np.asarray(v, dtype=float) for name, v in values.items()}
+    ok = np.isfinite(t)
+    if not ok.all():
+        t = t[ok]
+        cols = {name: v[ok] for name, v in cols.items()}
+    if len(t) > 1 and np.any(t[1:] < t[:-1]):
+        order = np.argsort(t, kind="stable")
+        t = t[order]
+        cols = {name: v[order] for name, v in cols.items()}
+    ids, stats = bucket_stats(t, cols, bucket_s)
+    out = Bins(ids * float(bucket_s))
+    for name, (sums, counts, mins, maxs) in stats.items():
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out.mean[name] = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+        out.min[name] = mins
+        out.max[name] = maxs
+        out.count[name] = counts
+    return out
+
+
+def in_range(values: np.ndarray, lo: float, hi: float, missing: Optional[float] = None) -> np.ndarray:
+    """Werte außerhalb ``[lo, hi]`` (und gleich ``missing``, z.B. Platzhalter 0.0) werden NaN."""
+    values = np.asarray(values, dtype=float)
+    with np.errstate(invalid="ignore"):
+        ok = (values >= lo) & (values <= hi)
+        if missing is not None:
+            ok &= values != missing
+    return np.where(ok, values, np.nan)
+
+
+def trapezoid_energy(t_s: np.ndarray, power: np.ndarray, max_gap_s: float) -> np.ndarray:
+    """Energie je Abschnitt zwischen zwei Samples (Trapez, Leistung × Stunden).
+
+    Abschnitte mit Lücke über ``max_gap_s``, nicht-positiver Dauer oder
+    NaN-Leistung liefern 0.
+    """
+    t_s = np.asarray(t_s, dtype=float)
+    power = np.asarray(power, dtype=float)
+    if len(t_s) < 2:
+        return np.zeros(0)
+    dt = np.diff(t_s)
+    avg = (power[1:] + power[:-1]) / 2.0
+    ok = (dt > 0) & (dt <= max_gap_s) & np.isfinite(avg)
+    return np.where(ok, avg * dt / 3600.0, 0.0)
+
+
+def dense_grid(ids: np.ndarray, values: np.ndarray, first: int, count: int) -> np.ndarray:
+    """Werte auf ein lückenloses Raster ``first .. first+count-1`` legen, fehlende IDs = NaN.
+
+    Bei doppelten IDs gewinnt der letzte Wert.
+    """
+    out = np.full(max(0, int(count)), np.nan)
+    pos = np.asarray(ids, dtype=np.int64) - int(first)
+    values = np.asarray(values, dtype=float)
+    ok = (pos >= 0) & (pos < len(out))
+    out[pos[ok]] = values[ok]
+    return out
@@ -0,0 +1,292 @@
+"""Kompaktes Speicherformat für den vollständigen BMK-Kanalvektor.
+
+Die BMK-Steuerung liefert pro Abfrage einen Vektor von 73 Werten (Temperaturen,
+Pumpen, Mischer, Relais, Betriebsstunden). Statt dafür 73 Spalten anzulegen,
+wird jede Messung als gepackter little-endian float32-Blob gespeichert
+(292 Bytes pro Sample). Fehlende oder nicht-numerische Werte werden als NaN
+abgelegt.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import Any, Final, Iterable, Iterator, Mapping, Sequence
+
+# Reihenfolge entspricht den Zeilen der daqdata.cgi-Antwort (PP-Index).
+BMK_CHANNELS: Final[tuple[str, ...]] = (
+    "Betriebsmodus",  # 0
+    "Kesseltemperatur",  # 1
+    "Außentemperatur",  # 2
+    "Wert_3",  # 3
+    "Puffer_Oben",  # 4
+    "Pufferspeicher_Mitte",  # 5
+    "Puffer_Unten",  # 6
+    "Wert_7",  # 7
+    "Kesselrücklauf",  # 8
+    "Rauchgastemperatur",  # 9
+    "Wert_10",  # 10
+    "Rauchgasauslastung",  # 11
+    "Warmwassertemperatur",  # 12
+    "Wert_13",  # 13
+    "Hysterese_14",  # 14
+    "Differenzial_15",  # 15
+    "Hysterese_16",  # 16
+    "Differenzial_17",  # 17
+    "Heizkreispumpe_EG",  # 18
+    "Solltemperatur_EG",  # 19
+    "Vorlauftemp_EG",  # 20
+    "Raumtemp_EG",  # 21
+    "Heizkreispumpe_OG",  # 22
+    "Solltemperatur_OG",  # 23
+    "Vorlauftemp_OG",  # 24
+    "Heizkreispumpe_DG",  # 25
+    "Heizkreispumpe_Boiler",  # 26
+    "Hysterese_EG",  # 27
+    "Hysterese_OG",  # 28
+    "Hysterese_DG",  # 29
+    "Reserve_Pumpe_Status",  # 30
+    "Hysterese_31",  # 31
+    "Ruecklauftemp_Heizkreis",  # 32
+    "Kesselpumpe_Status",  # 33
+    "Mischer_EG_Elektronisch",  # 34
+    "Hysterese_35",  # 35
+    "Hysterese_36",  # 36
+    "Grenzwert_37",  # 37
+    "Mischer_OG_Elektronisch",  # 38
+    "Hysterese_39",  # 39
+    "Temperatur_Sensor_40",  # 40
+    "Relais_41",  # 41
+    "Modus_Status",  # 42
+    "Brenner_Status",  # 43
+    "Brenner_Status_2",  # 44
+    "Wert_45",  # 45
+    "Relais_10_Status",  # 46
+    "Relais_11_Status",  # 47
+    "Relais_12_Status",  # 48
+    "Relais_13_Status",  # 49
+    "Relais_14_Status",  # 50
+    "Relais_15_Status",  # 51
+    "Tick_Counter",  # 52
+    "Betriebsstunden",  # 53
+    "Wert_54",  # 54
+    "Wert_55",  # 55
+    "Wert_56",  # 56
+    "Wert_57",  # 57
+    "Wert_58",  # 58
+    "Wert_59",  # 59
+    "Wert_60",  # 60
+    "Wert_61",  # 61
+    "Wert_62",  # 62
+    "Wert_63",  # 63
+    "Wert_64",  # 64
+    "Wert_65",  # 65
+    "Wert_66",  # 66
+    "Wert_67",  # 67
+    "Wert_68",  # 68
+    "Wert_69",  # 69
+    "Relais_16_Status",  # 70
+    "Relais_17_Status",  # 71
+    "Relais_18_Status",  # 72
+)
+
+CHANNEL_COUNT: Final[int] = len(BMK_CHANNELS)
+
+CHANNEL_INDEX: Final[dict[str, int]] = {name: idx for idx, name in enumerate(BMK_CHANNELS)}
+
+_BLOB = struct.Struct(f"<{CHANNEL_COUNT}f")
+_NAN = float("nan")
+
+BLOB_SIZE: Final[int] = _BLOB.size
+
+
+def channel_index(channel: str | int) -> int:
+    """Liefert den PP-Index für einen Kanalnamen oder Index.
+
+    Raises:
+        KeyError: Wenn der Kanal unbekannt ist.
+    """
+    if isinstance(channel, int):
+        if 0 <= channel < CHANNEL_COUNT:
+            return channel
+        raise KeyError(channel)
+    return CHANNEL_INDEX[channel]
+
+
+def channels_from_record(record: Mapping[str, Any]) -> list[float] | None:
+    """Extrahiert den Kanalvektor aus einem BMK-Dict (Schlüssel = Kanalnamen).
+
+    Returns:
+        Liste mit CHANNEL_COUNT Floats (NaN für fehlende Werte) oder None,
+        wenn der Datensatz keinen einzigen bekannten Kanal enthält.
+    """
+    values = [_NAN] * CHANNEL_COUNT
+    found = False
+    for idx, name in enumerate(BMK_CHANNELS):
+        raw = record.get(name)
+        if raw is None or raw == "":
+            continue
+        found = True
+        try:
+            values[idx] = float(raw)
+        except (TypeError, ValueError):
+            pass
+    return values if found else None
+
+
+def pack_channels(values: Sequence[float]) -> bytes:
+    """Packt einen Kanalvektor in einen float32-Blob fester Länge.
+
+    Kürzere Vektoren werden mit NaN aufgefüllt, längere abgeschnitten.
+    """
+    count = len(values)
+    if count != CHANNEL_COUNT:
+        values = list(values[:CHANNEL_COUNT]) + [_NAN] * max(0, CHANNEL_COUNT - count)
+    return _BLOB.pack(*values)
+
+
+def unpack_channels(blob: bytes) -> tuple[float, ...]:
+    """Entpackt einen Blob in ein Tupel mit CHANNEL_COUNT Floats."""
+    if len(blob) != BLOB_SIZE:
+        padded = bytes(blob[:BLOB_SIZE]).ljust(BLOB_SIZE, b"\x00")
+        values = list(_BLOB.unpack(padded))
+        for idx in range(len(blob) // 4, CHANNEL_COUNT):
+            values[idx] = _NAN
+        return tuple(values)
+    return _BLOB.unpack(blob)
+
+
+def channels_to_dict(values: Iterable[float]) -> dict[str, float | None]:
+    """Wandelt einen Kanalvektor in ein Dict Kanalname -> Wert (NaN -> None)."""
+    return {
+        name: (None if math.isnan(val) else val)
+        for name, val in zip(BMK_CHANNELS, values)
+    }
+
+
+# --- Parser & typisierter Datensatz -------------------------------------
+
+# PP-Indizes der Kanäle, die zusätzlich in der 'heating'-Tabelle landen.
+IDX_BETRIEBSMODUS: Final[int] = 0
+IDX_KESSEL: Final[int] = 1
+IDX_AUSSEN: Final[int] = 2
+IDX_PUFFER_OBEN: Final[int] = 4
+IDX_PUFFER_MITTE: Final[int] = 5
+IDX_PUFFER_UNTEN: Final[int] = 6
+IDX_WARMWASSER: Final[int] = 12
+
+# Legacy-Aliase, die UI und CSV-Import weiterhin erwarten.
+_LEGACY_ALIASES: Final[tuple[tuple[str, int], ...]] = (
+    ("Pufferspeicher Oben", IDX_PUFFER_OBEN),
+    ("Pufferspeicher Mitte", IDX_PUFFER_MITTE),
+    ("Pufferspeicher Unten", IDX_PUFFER_UNTEN),
+    ("Warmwasser", IDX_WARMWASSER),
+)
+
+_NAN_TEMPLATE = array("d", [_NAN] * CHANNEL_COUNT)
+
+
+def parse_into(text: str, out: array) -> int:
+    """Parst eine daqdata.cgi-Antwort in einem Durchlauf in einen Puffer.
+
+    Jede nicht-leere Zeile wird per Index in ``out`` geschrieben; nicht
+    numerische Werte und fehlende Zeilen werden zu NaN. Zeilen jenseits
+    von CHANNEL_COUNT werden ignoriert.
+
+    Args:
+        text: Rohtext der Antwort.
+        out: Vorallokiertes ``array('d')`` mit mindestens CHANNEL_COUNT Einträgen.
+
+    Returns:
+        Anzahl der gelesenen (nicht-leeren) Zeilen.
+    """
+    idx = 0
+    for line in text.splitlines():
+        if idx >= CHANNEL_COUNT:
+            break
+        try:
+            # float() ignoriert umgebenden Whitespace, kein strip() nötig
+            out[idx] = float(line)
+        except ValueError:
+            if not line or line.isspace():
+                continue
+            out[idx] = _NAN
+        idx += 1
+    for rest in range(idx, CHANNEL_COUNT):
+        out[rest] = _NAN
+    return idx
+
+
+def _opt(value: float) -> float | None:
+    return None if value != value else value
+
+
+@dataclass(slots=True)
+class BmkSample:
+    """Ein BMK-Messwert: Zeitstempel plus vollständiger Kanalvektor."""
+
+    timestamp: str
+    channels: array
+
+    @property
+    def kessel(self) -> float | None:
+        return _opt(self.channels[IDX_KESSEL])
+
+    @property
+    def aussen(self) -> float | None:
+        return _opt(self.channels[IDX_AUSSEN])
+
+    @property
+    def puffer_oben(self) -> float | None:
+        return _opt(self.channels[IDX_PUFFER_OBEN])
+
+    @property
+    def puffer_mitte(self) -> float | None:
+        return _opt(self.channels[IDX_PUFFER_MITTE])
+
+    @property
+    def puffer_unten(self) -> float | None:
+        return _opt(self.channels[IDX_PUFFER_UNTEN])
+
+    @property
+    def warmwasser(self) -> float | None:
+        return _opt(self.channels[IDX_WARMWASSER])
+
+    def heating_row(self) -> tuple:
+        """Spaltenwerte für die 'heating'-Tabelle in Insert-Reihenfolge."""
+        ch = self.channels
+        return (
+            self.timestamp,
+            _opt(ch[IDX_KESSEL]),
+            _opt(ch[IDX_AUSSEN]),
+            _opt(ch[IDX_PUFFER_OBEN]),
+            _opt(ch[IDX_PUFFER_MITTE]),
+            _opt(ch[IDX_PUFFER_UNTEN]),
+            _opt(ch[IDX_WARMWASSER]),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Legacy-Dict (Kanalnamen + Aliase), wie es die UI-Handler erwarten."""
+        data: dict[str, Any] = {"Zeitstempel": self.timestamp}
+        data.update(channels_to_dict(self.channels))
+        for alias, idx in _LEGACY_ALIASES:
+            data[alias] = data[BMK_CHANNELS[idx]]
+        return data
+
+
+def parse_sample(text: str, timestamp: str) -> BmkSample | None:
+    """Parst eine Antwort in einen neuen BmkSample (None bei leerer Antwort)."""
+    channels = array("d", _NAN_TEMPLATE)
+    if parse_into(text, channels) == 0:
+        return None
+    return BmkSample(timestamp=timestamp, channels=channels)
+
+
+def parse_many(payloads: Iterable[tuple[str, str]]) -> Iterator[BmkSample]:
+    """Parst aufgezeichnete Antworten ``(timestamp, text)`` für Replay/Bulk-Import."""
+    for timestamp, text in payloads:
+        sample = parse_sample(text, timestamp)
+        if sample is not None:
+            yield sample
@@ -0,0 +1,268 @@
+"""Chart-Daten aus LOD-Pyramiden: ``window(start, end, pixels)`` für jede Zoomstufe.
+
+Je Tabelle (Heizung, Fronius) hält eine ``ChartSource`` eine
+``LodPyramid``. Beim ersten Zugriff kommt die ältere Historie als
+SQL-Rollup in 5-Minuten-Buckets (``get_rollup``), nur die letzten
+``RAW_SECONDS`` als Rohzeilen. Ohne Rollup endet das erste Fenster am
+jüngsten Zeitstempel der Tabelle (``fetch_latest``), damit pausierte
+Erfassung nicht zu leeren Charts führt. Danach holt ``refresh`` nur noch
+Zeilen nach dem letzten Zeitstempel (``get_*_since``). Zeitraumwechsel, Zoom und Pan
+lesen nur noch aus dem Speicher – kein erneutes Abfragen und Rebinnen.
+
+Plausibilitätsregeln gibt es zweimal mit gleicher Bedeutung: als
+SQL-Ausdruck für den Rollup und als Vektor-Maske für Rohzeilen.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from core.binning import in_range
+from core.lod import LEVEL_SECONDS, RAW_SECONDS, LodPyramid, LodSlice
+from core.time_utils import db_timestamp_to_epoch, epoch_to_db_timestamp
+
+HEATING_CHANNELS = ("top", "mid", "bot", "kessel", "warm", "outdoor")
+FRONIUS_CHANNELS = ("pv", "load", "grid")
+
+_HEATING_COLUMNS = {
+    "top": "puffer_top",
+    "mid": "puffer_mid",
+    "bot": "puffer_bot",
+    "kessel": "kesseltemp",
+    "warm": "warmwasser",
+    "outdoor": "aussentemp",
+}
+_FRONIUS_COLUMNS = {"pv": "pv_power", "load": "load_power", "grid": "grid_power"}
+
+RETENTION_DAYS = 366
+REFRESH_S = 30.0
+
+
+def clean_heating(name: str, values: np.ndarray) -> np.ndarray:
+    """Außen: -40..60 °C. Heizkreise: 0.0 ist Platzhalter, gültig -40..120 °C."""
+    if name == "outdoor":
+        return in_range(values, -40.0, 60.0)
+    return in_range(values, -40.0, 120.0, missing=0.0)
+
+
+def heating_sql(name: str) -> str:
+    """SQL-Gegenstück zu ``clean_heating``."""
+    col = _HEATING_COLUMNS[name]
+    if name == "outdoor":
+        return f"CASE WHEN {col} BETWEEN -40 AND 60 THEN {col} END"
+    return f"CASE WHEN {col} != 0 AND {col} BETWEEN -40 AND 120 THEN {col} END"
+
+
+def clean_fronius(name: str, values: np.ndarray) -> np.ndarray:
+    """Leistungen in kW; ältere Quellen liefern teils W (Betrag > 200)."""
+    values = np.asarray(values, dtype=float)
+    with np.errstate(invalid="ignore"):
+        values = np.where(np.abs(values) > 200.0, values / 1000.0, values)
+        if name == "load":
+            values = np.abs(values)
+        elif name == "pv":
+            values = np.where(np.isfinite(values), np.maximum(values, 0.0), np.nan)
+    return values
+
+
+def fronius_sql(name: str) -> str:
+    """SQL-Gegenstück zu ``clean_fronius``."""
+    col = _FRONIUS_COLUMNS[name]
+    kw = f"(CASE WHEN ABS({col}) > 200 THEN {col} / 1000.0 ELSE {col} END)"
+    if name == "load":
+        return f"ABS{kw}"
+    if name == "pv":
+        return f"MAX({kw}, 0.0)"
+    return kw
+
+
+def rows_to_columns(rows: Sequence[dict], channels: Sequence[str]) -> tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Store-Zeilen zu Epoch-Array und Float-Spalten (None/Unlesbares = NaN)."""
+    stamps = [(row or {}).get("timestamp") for row in rows]
+    t = None
+    if all(isinstance(s, str) and len(s) == 19 for s in stamps):
+        # Kanonische Zeitstempel (naiv UTC) parst NumPy in einem Rutsch
+        try:
+            parsed = np.array(stamps, dtype="datetime64[s]")
+            t = np.where(np.isnat(parsed), np.nan, parsed.astype(np.int64).astype(float))
+        except ValueError:
+            t = None
+    if t is None:
+        t = np.array([_epoch_or_nan(s) for s in stamps], dtype=float)
+    cols = {}
+    for c in channels:
+        raw = [(row or {}).get(c) for row in rows]
+        try:
+            cols[c] = np.array(raw, dtype=float)
+        except (TypeError, ValueError):
+            cols[c] = np.array([_to_float(v) for v in raw], dtype=float)
+    ok = np.isfinite(t)
+    return t[ok], {c: v[ok] for c, v in cols.items()}
+
+
+def _epoch_or_nan(value: Any) -> float:
+    epoch = db_timestamp_to_epoch(value) if value else None
+    return np.nan if epoch is None else epoch
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def rollup_to_stats(rows: Sequence[dict], channels: Sequence[str]):
+    """``get_rollup``-Zeilen zu Bucket-Starts und (Summe, Anzahl, Min, Max) je Kanal."""
+    starts = np.array([row["bucket"] for row in rows], dtype=float)
+    stats = {}
+    for c in channels:
+        avg = np.array([row.get(f"{c}_avg") for row in rows], dtype=float)
+        counts = np.array([row.get(f"{c}_count") or 0 for row in rows], dtype=np.int64)
+        sums = np.where(counts > 0, np.nan_to_num(avg) * counts, 0.0)
+        mins = np.array([row.get(f"{c}_min") for row in rows], dtype=float)
+        maxs = np.array([row.get(f"{c}_max") for row in rows], dtype=float)
+        stats[c] = (sums, counts, mins, maxs)
+    return starts, stats
+
+
+class ChartSource:
+    """Eine Tabelle als LOD-Pyramide, inkrementell aus dem Store nachgeladen."""
+
+    def __init__(
+        self,
+        fetch_since: Callable[[Optional[str], Optional[int]], List[dict]],
+        channels: Sequence[str],
+        clean: Optional[Callable[[str, np.ndarray], np.ndarray]] = None,
+        fetch_rollup: Optional[Callable[[int, int, str], List[dict]]] = None,
+        fetch_latest: Optional[Callable[[], Optional[str]]] = None,
+        retention_days: int = RETENTION_DAYS,
+        refresh_s: float = REFRESH_S,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._fetch = fetch_since
+        self._fetch_rollup = fetch_rollup
+        self._fetch_latest = fetch_latest
+        self._clean = clean
+        self.channels = tuple(channels)
+        self.retention_s = float(retention_days) * 86400.0
+        self.refresh_s = refresh_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.pyramid = LodPyramid(self.channels)
+        self._loaded = False
+        self._last_refresh = 0.0
+
+    @property
+    def version(self) -> int:
+        return self.pyramid.version
+
+    def refresh(self, force: bool = False) -> bool:
+        """Neue Zeilen nachladen (höchstens alle ``refresh_s``); True bei neuen Daten."""
+        with self._lock:
+            now = self._clock()
+            if not force and self._loaded and now - self._last_refresh < self.refresh_s:
+                return False
+            self._last_refresh = now
+            version = self.pyramid.version
+            hours = int(self.retention_s // 3600)
+            if not self._loaded:
+                self._loaded = True
+                since = self._backfill(now, hours)
+                if since is None:
+                    since = self._anchored_since()
+            else:
+                last = self.pyramid.last_t
+                since = epoch_to_db_timestamp(last) if last is not None else None
+            try:
+                rows = self._fetch(since, hours)
+            except Exception:
+                rows = []
+            t, cols = rows_to_columns(rows, self.channels)
+            if self._clean is not None:
+                cols = {c: self._clean(c, v) for c, v in cols.items()}
+            self.pyramid.extend(t, cols)
+            # Aufbewahrung ab dem jüngsten Sample, nicht ab jetzt (pausierte Erfassung)
+            first, last = self.pyramid.first_t, self.pyramid.last_t
+            horizon = min(now, last if last is not None else now) - self.retention_s
+            if first is not None and first < horizon - 86400.0:
+                self.pyramid.drop_before(horizon)
+            return self.pyramid.version != version
+
+    def _anchored_since(self) -> Optional[str]:
+        """``since`` für das Rohzeilen-Fenster, das am jüngsten Zeitstempel der Tabelle endet."""
+        if self._fetch_latest is None:
+            return None
+        try:
+            latest = db_timestamp_to_epoch(self._fetch_latest())
+        except Exception:
+            return None
+        if latest is None:
+            return None
+        return epoch_to_db_timestamp(latest - self.retention_s)
+
+    def _backfill(self, now: float, hours: int) -> Optional[str]:
+        """Historie vor dem Rohdaten-Fenster als Rollup laden; liefert den ``since``-Zeitstempel der Rohzeilen."""
+        if self._fetch_rollup is None:
+            return None
+        bucket_s = LEVEL_SECONDS[0]
+        boundary = (now - RAW_SECONDS) // bucket_s * bucket_s
+        try:
+            rows = self._fetch_rollup(bucket_s, hours, epoch_to_db_timestamp(boundary))
+        except Exception:
+            return None
+        starts, stats = rollup_to_stats(rows, self.channels)
+        self.pyramid.extend_buckets(bucket_s, starts, stats)
+        # Rohzeilen ab der Grenze (``since`` ist exklusiv)
+        return epoch_to_db_timestamp(boundary - 1)
+
+    def window(self, start: float, end: float, pixels: int) -> LodSlice:
+        """Daten für ``[start, end]`` (Epoch-Sekunden) mit höchstens ~``pixels`` Punkten."""
+        self.refresh()
+        with self._lock:
+            return self.pyramid.query(start, end, pixels)
+
+    def bins(self, channel: str, start: float, end: float, bucket_s: int):
+        """Bucket-Starts und Mittelwerte von ``channel`` in festen ``bucket_s``-Buckets."""
+        self.refresh()
+        with self._lock:
+            return self.pyramid.bins(channel, start, end, bucket_s)
+
+
+def _rollup_fetcher(store: Any, table: str, expressions: Mapping[str, str]):
+    return lambda bucket_s, hours, before: store.get_rollup(table, dict(expressions), bucket_s, hours=hours, before=before)
+
+
+class ChartData:
+    """Gemeinsame Quellen je Store (Heizung, Fronius)."""
+
+    def __init__(self, store: Any):
+        self.heating = ChartSource(
+            lambda since, hours: store.get_heating_since(since, hours=hours),
+            HEATING_CHANNELS,
+            clean_heating,
+            fetch_rollup=_rollup_fetcher(store, "heating", {c: heating_sql(c) for c in HEATING_CHANNELS}),
+        )
+        self.fronius = ChartSource(
+            lambda since, hours: store.get_fronius_since(since, hours=hours),
+            FRONIUS_CHANNELS,
+            clean_fronius,
+            fetch_rollup=_rollup_fetcher(store, "fronius", {c: fronius_sql(c) for c in FRONIUS_CHANNELS}),
+        )
+
+
+_LOCK = threading.Lock()
+
+
+def get_chart_data(store: Any) -> ChartData:
+    """Eine ``ChartData`` je Store, damit alle Tabs dieselben Pyramiden nutzen."""
+    with _LOCK:
+        data = getattr(store, "_chart_data", None)
+        if data is None:
+            data = ChartData(store)
+            store._chart_data = data
+        return data
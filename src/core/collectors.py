@@ -0,0 +1,263 @@
+"""Collector-Plugins: Registry, gemeinsamer Scheduler und Schreibpfad.
+
+Eine Datenquelle implementiert ``Collector`` (fetch -> parse -> persist) und
+wird per ``register_collector`` angemeldet. Der ``CollectorScheduler`` ruft
+alle registrierten Collector in ihrem Intervall auf, schreibt über den
+gemeinsamen DataStore, pflegt ``core.health`` und verteilt neue Datensätze
+an Abonnenten (UI-Queue, Tabs).
+
+Quellen ohne eigene Tabelle deklarieren ``schema`` (Kanalnamen) und landen
+automatisch in der schmalen ``samples``-Tabelle (Historie + Rollups).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from .health import record_stage, update_source_health
+from .time_utils import epoch_to_db_timestamp, sample_tick
+
+logger = logging.getLogger(__name__)
+
+
+# Rückgabewert von ``Collector.parse``: Abruf erfolgreich, aber (noch) kein
+# Datensatz zu speichern – z.B. während ein Aggregations-Bucket gefüllt wird.
+PENDING = object()
+
+
+class Collector(ABC):
+    """Basisklasse für eine Datenquelle.
+
+    Attribute:
+        name: Eindeutiger Quellenname (auch Health- und samples-Schlüssel).
+        interval_s: Abfrageintervall in Sekunden.
+        schema: Kanalnamen, die ``persist`` in die samples-Tabelle schreibt.
+    """
+
+    name: str = ""
+    interval_s: float = 10.0
+    schema: tuple[str, ...] = ()
+
+    # Abtast-Tick des laufenden Zyklus (UTC-Epoch), vom Scheduler vor fetch gesetzt
+    _tick: int | None = None
+
+    def sample_epoch(self) -> int:
+        """UTC-Epoch des aktuellen Abtast-Ticks (auf ``interval_s`` ausgerichtet)."""
+        return self._tick if self._tick is not None else sample_tick(self.interval_s)
+
+    def sample_timestamp(self) -> str:
+        """Kanonischer DataStore-Zeitstempel (UTC) des aktuellen Ticks."""
+        return epoch_to_db_timestamp(self.sample_epoch())
+
+    @abstractmethod
+    def fetch(self) -> Any:
+        """Rohdaten vom Gerät holen (None = keine Daten)."""
+
+    def parse(self, raw: Any) -> Any:
+        """Rohdaten in einen Datensatz wandeln (None = verwerfen, PENDING = später).
+
+        Standard-Datensatz ist ein Dict mit 'timestamp' und Kanalwerten.
+        """
+        return raw
+
+    def persist(self, store, record: Any) -> None:
+        """Datensatz speichern (Standard: samples-Tabelle gemäß ``schema``)."""
+        if not self.schema:
+            return
+        store.insert_samples(
+            self.name,
+            record["timestamp"],
+            {channel: record.get(channel) for channel in self.schema},
+        )
+
+    def payload(self, record: Any) -> Any:
+        """Objekt, das an Abonnenten verteilt wird (Standard: Datensatz)."""
+        return record
+
+    def on_stop(self) -> Any:
+        """Beim Stoppen des Schedulers: letzter noch offener Datensatz (None = keiner).
+
+        Z.B. ein angefangener Aggregations-Bucket; er wird noch gespeichert.
+        """
+        return None
+
+
+_LOCK = threading.Lock()
+_COLLECTORS: Dict[str, Collector] = {}
+_SUBSCRIBERS: Dict[str, List[Callable[[Any], None]]] = {}
+
+
+def register_collector(collector: Collector) -> None:
+    """Collector anmelden (ersetzt einen gleichnamigen)."""
+    if not collector.name:
+        raise ValueError("Collector braucht einen Namen")
+    with _LOCK:
+        _COLLECTORS[collector.name] = collector
+
+
+def unregister_collector(name: str) -> None:
+    with _LOCK:
+        _COLLECTORS.pop(name, None)
+
+
+def get_collectors() -> Dict[str, Collector]:
+    with _LOCK:
+        return dict(_COLLECTORS)
+
+
+def subscribe(name: str, callback: Callable[[Any], None]) -> Callable[[], None]:
+    """Auf neue Datensätze einer Quelle hören. Callback läuft im Worker-Thread."""
+    with _LOCK:
+        _SUBSCRIBERS.setdefault(name, []).append(callback)
+
+    def _unsubscribe() -> None:
+        with _LOCK:
+            try:
+                _SUBSCRIBERS.get(name, []).remove(callback)
+            except ValueError:
+                pass
+
+    return _unsubscribe
+
+
+def _notify(name: str, payload: Any) -> None:
+    with _LOCK:
+        callbacks = list(_SUBSCRIBERS.get(name, ()))
+    for callback in callbacks:
+        try:
+            callback(payload)
+        except Exception:
+            logger.exception("Collector-Abonnent für %s fehlgeschlagen", name)
+
+
+class CollectorScheduler:
+    """Ein Scheduler-Thread für alle registrierten Collector.
+
+    Fällige Collector laufen in einem kleinen Thread-Pool, damit ein
+    langsames Gerät (Timeout) die anderen Quellen nicht verzögert. Ein
+    Collector wird nie parallel zu sich selbst ausgeführt.
+    """
+
+    def __init__(self, store_getter: Optional[Callable[[], Any]] = None, max_workers: int = 4):
+        if store_getter is None:
+            from .datastore import get_shared_datastore
+            store_getter = get_shared_datastore
+        self._store_getter = store_getter
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Collector")
+        self._next_due: Dict[str, float] = {}
+        self._running: set[str] = set()
+        self._running_lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name="CollectorScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Scheduler anhalten und auf laufende Zyklen warten (höchstens ``timeout``).
+
+        Danach schreibt kein Worker mehr in den Store; der DataStore darf
+        direkt im Anschluss geschlossen werden.
+        """
+        deadline = time.monotonic() + timeout
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        # Noch nicht gestartete Zyklen verwerfen, laufende zu Ende bringen
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        pending = [f for f in self._futures.values() if not f.done()]
+        if pending:
+            _, not_done = wait(pending, timeout=max(0.0, deadline - time.monotonic()))
+            if not_done:
+                logger.warning("%d Collector-Zyklus/Zyklen beim Stoppen noch aktiv", len(not_done))
+        busy = {name for name, f in self._futures.items() if not f.done()}
+        self._futures.clear()
+        for name, collector in get_collectors().items():
+            if name not in busy:
+                self._flush(collector)
+
+    def _flush(self, collector: Collector) -> None:
+        try:
+            record = collector.on_stop()
+            if record is not None and record is not PENDING:
+                collector.persist(self._store_getter(), record)
+        except Exception as exc:
+            logger.error("[DB] %s abschließend speichern fehlgeschlagen: %s", collector.name, exc)
+
+    def run_once(self, collector: Collector) -> Any:
+        """Einen Zyklus fetch -> parse -> persist -> notify ausführen.
+
+        Die Dauer jeder Stufe wird per ``record_stage`` in core.health erfasst.
+        """
+        name = collector.name
+        start = time.perf_counter()
+        # Gemeinsame Abtastuhr: Tick zu Beginn des Abrufs, nicht nach dem Timeout
+        collector._tick = sample_tick(collector.interval_s)
+        try:
+            raw = collector.fetch()
+            fetched = time.perf_counter()
+            record_stage(name, "fetch", (fetched - start) * 1000.0)
+            record = collector.parse(raw)
+            parsed = time.perf_counter()
+            record_stage(name, "parse", (parsed - fetched) * 1000.0)
+        except Exception as exc:
+            logger.error("Collector %s Fehler: %s", name, exc)
+            update_source_health(name, ok=False, error=str(exc))
+            return None
+        if record is None:
+            update_source_health(name, ok=False, error="no data")
+            return None
+        if record is PENDING:
+            update_source_health(name, ok=True, latency_ms=int((parsed - start) * 1000))
+            return None
+        try:
+            collector.persist(self._store_getter(), record)
+        except Exception as exc:
+            logger.error("[DB] %s speichern fehlgeschlagen: %s", name, exc)
+        persisted = time.perf_counter()
+        record_stage(name, "persist", (persisted - parsed) * 1000.0)
+        _notify(name, collector.payload(record))
+        total_ms = (time.perf_counter() - start) * 1000.0
+        record_stage(name, "total", total_ms)
+        update_source_health(name, ok=True, latency_ms=int(total_ms))
+        return record
+
+    def _run_guarded(self, collector: Collector) -> None:
+        try:
+            self.run_once(collector)
+        finally:
+            with self._running_lock:
+                self._running.discard(collector.name)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            now = time.monotonic()
+            wait_s = 1.0
+            for name, collector in get_collectors().items():
+                due = self._next_due.get(name, now)
+                if due > now:
+                    wait_s = min(wait_s, due - now)
+                    continue
+                with self._running_lock:
+                    if name in self._running:
+                        continue
+                    self._running.add(name)
+                interval = max(0.1, float(collector.interval_s))
+                self._next_due[name] = now + interval
+                wait_s = min(wait_s, interval)
+                try:
+                    self._futures[name] = self._pool.submit(self._run_guarded, collector)
+                except RuntimeError:
+                    # Pool bereits heruntergefahren
+                    return
+            self._stop.wait(max(0.01, wait_s))
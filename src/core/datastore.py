@@ -1,7 +1,10 @@
 
 from __future__ import annotations
 """Central SQLite datastore for PV and heating metrics."""
-from .time_utils import ensure_utc
+from .bmk_channels import (
+    BLOB_SIZE, BMK_CHANNELS, CHANNEL_COUNT, BmkSample, channel_index, channels_from_record, pack_channels,
+)
+from .time_utils import ensure_utc, normalize_db_timestamp
 from .utils import safe_float
 from collections import defaultdict
 import csv
@@ -12,12 +15,21 @@ import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 DB_PATH = Path(__file__).resolve().with_name("data.db")
+
+# Reihenfolge: (pv, grid, batt, load, soc) x (min, max)
+_FRONIUS_ENVELOPE_COLUMNS = (
+    "pv_min", "pv_max", "grid_min", "grid_max", "batt_min", "batt_max",
+    "load_min", "load_max", "soc_min", "soc_max",
+)
 DATA_DIR = DB_PATH.parent.parent.parent / "data"
 
+# PRAGMA user_version ab dem alle Zeitstempel kanonisch (naiv UTC) sind
+_UTC_SCHEMA_VERSION = 1
+
 _SHARED_LOCK = threading.Lock()
 _SHARED_STORE: Optional["DataStore"] = None
 
@@ -145,6 +157,12 @@ class DataStore:
             cols = [row[1] for row in cursor.execute("PRAGMA table_info(fronius)").fetchall()]
             if "load_power" not in cols:
                 cursor.execute("ALTER TABLE fronius ADD COLUMN load_power REAL")
+            # min/max je Bucket aus dem Hochfrequenz-Modus (NULL bei Einzelmessungen)
+            for col in _FRONIUS_ENVELOPE_COLUMNS:
+                if col not in cols:
+                    cursor.execute(f"ALTER TABLE fronius ADD COLUMN {col} REAL")
+            if "samples" not in cols:
+                cursor.execute("ALTER TABLE fronius ADD COLUMN samples INTEGER")
         except Exception:
             pass
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_fronius_ts ON fronius(timestamp)")
@@ -184,9 +202,54 @@ class DataStore:
         except Exception as e:
             logging.warning(f"Migration warning (aussentemp): {e}")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_heating_ts ON heating(timestamp)")
+
+        # Generische Collector-Messwerte (schmale Tabelle, siehe core/collectors.py)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS samples (
+                source TEXT NOT NULL,
+                channel TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                value REAL,
+                PRIMARY KEY (source, channel, timestamp)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_samples_ts ON samples(timestamp)")
+
+        # Vollständiger BMK-Kanalvektor als gepackter float32-Blob (siehe bmk_channels.py)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS heating_channels (
+                timestamp TEXT PRIMARY KEY,
+                channels BLOB NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+        if cursor.execute("PRAGMA user_version").fetchone()[0] < _UTC_SCHEMA_VERSION:
+            self._migrate_timestamps_to_utc(cursor)
+            cursor.execute(f"PRAGMA user_version = {_UTC_SCHEMA_VERSION}")
         
         self.conn.commit()
 
+    def _migrate_timestamps_to_utc(self, cursor) -> None:
+        """Einmalig: Alt-Zeitstempel auf kanonisches UTC (``YYYY-MM-DD HH:MM:SS``) umschreiben.
+
+        Läuft nur für Datenbanken vor ``_UTC_SCHEMA_VERSION``; dort wurde jeder
+        naive Zeitstempel in Ortszeit geschrieben.
+
+        - Mit Offset (``...T12:00:00+01:00``/``Z``) -> UTC über den Offset.
+        - Naiv -> UTC über die Ortszeitzone je Zeile (Sommer-/Winterzeit korrekt).
+
+        Kollisionen (z.B. doppelte Stunde bei Zeitumstellung) behalten die erste Zeile.
+        """
+        tail = "substr(timestamp, 20)"
+        has_offset = f"(instr({tail}, '+') > 0 OR instr({tail}, '-') > 0 OR upper({tail}) LIKE '%Z')"
+        expression = f"CASE WHEN {has_offset} THEN datetime(timestamp) ELSE datetime(timestamp, 'utc') END"
+        moved = {
+            table: _rewrite_timestamps(cursor, table, "timestamp IS NOT NULL", expression)
+            for table in ("fronius", "heating", "heating_channels", "samples")
+        }
+        if any(moved.values()):
+            logging.info("Migration: Zeitstempel auf UTC umgestellt %s", moved)
+
     def _hydrate_last_ingest_cache(self) -> None:
         """Populate ingest cache from existing DB content on startup."""
         with self._lock:
@@ -366,9 +429,11 @@ class DataStore:
         return out[-months:]
     
     def close(self):
-        """SchlieÃŸe Datenbank."""
-        if self.conn:
-            self.conn.close()
+        """SchlieÃŸe Datenbank (wartet auf laufende Schreib-/Lesezugriffe)."""
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
 
     # --- Neue Schreib-/Lese-APIs ---
 
@@ -376,7 +441,7 @@ class DataStore:
         """Persistiere einen Fronius-Datensatz."""
         if not record:
             return
-        ts = record.get('Zeitstempel') or record.get('timestamp')
+        ts = normalize_db_timestamp(record.get('Zeitstempel') or record.get('timestamp'))
         if not ts:
             return
         pv = safe_float(record.get('PV-Leistung (kW)') or record.get('pv'))
@@ -389,13 +454,24 @@ class DataStore:
         grid = _normalize_power_kw(grid)
         batt = _normalize_power_kw(batt)
         load_power = _normalize_power_kw(load_power)
+        # Optionale Bucket-Statistik (FroniusAggregator): pv_min, pv_max, ..., samples
+        # Leistungs-Hüllen in kW, SoC bleibt in %
+        envelope = []
+        for lo_col, hi_col in zip(_FRONIUS_ENVELOPE_COLUMNS[::2], _FRONIUS_ENVELOPE_COLUMNS[1::2]):
+            lo = safe_float(record.get(lo_col))
+            hi = safe_float(record.get(hi_col))
+            if not lo_col.startswith("soc_"):
+                lo, hi = _normalize_power_envelope_kw(lo, hi)
+            envelope += (lo, hi)
+        samples = record.get('samples')
         with self._lock:
             self._execute_with_retry(
-                """
-                INSERT OR REPLACE INTO fronius (timestamp, pv_power, grid_power, batt_power, soc, load_power)
-                VALUES (?, ?, ?, ?, ?, ?)
+                f"""
+                INSERT OR REPLACE INTO fronius
+                (timestamp, pv_power, grid_power, batt_power, soc, load_power, {', '.join(_FRONIUS_ENVELOPE_COLUMNS)}, samples)
+                VALUES (?, ?, ?, ?, ?, ?, {', '.join('?' * len(_FRONIUS_ENVELOPE_COLUMNS))}, ?)
                 """,
-                (ts, pv, grid, batt, soc, load_power),
+                (ts, pv, grid, batt, soc, load_power, *envelope, int(samples) if samples else None),
             )
             self._commit_with_retry()
             self._update_last_ingest_locked(ts)
@@ -407,7 +483,7 @@ class DataStore:
         if not record:
             logging.warning("[DB-INSERT] Empty record, skipping")
             return
-        ts = record.get('Zeitstempel') or record.get('timestamp')
+        ts = normalize_db_timestamp(record.get('Zeitstempel') or record.get('timestamp'))
         if not ts:
             logging.warning("[DB-INSERT] No timestamp in record: %s", list(record.keys())[:5])
             return
@@ -419,6 +495,7 @@ class DataStore:
         warm = safe_float(record.get('Warmwasser') or record.get('Warmwassertemperatur'))
         logging.debug("[DB-INSERT] Values: kessel=%s outdoor=%s top=%s mid=%s bot=%s warm=%s", 
                       kessel, outdoor, top, mid, bot, warm)
+        channels = channels_from_record(record)
         with self._lock:
             self._execute_with_retry(
                 """
@@ -427,10 +504,118 @@ class DataStore:
                 """,
                 (ts, kessel, outdoor, top, mid, bot, warm),
             )
+            if channels is not None:
+                self._execute_with_retry(
+                    "INSERT OR REPLACE INTO heating_channels (timestamp, channels) VALUES (?, ?)",
+                    (ts, pack_channels(channels)),
+                )
             self._commit_with_retry()
             self._update_last_ingest_locked(ts)
             self._cache_heating = None  # invalidate cache
 
+    def insert_heating_sample(self, sample: BmkSample) -> None:
+        """Persistiere einen geparsten BMK-Sample (heating + heating_channels)."""
+        self.insert_heating_samples((sample,))
+
+    def insert_heating_samples(self, samples: Iterable[BmkSample]) -> int:
+        """Persistiere mehrere BMK-Samples in einer Transaktion (z.B. Replay)."""
+        heating_rows = []
+        channel_rows = []
+        for sample in samples:
+            ts = normalize_db_timestamp(sample.timestamp)
+            if not ts:
+                continue
+            heating_rows.append((ts, *sample.heating_row()[1:]))
+            channel_rows.append((ts, pack_channels(sample.channels)))
+        if not heating_rows:
+            return 0
+        with self._lock:
+            self._executemany_with_retry(
+                """
+                INSERT OR REPLACE INTO heating (timestamp, kesseltemp, aussentemp, puffer_top, puffer_mid, puffer_bot, warmwasser)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                heating_rows,
+            )
+            self._executemany_with_retry(
+                "INSERT OR REPLACE INTO heating_channels (timestamp, channels) VALUES (?, ?)",
+                channel_rows,
+            )
+            self._commit_with_retry()
+            self._update_last_ingest_locked(max(row[0] for row in heating_rows))
+            self._cache_heating = None  # invalidate cache
+        return len(heating_rows)
+
+    def insert_samples(self, source: str, timestamp: str, values: dict) -> int:
+        """Persistiere Kanalwerte eines generischen Collectors (None-Werte werden übersprungen)."""
+        timestamp = normalize_db_timestamp(timestamp)
+        if not source or not timestamp or not values:
+            return 0
+        rows = [
+            (source, channel, timestamp, val)
+            for channel, val in ((ch, safe_float(v)) for ch, v in values.items())
+            if val is not None
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            self._executemany_with_retry(
+                "INSERT OR REPLACE INTO samples (source, channel, timestamp, value) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._commit_with_retry()
+        return len(rows)
+
+    def get_samples(self, source: str, channel: str, hours: Optional[int] = 24, limit: Optional[int] = None) -> List[dict]:
+        """Hole die Historie eines Collector-Kanals chronologisch."""
+        cutoff = _hours_ago_iso(hours)
+        where = "WHERE source = ? AND channel = ?" + (" AND timestamp >= ?" if cutoff else "")
+        params: list = [source, channel] + ([cutoff] if cutoff else [])
+        if limit:
+            sql = f"SELECT timestamp, value FROM samples {where} ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
+        else:
+            sql = f"SELECT timestamp, value FROM samples {where} ORDER BY timestamp ASC"
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        if limit:
+            rows.reverse()
+        return [{'timestamp': row[0], 'value': row[1]} for row in rows]
+
+    def get_last_sample(self, source: str, channel: str) -> Optional[dict]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT timestamp, value FROM samples WHERE source = ? AND channel = ? "
+                "ORDER BY timestamp DESC LIMIT 1",
+                (source, channel),
+            ).fetchone()
+        return {'timestamp': row[0], 'value': row[1]} if row else None
+
+    def get_sample_rollup(self, source: str, channel: str, hours: Optional[int] = 24, bucket_minutes: int = 60) -> List[dict]:
+        """Aggregiere einen Collector-Kanal zu Zeit-Buckets (avg/min/max/count, UTC)."""
+        bucket_s = max(60, int(bucket_minutes) * 60)
+        cutoff = _hours_ago_iso(hours)
+        where = "WHERE source = ? AND channel = ? AND value IS NOT NULL" + (" AND timestamp >= ?" if cutoff else "")
+        params: list = [bucket_s, bucket_s, source, channel] + ([cutoff] if cutoff else [])
+        sql = (
+            "SELECT (CAST(strftime('%s', timestamp) AS INTEGER) / ?) * ? AS bucket, "
+            "AVG(value), MIN(value), MAX(value), COUNT(*) "
+            f"FROM samples {where} GROUP BY bucket ORDER BY bucket ASC"
+        )
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [
+            {
+                'bucket': datetime.fromtimestamp(row[0], timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+                'avg': row[1],
+                'min': row[2],
+                'max': row[3],
+                'count': row[4],
+            }
+            for row in rows
+            if row[0] is not None
+        ]
+
     def get_recent_fronius(self, hours: int = 24, limit: Optional[int] = None) -> List[dict]:
         cutoff = _hours_ago_iso(hours)
         cursor = self.conn.cursor()
@@ -477,6 +662,39 @@ class DataStore:
             for row in rows
         ]
 
+    def get_fronius_envelope(self, hours: int = 24, limit: Optional[int] = None) -> List[dict]:
+        """Fronius-Zeilen inkl. min/max je Bucket (Hochfrequenz-Modus).
+
+        Für Einzelmessungen ohne Bucket-Statistik sind min/max gleich dem Wert.
+        """
+        cutoff = _hours_ago_iso(hours)
+        cols = ", ".join(_FRONIUS_ENVELOPE_COLUMNS)
+        where = "WHERE timestamp >= ? " if cutoff else ""
+        params: list = [cutoff] if cutoff else []
+        if limit:
+            sql = (f"SELECT timestamp, pv_power, grid_power, batt_power, load_power, soc, {cols}, samples "
+                   f"FROM fronius {where}ORDER BY timestamp DESC LIMIT ?")
+            params.append(limit)
+        else:
+            sql = (f"SELECT timestamp, pv_power, grid_power, batt_power, load_power, soc, {cols}, samples "
+                   f"FROM fronius {where}ORDER BY timestamp ASC")
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        if limit:
+            rows.reverse()
+        out = []
+        for row in rows:
+            entry = {'timestamp': row[0], 'samples': row[16] or 1}
+            for i, key in enumerate(('pv', 'grid', 'batt', 'load', 'soc')):
+                avg = row[1 + i]
+                lo = row[6 + 2 * i]
+                hi = row[7 + 2 * i]
+                entry[key] = avg
+                entry[f'{key}_min'] = avg if lo is None else lo
+                entry[f'{key}_max'] = avg if hi is None else hi
+            out.append(entry)
+        return out
+
     def get_recent_heating(self, hours: int = 24, limit: Optional[int] = None) -> List[dict]:
         cutoff = _hours_ago_iso(hours)
         cursor = self.conn.cursor()
@@ -522,6 +740,148 @@ class DataStore:
             for row in rows
         ]
 
+    def get_heating_since(self, since: Optional[str], hours: Optional[int] = None) -> List[dict]:
+        """Heizungszeilen nach ``since`` (exklusiv), chronologisch – zum inkrementellen Nachladen.
+
+        Ohne ``since`` gilt das Fenster ``hours`` (None = alles). Schema wie ``get_recent_heating``.
+        """
+        rows = self._rows_since(
+            "heating", "kesseltemp, aussentemp, puffer_top, puffer_mid, puffer_bot, warmwasser", since, hours,
+        )
+        return [
+            {
+                'timestamp': row[0],
+                'kessel': row[1],
+                'outdoor': row[2],
+                'top': row[3],
+                'mid': row[4],
+                'bot': row[5],
+                'warm': row[6],
+            }
+            for row in rows
+        ]
+
+    def get_fronius_since(self, since: Optional[str], hours: Optional[int] = None) -> List[dict]:
+        """Fronius-Zeilen nach ``since`` (exklusiv), chronologisch. Schema wie ``get_recent_fronius``."""
+        rows = self._rows_since("fronius", "pv_power, grid_power, batt_power, soc, load_power", since, hours)
+        return [
+            {
+                'timestamp': row[0],
+                'pv': row[1],
+                'grid': row[2],
+                'batt': row[3],
+                'soc': row[4],
+                'load': row[5],
+            }
+            for row in rows
+        ]
+
+    def get_rollup(
+        self,
+        table: str,
+        expressions: Dict[str, str],
+        bucket_s: int,
+        hours: Optional[int] = None,
+        before: Optional[str] = None,
+    ) -> List[dict]:
+        """Zeit-Buckets (UTC, Epoch-Start) mit avg/min/max/count je SQL-Ausdruck.
+
+        ``expressions`` bildet Namen auf Spaltenausdrücke ab (NULL = fehlt);
+        Ergebnis-Schlüssel ``<name>_avg``/``_min``/``_max``/``_count``. Zeilen ab
+        ``before`` bleiben außen vor – für den Backfill von Chart-Pyramiden.
+        """
+        if table not in ("heating", "fronius"):
+            raise ValueError(f"Unbekannte Tabelle: {table}")
+        bucket_s = max(1, int(bucket_s))
+        cutoff = _hours_ago_iso(hours)
+        clauses, params = [], [bucket_s, bucket_s]
+        if cutoff:
+            clauses.append("timestamp >= ?")
+            params.append(cutoff)
+        if before:
+            clauses.append("timestamp < ?")
+            params.append(before)
+        where = ("WHERE " + " AND ".join(clauses) + " ") if clauses else ""
+        cols = ", ".join(f"AVG({e}), MIN({e}), MAX({e}), COUNT({e})" for e in expressions.values())
+        sql = (
+            f"SELECT (CAST(strftime('%s', timestamp) AS INTEGER) / ?) * ? AS bucket, {cols} "
+            f"FROM {table} {where}GROUP BY bucket ORDER BY bucket ASC"
+        )
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        out = []
+        for row in rows:
+            if row[0] is None:
+                continue
+            entry = {'bucket': int(row[0])}
+            for i, name in enumerate(expressions):
+                base = 1 + 4 * i
+                entry[f'{name}_avg'] = row[base]
+                entry[f'{name}_min'] = row[base + 1]
+                entry[f'{name}_max'] = row[base + 2]
+                entry[f'{name}_count'] = row[base + 3]
+            out.append(entry)
+        return out
+
+    def _rows_since(self, table: str, columns: str, since: Optional[str], hours: Optional[int]) -> list:
+        if since:
+            where, params = "WHERE timestamp > ? ", [since]
+        else:
+            cutoff = _hours_ago_iso(hours)
+            where, params = ("WHERE timestamp >= ? ", [cutoff]) if cutoff else ("", [])
+        sql = f"SELECT timestamp, {columns} FROM {table} {where}ORDER BY timestamp ASC"
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def get_heating_channels(
+        self,
+        channels: Optional[Iterable[str | int]] = None,
+        hours: Optional[int] = 24,
+        limit: Optional[int] = None,
+    ) -> dict:
+        """Lese beliebige BMK-Kanäle als Arrays.
+
+        Args:
+            channels: Kanalnamen oder PP-Indizes (None = alle Kanäle).
+            hours: Zeitfenster in Stunden (None = gesamte Historie).
+            limit: Maximal N neueste Samples.
+
+        Returns:
+            Dict mit 'timestamp' (Liste von ISO-Strings, chronologisch) und
+            je Kanalname einem float32-numpy-Array (NaN = kein Wert).
+
+        Raises:
+            KeyError: Bei unbekanntem Kanal.
+        """
+        import numpy as np
+
+        indices = [channel_index(ch) for ch in channels] if channels is not None else list(range(CHANNEL_COUNT))
+        cutoff = _hours_ago_iso(hours)
+        where = "WHERE timestamp >= ? " if cutoff else ""
+        params: list = [cutoff] if cutoff else []
+        if limit:
+            sql = f"SELECT timestamp, channels FROM heating_channels {where}ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
+        else:
+            sql = f"SELECT timestamp, channels FROM heating_channels {where}ORDER BY timestamp ASC"
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        if limit:
+            rows.reverse()
+
+        blobs = [row[1] for row in rows]
+        if all(len(blob) == BLOB_SIZE for blob in blobs):
+            matrix = np.frombuffer(b"".join(blobs), dtype="<f4").reshape(len(rows), CHANNEL_COUNT)
+        else:
+            matrix = np.full((len(rows), CHANNEL_COUNT), np.nan, dtype=np.float32)
+            for row_idx, blob in enumerate(blobs):
+                vec = np.frombuffer(blob, dtype="<f4", count=min(len(blob) // 4, CHANNEL_COUNT))
+                matrix[row_idx, :vec.size] = vec
+        result: dict = {'timestamp': [row[0] for row in rows]}
+        for idx in indices:
+            result[BMK_CHANNELS[idx]] = matrix[:, idx].copy()
+        return result
+
     def get_last_heating_record(self) -> Optional[dict]:
         """
         Hole letzten Heizungs-Record als dict mit final keys (schema.py). Cached for 2s.
@@ -551,6 +911,14 @@ class DataStore:
             return result
         return None
 
+    def get_table_latest_timestamp(self, table: str) -> Optional[str]:
+        """Jüngster Zeitstempel einer Messwerttabelle (``fronius`` oder ``heating``)."""
+        if table not in ("fronius", "heating"):
+            raise ValueError(f"Unbekannte Tabelle: {table}")
+        with self._lock:
+            row = self.conn.execute(f"SELECT MAX(timestamp) FROM {table}").fetchone()
+        return row[0] if row else None
+
     def get_latest_timestamp(self) -> Optional[str]:
         with self._lock:
             return self._get_latest_timestamp_unlocked()
@@ -579,6 +947,20 @@ class DataStore:
         if last_exc:
             raise last_exc
 
+    def _executemany_with_retry(self, query: str, rows: list, retries: int = 5, base_delay: float = 0.05) -> None:
+        last_exc: Optional[Exception] = None
+        for attempt in range(retries):
+            try:
+                self.conn.executemany(query, rows)
+                return
+            except sqlite3.OperationalError as exc:
+                last_exc = exc
+                if "locked" not in str(exc).lower():
+                    raise
+                time.sleep(base_delay * (attempt + 1))
+        if last_exc:
+            raise last_exc
+
     def _commit_with_retry(self, retries: int = 5, base_delay: float = 0.05) -> None:
         last_exc: Optional[Exception] = None
         for attempt in range(retries):
@@ -619,20 +1001,24 @@ class DataStore:
         """Delete records older than retention_days. Returns counts of deleted rows."""
         cutoff = _hours_ago_iso(retention_days * 24)
         if not cutoff:
-            return {"fronius": 0, "heating": 0}
+            return {"fronius": 0, "heating": 0, "heating_channels": 0, "samples": 0}
         with self._lock:
             cursor = self.conn.cursor()
             cursor.execute("DELETE FROM fronius WHERE timestamp < ?", (cutoff,))
             fr_count = cursor.rowcount
             cursor.execute("DELETE FROM heating WHERE timestamp < ?", (cutoff,))
             ht_count = cursor.rowcount
-            if fr_count > 0 or ht_count > 0:
+            cursor.execute("DELETE FROM heating_channels WHERE timestamp < ?", (cutoff,))
+            ch_count = cursor.rowcount
+            cursor.execute("DELETE FROM samples WHERE timestamp < ?", (cutoff,))
+            sm_count = cursor.rowcount
+            if fr_count > 0 or ht_count > 0 or ch_count > 0 or sm_count > 0:
                 self._commit_with_retry()
                 logging.info(
                     f"[DB] Retention cleanup: {fr_count} fronius + {ht_count} heating records"
                     f" older than {retention_days} days deleted"
                 )
-        return {"fronius": fr_count, "heating": ht_count}
+        return {"fronius": fr_count, "heating": ht_count, "heating_channels": ch_count, "samples": sm_count}
 
     def seed_from_csv(self, data_dir: Optional[Path] = None) -> None:
         base = Path(data_dir) if data_dir else DATA_DIR
@@ -710,7 +1096,11 @@ def quick_import_if_needed():
 
 
 def _integrate_daily_energy(rows: Iterable[tuple[str, Optional[float]]]) -> List[dict]:
-    """Trapez-Integration zur Energie pro Tag (streaming, speichersparend)."""
+    """Trapez-Integration zur Energie pro Tag (streaming, speichersparend).
+
+    Tage sind Kalendertage in Ortszeit; die UTC-Zeitstempel werden je Zeile
+    (inkl. Sommer-/Winterzeit) umgerechnet.
+    """
     buckets: dict[str, dict[str, float | int]] = defaultdict(lambda: {'pv_kwh': 0.0, 'samples': 0})
     prev_ts: Optional[datetime] = None
     prev_power: Optional[float] = None
@@ -719,7 +1109,7 @@ def _integrate_daily_energy(rows: Iterable[tuple[str, Optional[float]]]) -> List
         if ts is None or pv is None:
             continue
         try:
-            cur_ts = ensure_utc(datetime.fromisoformat(ts))
+            cur_ts = ensure_utc(datetime.fromisoformat(ts)).astimezone()
             cur_power = float(pv)
         except ValueError:
             continue
@@ -754,7 +1144,7 @@ def _distribute_segment_energy(
     end_ts: datetime,
     end_power: float,
 ) -> None:
-    """Verteile eine Messspanne auf die jeweils betroffenen Kalendertage."""
+    """Verteile eine Messspanne auf die jeweils betroffenen Kalendertage (Ortszeit)."""
     current_ts = start_ts
     current_power = start_power
     final_ts = end_ts
@@ -764,13 +1154,14 @@ def _distribute_segment_energy(
         if hours <= 0:
             return
         energy = (p_start + p_end) / 2.0 * hours
-        day_key = ensure_utc(day_ts).date().isoformat()
+        day_key = day_ts.date().isoformat()
         bucket = buckets[day_key]
         bucket['pv_kwh'] += energy
         bucket['samples'] += 1
 
     while current_ts.date() != final_ts.date():
-        boundary = ensure_utc(datetime.combine(current_ts.date() + timedelta(days=1), datetime.min.time()))
+        # Lokale Mitternacht; astimezone() wählt den zum Tag passenden Offset
+        boundary = datetime.combine(current_ts.date() + timedelta(days=1), datetime.min.time()).astimezone()
         total_hours = (final_ts - current_ts).total_seconds() / 3600
         if total_hours <= 0:
             return
@@ -795,6 +1186,22 @@ def _hours_ago_iso(hours: int | None) -> Optional[str]:
     return (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _rewrite_timestamps(cursor, table: str, where: str, expression: str) -> int:
+    """Zeilen mit ``where`` neu einfügen, ``timestamp`` durch ``expression`` ersetzt."""
+    cols = [row[1] for row in cursor.execute(f"PRAGMA table_info({table})").fetchall()]
+    select = ", ".join(
+        f"COALESCE({expression}, timestamp) AS timestamp" if col == "timestamp" else col for col in cols
+    )
+    cursor.execute("DROP TABLE IF EXISTS temp._ts_moved")
+    cursor.execute(f"CREATE TEMP TABLE _ts_moved AS SELECT {select} FROM {table} WHERE {where}")
+    count = cursor.execute("SELECT COUNT(*) FROM temp._ts_moved").fetchone()[0]
+    if count:
+        cursor.execute(f"DELETE FROM {table} WHERE {where}")
+        cursor.execute(f"INSERT OR IGNORE INTO {table} ({', '.join(cols)}) SELECT * FROM temp._ts_moved")
+    cursor.execute("DROP TABLE temp._ts_moved")
+    return count
+
+
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
@@ -803,16 +1210,8 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
         # Accept common ISO UTC suffix.
         if raw.endswith("Z"):
             raw = raw[:-1] + "+00:00"
-        dt = datetime.fromisoformat(raw)
-        # Optional correction: if source stores local timestamps without tzinfo.
-        # Default remains "treat naive as UTC" (existing behavior).
-        if dt.tzinfo is None and os.environ.get("DASHBOARD_TS_ASSUME_LOCAL", "").strip().lower() in ("1", "true", "yes", "on"):
-            try:
-                local_tz = datetime.now().astimezone().tzinfo
-                dt = dt.replace(tzinfo=local_tz).astimezone(timezone.utc)
-            except Exception:
-                pass
-        return dt
+        # Naive Werte sind UTC (Alt-Zeilen in Ortszeit migriert _init_db)
+        return datetime.fromisoformat(raw)
     except Exception:
         return None
 
@@ -841,5 +1240,22 @@ def _normalize_power_kw(value: Optional[float]) -> Optional[float]:
     return v
 
 
+def _normalize_power_envelope_kw(
+    low: Optional[float], high: Optional[float]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Min/Max eines Buckets gemeinsam nach kW normalisieren.
+
+    Liegt eine der beiden Grenzen in W vor, werden beide umgerechnet, damit
+    ein kleines Minimum (z.B. 150 W) nicht als kW stehen bleibt.
+    """
+    values = [v for v in (low, high) if v is not None]
+    if not any(abs(v) > 200.0 for v in values):
+        return low, high
+    return (
+        low / 1000.0 if low is not None else None,
+        high / 1000.0 if high is not None else None,
+    )
+
+
 if __name__ == "__main__":
     quick_import_if_needed()
@@ -0,0 +1,140 @@
+"""Formtreues Ausdünnen von Linien für das Zeichnen.
+
+Mittelwert-Bins glätten genau die Spitzen weg, auf die es ankommt
+(Kessel-Aufheizen, PV-Peaks). Zwei Verfahren begrenzen stattdessen die
+Punkte je Linie auf etwa die Pixelbreite und behalten die Form:
+
+- ``lttb_indices``: Largest-Triangle-Three-Buckets – je Bucket der Punkt,
+  der mit dem zuletzt gewählten Punkt und dem Mittel des nächsten Buckets
+  das größte Dreieck bildet. Ergibt ``max_points`` Punkte, sieht aus wie
+  das Original.
+- ``minmax_indices``: Min/Max-Hüllkurve – je Bucket Minimum und Maximum in
+  Zeitreihenfolge. Jeder Extremwert bleibt exakt erhalten (bis zu
+  ``2 * buckets`` Punkte).
+
+Beide arbeiten auf Indizes, damit mehrere Reihen mit gemeinsamer x-Achse
+dieselbe Auswahl nutzen können. Für bereits gebinnte Daten (LOD-Stufen mit
+Min/Max je Bucket) zeichnet ``envelope`` beide Extreme als eine Linie. NaN-Lücken bleiben als Lücke erhalten
+(der erste NaN-Punkt nach gültigen Werten wird mitgenommen).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+LTTB = "lttb"
+MINMAX = "minmax"
+
+
+def _finite(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    finite = np.isfinite(x) & np.isfinite(y)
+    # Erster ungültiger Punkt nach gültigen Werten: Linie bricht dort ab
+    gaps = np.flatnonzero(~finite & np.r_[False, finite[:-1]])
+    return np.flatnonzero(finite), gaps
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], max_points: int) -> np.ndarray:
+    """Indizes der LTTB-Auswahl (aufsteigend, erster und letzter gültiger Punkt immer dabei)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid, gaps = _finite(x, y)
+    n = len(valid)
+    max_points = int(max_points)
+    if n <= max_points or max_points < 3:
+        return np.union1d(valid, gaps)
+    xf, yf = x[valid], y[valid]
+    every = (n - 2) / (max_points - 2)
+    bounds = np.floor(np.arange(max_points - 1) * every).astype(np.int64) + 1
+    bounds[-1] = n - 1
+    out = np.empty(max_points, dtype=np.int64)
+    out[0] = 0
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        nlo = hi
+        nhi = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x = xf[nlo:nhi].mean()
+        avg_y = yf[nlo:nhi].mean()
+        area = np.abs((xf[a] - avg_x) * (yf[lo:hi] - yf[a]) - (xf[a] - xf[lo:hi]) * (avg_y - yf[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    out[-1] = n - 1
+    return np.union1d(valid[out], gaps)
+
+
+def minmax_indices(x: Sequence[float], y: Sequence[float], buckets: int) -> np.ndarray:
+    """Indizes von Minimum und Maximum je Bucket (gleich viele Punkte je Bucket), plus Rand."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid, gaps = _finite(x, y)
+    n = len(valid)
+    buckets = max(1, int(buckets))
+    if n <= 2 * buckets:
+        return np.union1d(valid, gaps)
+    yf = y[valid]
+    bucket = np.arange(n, dtype=np.int64) * buckets // n
+    order = np.lexsort((yf, bucket))
+    starts = np.flatnonzero(np.r_[True, bucket[order][1:] != bucket[order][:-1]])
+    ends = np.r_[starts[1:] - 1, n - 1]
+    picks = np.concatenate([order[starts], order[ends], [0, n - 1]])
+    return np.union1d(valid[picks], gaps)
+
+
+def select(x: Sequence[float], y: Sequence[float], max_points: int, method: str = LTTB) -> np.ndarray:
+    """Indizes für höchstens ~``max_points`` Punkte nach ``method`` (``"lttb"`` oder ``"minmax"``)."""
+    if method == MINMAX:
+        return minmax_indices(x, y, max(1, int(max_points) // 2))
+    if method == LTTB:
+        return lttb_indices(x, y, max_points)
+    raise ValueError(f"Unbekanntes Verfahren: {method}")
+
+
+def select_union(x: Sequence[float], ys: Iterable[Sequence[float]], max_points: int, method: str = LTTB) -> np.ndarray:
+    """Gemeinsame Auswahl für mehrere Reihen auf derselben x-Achse (z.B. für ``fill_between``)."""
+    picks = [select(x, y, max_points, method) for y in ys]
+    if not picks:
+        return np.zeros(0, dtype=np.int64)
+    return np.unique(np.concatenate(picks))
+
+
+def downsample(x: Sequence[float], y: Sequence[float], max_points: int, method: str = LTTB) -> Tuple[np.ndarray, np.ndarray]:
+    """``(x, y)`` auf höchstens ~``max_points`` Punkte ausdünnen."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    idx = select(x, y, max_points, method)
+    return x[idx], y[idx]
+
+
+def envelope(
+    x: Sequence[float], lo: Sequence[float], hi: Sequence[float], max_points: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Min und Max je Bucket als eine Linie, auf ~``max_points`` Punkte ausgedünnt.
+
+    Je Bucket kommen beide Extreme an dessen x-Position, in Trendrichtung
+    geordnet (steigend: erst Min, dann Max), damit die Linie nicht unnötig
+    springt. Spitzen innerhalb eines Buckets bleiben so sichtbar.
+    """
+    x = np.asarray(x, dtype=float)
+    lo = np.asarray(lo, dtype=float)
+    hi = np.asarray(hi, dtype=float)
+    if not len(x):
+        return x, lo
+    with np.errstate(invalid="ignore"):
+        rising = np.r_[np.diff((lo + hi) / 2.0) >= 0, True]
+    xs = np.repeat(x, 2)
+    ys = np.column_stack([np.where(rising, lo, hi), np.where(rising, hi, lo)]).ravel()
+    idx = minmax_indices(xs, ys, max(1, int(max_points) // 2))
+    return xs[idx], ys[idx]
+
+
+def downsample_pairs(pairs: Sequence[Tuple[T, float]], max_points: int, method: str = LTTB) -> List[Tuple[T, float]]:
+    """Liste von ``(zeit, wert)`` ausdünnen; Zeiten als ``datetime`` oder Zahl."""
+    if len(pairs) <= max_points:
+        return list(pairs)
+    x = [t.timestamp() if hasattr(t, "timestamp") else float(t) for t, _ in pairs]
+    y = [value for _, value in pairs]
+    return [pairs[i] for i in select(x, y, max_points, method).tolist()]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 import threading
-from typing import Dict
+from typing import Deque, Dict
 
 
 @dataclass
@@ -16,8 +17,39 @@ class SourceHealth:
     last_error_msg: str | None = None
 
 
+@dataclass
+class StageStats:
+    """Rollierende Statistik einer Pipeline-Stufe (Werte in ms)."""
+    count: int
+    last_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    histogram: Dict[str, int]
+
+
+@dataclass
+class StallStats:
+    """Blockaden der Tk-Mainloop an einer Aufrufstelle (Dauer in ms)."""
+    site: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last: datetime | None = None
+
+
+# Pipeline-Stufen der Collector: HTTP, Parsen, DB-Insert, Queue bis MainApp, fetch..notify
+STAGES = ("fetch", "parse", "persist", "ui", "total")
+
+# Obergrenzen der Histogramm-Buckets in ms (letzter Bucket: darüber)
+HISTOGRAM_BOUNDS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_STAGE_WINDOW = 240  # ~40 min bei 10-s-Takt
+
 _LOCK = threading.Lock()
 _HEALTH: Dict[str, SourceHealth] = {}
+_STAGES: Dict[str, Dict[str, Deque[float]]] = {}
+_STALLS: Dict[str, StallStats] = {}
 
 
 def update_source_health(name: str, ok: bool, latency_ms: int | None = None, error: str | None = None) -> None:
@@ -40,3 +72,70 @@ def update_source_health(name: str, ok: bool, latency_ms: int | None = None, err
 def get_health_snapshot() -> Dict[str, SourceHealth]:
     with _LOCK:
         return {name: SourceHealth(**vars(entry)) for name, entry in _HEALTH.items()}
+
+
+def record_stage(name: str, stage: str, duration_ms: float) -> None:
+    """Dauer einer Pipeline-Stufe für eine Quelle festhalten."""
+    with _LOCK:
+        stages = _STAGES.setdefault(name, {})
+        ring = stages.get(stage)
+        if ring is None:
+            ring = stages[stage] = deque(maxlen=_STAGE_WINDOW)
+        ring.append(float(duration_ms))
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def _histogram(values: list[float]) -> Dict[str, int]:
+    labels = [f"<={b}" for b in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+    counts = dict.fromkeys(labels, 0)
+    for val in values:
+        for bound, label in zip(HISTOGRAM_BOUNDS_MS, labels):
+            if val <= bound:
+                counts[label] += 1
+                break
+        else:
+            counts[labels[-1]] += 1
+    return counts
+
+
+def get_stage_snapshot() -> Dict[str, Dict[str, StageStats]]:
+    """Statistik aller Stufen je Quelle über das rollierende Fenster."""
+    with _LOCK:
+        raw = {name: {stage: list(ring) for stage, ring in stages.items()} for name, stages in _STAGES.items()}
+    out: Dict[str, Dict[str, StageStats]] = {}
+    for name, stages in raw.items():
+        out[name] = {}
+        for stage, values in stages.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            out[name][stage] = StageStats(
+                count=len(values),
+                last_ms=values[-1],
+                p50_ms=_percentile(ordered, 50),
+                p95_ms=_percentile(ordered, 95),
+                max_ms=ordered[-1],
+                histogram=_histogram(values),
+            )
+    return out
+
+
+def record_stall(site: str, duration_ms: float) -> None:
+    """Blockade der Tk-Mainloop an ``site`` (z.B. 'tabs/spotify.py:412 _load_cover') zählen."""
+    with _LOCK:
+        entry = _STALLS.get(site)
+        if entry is None:
+            entry = _STALLS[site] = StallStats(site=site)
+        entry.count += 1
+        entry.total_ms += float(duration_ms)
+        entry.max_ms = max(entry.max_ms, float(duration_ms))
+        entry.last = datetime.now()
+
+
+def get_stall_snapshot() -> Dict[str, StallStats]:
+    with _LOCK:
+        return {site: StallStats(**vars(entry)) for site, entry in _STALLS.items()}
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 
 def parse_iso_dt(value: str | None) -> datetime | None:
-    """Parse ISO timestamp string, treating naive timestamps as local time."""
+    """Parse ISO timestamp string, treating naive timestamps as UTC (DataStore convention)."""
     if not value:
         return None
     try:
@@ -16,7 +16,7 @@ def parse_iso_dt(value: str | None) -> datetime | None:
             raw = raw[:-1] + "+00:00"
         dt = datetime.fromisoformat(raw)
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
+            dt = dt.replace(tzinfo=timezone.utc)
         return dt
     except Exception:
         return None
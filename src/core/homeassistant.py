@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from .collectors import Collector
+
 
 @dataclass(frozen=True)
 class HomeAssistantConfig:
@@ -31,6 +33,8 @@ class HomeAssistantConfig:
     force_away_webhook_id: Optional[str] = None
     force_home_webhook_id: Optional[str] = None
     actions: Optional[List[Dict[str, Any]]] = None
+    sensor_entity_ids: Optional[List[str]] = None
+    sensor_interval_s: float = 60.0
 
 
 def _read_json_file(path: str) -> Optional[dict]:
@@ -106,6 +110,17 @@ def load_homeassistant_config(config_path: Optional[str] = None) -> Optional[Hom
     else:
         dim_entity_ids = None
 
+    sensor_ids = file_cfg.get("sensor_entity_ids")
+    if isinstance(sensor_ids, list):
+        sensor_entity_ids = [str(x).strip() for x in sensor_ids if str(x).strip()] or None
+    else:
+        sensor_entity_ids = None
+
+    try:
+        sensor_interval_s = max(5.0, float(file_cfg.get("sensor_interval_s", 60.0)))
+    except Exception:
+        sensor_interval_s = 60.0
+
     raw_actions = file_cfg.get("actions")
     actions: Optional[List[Dict[str, Any]]] = None
     if isinstance(raw_actions, list):
@@ -174,6 +189,8 @@ def load_homeassistant_config(config_path: Optional[str] = None) -> Optional[Hom
         force_away_webhook_id=_opt_str("force_away_webhook_id"),
         force_home_webhook_id=_opt_str("force_home_webhook_id"),
         actions=actions,
+        sensor_entity_ids=sensor_entity_ids,
+        sensor_interval_s=sensor_interval_s,
     )
 
 
@@ -480,3 +497,34 @@ class HomeAssistantClient:
             pass
 
         return bool(ok)
+
+
+class HomeAssistantSensorCollector(Collector):
+    """Numerische HA-Sensoren (``sensor_entity_ids``) in die samples-Tabelle."""
+
+    name = "homeassistant"
+
+    def __init__(self, client: HomeAssistantClient):
+        self.client = client
+        self.schema = tuple(client.config.sensor_entity_ids or ())
+        self.interval_s = client.config.sensor_interval_s
+
+    def fetch(self) -> Dict[str, Any]:
+        wanted = set(self.schema)
+        return {
+            str(st.get("entity_id")): st.get("state")
+            for st in self.client.get_states()
+            if st.get("entity_id") in wanted
+        }
+
+    def parse(self, raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        values: Dict[str, Any] = {}
+        for entity_id, state in (raw or {}).items():
+            try:
+                values[entity_id] = float(state)
+            except (TypeError, ValueError):
+                continue  # "unavailable", "unknown", ...
+        if not values:
+            return None
+        values["timestamp"] = self.sample_timestamp()
+        return values
@@ -0,0 +1,296 @@
+"""Level-of-Detail-Pyramide für Zeitreihen (min/max/avg je Zeit-Bucket).
+
+Stufe 0 sind die Rohwerte der letzten ``raw_seconds``, jede weitere Stufe
+fasst die Samples in festen UTC-Buckets (``LEVEL_SECONDS``) zu Summe,
+Anzahl, Minimum und Maximum je Kanal zusammen. ``extend`` hängt neue
+Samples an – nur der letzte Bucket jeder Stufe wird dabei zusammengeführt,
+alles davor bleibt unverändert. Ältere Historie kommt als fertige Buckets
+über ``extend_buckets`` (z.B. aus einem SQL-Rollup), ohne Rohzeilen.
+
+``query(start, end, pixels)`` wählt die feinste Stufe, die im Fenster
+höchstens ``pixels`` Punkte liefert. Damit kostet ein Frame unabhängig vom
+Zeitraum ungefähr gleich viel – 24 h Rohdaten und 365 d Tagesbuckets
+werden gleich schnell gezeichnet.
+
+Die Klasse ist nicht thread-sicher; ``core.chart_data`` serialisiert die
+Zugriffe.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.binning import Stats, bucket_stats, group_stats, sample_stats
+
+LEVEL_SECONDS: Tuple[int, ...] = (300, 900, 3600, 3 * 3600, 6 * 3600, 24 * 3600)
+RAW_SECONDS = 48 * 3600
+
+
+class _Column:
+    """Wachsendes NumPy-Array (Kapazität verdoppelt sich, amortisiert O(1) je Element)."""
+
+    def __init__(self, dtype, fill=0):
+        self._data = np.full(64, fill, dtype=dtype)
+        self._fill = fill
+        self.size = 0
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[: self.size]
+
+    def append(self, values: np.ndarray) -> None:
+        need = self.size + len(values)
+        if need > len(self._data):
+            grown = np.full(max(need, 2 * len(self._data)), self._fill, dtype=self._data.dtype)
+            grown[: self.size] = self._data[: self.size]
+            self._data = grown
+        self._data[self.size:need] = values
+        self.size = need
+
+    def drop_front(self, count: int) -> None:
+        if count <= 0:
+            return
+        keep = self._data[count: self.size].copy()
+        self._data = np.full(max(64, 2 * len(keep)), self._fill, dtype=self._data.dtype)
+        self._data[: len(keep)] = keep
+        self.size = len(keep)
+
+
+class _Level:
+    def __init__(self, bucket_s: int, channels: Sequence[str]):
+        self.bucket_s = bucket_s
+        self.ids = _Column(np.int64)
+        self.sum = {c: _Column(np.float64) for c in channels}
+        self.count = {c: _Column(np.int32) for c in channels}
+        self.min = {c: _Column(np.float32, np.nan) for c in channels}
+        self.max = {c: _Column(np.float32, np.nan) for c in channels}
+
+    def extend(self, t: np.ndarray, stats: Mapping[str, Stats]) -> None:
+        """``t``: Zeitpunkte (Sekunden) der Eingangs-Samples bzw. feineren Buckets."""
+        ids, grouped = group_stats(np.floor_divide(t, self.bucket_s).astype(np.int64), stats)
+        if not len(ids):
+            return
+        first = 0
+        # Erster neuer Bucket = letzter vorhandener: zusammenführen statt anhängen
+        if self.ids.size and ids[0] == self.ids.values[-1]:
+            for c, (sums, counts, mins, maxs) in grouped.items():
+                self.sum[c].values[-1] += sums[0]
+                self.count[c].values[-1] += counts[0]
+                self.min[c].values[-1] = np.fmin(self.min[c].values[-1], mins[0])
+                self.max[c].values[-1] = np.fmax(self.max[c].values[-1], maxs[0])
+            first = 1
+        if first >= len(ids):
+            return
+        self.ids.append(ids[first:])
+        for c, (sums, counts, mins, maxs) in grouped.items():
+            self.sum[c].append(sums[first:])
+            self.count[c].append(counts[first:])
+            self.min[c].append(mins[first:])
+            self.max[c].append(maxs[first:])
+
+    def drop_before(self, t: float) -> None:
+        count = int(np.searchsorted(self.ids.values, int(t // self.bucket_s), side="left"))
+        for col in (self.ids, *self.sum.values(), *self.count.values(), *self.min.values(), *self.max.values()):
+            col.drop_front(count)
+
+
+@dataclass
+class LodSlice:
+    """Ausschnitt einer Stufe; ``t`` in Epoch-Sekunden (Bucket-Mitte bzw. Sample-Zeit)."""
+
+    level: int
+    bucket_s: int  # 0 = Rohwerte
+    t: np.ndarray
+    avg: Dict[str, np.ndarray] = field(default_factory=dict)
+    min: Dict[str, np.ndarray] = field(default_factory=dict)
+    max: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+
+class LodPyramid:
+    """Rohwerte plus aggregierte Stufen für eine Gruppe von Kanälen."""
+
+    def __init__(
+        self,
+        channels: Iterable[str],
+        level_seconds: Sequence[int] = LEVEL_SECONDS,
+        raw_seconds: float = RAW_SECONDS,
+    ):
+        self.channels = tuple(channels)
+        self.raw_seconds = float(raw_seconds)
+        self._raw_t = _Column(np.float64)
+        self._raw = {c: _Column(np.float32, np.nan) for c in self.channels}
+        self._levels = [_Level(int(s), self.channels) for s in level_seconds]
+        self._last_t: Optional[float] = None
+        self.version = 0
+
+    @property
+    def last_t(self) -> Optional[float]:
+        """Jüngster bekannter Zeitpunkt (Rohwert oder Bucket-Ende)."""
+        return self._last_t
+
+    @property
+    def first_t(self) -> Optional[float]:
+        level = self._levels[0] if self._levels else None
+        if level is not None and level.ids.size:
+            return float(level.ids.values[0] * level.bucket_s)
+        return float(self._raw_t.values[0]) if self._raw_t.size else None
+
+    @property
+    def level_seconds(self) -> Tuple[int, ...]:
+        return (0,) + tuple(level.bucket_s for level in self._levels)
+
+    @property
+    def raw_count(self) -> int:
+        return self._raw_t.size
+
+    def extend(self, t: Sequence[float], values: Mapping[str, Sequence[float]]) -> int:
+        """Rohwerte anhängen; Zeitpunkte bis ``last_t`` werden übersprungen."""
+        t = np.asarray(t, dtype=np.float64)
+        if not len(t):
+            return 0
+        order = np.argsort(t, kind="stable")
+        t = t[order]
+        cols = {c: np.asarray(values.get(c, np.full(len(t), np.nan)), dtype=float)[order] for c in self.channels}
+        if self._last_t is not None:
+            keep = t > self._last_t
+            if not keep.all():
+                t = t[keep]
+                cols = {c: v[keep] for c, v in cols.items()}
+        if not len(t):
+            return 0
+        self._raw_t.append(t)
+        for c, v in cols.items():
+            self._raw[c].append(v)
+        stats = {c: sample_stats(v) for c, v in cols.items()}
+        for level in self._levels:
+            level.extend(t, stats)
+        self._last_t = float(t[-1])
+        self._trim_raw()
+        self.version += 1
+        return len(t)
+
+    def extend_buckets(self, bucket_s: int, starts: Sequence[float], stats: Mapping[str, Stats]) -> int:
+        """Fertige Buckets (Start in Epoch-Sekunden) in alle Stufen >= ``bucket_s`` übernehmen.
+
+        Für den Backfill älterer Historie; muss vor den Rohwerten desselben Zeitraums kommen.
+        """
+        starts = np.asarray(starts, dtype=np.float64)
+        if not len(starts):
+            return 0
+        if self._last_t is not None:
+            keep = starts >= self._last_t
+            starts = starts[keep]
+            stats = {c: tuple(np.asarray(a)[keep] for a in s) for c, s in stats.items()}
+            if not len(starts):
+                return 0
+        full = {
+            c: stats.get(c) or (np.zeros(len(starts)), np.zeros(len(starts)), np.full(len(starts), np.nan), np.full(len(starts), np.nan))
+            for c in self.channels
+        }
+        for level in self._levels:
+            if level.bucket_s >= bucket_s and level.bucket_s % bucket_s == 0:
+                level.extend(starts, full)
+        self._last_t = float(starts[-1] + bucket_s - 1)
+        self.version += 1
+        return len(starts)
+
+    def drop_before(self, t: float) -> None:
+        """Alles vor ``t`` verwerfen (Aufbewahrungsfrist); Buckets nur ganz."""
+        count = int(np.searchsorted(self._raw_t.values, t, side="left"))
+        self._raw_t.drop_front(count)
+        for col in self._raw.values():
+            col.drop_front(count)
+        for level in self._levels:
+            level.drop_before(t)
+        self.version += 1
+
+    def _trim_raw(self) -> None:
+        # Erst bei 25 % Überhang kürzen, damit nicht jeder Refresh kopiert
+        if not self._raw_t.size:
+            return
+        cutoff = self._raw_t.values[-1] - self.raw_seconds
+        if self._raw_t.values[0] >= cutoff - 0.25 * self.raw_seconds:
+            return
+        count = int(np.searchsorted(self._raw_t.values, cutoff, side="left"))
+        self._raw_t.drop_front(count)
+        for col in self._raw.values():
+            col.drop_front(count)
+
+    def choose_level(self, start: float, end: float, pixels: int) -> int:
+        """Feinste Stufe mit höchstens ``pixels`` Punkten im Fenster.
+
+        Rohwerte nur, wenn sie das Fenster abdecken.
+        """
+        pixels = max(1, int(pixels))
+        raw_t = self._raw_t.values
+        if raw_t.size and raw_t[0] <= start:
+            lo, hi = np.searchsorted(raw_t, [start, end], side="left")
+            if hi - lo <= pixels:
+                return 0
+        span = max(0.0, end - start)
+        for index, level in enumerate(self._levels, start=1):
+            if span / level.bucket_s <= pixels:
+                return index
+        return len(self._levels)
+
+    def query(self, start: float, end: float, pixels: int, level: Optional[int] = None) -> LodSlice:
+        """Daten für ``[start, end]`` in passender Auflösung (inkl. je eines Punkts links/rechts)."""
+        if level is None:
+            level = self.choose_level(start, end, pixels)
+        if level == 0:
+            times = self._raw_t.values
+            lo, hi = self._bounds(times, start, end)
+            out = LodSlice(0, 0, times[lo:hi].copy())
+            for c in self.channels:
+                v = self._raw[c].values[lo:hi].astype(float)
+                out.avg[c] = v
+                out.min[c] = v
+                out.max[c] = v
+            return out
+        lvl = self._levels[level - 1]
+        ids = lvl.ids.values
+        lo, hi = self._bounds(ids, start // lvl.bucket_s, end // lvl.bucket_s)
+        out = LodSlice(level, lvl.bucket_s, ids[lo:hi] * float(lvl.bucket_s) + lvl.bucket_s / 2.0)
+        for c in self.channels:
+            counts = lvl.count[c].values[lo:hi]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out.avg[c] = np.where(counts > 0, lvl.sum[c].values[lo:hi] / np.maximum(counts, 1), np.nan)
+            out.min[c] = lvl.min[c].values[lo:hi].astype(float)
+            out.max[c] = lvl.max[c].values[lo:hi].astype(float)
+        return out
+
+    def bins(self, channel: str, start: float, end: float, bucket_s: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Bucket-Starts und Mittelwerte eines Kanals in ``[start, end)``, nur Buckets mit Werten.
+
+        Ist ``bucket_s`` eine Stufe, wird sie direkt gelesen (inkrementell
+        gepflegt); sonst werden die Rohwerte des Fensters neu gruppiert.
+        """
+        bucket_s = int(bucket_s)
+        lo_id, hi_id = start // bucket_s, end // bucket_s
+        level = next((lvl for lvl in self._levels if lvl.bucket_s == bucket_s), None)
+        if level is not None:
+            ids = level.ids.values
+            lo, hi = np.searchsorted(ids, [lo_id, hi_id], side="left")
+            ids = ids[lo:hi]
+            sums = level.sum[channel].values[lo:hi]
+            counts = level.count[channel].values[lo:hi]
+        else:
+            times = self._raw_t.values
+            lo, hi = np.searchsorted(times, [lo_id * bucket_s, hi_id * bucket_s], side="left")
+            ids, grouped = bucket_stats(times[lo:hi], {channel: self._raw[channel].values[lo:hi]}, bucket_s)
+            sums, counts = grouped[channel][:2] if len(ids) else (np.zeros(0), np.zeros(0))
+        valid = counts > 0
+        return ids[valid] * float(bucket_s), sums[valid] / counts[valid]
+
+    @staticmethod
+    def _bounds(keys: np.ndarray, start: float, end: float) -> Tuple[int, int]:
+        # Ein Nachbar links/rechts, damit Linien bis an den Rand reichen
+        lo = max(0, int(np.searchsorted(keys, start, side="left")) - 1)
+        hi = min(len(keys), int(np.searchsorted(keys, end, side="right")) + 1)
+        return lo, hi
@@ -0,0 +1,155 @@
+"""Gemeinsame Kurzzeit-Reihen für Sparklines (PV, Außentemperatur, Puffer).
+
+Sparklines in mehreren Views brauchen dieselben Reihen (z.B. PV der
+letzten 24 h in 15-Minuten-Bins). ``RecentSeries`` berechnet jede
+Kombination (Kanal, Fenster, Bin, Glättung) einmal je Datenstand und gibt
+allen Views dasselbe Ergebnis.
+
+Die Daten kommen aus eigenen ``ChartSource``-Pyramiden über die letzten
+``RECENT_DAYS`` Tage vor dem jüngsten Sample (bei pausierter Erfassung
+also nicht leer): ein neues Sample landet per ``refresh`` nur im jeweils
+letzten Bucket, statt 24 h neu zu binnen. Ohne DB-Daten gibt es
+einen gemeinsamen Puffer der Live-Samples (``record``/``live``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Tuple
+
+import numpy as np
+
+from core.binning import bin_series
+from core.chart_data import FRONIUS_CHANNELS, HEATING_CHANNELS, ChartSource, clean_fronius, clean_heating
+from core.schema import PV_POWER_KW
+
+Series = List[Tuple[datetime, float]]
+
+# Sparkline-Kanal -> Quelle
+CHANNEL_SOURCES: Dict[str, str] = {"pv": "fronius", "outdoor": "heating", "mid": "heating"}
+# Live-Sample-Keys (Payload der App) je Kanal
+LIVE_KEYS: Dict[str, str] = {"pv": PV_POWER_KW, "outdoor": "outdoor"}
+
+RECENT_DAYS = 2
+STALE_S = 3600.0
+LIVE_INTERVAL_S = 60.0
+
+
+def smooth(values: np.ndarray, window: int = 5) -> np.ndarray:
+    """Zentrierter gleitender Mittelwert; an den Rändern über die vorhandenen Nachbarn."""
+    values = np.asarray(values, dtype=float)
+    if window <= 1 or len(values) < window:
+        return values
+    half = window // 2
+    csum = np.r_[0.0, np.cumsum(values)]
+    idx = np.arange(len(values))
+    lo = np.maximum(0, idx - half)
+    hi = np.minimum(len(values), idx + half + 1)
+    return (csum[hi] - csum[lo]) / (hi - lo)
+
+
+def _to_series(starts: np.ndarray, values: np.ndarray) -> Series:
+    return [(datetime.fromtimestamp(t), float(v)) for t, v in zip(starts.tolist(), values.tolist())]
+
+
+class RecentSeries:
+    """Geteilte, je Datenstand gecachte Sparkline-Reihen."""
+
+    def __init__(
+        self,
+        sources: Mapping[str, ChartSource],
+        clock: Callable[[], float] = time.time,
+        stale_s: float = STALE_S,
+        live_maxlen: int = 2000,
+    ):
+        self._sources = dict(sources)
+        self._clock = clock
+        self.stale_s = stale_s
+        self._lock = threading.Lock()
+        self._cache: Dict[Hashable, Tuple[Hashable, Series]] = {}
+        self._live = {name: deque(maxlen=live_maxlen) for name in LIVE_KEYS}
+        self._last_live = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def series(self, channel: str, hours: float = 24, bin_minutes: int = 15, smooth_window: int = 5) -> Series:
+        """Gebinnte, geglättete Reihe (Bin-Start in Ortszeit, Wert).
+
+        Liegt das jüngste Sample über ``stale_s`` zurück, endet das Fenster
+        dort statt jetzt – die Sparkline bleibt bei pausierter Erfassung
+        gefüllt. Das Ergebnis wird geteilt und darf nicht verändert werden.
+        """
+        source = self._sources[CHANNEL_SOURCES[channel]]
+        source.refresh()
+        bin_s = max(60, int(bin_minutes * 60))
+        now = self._clock()
+        last = source.pyramid.last_t
+        end = now if last is None or now - last <= self.stale_s else last
+        key = (channel, float(hours), bin_s, smooth_window)
+        stamp = (source.version, int(end // bin_s))
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                self.hits += 1
+                return hit[1]
+            self.misses += 1
+        starts, avg = source.bins(channel, end - hours * 3600.0, end + bin_s, bin_s)
+        result = _to_series(starts, smooth(avg, smooth_window))
+        with self._lock:
+            self._cache[key] = (stamp, result)
+        return result
+
+    def record(self, data: Mapping[str, Any]) -> None:
+        """Live-Sample aus dem App-Payload merken (höchstens eins je ``LIVE_INTERVAL_S``)."""
+        now = self._clock()
+        with self._lock:
+            if now - self._last_live < LIVE_INTERVAL_S:
+                return
+            self._last_live = now
+            for name, key in LIVE_KEYS.items():
+                try:
+                    value = float(data.get(key))
+                except (TypeError, ValueError):
+                    continue
+                if np.isfinite(value):
+                    self._live[name].append((now, max(0.0, value) if name == "pv" else value))
+
+    def live(self, channel: str, hours: float = 6, bin_minutes: int = 5, smooth_window: int = 5) -> Series:
+        """Reihe aus den Live-Samples – Rückfall, solange die DB nichts liefert."""
+        with self._lock:
+            samples = list(self._live.get(channel, ()))
+        cutoff = self._clock() - hours * 3600.0
+        samples = [s for s in samples if s[0] >= cutoff]
+        if not samples:
+            return []
+        bin_s = max(60, int(bin_minutes * 60))
+        t, v = (np.array(col, dtype=float) for col in zip(*samples))
+        bins = bin_series(t, {"v": v}, bin_s)
+        return _to_series(bins.start, smooth(bins.mean["v"], smooth_window))
+
+
+_LOCK = threading.Lock()
+
+
+def get_recent_series(store: Any) -> RecentSeries:
+    """Ein ``RecentSeries`` je Store, geteilt von allen Sparkline-Views."""
+    with _LOCK:
+        service = getattr(store, "_recent_series", None)
+        if service is None:
+            service = RecentSeries({
+                "fronius": ChartSource(
+                    lambda since, hours: store.get_fronius_since(since, hours=hours),
+                    FRONIUS_CHANNELS, clean_fronius, retention_days=RECENT_DAYS,
+                    fetch_latest=lambda: store.get_table_latest_timestamp("fronius"),
+                ),
+                "heating": ChartSource(
+                    lambda since, hours: store.get_heating_since(since, hours=hours),
+                    HEATING_CHANNELS, clean_heating, retention_days=RECENT_DAYS,
+                    fetch_latest=lambda: store.get_table_latest_timestamp("heating"),
+                ),
+            })
+            store._recent_series = service
+        return service
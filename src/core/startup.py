@@ -0,0 +1,289 @@
+"""Startzeit: gecachte Umgebungs-Proben und Phasen-Timeline.
+
+Proben, die bei jedem Start dasselbe Ergebnis liefern (Font-Suche, Emoji-Font,
+Gültigkeit des matplotlib-Font-Caches), werden in ``startup_probes.json``
+gespeichert – zusammen mit einem Fingerabdruck der System-Font-Verzeichnisse.
+Ändert sich der Fingerabdruck (Font installiert/entfernt), laufen alle Proben
+neu; sonst kostet ein Neustart (z.B. durch ``run_with_restart``) nur einen
+JSON-Read.
+
+``StartupTimeline`` misst die Startphasen und schreibt sie ins Log.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROBE_CACHE_PATH = Path(__file__).resolve().with_name("startup_probes.json")
+_CACHE_VERSION = 1
+
+
+def _font_dirs() -> List[Path]:
+    home = Path.home()
+    system = platform.system()
+    if system == "Windows":
+        return [
+            Path(os.environ.get("WINDIR", r"C:\Windows")) / "Fonts",
+            Path(os.environ.get("LOCALAPPDATA", str(home))) / "Microsoft" / "Windows" / "Fonts",
+        ]
+    if system == "Darwin":
+        return [Path("/System/Library/Fonts"), Path("/Library/Fonts"), home / "Library" / "Fonts"]
+    return [
+        Path("/usr/share/fonts"),
+        Path("/usr/local/share/fonts"),
+        home / ".fonts",
+        home / ".local" / "share" / "fonts",
+    ]
+
+
+def font_fingerprint(dirs: Optional[Iterable[Path]] = None) -> str:
+    """Fingerabdruck der Font-Verzeichnisse (Pfad + mtime aller Unterordner).
+
+    Eine Installation/Deinstallation ändert die mtime des betroffenen
+    Verzeichnisses; die Fonts selbst werden dafür nicht gelesen.
+    """
+    digest = hashlib.sha1(platform.system().encode())
+    for base in dirs if dirs is not None else _font_dirs():
+        base = Path(base)
+        if not base.is_dir():
+            continue
+        for current, subdirs, _files in os.walk(base):
+            subdirs.sort()
+            try:
+                mtime = os.stat(current).st_mtime_ns
+            except OSError:
+                continue
+            digest.update(f"{current}\0{mtime}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class ProbeCache:
+    """Persistente Probe-Ergebnisse, gültig solange der Font-Fingerabdruck passt.
+
+    Werte müssen JSON-serialisierbar sein. Optional kann je Probe ein
+    ``stamp`` (z.B. mtime/Größe einer Datei) mitgegeben werden; weicht er ab,
+    läuft die Probe ebenfalls neu.
+    """
+
+    def __init__(self, path: Path | str = PROBE_CACHE_PATH, fingerprint: Optional[str] = None):
+        self.path = Path(path)
+        self._fingerprint = fingerprint
+        self._entries: Optional[Dict[str, dict]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = font_fingerprint()
+        return self._fingerprint
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is not None:
+            return self._entries
+        entries: Dict[str, dict] = {}
+        try:
+            with self.path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("version") == _CACHE_VERSION and data.get("fingerprint") == self.fingerprint:
+                entries = dict(data.get("probes") or {})
+            else:
+                logger.info("[STARTUP] Font-Fingerabdruck geändert – Proben laufen neu")
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logger.warning("[STARTUP] Probe-Cache %s unlesbar: %s", self.path, exc)
+        self._entries = entries
+        return entries
+
+    def get(self, name: str, probe: Callable[[], Any], stamp: Any = None) -> Any:
+        """Gecachtes Ergebnis von ``probe`` (läuft nur bei Cache-Miss)."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(name)
+            if entry is not None and entry.get("stamp") == stamp:
+                return entry.get("value")
+            value = probe()
+            entries[name] = {"stamp": stamp, "value": value}
+            self.save()
+            return value
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Eine Probe (oder alle) verwerfen."""
+        with self._lock:
+            entries = self._load()
+            if name is None:
+                entries.clear()
+            else:
+                entries.pop(name, None)
+            self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "version": _CACHE_VERSION,
+                "fingerprint": self.fingerprint,
+                "probes": self._load(),
+            }
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            try:
+                with tmp.open("w", encoding="utf-8") as fh:
+                    json.dump(data, fh, indent=1, sort_keys=True)
+                os.replace(tmp, self.path)
+            except Exception as exc:
+                logger.debug("[STARTUP] Probe-Cache nicht gespeichert: %s", exc)
+
+
+_SHARED: Optional[ProbeCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_probe_cache() -> ProbeCache:
+    """Prozessweiter Probe-Cache (``startup_probes.json`` neben ``data.db``)."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = ProbeCache()
+        return _SHARED
+
+
+def find_font(candidates: Iterable[str], loader: Callable[[str], Any], cache: Optional[ProbeCache] = None) -> Optional[str]:
+    """Ersten ladbaren Font aus ``candidates`` finden (Ergebnis gecacht).
+
+    ``loader(name)`` muss bei nicht ladbarem Font eine Exception werfen
+    (z.B. ``lambda n: ImageFont.truetype(n, 12)``).
+    """
+    names = list(candidates)
+
+    def probe() -> Optional[str]:
+        for name in names:
+            try:
+                loader(name)
+                return name
+            except Exception:
+                continue
+        return None
+
+    return (cache or get_probe_cache()).get("font:" + "|".join(names), probe)
+
+
+def fontlist_is_valid(path: Path | str, data_path: Optional[str] = None) -> bool:
+    """Prüft einen matplotlib-``fontlist-v*.json``: lesbar und alle Fontdateien vorhanden."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except Exception:
+        return False
+    if not isinstance(data, dict):
+        return False
+    for key in ("ttflist", "afmlist"):
+        entries = data.get(key, [])
+        if not isinstance(entries, list):
+            return False
+        for entry in entries:
+            fname = entry.get("fname") if isinstance(entry, dict) else None
+            if not fname:
+                return False
+            # matplotlib speichert Fonts aus mpl-data relativ zu get_data_path()
+            if not os.path.isabs(fname) and data_path:
+                fname = os.path.join(data_path, fname)
+            if not os.path.exists(fname):
+                return False
+    return True
+
+
+def validate_matplotlib_font_cache(cache: Optional[ProbeCache] = None) -> str:
+    """matplotlib-Font-Cache prüfen statt löschen.
+
+    Nur ein defekter oder veralteter (verweist auf gelöschte Fonts) Cache wird
+    entfernt; ein gültiger bleibt erhalten und erspart den Font-Rescan beim
+    Import von ``matplotlib.pyplot``. Das Ergebnis ist je Datei (mtime/Größe)
+    und Font-Fingerabdruck gecacht.
+
+    Returns:
+        ``absent``, ``ok`` oder ``removed``.
+    """
+    if importlib.util.find_spec("matplotlib") is None:
+        return "absent"
+    import matplotlib
+
+    cache = cache or get_probe_cache()
+    try:
+        files = sorted(Path(matplotlib.get_cachedir()).glob("fontlist-v*.json"))
+        data_path = matplotlib.get_data_path()
+    except Exception:
+        return "absent"
+    status = "absent"
+    for fontlist in files:
+        try:
+            st = fontlist.stat()
+        except OSError:
+            continue
+        name = f"mpl_fontlist:{fontlist.name}"
+        stamp = [st.st_mtime_ns, st.st_size]
+        if cache.get(name, lambda f=fontlist: fontlist_is_valid(f, data_path), stamp=stamp):
+            if status == "absent":
+                status = "ok"
+            continue
+        try:
+            fontlist.unlink()
+            logger.warning("[MATPLOTLIB] Ungültiger Font-Cache entfernt: %s", fontlist)
+        except OSError as exc:
+            logger.warning("[MATPLOTLIB] Font-Cache %s nicht entfernbar: %s", fontlist, exc)
+        cache.invalidate(name)
+        status = "removed"
+    return status
+
+
+class StartupTimeline:
+    """Dauer der Startphasen (ms), in Reihenfolge; ``log()`` schreibt sie ins Log."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        self._t0 = self._last = self._clock()
+        self._phases: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        """Phase ``name`` endet jetzt (Dauer seit der letzten Marke)."""
+        now = self._clock()
+        self._phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Nur die Laufzeit des Blocks als Phase ``name`` erfassen."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._last = self._clock()
+            self._phases.append((name, (self._last - start) * 1000.0))
+
+    def phases(self) -> List[Tuple[str, float]]:
+        return list(self._phases)
+
+    def total_ms(self) -> float:
+        return (self._last - self._t0) * 1000.0
+
+    def log(self, title: str = "Start") -> None:
+        if not self._phases:
+            return
+        lines = [f"  {name:<24} {ms:8.1f} ms" for name, ms in self._phases]
+        logger.info("[STARTUP] %s in %.0f ms:\n%s", title, self.total_ms(), "\n".join(lines))
+
+
+timeline = StartupTimeline()
@@ -0,0 +1,477 @@
+"""Tado-Anbindung: gemeinsamer Login, Zonenwahl und Zone-Collector.
+
+Die Verbindung (``get_tado_connection``) wird einmal je Prozess aufgebaut –
+per Benutzer/Passwort (python-tado) oder OAuth-Device-Flow (PyTado). Der
+``TadoZoneCollector`` wird beim App-Start registriert und sammelt unabhängig
+davon, ob der Tado-Tab je geöffnet wird; der Tab abonniert nur die
+Datensätze und den Verbindungsstatus und nutzt die Verbindung zum Steuern.
+
+Die Bibliothek wird erst im Login-Thread importiert, damit der Start nicht
+auf PyTado wartet.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from .collectors import Collector
+
+TADO_ENABLED = os.getenv("TADO_ENABLE", "").strip().lower() in {"1", "true", "yes", "on"}
+if not TADO_ENABLED:
+    TADO_ENABLED = bool(os.getenv("TADO_USER") or os.getenv("TADO_PASS"))
+
+# --- KONFIGURATION ---
+TADO_USER = os.getenv("TADO_USER")
+TADO_PASS = os.getenv("TADO_PASS")
+# Ablageort wie bisher neben dem Tab-Modul, damit vorhandene Tokens gültig bleiben
+TADO_TOKEN_FILE = os.getenv(
+    "TADO_TOKEN_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tabs", ".tado_refresh_token"),
+)
+TADO_CLIENT_ID = os.getenv("TADO_CLIENT_ID", "tado-web-app")
+TADO_SCOPE = os.getenv("TADO_SCOPE", "home.user")
+TADO_ECO_TEMP = float(os.getenv("TADO_ECO_TEMP", "19.0"))
+TADO_COMFORT_TEMP = float(os.getenv("TADO_COMFORT_TEMP", "21.0"))
+
+# Neuer Login-Versuch nach Verbindungsfehlern
+_LOGIN_RETRY_S = 300.0
+
+logger = logging.getLogger(__name__)
+
+
+def tado_configured() -> bool:
+    """Tado eingerichtet: per Umgebung aktiviert oder Device-Flow-Token vorhanden."""
+    return TADO_ENABLED or os.path.exists(TADO_TOKEN_FILE)
+
+
+def _load_tado_class() -> tuple[Any, Optional[str]]:
+    """Tado-Klasse importieren: python-tado, sonst PyTado (neu/alt). -> (Klasse, Implementierung)."""
+    try:
+        return getattr(importlib.import_module("python_tado"), "Tado"), "python_tado"
+    except ImportError as exc:
+        logger.info("[TADO] python-tado nicht verfügbar: %s", exc)
+    # Aktuelles `python-tado` (0.19.x) installiert i.d.R. als Paket `PyTado`
+    # und exportiert die Klasse über `PyTado.interface`.
+    for module in ("PyTado.interface", "PyTado.interface.interface"):
+        try:
+            cls = getattr(importlib.import_module(module), "Tado")
+            logger.info("[TADO] Import via %s erfolgreich.", module)
+            return cls, "pytado"
+        except ImportError as exc:
+            logger.info("[TADO] %s Import fehlgeschlagen: %s", module, exc)
+    return None, None
+
+
+def _get_nested(data: Any, *keys, default=None):
+    cur = data
+    for key in keys:
+        if not isinstance(cur, dict) or key not in cur:
+            return default
+        cur = cur[key]
+    return cur
+
+
+def _state_to_dict(state) -> dict:
+    if isinstance(state, dict):
+        return state
+    for attr in ("to_dict", "dict"):
+        fn = getattr(state, attr, None)
+        if callable(fn):
+            try:
+                return fn()
+            except Exception:
+                pass
+    try:
+        return dict(state)
+    except Exception:
+        pass
+    try:
+        return vars(state)
+    except Exception:
+        return {}
+
+
+def normalize_device_url(url: str | None) -> str | None:
+    """Device-Flow-URL um client_id/scope ergänzen, falls sie fehlen."""
+    if not url:
+        return url
+    try:
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query, keep_blank_values=True)
+        changed = False
+        if TADO_CLIENT_ID and "client_id" not in query:
+            query["client_id"] = [TADO_CLIENT_ID]
+            changed = True
+        if TADO_SCOPE and "scope" not in query:
+            query["scope"] = [TADO_SCOPE]
+            changed = True
+        if not changed:
+            return url
+        return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+    except Exception:
+        return url
+
+
+def parse_zone_state(state: dict) -> dict:
+    """Zone-State (python-tado oder PyTado) auf die Collector-Felder abbilden."""
+    # Temperatur
+    current = state.get("current_temp")
+    if current is None:
+        current = _get_nested(state, "sensorDataPoints", "insideTemperature", "celsius")
+    if current is None:
+        current = _get_nested(state, "sensorDataPoints", "insideTemperature", "value")
+    if current is None:
+        current = _get_nested(state, "insideTemperature", "celsius")
+    if current is None:
+        current = _get_nested(state, "setting", "temperature", "celsius")
+
+    # Feuchtigkeit
+    humidity = state.get("current_humidity")
+    if humidity is None:
+        humidity = _get_nested(state, "sensorDataPoints", "humidity", "percentage")
+    if humidity is None:
+        humidity = _get_nested(state, "sensorDataPoints", "humidity", "value")
+
+    # Zieltemperatur
+    target = state.get("target_temp")
+    overlay = state.get("overlay")
+    setting = (overlay or {}).get("setting") or state.get("setting", {})
+    if target is None and setting:
+        target = _get_nested(setting, "temperature", "celsius")
+    if target is None and setting:
+        target = 20
+
+    # Mode: overlay present => manual override
+    try:
+        manual = bool(overlay)
+    except Exception:
+        manual = False
+
+    power = state.get("power") or setting.get("power", "OFF")
+    power_pct = 0
+    if power == "ON":
+        power_pct = state.get("heating_power_percentage")
+        if power_pct is None:
+            power_pct = _get_nested(state, "activityDataPoints", "heatingPower", "percentage")
+        if power_pct is None:
+            power_pct = 75
+
+    return {
+        "temperature_c": current,
+        "humidity_pct": humidity,
+        "target_c": target,
+        "heating_power_pct": power_pct,
+        "manual": manual,
+        "power_on": power == "ON",
+    }
+
+
+class TadoConnection:
+    """Geteilte Tado-API-Verbindung inkl. Login-Status.
+
+    ``ensure_connected`` startet den Login im Hintergrund (der Device-Flow
+    kann lange auf die Aktivierung im Browser warten). Statusänderungen
+    gehen an ``subscribe_status``-Abonnenten (laufen im Worker-Thread).
+    """
+
+    def __init__(self, tado_cls: Any = None, impl: Optional[str] = None) -> None:
+        self._tado_cls = tado_cls
+        self._impl = impl
+        self.api: Any = None
+        self.zone_id: Optional[int] = None
+        self.zone_name: str = "-"
+        self.zones: list[dict] = []
+        self._lock = threading.Lock()
+        self._login_thread: Optional[threading.Thread] = None
+        self._retry_at = 0.0
+        self._gave_up = False
+        self._status: Dict[str, Any] = {"connected": False, "status": "Verbinde...", "hint": "", "device_url": None}
+        self._listeners: List[Callable[[dict], None]] = []
+        self._state_logged = False
+        self._state_error_logged = False
+
+    # --- Status ---
+
+    @property
+    def connected(self) -> bool:
+        return bool(self.api is not None and self.zone_id)
+
+    def status(self) -> dict:
+        with self._lock:
+            return dict(self._status, zone=self.zone_name)
+
+    def subscribe_status(self, callback: Callable[[dict], None]) -> Callable[[], None]:
+        """Auf Statusänderungen hören; ``callback`` bekommt sofort den aktuellen Stand."""
+        with self._lock:
+            self._listeners.append(callback)
+        callback(self.status())
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                try:
+                    self._listeners.remove(callback)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    def _set_status(self, status: str, hint: Optional[str] = None, device_url: Any = ...) -> None:
+        with self._lock:
+            self._status["connected"] = self.connected
+            self._status["status"] = status
+            if hint is not None:
+                self._status["hint"] = hint
+            if device_url is not ...:
+                self._status["device_url"] = device_url
+            listeners = list(self._listeners)
+        snapshot = self.status()
+        for callback in listeners:
+            try:
+                callback(snapshot)
+            except Exception:
+                logger.exception("[TADO] Status-Abonnent fehlgeschlagen")
+
+    # --- Login ---
+
+    def ensure_connected(self) -> bool:
+        """Verbunden? Sonst Login im Hintergrund anstoßen (höchstens einer gleichzeitig)."""
+        if self.connected:
+            return True
+        with self._lock:
+            busy = self._login_thread is not None and self._login_thread.is_alive()
+            if busy or self._gave_up or time.monotonic() < self._retry_at:
+                return False
+            self._login_thread = threading.Thread(target=self._login, name="TadoLogin", daemon=True)
+            self._login_thread.start()
+        return False
+
+    def _login(self) -> None:
+        if self._tado_cls is None:
+            self._tado_cls, self._impl = _load_tado_class()
+        if self._tado_cls is None:
+            self._gave_up = True
+            self._set_status(
+                "python-tado nicht installiert",
+                hint="Bitte `pip install python-tado` ausführen und Dashboard neu starten.",
+            )
+            return
+        try:
+            # Prefer direct User/Pass only for python-tado.
+            # PyTado uses token/device activation flow (token_file_path).
+            if self._impl == "python_tado" and TADO_USER and TADO_PASS:
+                try:
+                    api = self._tado_cls(TADO_USER, TADO_PASS)
+                except Exception:
+                    api = self._tado_cls(TADO_USER, TADO_PASS, client_id=TADO_CLIENT_ID)
+            else:
+                api = self._tado_cls(token_file_path=TADO_TOKEN_FILE)
+                if not self._activate_device(api):
+                    return
+            self.api = api
+
+            zones = self._call_any("get_zones", "getZones")
+            logger.debug("[TADO] zones gefunden: %s", len(zones or []))
+            self.zones = zones or []
+            # Single-zone setup: pick best match (Schlaf/Bed) else first.
+            picked = None
+            for zone in self.zones:
+                name = (zone.get("name") or "").lower()
+                if "schlaf" in name or "bed" in name:
+                    picked = zone
+                    break
+            if picked is None and self.zones:
+                picked = self.zones[0]
+            if picked is not None:
+                self.zone_id = picked.get("id")
+                self.zone_name = picked.get("name", "-")
+            if not self.zone_id:
+                self._gave_up = True
+                self._set_status("Tado: Keine Zone gefunden")
+                return
+            self._set_status("Verbunden", hint="", device_url=None)
+        except Exception as exc:
+            self.api = None
+            self._retry_at = time.monotonic() + _LOGIN_RETRY_S
+            msg = f"Login fehlgeschlagen: {type(exc).__name__}"
+            if str(exc):
+                msg += f" – {exc}"
+            logger.warning("[TADO] %s", msg)
+            self._set_status(
+                msg, hint="Login/Verbindung fehlgeschlagen. Prüfe Zugangsdaten oder Device-Flow Aktivierung."
+            )
+
+    def _activate_device(self, api) -> bool:
+        """OAuth-Device-Flow (seit 2025) abschließen; False = (noch) nicht aktiviert."""
+        status = api.device_activation_status()
+        logger.debug("[TADO] device_activation_status: %s", status)
+        if status == "COMPLETED":
+            return True
+        url = normalize_device_url(api.device_verification_url())
+        if url:
+            logger.info("[TADO] Device activation URL: %s", url)
+            self._set_status(
+                "Tado: Bitte Gerät im Browser aktivieren", hint=f"Aktivierung erforderlich: {url}", device_url=url
+            )
+        # Wait until flow is pending before activation
+        start = time.time()
+        while status == "NOT_STARTED" and (time.time() - start) < 10:
+            time.sleep(1)
+            status = api.device_activation_status()
+        if status == "PENDING":
+            api.device_activation()
+            status = api.device_activation_status()
+            logger.debug("[TADO] Status nach Aktivierung: %s", status)
+        if status == "COMPLETED":
+            return True
+        self._retry_at = time.monotonic() + _LOGIN_RETRY_S
+        # Keep URL available for manual activation
+        self._set_status("Tado Aktivierung fehlgeschlagen", hint=f"Aktivierung nicht abgeschlossen. URL: {url}")
+        return False
+
+    # --- API compatibility helpers (python-tado vs PyTado) ---
+
+    def _call_any(self, *names: str, **kwargs):
+        api = self.api
+        if api is None:
+            raise RuntimeError("Tado API not connected")
+        last_exc = None
+        for name in names:
+            try:
+                return getattr(api, name)(**kwargs)
+            except (TypeError, AttributeError) as exc:
+                last_exc = exc
+        if last_exc:
+            raise last_exc
+
+    def read_zone_state(self) -> dict:
+        """Zone-State vom API holen und normalisieren."""
+        try:
+            raw = self.api.get_zone_state(self.zone_id)
+        except Exception:
+            raw = self.api.getZoneState(self.zone_id)
+        state = _state_to_dict(raw)
+        if not self._state_logged:
+            logger.debug("[TADO] zone_state keys: %s", list(state.keys()))
+            logger.debug("[TADO] sensorDataPoints keys: %s", list((state.get("sensorDataPoints") or {}).keys()))
+            logger.debug("[TADO] activityDataPoints keys: %s", list((state.get("activityDataPoints") or {}).keys()))
+            logger.debug("[TADO] setting keys: %s", list((state.get("setting") or {}).keys()))
+            logger.debug("[TADO] overlay keys: %s", list((state.get("overlay") or {}).keys()))
+            self._state_logged = True
+        return parse_zone_state(state)
+
+    def set_zone_temperature(self, temp_c: float) -> None:
+        # python-tado
+        try:
+            self.api.set_temperature(self.zone_id, temp_c)
+            return
+        except Exception:
+            pass
+        # PyTado via deprecated wrapper -> dynamic snake_case endpoint
+        try:
+            self.api.setZoneOverlay(self.zone_id, "MANUAL", setTemp=float(temp_c))
+            return
+        except Exception:
+            pass
+        # Try direct snake_case if available (dynamic)
+        self.api.set_zone_overlay(
+            self.zone_id, overlay_mode="MANUAL", set_temp=float(temp_c), device_type="HEATING", power="ON"
+        )
+
+    def reset_zone_override(self) -> None:
+        # python-tado
+        try:
+            self.api.reset_zone_override(self.zone_id)
+            return
+        except Exception:
+            pass
+        # PyTado
+        try:
+            self.api.resetZoneOverlay(self.zone_id)
+            return
+        except Exception:
+            pass
+        self.api.reset_zone_overlay(self.zone_id)
+
+    def set_presence(self, away: bool) -> bool:
+        """Anwesenheit 'Away'/'Home' setzen (best-effort). True, wenn eine passende Methode lief."""
+        api = self.api
+        if api is None:
+            return False
+        names = ("setAway", "set_away", "setAwayMode", "set_away_mode") if away else (
+            "setHome", "set_home", "setHomeMode", "set_home_mode"
+        )
+        # PyTado (installed in this project) uses setAway()/setHome().
+        for name in names:
+            fn = getattr(api, name, None)
+            if callable(fn):
+                try:
+                    fn()
+                    return True
+                except Exception:
+                    return False
+        # Fallback: changePresence("AWAY"/"HOME") (some versions)
+        fn = getattr(api, "changePresence", None)
+        if callable(fn):
+            try:
+                fn("AWAY" if away else "HOME")
+                return True
+            except Exception:
+                return False
+        if not away:
+            return False
+        # As a last resort, at least drop any manual override back to schedule.
+        try:
+            if self.zone_id and callable(getattr(api, "reset_zone_override", None)):
+                api.reset_zone_override(self.zone_id)
+                return True
+        except Exception:
+            return False
+        return False
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED: Optional[TadoConnection] = None
+
+
+def get_tado_connection() -> TadoConnection:
+    """Prozessweite Tado-Verbindung (Collector und Tab teilen sich den Login)."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = TadoConnection()
+        return _SHARED
+
+
+class TadoZoneCollector(Collector):
+    """Tado-Zone (Temperatur, Feuchte, Soll, Heizleistung) über die geteilte Verbindung."""
+
+    name = "tado"
+    interval_s = 30.0
+    schema = ("temperature_c", "humidity_pct", "target_c", "heating_power_pct")
+
+    def __init__(self, connection: Optional[TadoConnection] = None):
+        self.connection = connection or get_tado_connection()
+
+    def fetch(self) -> Optional[dict]:
+        conn = self.connection
+        if not conn.ensure_connected():
+            return None
+        try:
+            state = conn.read_zone_state()
+        except Exception as e:
+            if not conn._state_error_logged:
+                logger.warning("[TADO] zone_state error: %s: %s", type(e).__name__, e)
+                conn._state_error_logged = True
+            raise
+        return state
+
+    def parse(self, raw: Optional[dict]) -> Optional[dict]:
+        if not raw:
+            return None
+        return {"timestamp": self.sample_timestamp(), **raw}
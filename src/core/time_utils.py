@@ -6,11 +6,15 @@ the application to avoid timezone-related bugs.
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
+# Canonical sample timestamp in the DataStore: naive UTC, second resolution.
+DB_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 def ensure_utc(dt: datetime) -> datetime:
     """Convert a datetime to UTC-aware.
@@ -44,6 +48,141 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def sample_tick(interval_s: float, now: float | None = None) -> int:
+    """Return the UTC epoch of the polling tick at or before ``now``.
+
+    All collectors stamp their samples with this clock, so sources polled
+    at the same interval land on identical timestamps (e.g. :00, :10, :20 s)
+    and can be joined without per-row parsing or timezone guessing. Ticks
+    are floored, so a sample is never stamped in the future.
+
+    Args:
+        interval_s: Polling interval in seconds (ticks are multiples of it).
+        now: Epoch seconds to align (defaults to ``time.time()``).
+
+    Returns:
+        Aligned UTC epoch seconds.
+
+    Examples:
+        >>> sample_tick(10, now=1700000004.9)
+        1700000000
+    """
+    step = max(1, int(round(interval_s)))
+    current = time.time() if now is None else now
+    return int(current // step) * step
+
+
+def epoch_to_db_timestamp(epoch: float) -> str:
+    """Format epoch seconds as canonical DataStore timestamp (naive UTC).
+
+    Args:
+        epoch: Seconds since 1970 (UTC).
+
+    Returns:
+        String like ``2024-01-15 12:00:00``.
+    """
+    return time.strftime(DB_TIMESTAMP_FORMAT, time.gmtime(int(epoch)))
+
+
+def normalize_db_timestamp(value: Any) -> str | None:
+    """Coerce a sample timestamp into the canonical DataStore form.
+
+    Accepts epoch numbers, datetimes and ISO-8601 strings. Aware values are
+    converted to UTC; naive values are taken as UTC (the store's convention).
+
+    Args:
+        value: Epoch seconds, datetime or ISO-8601 string.
+
+    Returns:
+        Canonical timestamp string, or None if ``value`` is empty/unparseable.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return epoch_to_db_timestamp(value)
+    if isinstance(value, datetime):
+        return ensure_utc(value).strftime(DB_TIMESTAMP_FORMAT)
+    raw = str(value).strip()
+    # Fast path: already canonical
+    if len(raw) == 19 and raw[10] == " ":
+        return raw
+    try:
+        if raw.endswith("Z"):
+            raw = raw[:-1] + "+00:00"
+        return ensure_utc(datetime.fromisoformat(raw)).strftime(DB_TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def db_timestamp_to_epoch(value: str | None) -> float | None:
+    """Parse a DataStore timestamp to UTC epoch seconds (naive = UTC).
+
+    Args:
+        value: Timestamp string as stored in the DataStore.
+
+    Returns:
+        Epoch seconds, or None if parsing fails.
+    """
+    if not value:
+        return None
+    try:
+        raw = str(value).strip()
+        if raw.endswith("Z"):
+            raw = raw[:-1] + "+00:00"
+        return ensure_utc(datetime.fromisoformat(raw)).timestamp()
+    except ValueError:
+        return None
+
+
+def to_utc_datetime(value: Any) -> datetime | None:
+    """Parse a record/DataStore timestamp into a UTC-aware datetime.
+
+    Accepts datetimes, epoch numbers and ISO-8601 strings (``Z`` suffix
+    allowed). Naive values are taken as UTC, the store's convention;
+    convert to local time only for display.
+
+    Args:
+        value: Datetime, epoch seconds or ISO-8601 string.
+
+    Returns:
+        UTC-aware datetime, or None if ``value`` is empty/unparseable.
+
+    Examples:
+        >>> to_utc_datetime("2024-01-15 10:30:00").isoformat()
+        '2024-01-15T10:30:00+00:00'
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return ensure_utc(value)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    try:
+        raw = str(value).strip()
+        if raw.endswith("Z"):
+            raw = raw[:-1] + "+00:00"
+        return ensure_utc(datetime.fromisoformat(raw))
+    except ValueError:
+        return None
+
+
+def local_utc_offset(epoch: float) -> float:
+    """Return the local UTC offset in seconds valid at ``epoch``.
+
+    Unlike ``datetime.now().astimezone().utcoffset()`` this honours DST
+    transitions, so timestamps on either side of a switch are shifted by
+    their own offset.
+
+    Args:
+        epoch: Seconds since 1970 (UTC).
+
+    Returns:
+        Offset in seconds (e.g. 7200.0 for CEST).
+    """
+    local = datetime.fromtimestamp(epoch, timezone.utc).astimezone()
+    return local.utcoffset().total_seconds()
+
+
 def local_display(dt: datetime) -> str:
     """Format datetime for local display.
     
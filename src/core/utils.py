@@ -9,6 +9,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
+from .time_utils import to_utc_datetime
+
 
 def safe_float(value: str | float | int | None) -> float | None:
     """Konvertiert einen Wert sicher zu float.
@@ -39,7 +41,7 @@ def parse_timestamp(ts: str | datetime | None) -> float:
     """Parst einen ISO-8601-Zeitstempel zu Unix-Timestamp.
     
     Args:
-        ts: ISO-8601-String mit Zeitzone oder datetime-Objekt
+        ts: ISO-8601-String oder datetime-Objekt; naive Werte gelten als UTC
         
     Returns:
         Unix-Timestamp als float, 0 bei Fehler
@@ -52,12 +54,8 @@ def parse_timestamp(ts: str | datetime | None) -> float:
     """
     if not ts:
         return 0.0
-    try:
-        if isinstance(ts, datetime):
-            return ts.timestamp()
-        return datetime.fromisoformat(str(ts)).timestamp()
-    except (ValueError, TypeError, AttributeError):
-        return 0.0
+    dt = to_utc_datetime(ts if isinstance(ts, datetime) else str(ts))
+    return dt.timestamp() if dt else 0.0
 
 
 def safe_fetchone(cursor: Any, default: Any = None) -> tuple | None:
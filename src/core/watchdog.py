@@ -0,0 +1,128 @@
+"""Watchdog für Blockaden der Tk-Mainloop.
+
+Die Mainloop meldet per ``after``-Heartbeat (``start_tk_heartbeat``), dass
+sie lebt. Ein Hintergrund-Thread prüft das Alter des letzten Heartbeats;
+ist er älter als die Schwelle, wird der Stack des Tk-Threads über
+``sys._current_frames()`` erfasst und mit der bisherigen Dauer geloggt.
+Endet die Blockade, wird ihre Gesamtdauer je Aufrufstelle (innerster Frame
+aus ``src/``) in ``core.health`` gezählt – der Health-Tab zeigt die Sünder.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Callable, Optional
+
+from .health import record_stall
+
+logger = logging.getLogger(__name__)
+
+_SRC_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STACK_LIMIT = 30
+
+
+def _call_site(frame, source_root: str) -> str:
+    """Innerster Frame aus dem Projekt (sonst der innerste überhaupt) als 'pfad:zeile funktion'."""
+    innermost = frame
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(source_root + os.sep) and filename != os.path.abspath(__file__):
+            rel = os.path.relpath(filename, source_root).replace(os.sep, "/")
+            return f"{rel}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    if innermost is None:
+        return "unbekannt"
+    return f"{os.path.basename(innermost.f_code.co_filename)}:{innermost.f_lineno} {innermost.f_code.co_name}"
+
+
+class StallWatchdog:
+    """Erkennt, wenn der überwachte Thread länger als ``threshold_s`` keinen Heartbeat liefert.
+
+    Scharf geschaltet wird erst mit dem ersten ``beat()`` – Startphase und
+    Zeit ohne Mainloop zählen nicht als Blockade.
+    """
+
+    def __init__(
+        self,
+        thread_id: Optional[int] = None,
+        threshold_s: float = 1.0,
+        poll_s: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+        source_root: str = _SRC_ROOT,
+    ):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.threshold_s = float(threshold_s)
+        self.poll_s = float(poll_s)
+        self._clock = clock
+        self._source_root = os.path.abspath(source_root)
+        self._last_beat: Optional[float] = None
+        self._stall_beat: Optional[float] = None
+        self._stall_site: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def beat(self) -> None:
+        """Heartbeat aus dem überwachten Thread (billig: nur ein Zeitstempel)."""
+        self._last_beat = self._clock()
+
+    def check(self) -> Optional[str]:
+        """Einmal prüfen; liefert die Aufrufstelle, wenn gerade eine Blockade erkannt wurde."""
+        last = self._last_beat
+        if last is None:
+            return None
+        if self._stall_beat is not None:
+            if last != self._stall_beat:
+                # Blockade vorbei: Dauer = Abstand der Heartbeats
+                duration_ms = (last - self._stall_beat) * 1000.0
+                record_stall(self._stall_site or "unbekannt", duration_ms)
+                logger.warning("[STALL] Tk-Mainloop war %.1f s blockiert bei %s", duration_ms / 1000.0, self._stall_site)
+                self._stall_beat = self._stall_site = None
+            return None
+        lag = self._clock() - last
+        if lag < self.threshold_s:
+            return None
+        frame = sys._current_frames().get(self.thread_id)
+        site = _call_site(frame, self._source_root) if frame is not None else "unbekannt"
+        stack = "".join(traceback.format_stack(frame, limit=_STACK_LIMIT)) if frame is not None else ""
+        self._stall_beat = last
+        self._stall_site = site
+        logger.warning("[STALL] Tk-Mainloop blockiert seit %.1f s bei %s\n%s", lag, site, stack)
+        return site
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            try:
+                self.check()
+            except Exception:
+                logger.debug("Watchdog-Prüfung fehlgeschlagen", exc_info=True)
+
+
+def start_tk_heartbeat(root: Any, watchdog: StallWatchdog, interval_ms: int = 250) -> None:
+    """Heartbeat per ``root.after`` einplanen (erster Beat erst in der laufenden Mainloop)."""
+
+    def tick() -> None:
+        watchdog.beat()
+        try:
+            root.after(interval_ms, tick)
+        except Exception:
+            pass
+
+    root.after(interval_ms, tick)
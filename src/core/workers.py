@@ -0,0 +1,265 @@
+"""Gemeinsamer, begrenzter Worker-Pool für Hintergrundaufgaben der UI.
+
+Statt je Aktion einen eigenen ``threading.Thread`` zu starten, landen
+Aufgaben in benannten Lanes mit eigener Parallelitätsgrenze:
+
+    * ``ui``        – direkte Benutzeraktionen (Licht, Szenen, Skripte)
+    * ``io``        – Integrations-Abfragen (Home Assistant, Kalender, Bridge)
+    * ``analytics`` – DB-Auswertungen und Wartung
+    * ``render``    – Chart-Rasterung mit matplotlib/Agg (siehe ``ui.chart_render``)
+
+Eine volle ``io``-Lane blockiert so nie eine Benutzeraktion. Aufgaben mit
+gleichem ``key`` ersetzen noch wartende Vorgänger (z.B. beim Ziehen des
+Dimmers gewinnt der letzte Wert) und laufen nie parallel zueinander.
+Threads entstehen bei Bedarf und beenden sich nach Leerlauf.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+LANE_UI = "ui"
+LANE_IO = "io"
+LANE_ANALYTICS = "analytics"
+LANE_RENDER = "render"
+
+# Maximale Threads je Lane
+DEFAULT_LANES: Dict[str, int] = {LANE_UI: 2, LANE_IO: 4, LANE_ANALYTICS: 1, LANE_RENDER: 1}
+
+_IDLE_TIMEOUT_S = 30.0
+
+
+class TaskHandle:
+    """Handle einer eingereihten Aufgabe (Status, Abbruch solange wartend)."""
+
+    __slots__ = ("fn", "lane", "key", "name", "submitted", "state")
+
+    def __init__(self, fn: Callable[[], None], lane: str, key: Optional[Hashable], name: str):
+        self.fn = fn
+        self.lane = lane
+        self.key = key
+        self.name = name
+        self.submitted = time.monotonic()
+        # queued -> running -> done/failed; queued -> cancelled
+        self.state = "queued"
+
+    @property
+    def cancelled(self) -> bool:
+        return self.state == "cancelled"
+
+    @property
+    def done(self) -> bool:
+        return self.state in ("done", "failed", "cancelled")
+
+
+@dataclass
+class LaneStats:
+    name: str
+    limit: int
+    workers: int
+    queued: int
+    running: int
+    submitted: int
+    completed: int
+    failed: int
+    cancelled: int
+    superseded: int
+    last_wait_ms: float
+    max_wait_ms: float
+
+
+class _Lane:
+    def __init__(self, name: str, limit: int, lock: threading.Lock):
+        self.name = name
+        self.limit = max(1, int(limit))
+        self.cond = threading.Condition(lock)
+        self.queue: Deque[TaskHandle] = deque()
+        self.running_keys: Set[Hashable] = set()
+        self.workers = 0
+        self.idle = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.superseded = 0
+        self.last_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def next_task(self) -> Optional[TaskHandle]:
+        """Älteste Aufgabe, deren ``key`` gerade nicht läuft."""
+        for i, task in enumerate(self.queue):
+            if task.key is None or task.key not in self.running_keys:
+                del self.queue[i]
+                return task
+        return None
+
+
+class WorkerPool:
+    """Begrenzter Thread-Pool mit Lanes, Ersetzen per ``key`` und Metriken."""
+
+    def __init__(self, lanes: Optional[Dict[str, int]] = None, idle_timeout_s: float = _IDLE_TIMEOUT_S):
+        self._lock = threading.Lock()
+        self._lanes = {
+            name: _Lane(name, limit, self._lock)
+            for name, limit in (lanes if lanes is not None else DEFAULT_LANES).items()
+        }
+        self._idle_timeout_s = idle_timeout_s
+        self._closed = False
+
+    def submit(
+        self,
+        fn: Callable[[], None],
+        lane: str = LANE_IO,
+        key: Optional[Hashable] = None,
+        name: Optional[str] = None,
+    ) -> TaskHandle:
+        """``fn`` in ``lane`` ausführen.
+
+        Args:
+            key: Wartende Aufgaben mit gleichem Key werden verworfen; Aufgaben
+                mit gleichem Key laufen nacheinander, nie parallel.
+            name: Bezeichnung für Log-Meldungen (Standard: Funktionsname).
+        """
+        target = self._lanes.get(lane)
+        if target is None:
+            raise ValueError(f"Unbekannte Lane: {lane!r}")
+        task = TaskHandle(fn, lane, key, name or getattr(fn, "__qualname__", repr(fn)))
+        with target.cond:
+            if self._closed:
+                raise RuntimeError("WorkerPool ist beendet")
+            if key is not None and target.queue:
+                kept: Deque[TaskHandle] = deque()
+                for queued in target.queue:
+                    if queued.key == key:
+                        queued.state = "cancelled"
+                        target.superseded += 1
+                    else:
+                        kept.append(queued)
+                target.queue = kept
+            target.queue.append(task)
+            target.submitted += 1
+            if len(target.queue) > target.idle and target.workers < target.limit:
+                target.workers += 1
+                threading.Thread(
+                    target=self._work, args=(target,), name=f"worker-{lane}-{target.workers}", daemon=True,
+                ).start()
+            else:
+                target.cond.notify()
+        return task
+
+    def cancel(self, task: TaskHandle) -> bool:
+        """Wartende Aufgabe verwerfen (laufende werden nicht unterbrochen)."""
+        target = self._lanes[task.lane]
+        with target.cond:
+            if task.state != "queued":
+                return False
+            try:
+                target.queue.remove(task)
+            except ValueError:
+                return False
+            task.state = "cancelled"
+            target.cancelled += 1
+            return True
+
+    def _work(self, lane: _Lane) -> None:
+        while True:
+            with lane.cond:
+                task = lane.next_task()
+                while task is None:
+                    if self._closed:
+                        lane.workers -= 1
+                        return
+                    lane.idle += 1
+                    woke = lane.cond.wait(timeout=self._idle_timeout_s)
+                    lane.idle -= 1
+                    task = lane.next_task()
+                    if task is None and not woke:
+                        lane.workers -= 1
+                        return
+                task.state = "running"
+                lane.running += 1
+                if task.key is not None:
+                    lane.running_keys.add(task.key)
+                wait_ms = (time.monotonic() - task.submitted) * 1000.0
+                lane.last_wait_ms = wait_ms
+                lane.max_wait_ms = max(lane.max_wait_ms, wait_ms)
+            ok = True
+            try:
+                task.fn()
+            except Exception:
+                ok = False
+                logger.exception("Hintergrundaufgabe %s (Lane %s) fehlgeschlagen", task.name, lane.name)
+            with lane.cond:
+                lane.running -= 1
+                if task.key is not None:
+                    lane.running_keys.discard(task.key)
+                    # Wartende Aufgabe mit diesem Key ist jetzt lauffähig
+                    lane.cond.notify()
+                task.state = "done" if ok else "failed"
+                if ok:
+                    lane.completed += 1
+                else:
+                    lane.failed += 1
+
+    def stats(self) -> Dict[str, LaneStats]:
+        """Momentaufnahme der Lane-Metriken."""
+        with self._lock:
+            return {
+                name: LaneStats(
+                    name=name,
+                    limit=lane.limit,
+                    workers=lane.workers,
+                    queued=len(lane.queue),
+                    running=lane.running,
+                    submitted=lane.submitted,
+                    completed=lane.completed,
+                    failed=lane.failed,
+                    cancelled=lane.cancelled,
+                    superseded=lane.superseded,
+                    last_wait_ms=lane.last_wait_ms,
+                    max_wait_ms=lane.max_wait_ms,
+                )
+                for name, lane in self._lanes.items()
+            }
+
+    def shutdown(self) -> None:
+        """Wartende Aufgaben verwerfen und Worker nach laufender Aufgabe beenden."""
+        with self._lock:
+            self._closed = True
+            for lane in self._lanes.values():
+                for task in lane.queue:
+                    task.state = "cancelled"
+                    lane.cancelled += 1
+                lane.queue.clear()
+                lane.cond.notify_all()
+
+
+_SHARED: Optional[WorkerPool] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """Prozessweiter Worker-Pool."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = WorkerPool()
+        return _SHARED
+
+
+def run_in_background(
+    fn: Callable[[], None],
+    lane: str = LANE_IO,
+    key: Optional[Hashable] = None,
+    name: Optional[str] = None,
+) -> TaskHandle:
+    """``fn`` im gemeinsamen Worker-Pool ausführen (siehe ``WorkerPool.submit``)."""
+    return get_worker_pool().submit(fn, lane=lane, key=key, name=name)
@@ -1,7 +1,8 @@
 import threading
-import queue
 import logging
 import time
+
+from core.startup import timeline as startup_timeline
 import tkinter as tk
 import subprocess
 import sys
@@ -15,8 +16,11 @@ import atexit
 import tracemalloc
 from pathlib import Path
 from core.datastore import DataStore, set_shared_datastore, close_shared_datastore
-from core.health import update_source_health
-import importlib
+from core.collectors import CollectorScheduler, register_collector, subscribe
+from core.health import record_stage
+from core.watchdog import StallWatchdog, start_tk_heartbeat
+from core.homeassistant import HomeAssistantClient, HomeAssistantSensorCollector, load_homeassistant_config
+from core.tado import TadoZoneCollector, tado_configured
 
 # Füge src-Verzeichnis zu Python-Pfad hinzu
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,58 +30,79 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core import BMKDATEN
 from core import Wechselrichter
 from ui.app import MainApp
+from ui.frame_budget import FrameScheduler
+from ui.wakeup import UiWakeup, WakeupQueue, drain_queue
+from core.startup import get_probe_cache, validate_matplotlib_font_cache
+
+startup_timeline.mark("imports")
 
 # Force Spotify redirect URI but allow override via env
 
 
 
-# --- Clear Matplotlib Font Cache ---
+# --- Validate Matplotlib Font Cache ---
 def clear_matplotlib_cache() -> None:
-    """Clear matplotlib fontlist cache to prevent corruption"""
+    """Remove matplotlib's fontlist cache only if it is corrupt or stale.
+
+    A valid cache is kept so importing pyplot does not rescan all fonts;
+    the validation result is cached per file and font fingerprint.
+    """
     try:
-        spec = importlib.util.find_spec("matplotlib")
-        if spec is None:
-            return
-        matplotlib = importlib.import_module("matplotlib")
-        cache_dir = matplotlib.get_configdir()
-        fontlist_file = os.path.join(cache_dir, "fontlist-v390.json")
-        if os.path.exists(fontlist_file):
-            try:
-                os.remove(fontlist_file)
-                print("[MATPLOTLIB] Cleared fontlist cache")
-            except Exception as e:
-                print(f"[MATPLOTLIB] Could not clear cache: {e}")
+        if validate_matplotlib_font_cache() == "removed":
+            print("[MATPLOTLIB] Cleared invalid fontlist cache")
     except Exception:
         pass
 
 clear_matplotlib_cache()
+startup_timeline.mark("matplotlib_font_cache")
 
 # --- Ensure Emoji Font is installed ---
+_EMOJI_FONT_PATHS = (
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/opentype/noto/NotoColorEmoji.ttf",
+)
+
+
+def _emoji_font_installed() -> bool:
+    if any(os.path.exists(path) for path in _EMOJI_FONT_PATHS):
+        return True
+    try:
+        result = subprocess.run(
+            ["dpkg", "-s", "fonts-noto-color-emoji"], capture_output=True, timeout=5
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def _install_emoji_font() -> int:
+    print("[EMOJI] Installing fonts-noto-color-emoji...")
+    try:
+        return subprocess.run(
+            ["sudo", "-n", "apt-get", "install", "-y", "fonts-noto-color-emoji"],
+            timeout=60, capture_output=True
+        ).returncode
+    except Exception:
+        return -1
+
+
 def ensure_emoji_font():
-    """Install emoji font if not available (for Raspberry Pi compatibility)."""
-    system = platform.system()
+    """Install emoji font if not available (for Raspberry Pi compatibility).
+
+    Detection and install attempts are cached until the system fonts change,
+    so restarts do not spawn dpkg/apt-get again.
+    """
+    if platform.system() != "Linux":
+        return
     try:
-        if system == "Linux":
-            # Try to install fonts-noto-color-emoji on Linux/Raspberry Pi
-            try:
-                subprocess.run(["dpkg", "-l"], capture_output=True, check=True, timeout=5)
-                # apt is available, check if emoji font is installed
-                result = subprocess.run(
-                    ["dpkg", "-l", "|", "grep", "fonts-noto-color-emoji"],
-                    shell=True, capture_output=True, text=True, timeout=5
-                )
-                if result.returncode != 0:
-                    print("[EMOJI] Installing fonts-noto-color-emoji...")
-                    subprocess.run(
-                        ["sudo", "apt-get", "install", "-y", "fonts-noto-color-emoji"],
-                        timeout=60, capture_output=True
-                    )
-            except Exception:
-                pass
+        cache = get_probe_cache()
+        if not cache.get("emoji_font_installed", _emoji_font_installed):
+            cache.get("emoji_font_install_rc", _install_emoji_font)
     except Exception as e:
         print(f"[EMOJI] Could not ensure emoji font: {e}")
 
 ensure_emoji_font()
+startup_timeline.mark("emoji_font")
 
 # --- Logging ---
 
@@ -118,6 +143,19 @@ for noisy in [
     logging.getLogger(noisy).setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
+# Start-Timeline ins Logfile (Konsole bleibt bei WARNING)
+logging.getLogger("core.startup").setLevel(logging.INFO)
+logging.getLogger("ui.lazy_tabs").setLevel(logging.INFO)
+logging.getLogger("ui.frame_budget").setLevel(logging.INFO)
+
+# Intervall für den Bericht der langsamsten Tk-Jobs (ms)
+FRAME_REPORT_MS = 10 * 60 * 1000
+
+# Ab dieser Dauer ohne Heartbeat gilt die Tk-Mainloop als blockiert (0 = Watchdog aus)
+try:
+    STALL_THRESHOLD_S = float(os.getenv("DASHBOARD_STALL_THRESHOLD_S", "1.5") or 0)
+except ValueError:
+    STALL_THRESHOLD_S = 1.5
 
 shutdown_event = threading.Event()
 _CRASH_LOG_FILE = None
@@ -125,7 +163,7 @@ CRASH_LOG_PATH = Path(__file__).resolve().with_name("crash.log")
 
 
 # Thread-safe queue for data updates
-data_queue = queue.Queue()
+data_queue = WakeupQueue()
 
 def _install_crash_logger(log_path: Path | str | None = None) -> None:
     global _CRASH_LOG_FILE
@@ -214,55 +252,26 @@ def _start_tracemalloc_snapshotter():
 
 _start_tracemalloc_snapshotter()
 
-def run_wechselrichter():
-    try:
-        while not shutdown_event.is_set():
-            # Statt nur abrufen_und_speichern(), Daten an die GUI übergeben
-            try:
-                start = time.perf_counter()
-                data = Wechselrichter.abrufen_und_speichern()
-                latency_ms = int((time.perf_counter() - start) * 1000)
-                if data:
-                    data_queue.put(('wechselrichter', data))
-                    update_source_health("pv", ok=True, latency_ms=latency_ms)
-                else:
-                    update_source_health("pv", ok=False, error="no data")
-            except Exception as e:
-                logging.error(f"Wechselrichter-Thread Fehler: {e}")
-                update_source_health("pv", ok=False, error=str(e))
-            time.sleep(10)
-    except Exception as e:
-        logging.error(f"Wechselrichter-Thread Fehler: {e}")
-        update_source_health("pv", ok=False, error=str(e))
-
-def run_bmkdaten():
-    logging.info("[BMKDATEN] Thread gestartet")
+def _register_collectors() -> None:
+    """Alle Datenquellen beim gemeinsamen Collector-Scheduler anmelden."""
+    register_collector(Wechselrichter.FroniusCollector())
+    register_collector(BMKDATEN.BmkCollector())
+    # Tado sammelt unabhängig vom (lazy gebauten) Tab; der Tab abonniert nur
+    if tado_configured():
+        register_collector(TadoZoneCollector())
     try:
-        while not shutdown_event.is_set():
-            try:
-                start = time.perf_counter()
-                data = BMKDATEN.abrufen_und_speichern()
-                latency_ms = int((time.perf_counter() - start) * 1000)
-                if data:
-                    logging.info("[BMKDATEN] Daten empfangen: %s keys, latency=%dms", len(data), latency_ms)
-                    data_queue.put(('bmkdaten', data))
-                    update_source_health("heating", ok=True, latency_ms=latency_ms)
-                else:
-                    logging.warning("[BMKDATEN] Keine Daten empfangen")
-                    update_source_health("heating", ok=False, error="no data")
-            except Exception as e:
-                logging.error(f"BMKDATEN-Thread Fehler: {e}")
-                update_source_health("heating", ok=False, error=str(e))
-            time.sleep(10)
-    except Exception as e:
-        logging.error(f"BMKDATEN-Thread Fehler: {e}")
-        update_source_health("heating", ok=False, error=str(e))
+        ha_config = load_homeassistant_config()
+        if ha_config and ha_config.sensor_entity_ids:
+            register_collector(HomeAssistantSensorCollector(HomeAssistantClient(ha_config)))
+    except Exception as exc:
+        logging.warning("Home-Assistant-Sensoren nicht registriert: %s", exc)
 
 
 def main():
     start_time = time.time()
 
     root = tk.Tk()
+    startup_timeline.mark("tk_root")
     # Fullscreen state tracking
     windowed_flag = os.getenv("DASHBOARD_WINDOWED", "0").strip().lower() in {"1", "true", "yes", "on"}
     root._fullscreen = not windowed_flag
@@ -279,6 +288,7 @@ def main():
         datastore.cleanup_old_records(retention_days=365)
     except Exception as exc:
         logging.warning("[DB] Retention cleanup skipped: %s", exc)
+    startup_timeline.mark("datastore")
 
     env_scale = os.getenv("UI_SCALING")
 
@@ -298,6 +308,7 @@ def main():
 
     root.title("Smart Energy Dashboard Pro")
     app = MainApp(root)
+    startup_timeline.mark("main_app")
 
     def set_fullscreen(enable: bool):
         # In windowed mode, never enable fullscreen (keeps window discoverable on multi-monitor setups)
@@ -350,32 +361,38 @@ def main():
 
         root.after(200, _bring_to_front)
 
-    def _start_collectors() -> list[threading.Thread]:
-        threads: list[threading.Thread] = []
-        for target, name in (
-            (run_wechselrichter, "WechselrichterCollector"),
-            (run_bmkdaten, "BMKDATENCollector"),
-        ):
-            try:
-                thread = threading.Thread(target=target, name=name, daemon=True)
-                thread.start()
-                threads.append(thread)
-            except Exception as exc:
-                logging.error("%s konnte nicht gestartet werden: %s", name, exc)
-        return threads
-
-    collector_threads = _start_collectors()
+    _register_collectors()
+    unsubscribers = [
+        subscribe("pv", lambda data: data_queue.put(('wechselrichter', data, time.perf_counter()))),
+        subscribe("heating", lambda data: data_queue.put(('bmkdaten', data, time.perf_counter()))),
+    ]
+    scheduler = CollectorScheduler()
+    scheduler.start()
+    startup_timeline.mark("collectors")
     elapsed = time.time() - start_time
     logger.info("Dashboard bereit in %.1fs", elapsed)
 
+    def _first_idle() -> None:
+        startup_timeline.mark("first_idle")
+        startup_timeline.log()
+
+    root.after_idle(_first_idle)
+
+    def _frame_report() -> None:
+        FrameScheduler.for_root(root).log_report()
+        root.after(FRAME_REPORT_MS, _frame_report)
+
+    root.after(FRAME_REPORT_MS, _frame_report)
+
     def on_close():
         logging.info("Programm wird beendet…")
         shutdown_event.set()
-        for thread in collector_threads:
-            try:
-                thread.join(timeout=2.0)
-            except Exception:
-                pass
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+        try:
+            scheduler.stop(timeout=2.0)
+        except Exception:
+            pass
         try:
             close_shared_datastore()
         except Exception:
@@ -384,23 +401,45 @@ def main():
 
     root.protocol("WM_DELETE_WINDOW", on_close)
 
-    # Poll the queue for data updates and schedule GUI updates in the main thread
+    # Collector-Daten im Tk-Thread verarbeiten: data_queue.put() weckt die Mainloop
+    def dispatch_item(item):
+        if item[0] == 'wechselrichter':
+            app.handle_wechselrichter_data(item[1])
+            source = "pv"
+        elif item[0] == 'bmkdaten':
+            app.handle_bmkdaten_data(item[1])
+            source = "heating"
+        else:
+            return
+        # Queue-Wartezeit + Übergabe an die UI (Stufe "ui")
+        if len(item) > 2:
+            record_stage(source, "ui", (time.perf_counter() - item[2]) * 1000.0)
+
     def poll_queue():
-        try:
-            while True:
-                item = data_queue.get_nowait()
-                if item[0] == 'wechselrichter':
-                    app.handle_wechselrichter_data(item[1])
-                elif item[0] == 'bmkdaten':
-                    app.handle_bmkdaten_data(item[1])
-        except queue.Empty:
-            pass
-        # Increased from 1500ms to 2000ms - collectors update every 10s
-        root.after(2000, poll_queue)
+        drain_queue(data_queue, dispatch_item)
+
+    data_wakeup = UiWakeup(root, poll_queue, fallback_ms=2000)
+    data_queue.bind(data_wakeup)
 
+    # Blockaden der Mainloop erkennen (Stack des Tk-Threads ins Log)
+    watchdog = None
+    if STALL_THRESHOLD_S > 0:
+        watchdog = StallWatchdog(threshold_s=STALL_THRESHOLD_S)
+        start_tk_heartbeat(root, watchdog)
+        watchdog.start()
 
     poll_queue()
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        # Bei Crash + Neustart (run_with_restart) keine doppelten Collector/Abos
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+        scheduler.stop(timeout=0.5)
+        data_queue.bind(None)
+        data_wakeup.close()
+        if watchdog is not None:
+            watchdog.stop()
 
             # Debug prints and placeholder code removed for production cleanup
 
@@ -417,11 +456,13 @@ def run_with_restart():
             logger.error("Crash detected: %s. Restarting in 3 seconds...", e)
             import time
             time.sleep(3)
+            startup_timeline.reset()
             # Optionally log crash details here
         except:
             logger.critical("Fatal error. Restarting in 3 seconds...")
             import time
             time.sleep(3)
+            startup_timeline.reset()
 
 if __name__ == "__main__":
     run_with_restart()
\ No newline at end of file
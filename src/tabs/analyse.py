@@ -1,9 +1,12 @@
+import time
 import tkinter as tk
+from datetime import datetime
 from tkinter import ttk
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib.dates as mdates
+from core.align import Series, align_to_grid, series_from_rows
 from core.datastore import get_shared_datastore
 from ui.styles import (
     COLOR_ROOT,
@@ -15,8 +18,12 @@ from ui.styles import (
     COLOR_WARNING,
     emoji,
 )
+from ui.chart_render import ChartImage, ChartRenderService, fit_figure, rasterize
 from ui.components.card import Card
 
+_GRID_STEP_S = 300.0
+_EMPTY: Series = (np.empty(0), np.empty(0))
+
 class AnalyseTab:
     """Energie-Effizienz Analyse mit modernem Card-Layout."""
     
@@ -46,54 +53,35 @@ class AnalyseTab:
         card.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
         card.add_title("PV vs. Speicherung (3 Tage)", icon="📊")
         
-        # Plot
-        self.fig, self.ax1 = plt.subplots(figsize=(7.6, 3.8), dpi=100)
+        # Plot: eigene Figure (kein pyplot), gezeichnet in der Render-Lane
+        self.fig = Figure(figsize=(7.6, 3.8), dpi=100)
+        self.ax1 = self.fig.add_subplot(111)
         self.fig.patch.set_facecolor(COLOR_CARD)
         self.ax1.set_facecolor(COLOR_CARD)
-        
-        self.canvas = FigureCanvasTkAgg(self.fig, master=card.content())
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas = FigureCanvasAgg(self.fig)
+
+        self._renderer = ChartRenderService.for_root(root)
+        self._render_key = ("analyse", id(self))
+        self.chart_image = ChartImage(
+            card.content(), bg=COLOR_CARD, on_resize=lambda _w, _h: self._update_plot(), width=760, height=380,
+        )
+        self.chart_image.pack(fill=tk.BOTH, expand=True)
 
         self._update_plot()
 
     def stop(self):
         self.alive = False
-        # Explicitly close matplotlib figure to prevent memory leaks
-        try:
-            import matplotlib.pyplot as plt
-            if hasattr(self, 'fig') and self.fig:
-                plt.close(self.fig)
-                self.fig = None
-        except Exception:
-            pass
-
-    def _load_pv_data(self, hours: int = 72) -> pd.DataFrame:
+        self._renderer.cancel(self._render_key)
+
+    def _load_pv_data(self, hours: int = 72) -> Series:
         if not self.datastore:
-            return pd.DataFrame()
-        rows = self.datastore.get_recent_fronius(hours=hours)
-        if not rows:
-            return pd.DataFrame()
-        df = pd.DataFrame(rows)
-        df.rename(columns={
-            'timestamp': 'Zeitstempel',
-            'pv': 'PV-Leistung (kW)',
-        }, inplace=True)
-        df['Zeitstempel'] = pd.to_datetime(df['Zeitstempel'])
-        return df[['Zeitstempel', 'PV-Leistung (kW)']]
-
-    def _load_heating_data(self, hours: int = 72) -> pd.DataFrame:
+            return _EMPTY
+        return series_from_rows(self.datastore.get_recent_fronius(hours=hours), "pv")
+
+    def _load_heating_data(self, hours: int = 72) -> Series:
         if not self.datastore:
-            return pd.DataFrame()
-        rows = self.datastore.get_recent_heating(hours=hours)
-        if not rows:
-            return pd.DataFrame()
-        df = pd.DataFrame(rows)
-        df.rename(columns={
-            'timestamp': 'Zeitstempel',
-            'top': 'Pufferspeicher Oben',
-        }, inplace=True)
-        df['Zeitstempel'] = pd.to_datetime(df['Zeitstempel'])
-        return df[['Zeitstempel', 'Pufferspeicher Oben']]
+            return _EMPTY
+        return series_from_rows(self.datastore.get_recent_heating(hours=hours), "top")
 
     def _style_axes(self):
         """Styling für Achsen."""
@@ -106,57 +94,61 @@ class AnalyseTab:
         self.ax1.tick_params(colors=COLOR_TEXT, which='both')
 
     def _update_plot(self):
-        """Update Plot."""
+        """Update Plot (Rendering im Worker, Anzeige im Tk-Thread)."""
+        if not self.alive:
+            return
+        width, height = self.chart_image.size
+        self._renderer.request(
+            self._render_key, lambda: self._render(width, height), self.chart_image.show, name="analyse",
+        )
+
+    def _render(self, width: int, height: int):
+        """Läuft in der Render-Lane: Daten laden, plotten, rastern."""
+        fit_figure(self.fig, width, height)
         self.fig.clear()
         self.ax1 = self.fig.add_subplot(111)
         self.fig.patch.set_facecolor(COLOR_CARD)
         self.ax1.set_facecolor(COLOR_CARD)
         self._style_axes()
         
-        # Load data
-        df_pv = self._load_pv_data()
-        df_heating = self._load_heating_data()
-        
-        if df_pv.empty or df_heating.empty:
-            self.ax1.text(0.5, 0.5, "Zu wenig Daten", color=COLOR_SUBTEXT, ha="center", va="center", 
-                         transform=self.ax1.transAxes, fontsize=12)
-            self.canvas.draw()
-            return
+        # Load data (Epoch-Arrays) und auf ein gemeinsames 5-min-Raster legen
+        pv = self._load_pv_data()
+        heating = self._load_heating_data()
+        grid, (pv_kw, puffer_top) = align_to_grid(
+            _GRID_STEP_S, pv, heating, start=time.time() - 3 * 86400, how="mean",
+        )
 
-        # Filter last 3 days
-        now = pd.Timestamp.now()
-        start_date = now - pd.Timedelta(days=3)
-        
-        df_pv = df_pv[df_pv["Zeitstempel"] >= start_date]
-        df_heating = df_heating[df_heating["Zeitstempel"] >= start_date]
-        
-        if df_pv.empty or df_heating.empty:
-            self.ax1.text(0.5, 0.5, "Keine Daten für die letzten 3 Tage", color=COLOR_SUBTEXT, ha="center", 
+        if not grid.size or np.all(np.isnan(pv_kw)) or np.all(np.isnan(puffer_top)):
+            self.ax1.text(0.5, 0.5, "Keine Daten für die letzten 3 Tage", color=COLOR_SUBTEXT, ha="center",
                          va="center", transform=self.ax1.transAxes, fontsize=11)
-            self.canvas.draw()
-            return
+            return rasterize(self.fig)
+
+        x = [datetime.fromtimestamp(t) for t in grid]
 
         # Plot 1: PV Leistung (Linke Achse)
         self.ax1.set_ylabel("PV Leistung (kW)", color=COLOR_PRIMARY, fontsize=10)
-        self.ax1.plot(df_pv["Zeitstempel"], df_pv["PV-Leistung (kW)"], color=COLOR_PRIMARY, 
-                 label="PV-Leistung", linewidth=1.8)
+        self.ax1.plot(x, pv_kw, color=COLOR_PRIMARY, label="PV-Leistung", linewidth=1.8)
         self.ax1.tick_params(axis='y', labelcolor=COLOR_PRIMARY, labelsize=9)
-        
-        # Plot 2: Puffer Oben (Rechte Achse) 
+
+        # Plot 2: Puffer Oben (Rechte Achse)
         ax2 = self.ax1.twinx()
         ax2.set_ylabel("Puffer Oben (°C)", color=COLOR_WARNING, fontsize=10)
-        ax2.plot(df_heating["Zeitstempel"], df_heating.get("Pufferspeicher Oben", 
-                df_heating.get("Puffer_Top", df_heating.get("PufferTop", pd.Series([0])))),
-                color=COLOR_WARNING, label="Puffer Oben", linewidth=1.6, linestyle="--")
+        ax2.plot(x, puffer_top, color=COLOR_WARNING, label="Puffer Oben", linewidth=1.6, linestyle="--")
         ax2.tick_params(axis='y', labelcolor=COLOR_WARNING, labelsize=9)
-        
+
+        # Korrelation auf dem gemeinsamen Raster
+        both = ~(np.isnan(pv_kw) | np.isnan(puffer_top))
+        corr = ""
+        if both.sum() > 2 and np.std(pv_kw[both]) > 0 and np.std(puffer_top[both]) > 0:
+            corr = f"  (r = {np.corrcoef(pv_kw[both], puffer_top[both])[0, 1]:.2f})"
+
         # Styling
         self.ax1.tick_params(axis="x", colors=COLOR_SUBTEXT, labelsize=8)
         self.ax1.xaxis.set_major_formatter(mdates.DateFormatter("%H:%M\n%d.%m"))
         self.ax1.grid(True, color=COLOR_BORDER, alpha=0.2, linewidth=0.8)
         
-        self.fig.suptitle("Zusammenhang: Sonneneinstrahlung vs. Wärmespeicher", 
+        self.fig.suptitle("Zusammenhang: Sonneneinstrahlung vs. Wärmespeicher" + corr, 
                          color=COLOR_TEXT, fontsize=11, fontweight='bold', y=0.98)
         
         self.fig.autofmt_xdate()
-        self.canvas.draw_idle()
+        return rasterize(self.fig)
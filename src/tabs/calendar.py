@@ -1,4 +1,3 @@
-import threading
 import queue
 import time
 import tkinter as tk
@@ -23,6 +22,7 @@ from ui.styles import (
     emoji,
 )
 from ui.components.card import Card
+from core.workers import LANE_IO, run_in_background
 
 # --- KONFIGURATION ---
 ICAL_URLS = [
@@ -421,7 +421,7 @@ class CalendarTab:
             self.status_var.set("Lade...")
         except Exception:
             pass
-        threading.Thread(target=self._load_events_worker, daemon=True).start()
+        run_in_background(self._load_events_worker, lane=LANE_IO, key="calendar:events")
 
     def _load_events_worker(self):
         try:
@@ -434,7 +434,7 @@ class CalendarTab:
         if not self.alive or self._today_refresh_inflight:
             return
         self._today_refresh_inflight = True
-        threading.Thread(target=self._load_today_events_worker, daemon=True).start()
+        run_in_background(self._load_today_events_worker, lane=LANE_IO, key="calendar:today")
 
     def _load_today_events_worker(self):
         try:
@@ -1,9 +1,12 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from datetime import date
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
+from core.binning import trapezoid_energy
+from core.chart_data import get_chart_data
 from core.datastore import get_shared_datastore
+from core.time_utils import to_utc_datetime
 from ui.styles import (
     COLOR_ROOT,
     COLOR_CARD,
@@ -18,13 +21,16 @@ from ui.styles import (
     emoji,
 )
 from ui.views.energy_chart import build_energy_chart
+from ui.chart_render import ChartRenderService
+from ui.frame_budget import PRIORITY_LOW, FrameScheduler
+from ui.tab_lifecycle import TabLifecycle
 
 # Austrian energy price defaults (EUR/kWh)
 _STROMPREIS_EUR_KWH = 0.25
 _EINSPEISETARIF_EUR_KWH = 0.08
 
 
-class ErtragTab:
+class ErtragTab(TabLifecycle):
     """PV-Ertrag pro Tag über längeren Zeitraum."""
 
     def __init__(self, root: tk.Tk, notebook: ttk.Notebook, tab_frame=None):
@@ -134,6 +140,8 @@ class ErtragTab:
 
     def stop(self):
         self.alive = False
+        ChartRenderService.for_root(self.root).cancel(("ertrag.load", id(self)))
+        FrameScheduler.for_root(self.root).cancel(("ertrag.plot", id(self)))
         if self._update_task_id:
             try:
                 self.root.after_cancel(self._update_task_id)
@@ -193,11 +201,11 @@ class ErtragTab:
         prev_power = None
 
         for row in rows:
-            ts_raw = row.get("timestamp")
-            try:
-                ts = datetime.fromisoformat(str(ts_raw))
-            except Exception:
+            # DB-Zeitstempel sind UTC; Tage werden nach Ortszeit getrennt
+            ts = to_utc_datetime(str(row.get("timestamp") or ""))
+            if ts is None:
                 continue
+            ts = ts.astimezone().replace(tzinfo=None)
             if ts < cutoff:
                 continue
             load_kw = row.get("load")
@@ -405,87 +413,55 @@ class ErtragTab:
             else:
                 btn.configure(bg=COLOR_BORDER, fg=COLOR_TEXT, activebackground=COLOR_PRIMARY)
 
-    def _load_energy_flow(self, days: int, bin_minutes: int = 10) -> list[dict]:
+    def _load_energy_flow(self, days: int, pixels: int = 1000) -> tuple[list[dict], int]:
         """Load PV power + house consumption power + grid power for the last N days.
 
+        Kommt aus der Fronius-LOD-Pyramide (``core.chart_data``): die Stufe
+        richtet sich nach ``pixels``, nicht nach dem Zeitraum. Liefert die
+        Punkte und die Bucket-Breite in Sekunden (0 = Rohwerte).
+
         Output schema matches build_energy_chart():
-          - timestamp: datetime
+          - timestamp: datetime (UTC)
           - pv_power: float (kW)
           - house_consumption: float (kW)
           - grid_power: float (kW, + = import, - = export)
         """
         if not self.store:
-            return []
+            return [], 0
 
         try:
-            conn = getattr(self.store, "conn", None)
-            if conn is None:
-                return []
-
-            cutoff = (datetime.now() - timedelta(days=int(days))).strftime("%Y-%m-%d %H:%M:%S")
-            bucket_seconds = max(60, int(bin_minutes) * 60)
-
-            # Bucket by unixepoch seconds to avoid loading huge raw row counts for long windows.
-            bucket_expr = (
-                f"datetime((CAST(strftime('%s', datetime(timestamp)) AS INTEGER) / {bucket_seconds}) * {bucket_seconds}, 'unixepoch')"
-            )
-            sql = (
-                "SELECT "
-                + bucket_expr
-                + " AS bucket_ts, "
-                + "AVG(pv_power) AS pv_avg, "
-                + "AVG(ABS(load_power)) AS load_avg, "
-                + "AVG(grid_power) AS grid_avg "
-                + "FROM fronius "
-                + "WHERE datetime(timestamp) >= datetime(?) "
-                + "GROUP BY bucket_ts "
-                + "ORDER BY bucket_ts ASC"
-            )
-
-            rows = conn.execute(sql, (cutoff,)).fetchall()
+            now = datetime.now().timestamp()
+            data = get_chart_data(self.store).fronius.window(now - int(days) * 86400.0, now, pixels)
         except Exception:
-            return []
+            return [], 0
 
+        # Leere Kanäle im Bucket wie bisher als 0 kW
+        pv = np.nan_to_num(data.avg["pv"]).tolist()
+        load = np.nan_to_num(data.avg["load"]).tolist()
+        grid = np.nan_to_num(data.avg["grid"]).tolist()
         out: list[dict] = []
-        for row in rows:
-            bucket_ts = row[0]
-            pv_avg = row[1]
-            load_avg = row[2]
-            grid_avg = row[3]
-            try:
-                ts = datetime.fromisoformat(str(bucket_ts))
-            except Exception:
-                continue
+        for i, t in enumerate(data.t.tolist()):
+            out.append(
+                {"timestamp": datetime.fromtimestamp(t, timezone.utc), "pv_power": pv[i], "house_consumption": load[i], "grid_power": grid[i]}
+            )
+        return out, data.bucket_s
 
+    def on_catch_up(self) -> None:
+        # Evtl. noch geplanten Timer ersetzen, damit keine zweite Schleife entsteht
+        if self._update_task_id is not None:
             try:
-                pv_kw = float(pv_avg) if pv_avg is not None else 0.0
-            except Exception:
-                pv_kw = 0.0
-            try:
-                load_kw = float(load_avg) if load_avg is not None else 0.0
-            except Exception:
-                load_kw = 0.0
-            try:
-                grid_kw = float(grid_avg) if grid_avg is not None else 0.0
+                self.root.after_cancel(self._update_task_id)
             except Exception:
-                grid_kw = 0.0
-
-            # Backward compatibility: some sources may still store W.
-            if pv_kw > 200.0:
-                pv_kw = pv_kw / 1000.0
-            if load_kw > 200.0:
-                load_kw = load_kw / 1000.0
-            if abs(grid_kw) > 200.0:
-                grid_kw = grid_kw / 1000.0
-
-            pv_kw = max(0.0, pv_kw)
-            load_kw = max(0.0, load_kw)
-            out.append({"timestamp": ts, "pv_power": pv_kw, "house_consumption": load_kw, "grid_power": grid_kw})
-        return out
+                pass
+            self._update_task_id = None
+        self._update_plot()
 
     def _update_plot(self):
         if not self.alive:
             return
+        # Versteckt: kein Replot, beim Anzeigen einmal nachholen
+        if self.defer_while_hidden():
+            return
         if getattr(self, "energy_chart", None) is None:
             return
 
@@ -496,20 +472,31 @@ class ErtragTab:
                 pass
             self._update_task_id = None
 
+        # Laden im Worker (Pyramide, ggf. erster Rollup), Rendern/Statistik
+        # als budgetierte Chunks im Tk-Leerlauf
         window_days = int(self._period_map.get(self._period_var.get(), 7) or 7)
+        try:
+            pixels = int(self.energy_chart.canvas_widget.winfo_width() or 0)
+        except Exception:
+            pixels = 0
+        pixels = pixels if pixels >= 50 else 1000
+        ChartRenderService.for_root(self.root).request(
+            ("ertrag.load", id(self)),
+            # Feiner laden als gezeichnet: EnergyChart dünnt per LTTB auf die Breite aus
+            lambda: self._load_energy_flow(window_days, pixels=pixels * 4),
+            self._on_loaded,
+            name="ertrag",
+        )
 
-        # Choose a coarse bin for long windows to keep UI fast.
-        if window_days <= 7:
-            bin_minutes = 10
-        elif window_days <= 30:
-            bin_minutes = 30
-        elif window_days <= 180:
-            bin_minutes = 180
-        else:
-            bin_minutes = 360
-
-        data = self._load_energy_flow(window_days, bin_minutes=bin_minutes)
+    def _on_loaded(self, result) -> None:
+        if not self.alive:
+            return
+        data, bucket_s = result
+        FrameScheduler.for_root(self.root).submit(
+            "ertrag.plot", lambda: self._plot_steps(data, bucket_s), priority=PRIORITY_LOW, key=("ertrag.plot", id(self)),
+        )
 
+    def _plot_steps(self, data: list[dict], bucket_s: int):
         last = data[-1] if data else None
         key = (
             len(data),
@@ -522,8 +509,12 @@ class ErtragTab:
             self._update_task_id = self.root.after(60 * 1000, self._update_plot)
             return
         self._last_key = key
+        yield
+        if not self.alive:
+            return
 
         self.energy_chart.render(data)
+        yield
 
         # Integrate kW to kWh over the visible window (trapezoid), for the footer stats.
         pv_kwh = 0.0
@@ -532,25 +523,14 @@ class ErtragTab:
         grid_export_kwh = 0.0
         try:
             if len(data) >= 2:
-                max_gap_h = max(6.0, (float(bin_minutes) / 60.0) * 4.0)
-                for a, b in zip(data, data[1:]):
-                    ta = a.get("timestamp")
-                    tb = b.get("timestamp")
-                    if not isinstance(ta, datetime) or not isinstance(tb, datetime):
-                        continue
-                    dt_h = (tb - ta).total_seconds() / 3600.0
-                    if dt_h <= 0 or dt_h > max_gap_h:
-                        continue
-                    pv_kwh += (float(a.get("pv_power", 0.0)) + float(b.get("pv_power", 0.0))) / 2.0 * dt_h
-                    load_kwh += (float(a.get("house_consumption", 0.0)) + float(b.get("house_consumption", 0.0))) / 2.0 * dt_h
-                    # Grid: positive = import, negative = export
-                    g_a = float(a.get("grid_power", 0.0))
-                    g_b = float(b.get("grid_power", 0.0))
-                    g_avg = (g_a + g_b) / 2.0
-                    if g_avg > 0:
-                        grid_import_kwh += g_avg * dt_h
-                    else:
-                        grid_export_kwh += abs(g_avg) * dt_h
+                max_gap_s = max(6.0, (float(bucket_s) / 3600.0) * 4.0) * 3600.0
+                t = np.array([d["timestamp"].timestamp() for d in data], dtype=float)
+                pv_kwh = float(trapezoid_energy(t, [d.get("pv_power", 0.0) for d in data], max_gap_s).sum())
+                load_kwh = float(trapezoid_energy(t, [d.get("house_consumption", 0.0) for d in data], max_gap_s).sum())
+                # Grid: positive = import, negative = export
+                grid = trapezoid_energy(t, [d.get("grid_power", 0.0) for d in data], max_gap_s)
+                grid_import_kwh = float(grid[grid > 0].sum())
+                grid_export_kwh = float(-grid[grid < 0].sum())
         except Exception:
             pv_kwh = 0.0
             load_kwh = 0.0
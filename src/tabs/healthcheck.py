@@ -2,7 +2,6 @@ import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-import threading
 import requests
 import subprocess
 import shutil
@@ -21,7 +20,12 @@ from ui.styles import (
     COLOR_BORDER,
     emoji,
 )
+from ui.chart_render import ChartRenderService
 from ui.components.card import Card
+from ui.frame_budget import PRIORITY_LOW, FrameScheduler
+from ui.tab_lifecycle import TabLifecycle
+from core.health import STAGES, get_health_snapshot, get_stage_snapshot, get_stall_snapshot
+from core.workers import LANE_ANALYTICS, LANE_IO, get_worker_pool, run_in_background
 
 
 def _fmt_age_minutes(dt: datetime | None) -> str:
@@ -67,7 +71,77 @@ def _max_gap_minutes(timestamps: list[str]) -> float | None:
     return max_gap_s / 60.0
 
 
-class HealthTab:
+def _fmt_pipeline(stages: dict) -> str:
+    """Eine Zeile je Quelle: 'pv  fetch 45/120  parse 0.2/0.4 ...'."""
+    lines = []
+    for source in sorted(stages):
+        parts = []
+        for stage in STAGES:
+            st = stages[source].get(stage)
+            if st is not None:
+                parts.append(f"{stage} {st.p50_ms:.3g}/{st.p95_ms:.3g}")
+        if parts:
+            lines.append(f"{source:<13} " + "  ".join(parts))
+    return "\n".join(lines) or "–"
+
+
+def _fmt_histograms(stages: dict, stage: str = "total") -> str:
+    """Verteilung der Zyklusdauer je Quelle: 'hist:pv  <=50 12  <=100 200  <=500 28' (leere Buckets weg)."""
+    lines = []
+    for source in sorted(stages):
+        st = stages[source].get(stage)
+        if st is None:
+            continue
+        buckets = [f"{label} {count}" for label, count in st.histogram.items() if count]
+        if buckets:
+            lines.append(f"{'hist:' + source:<13} " + "  ".join(buckets))
+    return "\n".join(lines)
+
+
+def _fmt_workers(lanes: dict) -> str:
+    """Eine Zeile je Worker-Lane: 'worker:io  1/4 aktiv  q0  max 12 ms  ersetzt 3'."""
+    lines = []
+    for name, st in lanes.items():
+        if not st.submitted:
+            continue
+        line = f"{'worker:' + name:<13} {st.running}/{st.limit} aktiv  q{st.queued}  max {st.max_wait_ms:.3g} ms"
+        if st.superseded:
+            line += f"  ersetzt {st.superseded}"
+        if st.failed:
+            line += f"  Fehler {st.failed}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _fmt_frames(worst: list) -> str:
+    """Langsamste Tk-Jobs: 'frame:ertrag.plot  max 85 ms  Ø 40 ms  >Budget 3'."""
+    return "\n".join(
+        f"{'frame:' + st.name:<13} max {st.max_ms:.3g} ms  Ø {st.mean_ms:.3g} ms  >Budget {st.over_budget}"
+        for st in worst
+        if st.over_budget
+    )
+
+
+def _fmt_charts(charts: dict) -> str:
+    """Chart-Rendering im Worker: 'chart:historical  max 180 ms  zuletzt 40 ms  verworfen 2'."""
+    lines = []
+    for name, st in charts.items():
+        line = f"{'chart:' + name:<13} max {st.max_ms:.3g} ms  zuletzt {st.last_ms:.3g} ms"
+        if st.stale:
+            line += f"  verworfen {st.stale}"
+        if st.failed:
+            line += f"  Fehler {st.failed}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _fmt_stalls(stalls: dict, limit: int = 3) -> str:
+    """Häufigste Blockaden der Mainloop: 'stall tabs/spotify.py:412 _load_cover  3x  max 2.1 s'."""
+    worst = sorted(stalls.values(), key=lambda st: (st.count, st.max_ms), reverse=True)[:limit]
+    return "\n".join(f"stall {st.site}  {st.count}x  max {st.max_ms / 1000.0:.1f} s" for st in worst)
+
+
+class HealthTab(TabLifecycle):
     """Simple health check + self-healing tools."""
 
     def __init__(self, root: tk.Tk, notebook, datastore=None, app=None, tab_frame=None):
@@ -211,6 +285,19 @@ class HealthTab:
         for v in (self.var_hue, self.var_tado, self.var_spotify):
             ctk.CTkLabel(body2, textvariable=v, font=("Segoe UI", 12), text_color=COLOR_TEXT).pack(anchor="w", pady=2)
 
+        # Pipeline-Zeiten je Quelle (p50/p95 über das rollierende Fenster)
+        self.card_pipe = Card(grid)
+        self.card_pipe.grid(row=1, column=0, columnspan=2, sticky="nsew", pady=(12, 0))
+        self.card_pipe.add_title("Pipeline (p50/p95 ms)", icon="⏱")
+        self.var_pipeline = tk.StringVar(value="–")
+        ctk.CTkLabel(
+            self.card_pipe.content(),
+            textvariable=self.var_pipeline,
+            font=("Consolas", 11),
+            text_color=COLOR_TEXT,
+            justify="left",
+        ).pack(anchor="w", pady=2)
+
     def _refresh_homeassistant_async(self) -> None:
         if getattr(self, "_ha_check_running", False):
             return
@@ -269,7 +356,7 @@ class HealthTab:
             except Exception:
                 self._ha_check_running = False
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_IO, key="health:homeassistant")
 
     def _rebuild_spark_cache(self) -> None:
         try:
@@ -332,7 +419,7 @@ class HealthTab:
             except Exception:
                 pass
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_ANALYTICS, key="health:self_heal")
 
     def _git_pull_and_restart(self) -> None:
         """Pull latest changes and quit so the service can restart the app."""
@@ -525,7 +612,7 @@ class HealthTab:
             except Exception:
                 pass
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_IO, key="health:git_pull")
 
     def _parse_git_pull_changes(self, output: str) -> int | None:
         """Parse git pull output to extract number of changed files."""
@@ -606,9 +693,21 @@ class HealthTab:
             except Exception:
                 pass
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_ANALYTICS, key="health:last_update")
+
+    def on_catch_up(self) -> None:
+        self.refresh()
 
     def refresh(self) -> None:
+        # Versteckt: keine DB-/API-Abfragen, beim Anzeigen einmal nachholen
+        if self.defer_while_hidden():
+            return
+        # DB-Abfragen als budgetierte Chunks im Tk-Leerlauf (Touch bleibt flüssig)
+        FrameScheduler.for_root(self.root).submit(
+            "health.refresh", self._refresh_steps, priority=PRIORITY_LOW, key=("health.refresh", id(self)),
+        )
+
+    def _refresh_steps(self):
         ds = self.datastore
         if ds is None and self.app is not None:
             ds = getattr(self.app, "datastore", None)
@@ -649,6 +748,7 @@ class HealthTab:
             self.var_heat.set(f"Heizung last: {_fmt_age_minutes(dt)}")
         except Exception:
             self.var_heat.set("Heizung last: –")
+        yield
 
         # Gap detection (24h)
         try:
@@ -657,6 +757,7 @@ class HealthTab:
             self.var_gap_pv.set("PV gap(24h): –" if gap is None else f"PV gap(24h): {gap:.0f}m")
         except Exception:
             self.var_gap_pv.set("PV gap(24h): –")
+        yield
 
         try:
             h_rows = ds.get_recent_heating(hours=24, limit=4000) if ds else []
@@ -664,6 +765,7 @@ class HealthTab:
             self.var_gap_heat.set("Heizung gap(24h): –" if gap is None else f"Heizung gap(24h): {gap:.0f}m")
         except Exception:
             self.var_gap_heat.set("Heizung gap(24h): –")
+        yield
 
         # Sparkline cache file
         try:
@@ -681,20 +783,31 @@ class HealthTab:
         self._refresh_homeassistant_async()
 
         try:
-            tab = getattr(self.app, "tado_tab", None) if self.app else None
-            api = getattr(tab, "api", None) if tab else None
-            if api is None:
+            # Tado wird vom Collector-Scheduler abgefragt; hier nur dessen Health lesen.
+            entry = get_health_snapshot().get("tado")
+            if entry is None:
                 self.var_tado.set("Tado: –")
+            elif entry.last_ok and (entry.last_error is None or entry.last_ok >= entry.last_error):
+                self.var_tado.set(f"Tado: OK ({_fmt_age_minutes(entry.last_ok.astimezone())})")
             else:
-                # Best-effort check
-                try:
-                    api.getHomeState()
-                    self.var_tado.set("Tado: OK")
-                except Exception:
-                    self.var_tado.set("Tado: OK (ohne HomeState)")
+                self.var_tado.set(f"Tado: Fehler ({entry.last_error_msg or '–'})")
         except Exception as exc:
             self.var_tado.set(f"Tado: Fehler ({type(exc).__name__})")
 
+        try:
+            stage_stats = get_stage_snapshot()
+            parts = (
+                _fmt_pipeline(stage_stats),
+                _fmt_histograms(stage_stats),
+                _fmt_workers(get_worker_pool().stats()),
+                _fmt_frames(FrameScheduler.for_root(self.root).worst(3)),
+                _fmt_charts(ChartRenderService.for_root(self.root).stats()),
+                _fmt_stalls(get_stall_snapshot()),
+            )
+            self.var_pipeline.set("\n".join(p for p in parts if p))
+        except Exception:
+            self.var_pipeline.set("–")
+
         # Lightweight periodic refresh (keeps freshness values current)
         try:
             if self._refresh_after_id is not None:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+import time
 import tkinter as tk
 from tkinter import ttk
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import matplotlib
 
 matplotlib.use("Agg")
 import matplotlib.dates as mdates
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
 from ui.styles import (
@@ -26,17 +27,77 @@ from ui.styles import (
     COLOR_TITLE,
     emoji,
 )
+from core.chart_data import RETENTION_DAYS, get_chart_data
+from core.downsample import downsample, envelope
+from core.time_utils import local_utc_offset
+from ui.chart_model import BlitLineChart
+from ui.chart_render import ChartImage, ChartRenderService, fit_figure, snapshot
+from ui.chart_zoom import ZoomGesture, ZoomWindow
+from ui.tab_lifecycle import TabLifecycle
 
+# Achsenbereich der Figur (``subplots_adjust``) – auch für die Zoom-Geste
+_PLOT_LEFT, _PLOT_RIGHT = 0.07, 0.97
+_MDATES_EPOCH = mdates.date2num(datetime(1970, 1, 1))
+# Pyramide feiner abfragen als gezeichnet wird; LTTB dünnt formtreu auf die Pixelbreite aus
+_OVERSAMPLE = 4
 
-class HistoricalTab(tk.Frame):
+
+# Zonenwechsel (Sommer-/Winterzeit) liegen auf Vielfachen von 15 min UTC
+_OFFSET_QUANTUM_S = 900.0
+
+
+def _epoch_to_num(t):
+    """UTC-Epoch-Sekunden als matplotlib-Datumszahl in Ortszeit.
+
+    Der UTC-Offset gilt je Zeitstempel, damit Bereiche über eine
+    Zeitumstellung nicht um eine Stunde verschoben werden. Er wird je
+    15-min-Quantum einmal bestimmt und dann vektorisiert angewendet.
+    """
+    values = np.asarray(t, dtype=float)
+    offsets = np.zeros_like(values)
+    finite = np.isfinite(values)
+    if finite.any():
+        quanta, inverse = np.unique(np.floor(values[finite] / _OFFSET_QUANTUM_S), return_inverse=True)
+        per_quantum = np.array([local_utc_offset(q * _OFFSET_QUANTUM_S) for q in quanta])
+        offsets[finite] = per_quantum[inverse.reshape(-1)]
+    return _MDATES_EPOCH + (values + offsets) / 86400.0
+
+
+def _resolution_label(bucket_s: int) -> str:
+    if bucket_s <= 0:
+        return "Rohdaten"
+    if bucket_s < 3600:
+        return f"{bucket_s // 60} min"
+    if bucket_s < 86400:
+        return f"{bucket_s // 3600} h"
+    return f"{bucket_s // 86400} d"
+
+
+class HistoricalTab(tk.Frame, TabLifecycle):
     """Heizung-Historie: zeigt Temperatur-Verläufe als Linienplot.
 
     Ziele:
     - Tab wird zuverlässig im Notebook angezeigt
     - Zeitraum wählbar (24h/7d/30d)
     - Fehlende Werte werden als Lücken dargestellt (kein Fake-0)
+    - Achse und Linien werden einmal angelegt und nur per ``set_data``
+      aktualisiert; Refreshes ohne Grenzänderung laufen per Blitting
+    - Laden und Zeichnen laufen in der Render-Lane (``ui.chart_render``),
+      der Tk-Thread zeigt nur das fertige Bild
+    - Daten kommen aus der LOD-Pyramide (``core.chart_data``): Zeitraum-
+      wechsel, Ziehen (Pan) und Zoom wählen nur die passende Stufe, ohne
+      neu zu laden oder zu binnen; Doppeltipp springt zurück zum Zeitraum
     """
 
+    _PLOT_DEFS = [
+        ("top", "Puffer oben", COLOR_PRIMARY, "-"),
+        ("mid", "Puffer mitte", COLOR_INFO, "-"),
+        ("bot", "Puffer unten", COLOR_WARNING, "-"),
+        ("kessel", "Kessel", COLOR_DANGER, "-"),
+        ("warm", "Warmwasser", COLOR_SUCCESS, "-"),
+        ("outdoor", "Außen", COLOR_SUBTEXT, "--"),
+    ]
+
     def __init__(self, parent: tk.Misc, notebook: ttk.Notebook, datastore, tab_frame=None, *args, **kwargs):
         # Use provided tab_frame as parent or notebook (legacy)
         frame_parent = tab_frame if tab_frame is not None else notebook
@@ -55,6 +116,7 @@ class HistoricalTab(tk.Frame):
             "365d": 8760,
         }
         self.after_job = None
+        self._stopped = False
 
         # Compatibility hooks used elsewhere in app.py
         self._last_key = None
@@ -147,14 +209,19 @@ class HistoricalTab(tk.Frame):
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor(COLOR_ROOT)
 
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        try:
-            self.canvas_widget.configure(bg=COLOR_ROOT, highlightthickness=0)
-        except Exception:
-            pass
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
-        self.canvas_widget.bind("<Configure>", self._on_canvas_resize)
+        # Agg-Canvas ohne Tk: gezeichnet wird nur in der Render-Lane
+        self.canvas = FigureCanvasAgg(self.fig)
+        self._renderer = ChartRenderService.for_root(self.root)
+        self._render_key = ("historical", id(self))
+        self.chart_image = ChartImage(
+            self.chart_frame, bg=COLOR_ROOT, on_resize=lambda _w, _h: self._update_plot(), width=1000, height=480,
+        )
+        self.chart_image.pack(fill=tk.BOTH, expand=True)
+        self._zoom = ZoomWindow(max_span=RETENTION_DAYS * 86400.0)
+        self._gesture = ZoomGesture(
+            self.chart_image, self._zoom, self._default_window, self._update_plot, plot_x=(_PLOT_LEFT, _PLOT_RIGHT),
+        )
+        self._build_chart()
 
         self.statusbar = tk.Label(
             self,
@@ -166,36 +233,24 @@ class HistoricalTab(tk.Frame):
         )
         self.statusbar.grid(row=2, column=0, sticky="ew", padx=10, pady=(6, 10))
 
-    @staticmethod
-    def _parse_ts(value) -> datetime | None:
-        if not value:
-            return None
-        try:
-            s = str(value).strip()
-            if s.endswith("Z"):
-                s = s[:-1] + "+00:00"
-            dt = datetime.fromisoformat(s)
-            if getattr(dt, "tzinfo", None) is not None:
-                dt = dt.astimezone().replace(tzinfo=None)
-            return dt
-        except Exception:
-            return None
-
-    @staticmethod
-    def _as_float(v):
-        if v in (None, ""):
-            return None
-        try:
-            return float(v)
-        except Exception:
-            return None
-
     def _select_period(self, period: str) -> None:
         """Wechselt Zeitraum und aktualisiert Button-Farben."""
         self._period_var.set(period)
         self._update_period_button_colors()
+        self._zoom.reset()
         self._update_plot()
 
+    def _default_window(self) -> tuple[float, float]:
+        """Fenster des gewählten Zeitraums (Epoch-Sekunden).
+
+        "Jetzt" liegt bei 75% der Breite: 33% zusätzliche Zeit in die Zukunft.
+        """
+        span = self._period_map.get(self._period_var.get(), 24) * 3600.0
+        now = time.time()
+        end = now + span * 0.33
+        self._zoom.bounds = (now - RETENTION_DAYS * 86400.0, end)
+        return now - span, end
+
     def _update_period_button_colors(self) -> None:
         """Aktualisiert Button-Farben basierend auf aktuellem Zeitraum."""
         current = self._period_var.get()
@@ -205,6 +260,67 @@ class HistoricalTab(tk.Frame):
             else:
                 btn.configure(fg_color=COLOR_BORDER, text_color=COLOR_TEXT, hover_color=COLOR_PRIMARY)
 
+    def _build_chart(self) -> None:
+        """Linien, Jetzt-Linie, Leer-Hinweis und Legende einmalig anlegen."""
+        self._style_axes()
+        self.ax.xaxis_date()
+        locator = mdates.AutoDateLocator(minticks=4, maxticks=8)
+        self.ax.xaxis.set_major_locator(locator)
+        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+        self.chart = BlitLineChart(self.fig, self.ax, self.canvas, self._PLOT_DEFS)
+        # Vertikale "Jetzt"-Linie bei ~75%, wandert per set_xdata mit
+        self._now_line = self.chart.add_overlay(
+            self.ax.axvline(0.0, color=COLOR_PRIMARY, linewidth=1.8, linestyle='--', alpha=0.7, label='Jetzt', zorder=10)
+        )
+        self._empty_text = self.ax.text(
+            0.5,
+            0.5,
+            "Keine Daten",
+            ha="center",
+            va="center",
+            transform=self.ax.transAxes,
+            color=COLOR_SUBTEXT,
+            fontsize=14,
+            visible=False,
+        )
+        # Legend: keep it compact and out of the way (avoid overlapping the newest data at the right).
+        self._legend = self.ax.legend(
+            loc="upper left",
+            fontsize=9,
+            frameon=False,
+            labelcolor=COLOR_SUBTEXT,
+            ncol=3,
+            handlelength=1.2,
+            columnspacing=0.8,
+            handletextpad=0.4,
+        )
+        # Erst nach der Legende animieren, sonst fehlen deren Handles im Hintergrund
+        self.chart.animate()
+        self._apply_layout()
+        self._title = None
+        self._empty = None
+
+    def _set_empty(self, empty: bool) -> None:
+        """Leerzustand ohne Fake-Achsen (kein 0..1-Maßstab, keine doppelten Tick-Labels)."""
+        if empty == self._empty:
+            return
+        self._empty = empty
+        try:
+            self._empty_text.set_visible(empty)
+            self._legend.set_visible(not empty)
+            self.ax.xaxis.set_visible(not empty)
+            self.ax.yaxis.set_visible(not empty)
+            self.ax.spines["left"].set_visible(not empty)
+            self.ax.spines["bottom"].set_visible(not empty)
+            if empty:
+                self.ax.grid(False)
+            else:
+                self.ax.grid(True, color=COLOR_BORDER, alpha=0.20, linewidth=0.6)
+        except Exception:
+            pass
+        self.chart.invalidate()
+
     def _schedule_update(self) -> None:
         if self.after_job is not None:
             try:
@@ -213,40 +329,10 @@ class HistoricalTab(tk.Frame):
                 pass
         self.after_job = self.after(60000, self._update_plot)
 
-    def _on_canvas_resize(self, event) -> None:
-        try:
-            w = max(1, int(getattr(event, "width", 1)))
-            h = max(1, int(getattr(event, "height", 1)))
-            dpi = float(self.fig.get_dpi() or 100.0)
-            self.fig.set_size_inches(w / dpi, h / dpi, forward=False)
-            self._apply_layout()
-            # Full draw to avoid leftover pixels from a previous larger render.
-            self.canvas.draw()
-        except Exception:
-            pass
-
     def _apply_layout(self) -> None:
         # Optimierte Margins: Links für Y-Achse, rechts großzügig für letzte Labels
         try:
-            self.fig.subplots_adjust(left=0.07, right=0.97, top=0.90, bottom=0.16)
-        except Exception:
-            pass
-
-    def _sync_figure_to_canvas(self) -> None:
-        """Make sure the figure render buffer matches the widget size.
-
-        If the renderer buffer is smaller than the Tk widget, old pixels can remain visible
-        and look like a second plot underneath.
-        """
-        try:
-            if not hasattr(self, "canvas_widget"):
-                return
-            w = int(self.canvas_widget.winfo_width() or 0)
-            h = int(self.canvas_widget.winfo_height() or 0)
-            if w <= 2 or h <= 2:
-                return
-            dpi = float(self.fig.get_dpi() or 100.0)
-            self.fig.set_size_inches(w / dpi, h / dpi, forward=False)
+            self.fig.subplots_adjust(left=_PLOT_LEFT, right=_PLOT_RIGHT, top=0.90, bottom=0.16)
         except Exception:
             pass
 
@@ -270,240 +356,120 @@ class HistoricalTab(tk.Frame):
         except Exception:
             pass
 
-    @staticmethod
-    def _downsample_timeseries(times: list[datetime], series: dict[str, list[float]], bin_hours: int) -> tuple[list[datetime], dict[str, list[float]]]:
-        if not times or bin_hours <= 1:
-            return times, series
-
-        bin_seconds = max(1, int(bin_hours * 3600))
-        buckets: dict[int, dict[str, list[float]]] = {}
-
-        for idx, ts in enumerate(times):
-            try:
-                bin_id = int(ts.timestamp()) // bin_seconds
-            except Exception:
-                continue
-            if bin_id not in buckets:
-                buckets[bin_id] = {k: [] for k in series.keys()}
-            for key, values in series.items():
-                val = values[idx]
-                if val is None or (isinstance(val, float) and np.isnan(val)):
-                    continue
-                buckets[bin_id][key].append(float(val))
-
-        if not buckets:
-            return times, series
-
-        ordered_bins = sorted(buckets.keys())
-        binned_times = [datetime.fromtimestamp(bid * bin_seconds) for bid in ordered_bins]
-        binned_series: dict[str, list[float]] = {k: [] for k in series.keys()}
-
-        for bid in ordered_bins:
-            bucket = buckets[bid]
-            for key in series.keys():
-                vals = bucket.get(key, [])
-                if not vals:
-                    binned_series[key].append(np.nan)
-                else:
-                    binned_series[key].append(float(np.mean(vals)))
-
-        return binned_times, binned_series
+    def on_catch_up(self) -> None:
+        self._update_plot()
 
     def _update_plot(self) -> None:
-        hours = self._period_map.get(self._period_var.get(), 24)
-        period_label = self._period_var.get() or f"{hours}h"
-        now = datetime.now()
-        cutoff = now - timedelta(hours=hours)
-
-        try:
-            rows = self.datastore.get_recent_heating(hours=hours, limit=None) if self.datastore else []
-        except Exception:
-            rows = []
-
-        times: list[datetime] = []
-        series = {
-            "top": [],
-            "mid": [],
-            "bot": [],
-            "kessel": [],
-            "warm": [],
-            "outdoor": [],
-        }
+        # Nach stop() gehört die Figure dem Abbau in der Render-Lane
+        if self._stopped:
+            return
+        # Versteckt: kein Replot, beim Anzeigen einmal nachholen
+        if self.defer_while_hidden():
+            return
+        # Fenster und Größe im Tk-Thread lesen, Laden/Zeichnen im Worker
+        period = self._period_var.get()
+        window = self._zoom.current(self._default_window())
+        zoomed = self._zoom.active
+        width, height = self.chart_image.size
+        self._renderer.request(
+            self._render_key,
+            lambda: self._render(period, window, zoomed, width, height),
+            self._show_render,
+            name="historical",
+        )
 
-        for row in rows:
-            ts = self._parse_ts((row or {}).get("timestamp"))
-            if ts is None:
-                continue
-            if ts < cutoff or ts > now + timedelta(seconds=60):
-                continue
-            times.append(ts)
-
-            for key in series.keys():
-                val = self._as_float((row or {}).get(key))
-                if val is None:
-                    series[key].append(np.nan)
-                    continue
-
-                # Plausibility filtering; keep outdoor wider and allow 0°C.
-                if key == "outdoor":
-                    if not (-40.0 <= val <= 60.0):
-                        series[key].append(np.nan)
-                    else:
-                        series[key].append(val)
-                    continue
-
-                # Heating temps: treat 0.0 as missing (common placeholder), and clamp plausible range.
-                if val == 0.0:
-                    series[key].append(np.nan)
-                elif not (-40.0 <= val <= 120.0):
-                    series[key].append(np.nan)
-                else:
-                    series[key].append(val)
-
-        # Defensive: rebuild axes to avoid accidental overlay of multiple axes
-        self.fig.clear()
-        self.ax = self.fig.add_subplot(111)
-        self.fig.patch.set_facecolor(COLOR_ROOT)
-        self.fig.patch.set_alpha(1.0)
-        self._style_axes()
+    def _show_render(self, result) -> None:
+        raster, points, bucket_s = result
+        self.chart_image.show(raster)
+        self._render_status(points, bucket_s)
+        self._schedule_update()
 
-        # Ensure renderer matches widget size before drawing.
-        self._sync_figure_to_canvas()
+    def _render(self, period: str, window: tuple[float, float], zoomed: bool, width: int, height: int):
+        """Läuft in der Render-Lane: Fenster aus der Pyramide holen, Artists aktualisieren, rastern."""
+        start, end = window
+        now = time.time()
+        # Etwa ein Punkt je Pixel der Plotbreite – unabhängig vom Zeitraum
+        pixels = max(50, int(width * (_PLOT_RIGHT - _PLOT_LEFT)))
 
-        # Title like sparkline: left aligned, subtle
         try:
-            self.ax.set_title(
-                f"Heizung & Temperaturen ({period_label})",
-                loc="left",
-                fontsize=13,
-                color=COLOR_TEXT,
-                pad=8,
-            )
+            source = get_chart_data(self.datastore).heating if self.datastore else None
+            data = source.window(start, min(end, now + 60), pixels * _OVERSAMPLE) if source else None
         except Exception:
-            pass
+            data = None
 
-        # "Jetzt" bei 75% der Breite: zeige 33% zusätzliche Zeit in die Zukunft
-        # Damit: cutoff bis now = 75% der Breite, now bis future_end = 25% der Breite
-        future_extension = timedelta(hours=hours * 0.33)  # 1/3 der Vergangenheit = 25% der Gesamtbreite
-        try:
-            self.ax.set_xlim(cutoff, now + future_extension)
-        except Exception:
-            pass
-        
-        # Vertikale "Jetzt"-Linie bei ~75%
-        try:
-            self.ax.axvline(now, color=COLOR_PRIMARY, linewidth=1.8, linestyle='--', alpha=0.7, label='Jetzt', zorder=10)
-        except Exception:
-            pass
+        # Persistente Artists: nur Daten, Grenzen und Titel aktualisieren
+        chart = self.chart
+        # Render buffer must match the widget size, otherwise old pixels remain visible.
+        if fit_figure(self.fig, width, height):
+            chart.invalidate()
 
-        if not times:
-            self.ax.text(
-                0.5,
-                0.5,
-                "Keine Daten",
-                ha="center",
-                va="center",
-                transform=self.ax.transAxes,
-                color=COLOR_SUBTEXT,
-                fontsize=14,
-            )
-            # Empty state: no fake axes (avoid 0..1 scale / duplicate tick labels)
-            self.ax.set_xticks([])
-            self.ax.set_yticks([])
+        # Title like sparkline: left aligned, subtle
+        title = f"Heizung & Temperaturen ({'Zoom' if zoomed else period})"
+        if title != self._title:
             try:
-                for spine in self.ax.spines.values():
-                    spine.set_visible(False)
-                self.ax.grid(False)
-                self.ax.set_ylabel("")
-                self.ax.xaxis.get_offset_text().set_visible(False)
+                self.ax.set_title(title, loc="left", fontsize=13, color=COLOR_TEXT, pad=8)
+                self._title = title
             except Exception:
                 pass
-            self._render_status(hours, 0)
-            self._apply_layout()
-            self.canvas.draw()
-            self._schedule_update()
-            return
-
-        # Sort by time (DB text order may be inconsistent)
-        order = np.argsort(np.array(times, dtype="datetime64[ns]"))
-        times_sorted = [times[i] for i in order]
-
-        def _ordered(arr):
-            a = np.array(arr, dtype=float)
-            return a[order]
-
-        ordered_series = {key: _ordered(series[key]) for key in series.keys()}
-
-        # Downsample for long ranges to reduce noise and improve readability.
-        bin_hours = 0
-        if hours >= 720:
-            bin_hours = 24
-        elif hours >= 168:
-            bin_hours = 3
-
-        if bin_hours:
-            times_sorted, ordered_series = self._downsample_timeseries(times_sorted, ordered_series, bin_hours)
-
-        plot_defs = [
-            ("top", "Puffer oben", COLOR_PRIMARY, "-"),
-            ("mid", "Puffer mitte", COLOR_INFO, "-"),
-            ("bot", "Puffer unten", COLOR_WARNING, "-"),
-            ("kessel", "Kessel", COLOR_DANGER, "-"),
-            ("warm", "Warmwasser", COLOR_SUCCESS, "-"),
-            ("outdoor", "Außen", COLOR_SUBTEXT, "--"),
-        ]
-
-        for key, label, color, style in plot_defs:
-            self.ax.plot(times_sorted, ordered_series[key], label=label, color=color, linewidth=1.6, linestyle=style, alpha=0.95)
-
-        locator = mdates.AutoDateLocator(minticks=4, maxticks=8)
-        self.ax.xaxis.set_major_locator(locator)
-        self.ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
-        try:
-            self.ax.xaxis.get_offset_text().set_visible(False)
-        except Exception:
-            pass
-
-        # Legend: keep it compact and out of the way (avoid overlapping the newest data at the right).
-        self.ax.legend(
-            loc="upper left",
-            fontsize=9,
-            frameon=False,
-            labelcolor=COLOR_SUBTEXT,
-            ncol=3,
-            handlelength=1.2,
-            columnspacing=0.8,
-            handletextpad=0.4,
-        )
-
-        # Keine automatischen X-Margins verwenden, da wir xlim explizit setzen
-        try:
-            self.ax.margins(x=0, y=0.05)
-        except Exception:
-            pass
+            chart.invalidate()
+
+        # Fenster springt erst, wenn es >1% gewandert ist – dazwischen reicht ein Blit
+        chart.set_xwindow(*_epoch_to_num([start, end]))
+        x_now = float(_epoch_to_num(now))
+        self._now_line.set_xdata([x_now, x_now])
+
+        if data is None or not len(data):
+            chart.clear_series()
+            self._set_empty(True)
+            chart.redraw()
+            return snapshot(self.canvas), 0, 0
+
+        self._set_empty(False)
+        x = _epoch_to_num(data.t)
+        # Aggregierte Stufe: Min/Max je Bucket zeichnen, sonst wären Spitzen
+        # (Kessel-Aufheizen) schon vor dem Ausdünnen weggemittelt
+        binned = data.bucket_s > 0
+        for key in chart.lines:
+            if binned:
+                chart.set_series(key, *envelope(x, data.min[key], data.max[key], pixels))
+            else:
+                chart.set_series(key, *downsample(x, data.avg[key], pixels))
 
-        self._apply_layout()
+        columns = (data.min, data.max) if binned else (data.avg,)
+        values = np.concatenate([col[key] for col in columns for key in chart.lines])
+        finite = values[np.isfinite(values)]
+        if finite.size:
+            chart.fit_y(float(finite.min()), float(finite.max()))
 
-        self._render_status(hours, len(times_sorted))
-        self.canvas.draw()
-        self._schedule_update()
+        chart.redraw()
+        return snapshot(self.canvas), len(data), data.bucket_s
 
-    def _render_status(self, hours: int, points: int) -> None:
+    def _render_status(self, points: int, bucket_s: int) -> None:
         # Show the selected period label instead of huge hour numbers.
-        self.topbar_status.config(text=f"{self._period_var.get()}")
-        self.statusbar.config(text=f"Letztes Update: {datetime.now().strftime('%H:%M')}  |  Datenpunkte: {points}")
+        self.topbar_status.config(text="Zoom" if self._zoom.active else f"{self._period_var.get()}")
+        self.statusbar.config(
+            text=f"Letztes Update: {datetime.now().strftime('%H:%M')}  |  Datenpunkte: {points}"
+            f"  |  Auflösung: {_resolution_label(bucket_s)}"
+        )
 
     def update_data(self, data: dict) -> None:
         # Called by app update loop; keep for compatibility.
         self._latest_data = data
 
     def stop(self) -> None:
+        self._stopped = True
         if self.after_job is not None:
             try:
                 self.after_cancel(self.after_job)
             except Exception:
                 pass
             self.after_job = None
+        # Figure gehört der Render-Lane: Abbau erst nach einem laufenden Rendering
+        self._renderer.dispose(self._render_key, self._close_figure, name="historical")
+
+    def _close_figure(self) -> None:
+        if getattr(self, "chart", None) is not None:
+            self.chart.disconnect()
         # Fix memory leak: properly close matplotlib figure
         try:
             import matplotlib.pyplot as plt
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import queue
-import threading
 import tkinter as tk
 from typing import Any, Dict, List, Optional
 
 import customtkinter as ctk
 
 from core.homeassistant import HomeAssistantClient, load_homeassistant_config
+from core.workers import LANE_IO, LANE_UI, run_in_background
 from ui.components.card import Card
 from ui.styles import COLOR_BORDER, COLOR_CARD, COLOR_ROOT, COLOR_SUBTEXT, COLOR_TEXT, get_safe_font
+from ui.wakeup import WakeupQueue, start_callback_pump
 
 
 class HomeAssistantActionsTab:
@@ -37,7 +37,7 @@ class HomeAssistantActionsTab:
         self.status_var = tk.StringVar(value="Home Assistant: –")
 
         # Tkinter is not thread-safe. Background workers must not call Tk APIs.
-        self._ui_queue: "queue.Queue[callable]" = queue.Queue()
+        self._ui_queue: WakeupQueue = WakeupQueue()
 
         if tab_frame is not None:
             self.tab_frame = tab_frame
@@ -53,30 +53,16 @@ class HomeAssistantActionsTab:
 
     def cleanup(self) -> None:
         self.alive = False
+        wakeup = getattr(self, "_ui_wakeup", None)
+        if wakeup is not None:
+            wakeup.close()
 
     def _start_ui_pump(self) -> None:
-        def pump() -> None:
-            if not self.alive:
-                return
-            try:
-                while True:
-                    cb = self._ui_queue.get_nowait()
-                    try:
-                        cb()
-                    except Exception:
-                        pass
-            except queue.Empty:
-                pass
-
-            try:
-                self.root.after(50, pump)
-            except Exception:
-                pass
-
+        # Event-getrieben: _post_ui weckt die Tk-Mainloop (siehe ui.wakeup)
         try:
-            self.root.after(0, pump)
+            self._ui_wakeup = start_callback_pump(self.root, self._ui_queue)
         except Exception:
-            pass
+            self._ui_wakeup = None
 
     def _post_ui(self, callback) -> None:
         try:
@@ -232,7 +218,7 @@ class HomeAssistantActionsTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_IO, key="ha_actions:entities")
 
     def _render_actions(self) -> None:
         try:
@@ -322,4 +308,4 @@ class HomeAssistantActionsTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI)
@@ -10,7 +10,6 @@ The UI lists Home Assistant scenes (scene.*) and triggers `scene.turn_on`.
 
 from __future__ import annotations
 
-import queue
 import threading
 import tkinter as tk
 from tkinter import ttk
@@ -21,7 +20,10 @@ from typing import Any, Dict, List, Optional
 import customtkinter as ctk
 
 from core.homeassistant import HomeAssistantClient, load_homeassistant_config
+from core.workers import LANE_IO, LANE_UI, run_in_background
 from ui.styles import COLOR_BORDER, COLOR_CARD, COLOR_ROOT, COLOR_SUBTEXT, COLOR_TEXT, COLOR_WARNING, get_safe_font, emoji
+from ui.wakeup import WakeupQueue, start_callback_pump
+from ui.tab_lifecycle import TabLifecycle
 
 
 class _HomeAssistantBridgeAdapter:
@@ -63,7 +65,7 @@ class _HomeAssistantBridgeAdapter:
             return {"state": {"any_on": False}}
 
 
-class HueTab:
+class HueTab(TabLifecycle):
     """Home Assistant scenes controller (keeps HueTab name for compatibility)."""
 
     def __init__(self, root, notebook, tab_frame=None):
@@ -92,7 +94,7 @@ class HueTab:
 
         # Tkinter is not thread-safe. Background workers must not call Tk APIs.
         # We route UI updates through this queue and execute them on the main thread.
-        self._ui_queue: "queue.Queue[callable]" = queue.Queue()
+        self._ui_queue: WakeupQueue = WakeupQueue()
 
         if tab_frame is not None:
             self.tab_frame = tab_frame
@@ -108,29 +110,11 @@ class HueTab:
         self._schedule_vorraum_poll()
 
     def _start_ui_pump(self) -> None:
-        def pump() -> None:
-            if not self.alive:
-                return
-            try:
-                while True:
-                    cb = self._ui_queue.get_nowait()
-                    try:
-                        cb()
-                    except Exception:
-                        pass
-            except queue.Empty:
-                pass
-
-            try:
-                # Increased from 50ms to 200ms to reduce main thread load
-                self.root.after(200, pump)
-            except Exception:
-                pass
-
+        # Event-getrieben: _post_ui weckt die Tk-Mainloop (siehe ui.wakeup)
         try:
-            self.root.after(0, pump)
+            self._ui_wakeup = start_callback_pump(self.root, self._ui_queue)
         except Exception:
-            pass
+            self._ui_wakeup = None
 
     def _post_ui(self, callback) -> None:
         try:
@@ -143,6 +127,9 @@ class HueTab:
     # --- public API used by app.py ---
     def cleanup(self) -> None:
         self.alive = False
+        wakeup = getattr(self, "_ui_wakeup", None)
+        if wakeup is not None:
+            wakeup.close()
 
     def _threaded_group_cmd(self, turn_on: bool) -> None:
         """Best-effort master on/off for header switch callbacks."""
@@ -182,7 +169,7 @@ class HueTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI, key="hue:group")
 
     def come_home_safe(self) -> bool:
         """Trigger the configured 'come home' scene (best-effort, async)."""
@@ -320,7 +307,7 @@ class HueTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI, key="hue:brightness")
 
     # --- UI ---
     def _build_ui(self) -> None:
@@ -548,7 +535,7 @@ class HueTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_IO, key="hue:scenes")
 
     def _refresh_all_async(self) -> None:
         self._refresh_scenes_async()
@@ -631,7 +618,7 @@ class HueTab:
                 pass
             self._refresh_vorraum_status_async()
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI, key="hue:vorraum")
 
     def _schedule_vorraum_poll(self) -> None:
         if not self.alive:
@@ -640,6 +627,9 @@ class HueTab:
         def tick() -> None:
             if not self.alive:
                 return
+            # Versteckt: Poll aussetzen, on_catch_up startet ihn wieder
+            if self.defer_while_hidden():
+                return
             self._refresh_vorraum_status_async()
             try:
                 self.root.after(5000, tick)
@@ -651,6 +641,10 @@ class HueTab:
         except Exception:
             pass
 
+    def on_catch_up(self) -> None:
+        self._refresh_vorraum_status_async()
+        self._schedule_vorraum_poll()
+
     def _refresh_vorraum_status_async(self) -> None:
         if not self.alive:
             return
@@ -738,7 +732,7 @@ class HueTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_IO, key="hue:vorraum_status")
 
     def _activate_scene_async(self, entity_id: str) -> None:
         entity_id = str(entity_id or "").strip()
@@ -762,4 +756,4 @@ class HueTab:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI, key="hue:scene")
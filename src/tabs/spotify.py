@@ -9,6 +9,7 @@ from typing import Optional
 
 import requests
 from ui.styles import COLOR_ROOT, COLOR_TEXT, COLOR_SUBTEXT, COLOR_TITLE
+from ui.tab_lifecycle import TabLifecycle
 try:
     import ttkbootstrap as ttk
     from ttkbootstrap.constants import BOTH, LEFT, RIGHT, W
@@ -28,7 +29,7 @@ COVER_SIZE = (260, 260)
 PLAYLIST_IMAGE_SIZE = (96, 96)
 
 
-class SpotifyTab:
+class SpotifyTab(TabLifecycle):
     def safe_toggle_style(self, style_name="round-toggle"):
         try:
             import ttkbootstrap as ttk
@@ -531,9 +532,16 @@ class SpotifyTab:
             self.root.after_cancel(self._poll_job)
         self._poll_job = self.root.after(500, self._poll_playback)
 
+    def on_catch_up(self) -> None:
+        self._start_playback_poll()
+
     def _poll_playback(self):
         if not self.alive:
             return
+        # Versteckt: Playback-Poll aussetzen, beim Anzeigen neu starten
+        if self.defer_while_hidden():
+            self._poll_job = None
+            return
         if not self.client:
             self._ensure_cached_session()
         if self.client:
@@ -1,7 +1,6 @@
 
 import tkinter as tk
 from tkinter import ttk
-from datetime import datetime
 from collections import deque
 import math
 import traceback
@@ -13,6 +12,7 @@ from core.datastore import get_shared_datastore
 from core.homeassistant import HomeAssistantClient, load_homeassistant_config
 from core.schema import PV_POWER_KW, GRID_POWER_KW, BATTERY_POWER_KW, BATTERY_SOC_PCT, BMK_KESSEL_C, BMK_WARMWASSER_C, BUF_TOP_C, BUF_MID_C, BUF_BOTTOM_C
 from core.health import get_health_snapshot
+from core.time_utils import to_utc_datetime, utc_now
 from ui.styles import (
     COLOR_ROOT,
     COLOR_CARD,
@@ -27,8 +27,9 @@ from ui.styles import (
 )
 from ui.components.card import Card
 from ui.components.rounded import RoundedFrame
+from ui.tab_lifecycle import TabLifecycle
 
-class StatusTab(ctk.CTkFrame):
+class StatusTab(ctk.CTkFrame, TabLifecycle):
     def _get_ha_client(self):
         """Lazy-init Home Assistant client."""
         client = getattr(self, "_ha_client", None)
@@ -384,9 +385,15 @@ class StatusTab(ctk.CTkFrame):
                 pass
         self.after_job = self.after(3000, self._update_status)
 
+    def on_catch_up(self) -> None:
+        self._update_status()
+
     def _update_status(self):
         """Minimales Update: nur Ampeln und Live-Werte."""
-        now = datetime.now()
+        if self.defer_while_hidden():
+            return
+        # DB-Zeitstempel sind UTC – Alter gegen UTC-Jetzt messen
+        now = utc_now()
         
         # Default: alle Werte auf "--"
         for lbl in self.snapshot_labels.values():
@@ -535,20 +542,12 @@ class StatusTab(ctk.CTkFrame):
     def _safe_iso_to_dt(ts):
         if not ts:
             return None
-        try:
-            return datetime.fromisoformat(str(ts))
-        except Exception:
-            return None
+        return to_utc_datetime(str(ts))
 
     @staticmethod
     def _age_seconds(now, dt):
         if dt is None:
             return None
-        # Normalize both datetimes to naive (no tzinfo) to avoid TypeError
-        if hasattr(now, 'tzinfo') and now.tzinfo is not None:
-            now = now.replace(tzinfo=None)
-        if hasattr(dt, 'tzinfo') and dt.tzinfo is not None:
-            dt = dt.replace(tzinfo=None)
         return (now - dt).total_seconds()
 
     @staticmethod
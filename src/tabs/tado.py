@@ -1,13 +1,8 @@
-import threading
-import os
-import time
 import logging
-import importlib
 import tkinter as tk
 from tkinter import ttk
 import webbrowser
 import customtkinter as ctk
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from ui.styles import (
     COLOR_ROOT,
     COLOR_CARD,
@@ -22,61 +17,22 @@ from ui.styles import (
     emoji,
 )
 from ui.components.card import Card
-
-TADO_ENABLED = os.getenv("TADO_ENABLE", "").strip().lower() in {"1", "true", "yes", "on"}
-if not TADO_ENABLED:
-    TADO_ENABLED = bool(os.getenv("TADO_USER") or os.getenv("TADO_PASS"))
-
-# --- Robust: python-tado-Import mit Fallback ---
-Tado = None
-_TADO_IMPL = None  # "python_tado" | "pytado" | None
-try:
-    _python_tado_mod = importlib.import_module("python_tado")
-    Tado = getattr(_python_tado_mod, "Tado")
-    _TADO_IMPL = "python_tado"
-except ImportError as exc:
-    if TADO_ENABLED:
-        logging.warning("[TADO] python-tado Import fehlgeschlagen: %s", exc)
-    else:
-        logging.info("[TADO] python-tado nicht installiert (TADO deaktiviert)")
-
-if Tado is None:
-    # Aktuelles `python-tado` (0.19.x) installiert i.d.R. als Paket `PyTado`
-    # und exportiert die Klasse über `PyTado.interface`.
-    try:
-        _pytado_interface_mod = importlib.import_module("PyTado.interface")
-        Tado = getattr(_pytado_interface_mod, "Tado")
-        _TADO_IMPL = "pytado"
-        logging.info("[TADO] Import via PyTado.interface erfolgreich.")
-    except ImportError as exc_pytado:
-        try:
-            _pytado_interface2_mod = importlib.import_module("PyTado.interface.interface")
-            Tado = getattr(_pytado_interface2_mod, "Tado")
-            _TADO_IMPL = "pytado"
-            logging.info("[TADO] Import via PyTado.interface.interface erfolgreich.")
-        except ImportError as exc_pytado2:
-            if TADO_ENABLED:
-                logging.warning("[TADO] PyTado Import fehlgeschlagen: %s", exc_pytado)
-                logging.warning("[TADO] PyTado (alt) Import ebenfalls fehlgeschlagen: %s", exc_pytado2)
-            else:
-                logging.info("[TADO] PyTado nicht installiert (TADO deaktiviert)")
-
-# --- KONFIGURATION ---
-TADO_USER = os.getenv("TADO_USER")
-TADO_PASS = os.getenv("TADO_PASS")
-TADO_TOKEN_FILE = os.getenv(
-    "TADO_TOKEN_FILE",
-    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tado_refresh_token"),
+from core.collectors import subscribe
+from core.tado import (
+    TADO_COMFORT_TEMP,
+    TADO_ECO_TEMP,
+    TadoZoneCollector,
+    get_tado_connection,
+    tado_configured,
 )
-TADO_CLIENT_ID = os.getenv("TADO_CLIENT_ID", "tado-web-app")
-TADO_SCOPE = os.getenv("TADO_SCOPE", "home.user")
-TADO_ECO_TEMP = float(os.getenv("TADO_ECO_TEMP", "19.0"))
-TADO_COMFORT_TEMP = float(os.getenv("TADO_COMFORT_TEMP", "21.0"))
 
 class TadoTab:
     """Tado Klima-Tab (Status + Steuerung).
 
-    Hinweis: Login/Authentifizierung bleibt wie zuvor (env vars / device flow).
+    Hinweis: Login/Authentifizierung bleibt wie zuvor (env vars / device flow),
+    läuft aber über die geteilte Verbindung aus ``core.tado``. Die Zone wird
+    vom dort beim App-Start registrierten Collector abgefragt; der Tab
+    abonniert nur dessen Datensätze und den Verbindungsstatus.
     Der Tab bleibt immer sichtbar und zeigt bei fehlender Konfiguration
     eine klare Anleitung statt zu verschwinden.
     """
@@ -85,10 +41,9 @@ class TadoTab:
         self.root = root
         self.notebook = notebook
         self.alive = True
-        self.api = None
-        self.zone_id = None
-        self.zones: list[dict] = []
-        self._zone_name_to_id: dict[str, int] = {}
+        self._tado = get_tado_connection()
+        self._unsubscribe_state = None
+        self._unsubscribe_status = None
         self._pending_apply_job = None
         self._suppress_target_send = False
         self._suppress_mode_send = False
@@ -122,12 +77,15 @@ class TadoTab:
             pass
 
         self._build_ui()
-
-        # Start Update Loop
-        self.root.after(0, lambda: threading.Thread(target=self._loop, daemon=True).start())
+        self._connect()
 
     def stop(self):
         self.alive = False
+        for attr in ("_unsubscribe_state", "_unsubscribe_status"):
+            unsubscribe = getattr(self, attr, None)
+            if unsubscribe is not None:
+                unsubscribe()
+                setattr(self, attr, None)
         if self._pending_apply_job is not None:
             try:
                 self.root.after_cancel(self._pending_apply_job)
@@ -149,39 +107,7 @@ class TadoTab:
         Supports both python-tado and PyTado variants.
         Returns True if a compatible method was found and invoked.
         """
-        api = getattr(self, "api", None)
-        if api is None:
-            return False
-
-        # PyTado (installed in this project) uses setAway()/setHome().
-        for name in ("setAway", "set_away", "setAwayMode", "set_away_mode"):
-            fn = getattr(api, name, None)
-            if callable(fn):
-                try:
-                    fn()
-                    return True
-                except Exception:
-                    return False
-
-        # Fallback: changePresence("AWAY") (some versions)
-        fn = getattr(api, "changePresence", None)
-        if callable(fn):
-            try:
-                fn("AWAY")
-                return True
-            except Exception:
-                return False
-
-        # As a last resort, at least drop any manual override back to schedule.
-        try:
-            zone_id = getattr(self, "zone_id", None)
-            if zone_id and callable(getattr(api, "reset_zone_override", None)):
-                api.reset_zone_override(zone_id)
-                return True
-        except Exception:
-            return False
-
-        return False
+        return self._tado.set_presence(away=True)
 
     def set_home_safe(self) -> bool:
         """Set Tado to 'Home' presence (best-effort).
@@ -189,28 +115,7 @@ class TadoTab:
         Supports both python-tado and PyTado variants.
         Returns True if a compatible method was found and invoked.
         """
-        api = getattr(self, "api", None)
-        if api is None:
-            return False
-
-        for name in ("setHome", "set_home", "setHomeMode", "set_home_mode"):
-            fn = getattr(api, name, None)
-            if callable(fn):
-                try:
-                    fn()
-                    return True
-                except Exception:
-                    return False
-
-        fn = getattr(api, "changePresence", None)
-        if callable(fn):
-            try:
-                fn("HOME")
-                return True
-            except Exception:
-                return False
-
-        return False
+        return self._tado.set_presence(away=False)
 
     def _build_ui(self) -> None:
         # Layout: header + two cards
@@ -537,7 +442,7 @@ class TadoTab:
 
     def _apply_target_temperature(self) -> None:
         self._pending_apply_job = None
-        if not (self.api and self.zone_id):
+        if not self._tado.connected:
             return
         self._cancel_manual_timer()
         try:
@@ -558,7 +463,7 @@ class TadoTab:
         This is a local timer (dashboard must remain running).
         """
         self._pending_apply_job = None
-        if not (self.api and self.zone_id):
+        if not self._tado.connected:
             return
         self._cancel_manual_timer()
         try:
@@ -615,52 +520,6 @@ class TadoTab:
         except Exception:
             self._manual_timer_after_id = None
 
-    def _get_nested(self, data: dict, *keys, default=None):
-        cur = data
-        for key in keys:
-            if not isinstance(cur, dict) or key not in cur:
-                return default
-            cur = cur[key]
-        return cur
-
-    def _state_to_dict(self, state):
-        if isinstance(state, dict):
-            return state
-        for attr in ("to_dict", "dict"):
-            fn = getattr(state, attr, None)
-            if callable(fn):
-                try:
-                    return fn()
-                except Exception:
-                    pass
-        try:
-            return dict(state)
-        except Exception:
-            pass
-        try:
-            return vars(state)
-        except Exception:
-            return {}
-
-    def _normalize_device_url(self, url: str | None) -> str | None:
-        if not url:
-            return url
-        try:
-            parsed = urlparse(url)
-            query = parse_qs(parsed.query, keep_blank_values=True)
-            changed = False
-            if TADO_CLIENT_ID and "client_id" not in query:
-                query["client_id"] = [TADO_CLIENT_ID]
-                changed = True
-            if TADO_SCOPE and "scope" not in query:
-                query["scope"] = [TADO_SCOPE]
-                changed = True
-            if not changed:
-                return url
-            return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
-        except Exception:
-            return url
-
     def _change_temp(self, delta: int):
         """Legacy helper (kept for compatibility)."""
         self._nudge_target(float(delta))
@@ -668,7 +527,7 @@ class TadoTab:
     def _set_heating(self):
         """Aktiviere Heizung."""
         try:
-            if self.api and self.zone_id:
+            if self._tado.connected:
                 current = float(self.var_target.get())
                 self._set_zone_temperature(current)
                 self.var_status.set("Heizung aktiviert")
@@ -678,7 +537,7 @@ class TadoTab:
     def _set_auto(self):
         """Zurück auf Automatik/Plan (reset override)."""
         try:
-            if self.api and self.zone_id:
+            if self._tado.connected:
                 self._cancel_manual_timer()
                 self._reset_zone_override()
                 self._ui_set(self.var_status, "Auto")
@@ -687,70 +546,12 @@ class TadoTab:
         except Exception:
             self._ui_set(self.var_status, "Fehler")
 
-    # --- API compatibility helpers (python-tado vs PyTado) ---
-    def _call_any(self, *names: str, **kwargs):
-        api = getattr(self, "api", None)
-        if api is None:
-            raise RuntimeError("Tado API not connected")
-        last_exc = None
-        for name in names:
-            try:
-                fn = getattr(api, name)
-                return fn(**kwargs)
-            except TypeError as exc:
-                last_exc = exc
-            except AttributeError as exc:
-                last_exc = exc
-        if last_exc:
-            raise last_exc
-
-    def _get_zones(self):
-        return self._call_any("get_zones", "getZones")
-
-    def _get_zone_state(self, zone_id: int):
-        try:
-            fn = getattr(self.api, "get_zone_state")
-            return fn(zone_id)
-        except Exception:
-            fn = getattr(self.api, "getZoneState")
-            return fn(zone_id)
-
+    # --- Steuerung über die geteilte Verbindung ---
     def _set_zone_temperature(self, temp_c: float) -> None:
-        # python-tado
-        try:
-            fn = getattr(self.api, "set_temperature")
-            fn(self.zone_id, temp_c)
-            return
-        except Exception:
-            pass
-        # PyTado via deprecated wrapper -> dynamic snake_case endpoint
-        try:
-            fn = getattr(self.api, "setZoneOverlay")
-            fn(self.zone_id, "MANUAL", setTemp=float(temp_c))
-            return
-        except Exception:
-            pass
-        # Try direct snake_case if available (dynamic)
-        fn = getattr(self.api, "set_zone_overlay")
-        fn(self.zone_id, overlay_mode="MANUAL", set_temp=float(temp_c), device_type="HEATING", power="ON")
+        self._tado.set_zone_temperature(temp_c)
 
     def _reset_zone_override(self) -> None:
-        # python-tado
-        try:
-            fn = getattr(self.api, "reset_zone_override")
-            fn(self.zone_id)
-            return
-        except Exception:
-            pass
-        # PyTado
-        try:
-            fn = getattr(self.api, "resetZoneOverlay")
-            fn(self.zone_id)
-            return
-        except Exception:
-            pass
-        fn = getattr(self.api, "reset_zone_overlay")
-        fn(self.zone_id)
+        self._tado.reset_zone_override()
 
     def apply_profile_safe(self, profile: str) -> bool:
         """Apply a simple profile to the current zone.
@@ -774,212 +575,73 @@ class TadoTab:
             return False
         return False
 
-    def _loop(self):
-        """Hintergrund-Update Loop."""
-        logging.info("[TADO] Loop gestartet")
-
-        if Tado is None:
-            self._ui_set(self.var_status, "python-tado nicht installiert")
-            self._set_hint("Bitte `pip install python-tado` ausführen und Dashboard neu starten.")
+    def _connect(self) -> None:
+        """Verbindungsstatus und Zone-Datensätze abonnieren (Login läuft in ``core.tado``)."""
+        if not tado_configured():
+            self._ui_set(self.var_status, "Tado nicht konfiguriert")
+            self._set_hint("TADO_USER/TADO_PASS oder TADO_ENABLE=1 setzen und Dashboard neu starten.")
             self._ui_set(self.var_temp_ist, "N/A")
             self._ui_set(self.var_humidity, "N/A")
             self._ui_call(self._set_controls_enabled, False)
-            while self.alive:
-                time.sleep(30)
             return
+        self._unsubscribe_status = self._tado.subscribe_status(self._apply_connection)
+        self._unsubscribe_state = subscribe(TadoZoneCollector.name, self._apply_state)
+        self._tado.ensure_connected()
 
-        # Login
-        try:
-            # Prefer direct User/Pass only for python-tado.
-            # PyTado uses token/device activation flow (token_file_path).
-            if _TADO_IMPL == "python_tado" and TADO_USER and TADO_PASS:
-                try:
-                    self.api = Tado(TADO_USER, TADO_PASS)
-                    self._ui_set(self.var_status, "Verbunden")
-                except Exception:
-                    self.api = Tado(TADO_USER, TADO_PASS, client_id=TADO_CLIENT_ID)
-                    self._ui_set(self.var_status, "Verbunden")
-            else:
-                # OAuth Device Flow (seit 2025) + Token-Cache
-                self.api = Tado(token_file_path=TADO_TOKEN_FILE)
-                status = self.api.device_activation_status()
-                logging.debug("[TADO] device_activation_status: %s", status)
-                if status != "COMPLETED":
-                    url = self._normalize_device_url(self.api.device_verification_url())
-                    if url:
-                        logging.info("[TADO] Device activation URL: %s", url)
-                        self._ui_set(self.var_status, "Tado: Bitte Gerät im Browser aktivieren")
-                        self._set_hint(f"Aktivierung erforderlich: {url}", device_url=url)
-
-                    # Wait until flow is pending before activation
-                    start = time.time()
-                    while status == "NOT_STARTED" and (time.time() - start) < 10:
-                        time.sleep(1)
-                        status = self.api.device_activation_status()
-
-                    if status == "PENDING":
-                        self.api.device_activation()
-                        status = self.api.device_activation_status()
-                        logging.debug("[TADO] Status nach Aktivierung: %s", status)
-
-                    if status != "COMPLETED":
-                        self._ui_set(self.var_status, "Tado Aktivierung fehlgeschlagen")
-                        # Keep URL available for manual activation
-                        self._set_hint(f"Aktivierung nicht abgeschlossen. URL: {url}", device_url=url)
-                        self._ui_set(self.var_temp_ist, "N/A")
-                        self._ui_set(self.var_humidity, "N/A")
-                        while self.alive:
-                            time.sleep(30)
-                        return
-            
-            zones = self._get_zones()
-            logging.debug("[TADO] zones gefunden: %s", len(zones))
-            self.zones = zones or []
-
-            # Single-zone setup: pick best match (Schlaf/Bed) else first.
-            picked = None
-            for z in self.zones:
-                name = (z.get("name") or "")
-                if "schlaf" in name.lower() or "bed" in name.lower():
-                    picked = z
-                    break
-            if picked is None and self.zones:
-                picked = self.zones[0]
-
-            if picked is not None:
-                self.zone_id = picked.get("id")
-                self._ui_set(self.var_zone, picked.get("name", "-"))
-
-            if not self.zone_id:
-                self._ui_set(self.var_status, "Tado: Keine Zone gefunden")
-                self._ui_call(self._set_controls_enabled, False)
-                while self.alive:
-                    time.sleep(30)
-                return
-            
-            self._ui_set(self.var_status, "Verbunden")
-            self._set_hint("", clear_url=True)  # Clear URL after successful connection
-            # Start in Auto mode until we see an overlay
-            self._ui_set(self.var_mode, "Auto")
-            self._ui_call(self._set_controls_enabled, False)
-        except ImportError:
-            self._ui_set(self.var_status, "python-tado nicht installiert! Bitte im Terminal ausführen: 'pip install python-tado' (im .venv falls vorhanden). Dann Dashboard neu starten.")
-            self._set_hint("Bitte `pip install python-tado` ausführen und Dashboard neu starten.")
-            self._ui_set(self.var_temp_ist, "N/A")
-            self._ui_set(self.var_humidity, "N/A")
-            self._ui_call(self._set_controls_enabled, False)
-            while self.alive:
-                time.sleep(5)
+    def _apply_connection(self, info: dict) -> None:
+        """Login-Status in die UI übernehmen (Status-Abonnent, beliebiger Thread)."""
+        if not self.alive:
             return
-        except Exception as e:
-            # Zeige Fehlername und ggf. Message für bessere Diagnose
-            err_type = type(e).__name__
-            err_msg = str(e)
-            msg = f"Login fehlgeschlagen: {err_type}"
-            if err_msg:
-                msg += f" – {err_msg}"
-            self._ui_set(self.var_status, msg)
-            self._ui_set(self.var_temp_ist, "N/A")
-            self._ui_set(self.var_humidity, "N/A")
-            self._set_hint("Login/Verbindung fehlgeschlagen. Prüfe Zugangsdaten oder Device-Flow Aktivierung.")
+        self._ui_set(self.var_status, info.get("status") or "")
+        self._ui_set(self.var_zone, info.get("zone") or "-")
+        device_url = info.get("device_url")
+        if device_url:
+            self._set_hint(info.get("hint") or "", device_url=device_url)
+        else:
+            self._set_hint(info.get("hint") or "", clear_url=True)
+        if not info.get("connected"):
             self._ui_call(self._set_controls_enabled, False)
-            while self.alive:
-                time.sleep(30)
+
+    def _apply_state(self, record: dict) -> None:
+        """Neuen Tado-Datensatz in die UI übernehmen (Collector-Abonnent)."""
+        if not self.alive:
             return
+        current = record.get("temperature_c")
+        humidity = record.get("humidity_pct")
+        target = record.get("target_c")
+        manual = bool(record.get("manual"))
 
-        # Update Loop
-        while self.alive:
-            try:
-                state = self._get_zone_state(self.zone_id)
-                state = self._state_to_dict(state)
-
-                if not getattr(self, "_state_logged", False):
-                    logging.debug("[TADO] zone_state keys: %s", list(state.keys()))
-                    logging.debug("[TADO] sensorDataPoints keys: %s", list(state.get("sensorDataPoints", {}).keys()))
-                    logging.debug("[TADO] activityDataPoints keys: %s", list(state.get("activityDataPoints", {}).keys()))
-                    logging.debug("[TADO] setting keys: %s", list(state.get("setting", {}).keys()))
-                    logging.debug("[TADO] overlay keys: %s", list(state.get("overlay", {}).keys()))
-                    self._state_logged = True
-                
-                # Temperatur
-                current = state.get("current_temp")
-                if current is None:
-                    current = self._get_nested(state, "sensorDataPoints", "insideTemperature", "celsius")
-                if current is None:
-                    current = self._get_nested(state, "sensorDataPoints", "insideTemperature", "value")
-                if current is None:
-                    current = self._get_nested(state, "insideTemperature", "celsius")
-                if current is None:
-                    current = self._get_nested(state, "setting", "temperature", "celsius")
-                if current is None:
-                    current = 0.0
-                self._ui_set(self.var_temp_ist, f"{current:.1f} °C")
-                
-                # Feuchtigkeit
-                humidity = state.get("current_humidity")
-                if humidity is None:
-                    humidity = self._get_nested(state, "sensorDataPoints", "humidity", "percentage")
-                if humidity is None:
-                    humidity = self._get_nested(state, "sensorDataPoints", "humidity", "value")
-                if humidity is None:
-                    humidity = 0.0
-                self._ui_set(self.var_humidity, f"{humidity:.0f} %")
-                
-                # Zieltemperatur
-                target = state.get("target_temp")
-                overlay = state.get('overlay')
-                setting = (overlay or {}).get("setting") or state.get("setting", {})
-                if target is None and setting:
-                    target = self._get_nested(setting, "temperature", "celsius")
-                if target is None and setting:
-                    target = 20
-
-                # Mode: overlay present => manual override
-                try:
-                    manual = bool(overlay)
-                except Exception:
-                    manual = False
-                try:
-                    self._suppress_mode_send = True
-                    self._ui_set(self.var_mode, "Manuell" if manual else "Auto")
-                    self._ui_call(self._set_controls_enabled, manual)
-                finally:
-                    self._suppress_mode_send = False
-
-                if target is not None:
-                    if abs(float(target) - round(float(target))) < 0.01:
-                        self._ui_set(self.var_temp_soll, f"{float(target):.0f} °C")
-                    else:
-                        self._ui_set(self.var_temp_soll, f"{float(target):.1f} °C")
-                    # Update slider value without triggering a write-back
-                    try:
-                        self._suppress_target_send = True
-                        self._ui_call(self.var_target.set, float(target))
-                    finally:
-                        self._suppress_target_send = False
-                    
-                power = state.get("power") or setting.get('power', 'OFF')
-                if power == 'ON':
-                    power_pct = state.get("heating_power_percentage")
-                    if power_pct is None:
-                        power_pct = self._get_nested(state, "activityDataPoints", "heatingPower", "percentage")
-                    if power_pct is None:
-                        power_pct = 75
-                    self.var_power.set(int(power_pct))
-                    self._ui_call(self._set_power_bar, int(power_pct))
-                    self._ui_set(self.var_status, "Heizung aktiv")
-                else:
-                    self.var_power.set(0)
-                    self._ui_call(self._set_power_bar, 0)
-                    self._ui_set(self.var_status, "Auto" if not manual else "Manuell")
-                if target is None:
-                    self._ui_set(self.var_temp_soll, "-- °C")
-                    self._ui_set(self.var_status, "Automatik")
-                    
-            except Exception as e:
-                if not getattr(self, "_state_error_logged", False):
-                    logging.warning("[TADO] zone_state error: %s: %s", type(e).__name__, e)
-                    self._state_error_logged = True
-            
-            time.sleep(30)  # Update alle 30 Sekunden
+        self._ui_set(self.var_temp_ist, f"{float(current if current is not None else 0.0):.1f} °C")
+        self._ui_set(self.var_humidity, f"{float(humidity if humidity is not None else 0.0):.0f} %")
 
+        try:
+            self._suppress_mode_send = True
+            self._ui_set(self.var_mode, "Manuell" if manual else "Auto")
+            self._ui_call(self._set_controls_enabled, manual)
+        finally:
+            self._suppress_mode_send = False
+
+        if target is not None:
+            if abs(float(target) - round(float(target))) < 0.01:
+                self._ui_set(self.var_temp_soll, f"{float(target):.0f} °C")
+            else:
+                self._ui_set(self.var_temp_soll, f"{float(target):.1f} °C")
+            # Update slider value without triggering a write-back
+            try:
+                self._suppress_target_send = True
+                self._ui_call(self.var_target.set, float(target))
+            finally:
+                self._suppress_target_send = False
+
+        if record.get("power_on"):
+            power_pct = int(record.get("heating_power_pct") or 0)
+            self._ui_call(self.var_power.set, power_pct)
+            self._ui_call(self._set_power_bar, power_pct)
+            self._ui_set(self.var_status, "Heizung aktiv")
+        else:
+            self._ui_call(self.var_power.set, 0)
+            self._ui_call(self._set_power_bar, 0)
+            self._ui_set(self.var_status, "Auto" if not manual else "Manuell")
+        if target is None:
+            self._ui_set(self.var_temp_soll, "-- °C")
+            self._ui_set(self.var_status, "Automatik")
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 
 import matplotlib
 
 matplotlib.use("Agg")
 import matplotlib.dates as mdates
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
+from core.binning import dense_grid
 from ui.styles import (
     COLOR_BORDER,
     COLOR_PRIMARY,
@@ -22,14 +23,17 @@ from ui.styles import (
     COLOR_WARNING,
     emoji,
 )
+from ui.chart_render import ChartImage, ChartRenderService, fit_figure, rasterize
+from ui.tab_lifecycle import TabLifecycle
 
 
-class TagesproduktionTab(tk.Frame):
+class TagesproduktionTab(tk.Frame, TabLifecycle):
     """Tagesproduktion (PV-kWh pro Tag) als Linien-Diagramm.
 
     Anforderungen:
     - Zeitraum wählbar
     - Tage klar erkennbar (Marker + bei kurzen Zeiträumen Tages-Raster)
+    - Gezeichnet wird in der Render-Lane (``ui.chart_render``)
     """
 
     def __init__(
@@ -133,14 +137,14 @@ class TagesproduktionTab(tk.Frame):
         self.ax = self.fig.add_subplot(111)
         self.ax.set_facecolor(COLOR_ROOT)
 
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        try:
-            self.canvas_widget.configure(bg=COLOR_ROOT, highlightthickness=0)
-        except Exception:
-            pass
-        self.canvas_widget.pack(fill=tk.BOTH, expand=True)
-        self.canvas_widget.bind("<Configure>", self._on_canvas_resize)
+        # Agg-Canvas ohne Tk: gezeichnet wird nur in der Render-Lane
+        self.canvas = FigureCanvasAgg(self.fig)
+        self._renderer = ChartRenderService.for_root(self.winfo_toplevel())
+        self._render_key = ("tagesproduktion", id(self))
+        self.chart_image = ChartImage(
+            self.chart_frame, bg=COLOR_ROOT, on_resize=lambda _w, _h: self._update_plot(), width=1000, height=480,
+        )
+        self.chart_image.pack(fill=tk.BOTH, expand=True)
 
         self.statusbar = tk.Label(
             self,
@@ -176,59 +180,12 @@ class TagesproduktionTab(tk.Frame):
                 pass
         self.after_job = self.after(60000, self._update_plot)
 
-    def _on_canvas_resize(self, event) -> None:
-        try:
-            w = max(1, int(getattr(event, "width", 1)))
-            h = max(1, int(getattr(event, "height", 1)))
-            if not self._sync_size(w, h):
-                return
-            self._apply_layout()
-            # Full draw avoids stale pixels that can look like an overlayed smaller chart.
-            self.canvas.draw()
-        except Exception:
-            pass
-
-    def _sync_size(self, w: int, h: int) -> bool:
-        """Sync Matplotlib figure size to the current Tk widget size.
-
-        CTk/Tk layouts can briefly report 1x1 during relayouts. Resizing the
-        renderer to that can leave a tiny re-render on top of an older buffer.
-        """
-        try:
-            if w < 50 or h < 50:
-                return False
-            dpi = float(self.fig.get_dpi() or 100.0)
-            self.fig.set_size_inches(w / dpi, h / dpi, forward=True)
-            return True
-        except Exception:
-            return False
-
-    def _clear_tk_canvas(self) -> None:
-        """Ensure the underlying Tk canvas is configured for clean redraws."""
-        try:
-            tk_canvas = getattr(self.canvas, "_tkcanvas", None)
-            if tk_canvas is not None:
-                try:
-                    tk_canvas.configure(bg=COLOR_ROOT, highlightthickness=0, bd=0)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
     def _apply_layout(self) -> None:
         try:
             self.fig.subplots_adjust(left=0.07, right=0.98, top=0.90, bottom=0.18)
         except Exception:
             pass
 
-    @staticmethod
-    def _date_range(start: date, end: date):
-        cur = start
-        one = timedelta(days=1)
-        while cur <= end:
-            yield cur
-            cur = cur + one
-
     def _load_daily_pv(self, window_days: int) -> list[tuple[datetime, float]]:
         out: list[tuple[datetime, float]] = []
         try:
@@ -258,16 +215,11 @@ class TagesproduktionTab(tk.Frame):
 
         end_day = datetime.now().date()
         start_day = end_day - timedelta(days=max(1, int(window_days)) - 1)
-        by_day: dict[date, float] = {}
-        for ts, val in data:
-            by_day[ts.date()] = float(val)
-
-        xs: list[datetime] = []
-        ys: list[float] = []
-        for d in self._date_range(start_day, end_day):
-            xs.append(datetime.combine(d, datetime.min.time()))
-            ys.append(by_day.get(d, float("nan")))
-        return xs, np.array(ys, dtype=float)
+        count = (end_day - start_day).days + 1
+        # Tage als Ordinalzahlen: fehlende Tage bleiben NaN (Lücke statt Fake-0)
+        ys = dense_grid([ts.toordinal() for ts, _ in data], [val for _, val in data], start_day.toordinal(), count)
+        xs = [datetime.combine(start_day + timedelta(days=i), datetime.min.time()) for i in range(count)]
+        return xs, ys
 
     def _style_axes(self) -> None:
         self.ax.set_facecolor(COLOR_ROOT)
@@ -281,19 +233,37 @@ class TagesproduktionTab(tk.Frame):
         self.ax.grid(True, axis="y", color=COLOR_BORDER, alpha=0.08, linewidth=0.6)
         self.ax.grid(False, axis="x")
 
+    def on_catch_up(self) -> None:
+        self._update_plot()
+
     def _update_plot(self) -> None:
-        window_days = int(self._period_map.get(self._period_var.get(), 30))
+        # Versteckt: kein Replot, beim Anzeigen einmal nachholen
+        if self.defer_while_hidden():
+            return
+        # Zeitraum und Größe im Tk-Thread lesen, Laden/Zeichnen im Worker
+        period = self._period_var.get()
+        width, height = self.chart_image.size
+        self._renderer.request(
+            self._render_key,
+            lambda: self._render(period, width, height),
+            self._show_render,
+            name="tagesproduktion",
+        )
+
+    def _show_render(self, result) -> None:
+        raster, status = result
+        self.chart_image.show(raster)
+        self.statusbar.configure(text=status)
+        self._schedule_update()
+
+    def _render(self, period: str, width: int, height: int):
+        """Läuft in der Render-Lane: Daten laden, plotten, rastern."""
+        window_days = int(self._period_map.get(period, 30))
         raw = self._load_daily_pv(window_days)
         xs, ys = self._with_gaps_daily(raw, window_days)
 
         # Keep the render buffer aligned with the widget size before clearing/plotting.
-        try:
-            self._clear_tk_canvas()
-            w = int(self.canvas_widget.winfo_width() or 0)
-            h = int(self.canvas_widget.winfo_height() or 0)
-            self._sync_size(w, h)
-        except Exception:
-            pass
+        fit_figure(self.fig, width, height)
 
         self.ax.clear()
         self._style_axes()
@@ -309,11 +279,8 @@ class TagesproduktionTab(tk.Frame):
                 color=COLOR_SUBTEXT,
                 fontsize=10,
             )
-            self.statusbar.configure(text="Keine Daten im Zeitraum")
             self._apply_layout()
-            self.canvas.draw()
-            self._schedule_update()
-            return
+            return rasterize(self.fig), "Keine Daten im Zeitraum"
 
         # Plot: daily line with markers so individual days are easy to see.
         self.ax.plot(
@@ -366,11 +333,18 @@ class TagesproduktionTab(tk.Frame):
         except Exception:
             last_val = None
         if last_val is None or not np.isfinite(last_val):
-            self.statusbar.configure(text=f"Zeitraum: {self._period_var.get()}")
+            status = f"Zeitraum: {period}"
         else:
-            self.statusbar.configure(text=f"Zeitraum: {self._period_var.get()}  •  Letzter Tag: {last_val:.1f} kWh")
+            status = f"Zeitraum: {period}  •  Letzter Tag: {last_val:.1f} kWh"
 
         self._apply_layout()
-        # Full draw (not draw_idle) to avoid ghost pixels / overlays.
-        self.canvas.draw()
-        self._schedule_update()
+        return rasterize(self.fig), status
+
+    def stop(self) -> None:
+        self._renderer.cancel(self._render_key)
+        if self.after_job is not None:
+            try:
+                self.after_cancel(self.after_job)
+            except Exception:
+                pass
+            self.after_job = None
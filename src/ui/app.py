@@ -10,7 +10,7 @@ import os
 import platform
 import shutil
 import subprocess
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 import logging
 import time
 import threading
@@ -25,6 +25,11 @@ DEBUG_LOG = os.environ.get("DASHBOARD_DEBUG", "").strip().lower() in ("1", "true
 _show_status = os.environ.get("DASHBOARD_SHOW_STATUS_TAB", "").strip().lower() in ("1", "true", "yes", "on")
 _hide_status = os.environ.get("DASHBOARD_HIDE_STATUS_TAB", "").strip().lower() in ("1", "true", "yes", "on")
 SHOW_STATUS_TAB = bool(_show_status) and not bool(_hide_status)
+# Sekunden nach dem Start, ab denen nicht gewählte Tabs im Leerlauf gebaut werden (0 = aus)
+try:
+    TAB_WARMUP_S = float(os.environ.get("DASHBOARD_TAB_WARMUP_S", "30") or 0)
+except ValueError:
+    TAB_WARMUP_S = 30.0
 
 
 def _dbg_print(msg: str) -> None:
@@ -58,7 +63,10 @@ from ui.views.energy_flow import EnergyFlowView
 from ui.views.buffer_storage import BufferStorageView
 from ui.views.pv_sparkline import PVSparklineView
 from ui.app_state import AppState
-from ui.state_schema import validate_payload
+from ui.lazy_tabs import LazyTabRegistry, TabSpec
+from ui.tab_lifecycle import TabLifecycleManager
+from ui.wakeup import WakeupQueue, start_callback_pump
+from ui.state_schema import BUFFER_KEYS, PV_KEYS, SPARKLINE_KEYS, validate_payload
 from ui.tabview_wrapper import TabviewWrapper
 
 # Refactored modules
@@ -88,8 +96,10 @@ from ui.app_presence import PresenceOverrideManager
 
 # Core modules
 from core.datastore import DataStore, get_shared_datastore
+from core.time_utils import utc_now
 from core.utils import safe_float
 from core.homeassistant import HomeAssistantClient, load_homeassistant_config
+from core.workers import LANE_ANALYTICS, LANE_IO, run_in_background
 from core.schema import (
     PV_POWER_KW,
     GRID_POWER_KW,
@@ -107,6 +117,14 @@ from core.schema import (
 _UI_DIR = os.path.dirname(os.path.abspath(__file__))
 _SRC_DIR = os.path.dirname(_UI_DIR)
 _PROJECT_ROOT = os.path.dirname(_SRC_DIR)
+def _prepare_tab_frame(frame) -> None:
+    """Setze Tab-Frame Hintergrund explizit auf COLOR_ROOT."""
+    try:
+        frame.configure(fg_color=COLOR_ROOT)
+    except Exception:
+        pass
+
+
 def safe_get_datastore() -> DataStore | None:
     try:
         return get_shared_datastore()
@@ -115,65 +133,6 @@ def safe_get_datastore() -> DataStore | None:
         return None
 
 
-try:
-    from tabs.historical import HistoricalTab
-except ImportError:
-    HistoricalTab = None
-try:
-    from tabs.ertrag import ErtragTab
-except ImportError:
-    ErtragTab = None
-
-try:
-    from tabs.tagesproduktion import TagesproduktionTab
-except ImportError:
-    TagesproduktionTab = None
-
-
-# Spotify Tab mit integriertem OAuth
-try:
-    from tabs.spotify import SpotifyTab
-except Exception as e:
-    logger.warning("SpotifyTab import failed: %s", e)
-    SpotifyTab = None
-
-try:
-    from tabs.tado import TadoTab
-except ImportError:
-    TadoTab = None
-
-try:
-    from tabs.hue import HueTab
-except ImportError:
-    HueTab = None
-
-SystemTab = None
-
-try:
-    from tabs.calendar import CalendarTab
-except ImportError:
-    CalendarTab = None
-
-try:
-    from tabs.analyse import AnalyseTab
-except ImportError:
-    AnalyseTab = None
-
-try:
-    from tabs.healthcheck import HealthTab
-except ImportError:
-    HealthTab = None
-
-try:
-    from tabs.homeassistant_actions import HomeAssistantActionsTab
-except ImportError:
-    HomeAssistantActionsTab = None
-
-# StatusTab importieren
-try:
-    from tabs.status import StatusTab
-except ImportError:
-    StatusTab = None
 
 
 
@@ -185,31 +144,18 @@ class MainApp:
     """
     
     def _start_ui_pump(self) -> None:
-        """Start the UI queue pump for thread-safe updates."""
+        """Start the UI queue pump for thread-safe updates.
+
+        Event-driven: ``_post_ui`` wakes the Tk loop, so callbacks run right
+        away instead of waiting for the next poll tick.
+        """
         if getattr(self, "_ui_pump_started", False):
             return
         self._ui_pump_started = True
-
-        def pump() -> None:
-            try:
-                while True:
-                    cb = self._ui_queue.get_nowait()
-                    try:
-                        cb()
-                    except Exception:
-                        pass
-            except queue.Empty:
-                pass
-            try:
-                # Increased from 100ms to 1000ms to reduce main thread load
-                self.root.after(1000, pump)
-            except Exception:
-                pass
-
         try:
-            self.root.after(0, pump)
+            self._ui_wakeup = start_callback_pump(self.root, self._ui_queue)
         except Exception:
-            pass
+            self._ui_wakeup = None
 
     def _post_ui(self, callback) -> None:
         """Post a callback to be executed on the main thread."""
@@ -255,7 +201,8 @@ class MainApp:
             last_heat_event_dt = None
             try:
                 daily = self.datastore.get_daily_totals(days=2) if self.datastore else []
-                today_key = datetime.now(timezone.utc).date().isoformat()
+                # Tagessummen sind nach Ortszeit-Tagen gebucht
+                today_key = datetime.now().date().isoformat()
                 for item in reversed(daily or []):
                     if str(item.get("day")) == today_key:
                         pv_today_kwh = float(item.get("pv_kwh") or 0.0)
@@ -275,25 +222,24 @@ class MainApp:
                 self._status_metrics["last_heat_event_dt"] = last_heat_event_dt
             self._post_ui(apply)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_ANALYTICS, key="app:status_metrics")
     def build_tabs(self):
         """Robustly rebuilds all tabs, ensuring correct references after UI changes (fullscreen, etc)."""
         # CTkTabview: Tabs können nicht dynamisch entfernt werden, daher nur _add_other_tabs aufrufen
         # Dashboard-Tab wurde bereits in __init__ erstellt
+        # Versteckte Tabs pausieren ihre periodische Arbeit (siehe ui.tab_lifecycle)
+        self.tab_lifecycle = TabLifecycleManager(self.tabview, on_change=self._on_tab_selected)
+        self.tab_registry = LazyTabRegistry(
+            self.tabview, prepare_frame=_prepare_tab_frame, on_built=self._on_tab_built,
+        )
         try:
             self._add_other_tabs()
         except Exception as e:
             logger.error("Error adding tabs: %s", e)
         self._subscribe_view_updates()
-        # Ensure all tab references are up to date
-        if hasattr(self, 'historical_tab') and self.historical_tab:
-            _dbg_print("[build_tabs] historical_tab is set.")
-        else:
-            _dbg_print("[build_tabs] historical_tab is None!")
-        if hasattr(self, 'spotify_tab') and self.spotify_tab:
-            _dbg_print("[build_tabs] spotify_tab is set.")
-        if hasattr(self, 'hue_tab') and self.hue_tab:
-            _dbg_print("[build_tabs] hue_tab is set.")
+        self.tab_lifecycle.start()
+        # Übrige Tabs im Leerlauf nach dem Start vorbauen (0 = nur bei Auswahl)
+        self.tab_registry.warm_up(self.root, delay_ms=int(TAB_WARMUP_S * 1000))
 
     def _start_ertrag_validator(self):
         """Starte wöchentliche Ertrag-Validierung im Hintergrund."""
@@ -354,6 +300,11 @@ class MainApp:
         self._tick_count += 1
         now_mono = time.monotonic()
         
+        # Tab-Wechsel ohne command-Callback (z.B. tabview.set) nachziehen
+        lifecycle = getattr(self, "tab_lifecycle", None)
+        if lifecycle is not None:
+            lifecycle.sync()
+
         # Performance optimization: Pause animation when not on Dashboard tab
         try:
             current_tab = self.tabview.get()
@@ -387,7 +338,7 @@ class MainApp:
             try:
                 if last_heat_event_dt is not None:
                     age_s = (datetime.now().astimezone() - last_heat_event_dt).total_seconds()
-                    heat_part = f"Einheizen: {last_heat_event_dt.strftime('%H:%M')} (vor {format_age_short(age_s)})"
+                    heat_part = f"Einheizen: {last_heat_event_dt.astimezone().strftime('%H:%M')} (vor {format_age_short(age_s)})"
             except Exception:
                 pass
 
@@ -470,7 +421,7 @@ class MainApp:
         self._dbg_last_dump = 0.0  # Für Debug-Logging der Daten-Keys
 
         # Tkinter is not thread-safe; route background-thread UI updates via this queue.
-        self._ui_queue: "queue.Queue[callable]" = queue.Queue()
+        self._ui_queue: "queue.Queue[callable]" = WakeupQueue()
         self._start_ui_pump()
 
         # Shared DataStore wird beim Start bereitgestellt
@@ -478,7 +429,8 @@ class MainApp:
         self.datastore = datastore or safe_get_datastore()
         _dbg_print(f"[INIT] MainApp: DataStore geladen: {type(self.datastore)}")
 
-        self.app_state = AppState(validator=validate_payload)
+        # Updates innerhalb eines Event-Loop-Durchlaufs zu einer Benachrichtigung bündeln
+        self.app_state = AppState(validator=validate_payload, schedule=self.root.after_idle)
         self._state_unsubscribers = []
 
         # Health-Status für Datenquellen (PV, Heizung)
@@ -698,7 +650,7 @@ class MainApp:
 
             self._post_ui(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_IO, key="app:hue_switch")
 
     def _update_header_datetime(self):
         now = datetime.now()
@@ -737,7 +689,7 @@ class MainApp:
                 self._cached_out_temp = temp_str
             self._post_ui(apply)
         
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_ANALYTICS, key="app:outdoor_temp")
 
     def _style_tabview_buttons(self) -> None:
         """Make the active tab more readable and improve contrast."""
@@ -765,186 +717,78 @@ class MainApp:
     # PV Status Tab und zugehörige Methoden entfernt, ersetzt durch StatusTab
 
     def _add_other_tabs(self):
-        _dbg_print("[TABS] Starte Initialisierung aller weiteren Tabs...")
-        """Integriert alle weiteren Tabs.
+        """Registriert alle weiteren Tabs als lazy Factories (siehe ui.lazy_tabs).
+
+        Import und Aufbau eines Tabs erfolgen bei seiner ersten Auswahl bzw. im
+        Leerlauf nach dem Start. Licht und Kalender werden sofort gebaut, weil
+        Header-Schalter und Termin-Overlay sie benötigen.
 
         Hinweis: Der Health-Tab wird bewusst ganz am Ende hinzugefügt,
         damit er immer ganz rechts steht.
         """
-        
-        # Hue Tab (direkt mit CTk Tabview)
-        if HueTab:
-            try:
-                _dbg_print("[TABS] HueTab wird erstellt...")
-                # Tab in Tabview erstellen
-                self.tabview.add(emoji("💡 Licht", "Licht"))
-                hue_frame = self.tabview.tab(emoji("💡 Licht", "Licht"))
-                # Setze Frame Hintergrund
-                try:
-                    hue_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                # HueTab initialisieren mit direktem Frame
-                self.hue_tab = HueTab(self.root, self.notebook, tab_frame=hue_frame)
-                _dbg_print("[TABS] HueTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("HueTab initialization failed: %s", e, exc_info=True)
-                self.hue_tab = None
+        _dbg_print("[TABS] Registriere weitere Tabs (lazy)...")
+        root, notebook, datastore = self.root, self.notebook, self.datastore
 
-        # HomeA (Home Assistant Automationen/Skripte) soll als 3. Tab erscheinen
-        if HomeAssistantActionsTab:
-            try:
-                _dbg_print("[TABS] HomeAssistantActionsTab wird erstellt...")
-                self.tabview.add("HomeA")
-                ha_frame = self.tabview.tab("HomeA")
-                try:
-                    ha_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.homeassistant_actions_tab = HomeAssistantActionsTab(self.root, self.notebook, tab_frame=ha_frame)
-                _dbg_print("[TABS] HomeAssistantActionsTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("HomeAssistantActionsTab init failed: %s", e)
-                self.homeassistant_actions_tab = None
-        
-        # Andere Tabs (Portierung zu CustomTkinter fortlaufend)
-        if SpotifyTab:
-            try:
-                _dbg_print("[TABS] SpotifyTab wird erstellt...")
-                self.tabview.add("Spotify")
-                spotify_frame = self.tabview.tab("Spotify")
-                try:
-                    spotify_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.spotify_tab = SpotifyTab(self.root, self.notebook, tab_frame=spotify_frame)
-                _dbg_print("[TABS] SpotifyTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("SpotifyTab initialization failed: %s", e)
-                self.spotify_tab = None
-
-        if TadoTab:
-            try:
-                _dbg_print("[TABS] TadoTab wird erstellt...")
-                self.tabview.add(emoji("🌡️ Raumtemperatur", "Raumtemperatur"))
-                tado_frame = self.tabview.tab(emoji("🌡️ Raumtemperatur", "Raumtemperatur"))
-                try:
-                    tado_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.tado_tab = TadoTab(self.root, self.notebook, tab_frame=tado_frame)
-                _dbg_print("[TABS] TadoTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("TadoTab initialization failed: %s", e)
-                self.tado_tab = None
-        else:
-            _dbg_print(f"[TABS] TadoTab nicht verfügbar (Import fehlgeschlagen)")
+        def _simple(cls, frame):
+            return cls(root, notebook, tab_frame=frame)
 
-        if CalendarTab:
-            try:
-                _dbg_print("[TABS] CalendarTab wird erstellt...")
-                self.tabview.add(emoji("📅 Kalender", "Kalender"))
-                calendar_frame = self.tabview.tab(emoji("📅 Kalender", "Kalender"))
-                try:
-                    calendar_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.calendar_tab = CalendarTab(self.root, self.notebook, tab_frame=calendar_frame)
-                _dbg_print("[TABS] CalendarTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("CalendarTab init failed: %s", e)
-                self.calendar_tab = None
-
-        if HistoricalTab:
-            try:
-                _dbg_print("[TABS] HistoricalTab wird erstellt...")
-                self.tabview.add(emoji("📈 Historie", "Historie"))
-                historical_frame = self.tabview.tab(emoji("📈 Historie", "Historie"))
-                try:
-                    historical_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.historical_tab = HistoricalTab(self.root, self.notebook, datastore=self.datastore, tab_frame=historical_frame)
-                _dbg_print("[TABS] HistoricalTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("HistoricalTab init failed: %s", e)
-                self.historical_tab = None
-
-        if ErtragTab:
-            try:
-                _dbg_print("[TABS] ErtragTab wird erstellt...")
-                self.tabview.add(emoji("🔆 Ertrag", "Ertrag"))
-                ertrag_frame = self.tabview.tab(emoji("🔆 Ertrag", "Ertrag"))
-                try:
-                    ertrag_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.ertrag_tab = ErtragTab(self.root, self.notebook, tab_frame=ertrag_frame)
-                _dbg_print("[TABS] ErtragTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("ErtragTab init failed: %s", e)
-                self.ertrag_tab = None
+        def _with_datastore(cls, frame):
+            return cls(root, notebook, datastore=datastore, tab_frame=frame)
 
-        if TagesproduktionTab:
+        def _tagesproduktion(cls, frame):
+            # Clear old widgets (e.g. after rebuild) before creating a new tab instance.
             try:
-                _dbg_print("[TABS] TagesproduktionTab wird erstellt...")
-                self.tabview.add(emoji("📊 Tagesproduktion", "Tagesproduktion"))
-                prod_frame = self.tabview.tab(emoji("📊 Tagesproduktion", "Tagesproduktion"))
-                try:
-                    prod_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                # Clear old widgets (e.g. after rebuild) before creating a new tab instance.
-                try:
-                    for child in prod_frame.winfo_children():
-                        child.destroy()
-                except Exception:
-                    pass
-                self.tagesproduktion_tab = TagesproduktionTab(
-                    self.root,
-                    self.notebook,
-                    datastore=self.datastore,
-                    tab_frame=prod_frame,
-                )
-                _dbg_print("[TABS] TagesproduktionTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("TagesproduktionTab init failed: %s", e)
-                self.tagesproduktion_tab = None
-
+                for child in frame.winfo_children():
+                    child.destroy()
+            except Exception:
+                pass
+            return _with_datastore(cls, frame)
+
+        specs = [
+            TabSpec(emoji("💡 Licht", "Licht"), "tabs.hue", "HueTab", _simple, "hue_tab", eager=True),
+            # HomeA (Home Assistant Automationen/Skripte) soll als 3. Tab erscheinen
+            TabSpec("HomeA", "tabs.homeassistant_actions", "HomeAssistantActionsTab", _simple,
+                    "homeassistant_actions_tab"),
+            TabSpec("Spotify", "tabs.spotify", "SpotifyTab", _simple, "spotify_tab"),
+            TabSpec(emoji("🌡️ Raumtemperatur", "Raumtemperatur"), "tabs.tado", "TadoTab", _simple, "tado_tab"),
+            TabSpec(emoji("📅 Kalender", "Kalender"), "tabs.calendar", "CalendarTab", _simple,
+                    "calendar_tab", eager=True),
+            TabSpec(emoji("📈 Historie", "Historie"), "tabs.historical", "HistoricalTab", _with_datastore,
+                    "historical_tab"),
+            TabSpec(emoji("🔆 Ertrag", "Ertrag"), "tabs.ertrag", "ErtragTab", _simple, "ertrag_tab"),
+            TabSpec(emoji("📊 Tagesproduktion", "Tagesproduktion"), "tabs.tagesproduktion",
+                    "TagesproduktionTab", _tagesproduktion, "tagesproduktion_tab"),
+        ]
         # StatusTab immer als letzter Tab (rechts)
-        if StatusTab and SHOW_STATUS_TAB:
-            try:
-                _dbg_print("[TABS] StatusTab wird erstellt...")
-                self.tabview.add("Status")
-                status_frame = self.tabview.tab("Status")
-                try:
-                    status_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.status_tab = StatusTab(self.root, tab_frame=status_frame)
-                _dbg_print("[TABS] StatusTab erfolgreich hinzugefügt.")
-            except Exception as e:
-                logger.error("StatusTab init failed: %s", e)
-                self.status_tab = None
-        elif StatusTab:
-            _dbg_print("[TABS] StatusTab ausgeblendet (DASHBOARD_HIDE_STATUS_TAB=1 zum Ausblenden aktiv)")
-
+        if SHOW_STATUS_TAB:
+            specs.append(TabSpec("Status", "tabs.status", "StatusTab",
+                                 lambda cls, frame: cls(root, tab_frame=frame), "status_tab"))
+        else:
+            _dbg_print("[TABS] StatusTab ausgeblendet (DASHBOARD_SHOW_STATUS_TAB=1 zum Einblenden)")
         # HealthTab immer ganz rechts (letzter Tab)
-        if HealthTab:
+        specs.append(TabSpec(
+            emoji("🩺 Health", "Health"), "tabs.healthcheck", "HealthTab",
+            lambda cls, frame: cls(root, notebook, datastore=datastore, app=self, tab_frame=frame),
+            "health_tab",
+        ))
+
+        for spec in specs:
+            setattr(self, spec.attr, None)
             try:
-                _dbg_print("[TABS] HealthTab wird erstellt...")
-                self.tabview.add(emoji("🩺 Health", "Health"))
-                health_frame = self.tabview.tab(emoji("🩺 Health", "Health"))
-                try:
-                    health_frame.configure(fg_color=COLOR_ROOT)
-                except:
-                    pass
-                self.health_tab = HealthTab(self.root, self.notebook, datastore=self.datastore, app=self, tab_frame=health_frame)
-                _dbg_print("[TABS] HealthTab erfolgreich hinzugefügt.")
+                self.tab_registry.add(spec)
             except Exception as e:
-                logger.error("HealthTab init failed: %s", e)
-                self.health_tab = None
-        _dbg_print("[TABS] Alle weiteren Tabs wurden verarbeitet.")
+                logger.error("%s registration failed: %s", spec.class_name, e)
+        _dbg_print("[TABS] Alle weiteren Tabs wurden registriert.")
+
+    def _on_tab_built(self, spec: TabSpec, tab) -> None:
+        """Frisch gebauten Tab verdrahten (Attribut, Lebenszyklus, State-Abo)."""
+        setattr(self, spec.attr, tab)
+        self.tab_lifecycle.register(spec.name, tab)
+        if spec.attr == "historical_tab":
+            self._subscribe_view_updates()
+
+    def _on_tab_selected(self, name: str) -> None:
+        self.tab_registry.ensure(name)
 
     def _subscribe_view_updates(self) -> None:
         if not hasattr(self, "app_state") or not self.app_state:
@@ -956,7 +800,7 @@ class MainApp:
                 pass
         self._state_unsubscribers = []
 
-        def _subscribe(handler, label: str) -> None:
+        def _subscribe(handler, label: str, keys=None, deltas: bool = False) -> None:
             if handler is None:
                 return
 
@@ -966,15 +810,17 @@ class MainApp:
                 except Exception:
                     logging.exception("%s update_data failed", label)
 
-            self._state_unsubscribers.append(self.app_state.subscribe(_listener))
+            self._state_unsubscribers.append(self.app_state.subscribe(_listener, keys=keys, deltas=deltas))
 
+        # Energiefluss und Puffer/Boiler merken sich ihre Eingänge und bekommen nur Änderungen;
+        # die Sparkline tastet den vollen Stand ab (konstante Werte zählen als Sample)
         if hasattr(self, "energy_view"):
-            _subscribe(self.energy_view.update_data, "energy_view")
+            _subscribe(self.energy_view.update_data, "energy_view", PV_KEYS, deltas=True)
         if hasattr(self, "buffer_view"):
-            _subscribe(self.buffer_view.update_data, "buffer_view")
+            _subscribe(self.buffer_view.update_data, "buffer_view", BUFFER_KEYS, deltas=True)
         if hasattr(self, "sparkline_view"):
-            _subscribe(self.sparkline_view.update_data, "sparkline_view")
-        if hasattr(self, "historical_tab"):
+            _subscribe(self.sparkline_view.update_data, "sparkline_view", SPARKLINE_KEYS)
+        if getattr(self, "historical_tab", None) is not None:
             _subscribe(self.historical_tab.update_data, "historical_tab")
 
     # --- Callbacks ---
@@ -1466,24 +1312,18 @@ class MainApp:
             cached = None
         if cached:
             return cached
-        ts_str = self.datastore.get_latest_timestamp()
-        if not ts_str:
-            return None
-        try:
-            return datetime.fromisoformat(ts_str)
-        except Exception:
-            return None
+        return parse_iso_datetime(self.datastore.get_latest_timestamp())
 
     def _load_pv_sparkline(self, minutes: int = 60) -> list[float]:
         if not self.datastore:
             logger.debug("[SPARKLINE] Kein Datastore!")
             return []
-        cutoff = datetime.now() - timedelta(minutes=minutes)
+        cutoff = utc_now() - timedelta(minutes=minutes)
         hours = max(1, (minutes // 60) + 1)
         rows = self.datastore.get_recent_fronius(hours=hours, limit=1200)
         values: list[float] = []
         for row in rows[-400:]:
-            ts = self._parse_timestamp_value(row.get('timestamp'))
+            ts = parse_timestamp_value(row.get('timestamp'))
             pv_kw = row.get('pv')
             if ts is None or pv_kw is None:
                 continue
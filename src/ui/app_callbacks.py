@@ -5,9 +5,10 @@ and input booleans via the Home Assistant API.
 """
 
 import os
-import threading
 from typing import TYPE_CHECKING, Callable
 
+from core.workers import LANE_UI, run_in_background
+
 if TYPE_CHECKING:
     from core.homeassistant import HomeAssistantClient
 
@@ -181,7 +182,7 @@ def trigger_ha_input_boolean_turn_on(
             pass
 
     try:
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI)
     except Exception:
         pass
 
@@ -241,7 +242,7 @@ def trigger_ha_script(
             pass
 
     try:
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI)
     except Exception:
         pass
 
@@ -301,7 +302,7 @@ def trigger_ha_automation(
             pass
 
     try:
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI)
     except Exception:
         pass
 
@@ -361,6 +362,6 @@ def trigger_ha_webhook(
             pass
 
     try:
-        threading.Thread(target=worker, daemon=True).start()
+        run_in_background(worker, lane=LANE_UI)
     except Exception:
         pass
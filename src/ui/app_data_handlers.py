@@ -4,9 +4,9 @@ Contains functions for processing incoming data from energy sources
 (PV inverter, BMK heating system) and updating app state.
 """
 
-from datetime import datetime
 from typing import Any, TYPE_CHECKING
 
+from core.time_utils import utc_now
 from core.utils import safe_float
 from core.schema import (
     PV_POWER_KW,
@@ -44,7 +44,7 @@ def process_wechselrichter_data(
         last_data: Mutable dict for storing last known values.
         source_health: Health tracking dict for data sources.
     """
-    ts = parse_timestamp_value(data.get("Zeitstempel")) or datetime.now()
+    ts = parse_timestamp_value(data.get("Zeitstempel")) or utc_now()
     source = source_health.get("pv")
     if source:
         source["ts"] = ts
@@ -107,7 +107,7 @@ def process_bmkdaten_data(
     import logging
     logging.info("[BMK] process_bmkdaten_data: data=%s", data)
     
-    ts = parse_timestamp_value(data.get("Zeitstempel")) or datetime.now()
+    ts = parse_timestamp_value(data.get("Zeitstempel")) or utc_now()
     source = source_health.get("heating")
     if source:
         source["ts"] = ts
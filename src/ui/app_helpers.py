@@ -4,21 +4,24 @@ Contains static utility functions for timestamp parsing, age formatting,
 and other common operations used throughout the app.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
+from core.time_utils import ensure_utc, to_utc_datetime, utc_now
+
 
 def parse_iso_datetime(value: str | None) -> datetime | None:
-    """Parse an ISO-8601 timestamp string into a datetime object.
+    """Parse an ISO-8601 timestamp string into a UTC-aware datetime.
     
-    Handles both naive timestamps (treated as local time) and
-    timezone-aware timestamps. Supports 'Z' suffix for UTC.
+    Naive timestamps are DataStore/record timestamps and therefore UTC;
+    aware timestamps are converted to UTC. Supports 'Z' suffix for UTC.
+    Convert to local time only for display.
     
     Args:
         value: ISO-8601 timestamp string, or None.
         
     Returns:
-        Parsed datetime object, or None if parsing fails.
+        UTC-aware datetime object, or None if parsing fails.
         
     Examples:
         >>> parse_iso_datetime("2024-01-15T10:30:00Z")
@@ -28,55 +31,41 @@ def parse_iso_datetime(value: str | None) -> datetime | None:
     """
     if not value:
         return None
-    try:
-        raw = str(value).strip()
-        if raw.endswith("Z"):
-            raw = raw[:-1] + "+00:00"
-        dt = datetime.fromisoformat(raw)
-        if dt.tzinfo is None:
-            # Treat naive timestamps as local time
-            dt = dt.replace(tzinfo=datetime.now().astimezone().tzinfo)
-        return dt
-    except Exception:
-        return None
+    return to_utc_datetime(str(value))
 
 
 def parse_timestamp_value(value: Any) -> datetime | None:
-    """Parse a timestamp value (string or datetime) into a datetime.
+    """Parse a timestamp value (string or datetime) into a UTC-aware datetime.
     
     More lenient than parse_iso_datetime - accepts datetime objects directly.
+    Naive values are taken as UTC.
     
     Args:
         value: A datetime object or ISO-8601 string.
         
     Returns:
-        Datetime object, or None if parsing fails.
+        UTC-aware datetime, or None if parsing fails.
     """
     if isinstance(value, datetime):
-        return value
+        return ensure_utc(value)
     if not value:
         return None
-    try:
-        return datetime.fromisoformat(str(value))
-    except Exception:
-        return None
+    return to_utc_datetime(str(value))
 
 
 def parse_timestamp_as_epoch(ts: Any) -> float:
     """Parse a timestamp and return epoch seconds.
     
+    Naive values are taken as UTC (DataStore convention).
+    
     Args:
         ts: Timestamp as ISO-8601 string or datetime.
         
     Returns:
         Epoch timestamp (seconds since 1970), or 0 if parsing fails.
     """
-    if not ts:
-        return 0
-    try:
-        return datetime.fromisoformat(str(ts)).timestamp()
-    except Exception:
-        return 0
+    dt = parse_timestamp_value(ts)
+    return dt.timestamp() if dt else 0
 
 
 def format_age_short(seconds: float | None) -> str:
@@ -136,7 +125,7 @@ def format_age_compact(seconds: float | int) -> str:
 def age_seconds(ts: datetime | None) -> float | None:
     """Calculate the age of a timestamp in seconds.
     
-    Handles both timezone-aware and naive datetimes correctly.
+    Naive datetimes are taken as UTC; the age is measured against UTC now.
     
     Args:
         ts: Timestamp to calculate age from.
@@ -147,11 +136,7 @@ def age_seconds(ts: datetime | None) -> float | None:
     if ts is None:
         return None
     try:
-        if ts.tzinfo is not None and ts.tzinfo.utcoffset(ts) is not None:
-            now = datetime.now(ts.tzinfo)
-        else:
-            now = datetime.now()
-        return (now - ts).total_seconds()
+        return (utc_now() - ensure_utc(ts)).total_seconds()
     except Exception:
         return None
 
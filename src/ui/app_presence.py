@@ -5,10 +5,11 @@ via device tracker or script-based approaches.
 """
 
 import os
-import threading
 import time
 from typing import TYPE_CHECKING, Any, Callable
 
+from core.workers import LANE_IO, run_in_background
+
 if TYPE_CHECKING:
     from core.homeassistant import HomeAssistantClient
 
@@ -225,9 +226,9 @@ class PresenceOverrideManager:
             # In script mode we only fire once (first tick)
             if mode == "script":
                 if self._last_ok is None:
-                    threading.Thread(target=worker, daemon=True).start()
+                    run_in_background(worker, lane=LANE_IO, key="presence:override")
             else:
-                threading.Thread(target=worker, daemon=True).start()
+                run_in_background(worker, lane=LANE_IO, key="presence:override")
         except Exception:
             pass
         
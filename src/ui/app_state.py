@@ -1,27 +1,63 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 import logging
 
+_MISSING = object()
+
+
+class _Subscription:
+    __slots__ = ("callback", "keys", "deltas")
+
+    def __init__(self, callback: Callable[[dict], None], keys: Optional[frozenset], deltas: bool) -> None:
+        self.callback = callback
+        self.keys = keys
+        self.deltas = deltas
+
 
 class AppState:
-    """Simple in-memory app state with pub/sub updates and delta detection."""
+    """Simple in-memory app state with pub/sub updates and delta detection.
+
+    Listeners can be scoped to a key set (only called when one of those keys
+    changed) and can receive either the full snapshot or only the changed
+    keys. With ``schedule`` (e.g. ``root.after_idle``) all updates until the
+    scheduled flush are coalesced into one notification per listener.
+    """
 
-    def __init__(self, validator: Optional[Callable[[dict], list[str]]] = None) -> None:
+    def __init__(
+        self,
+        validator: Optional[Callable[[dict], list[str]]] = None,
+        schedule: Optional[Callable[[Callable[[], None]], object]] = None,
+    ) -> None:
         self._data: Dict[str, object] = {}
-        self._listeners: List[Callable[[dict], None]] = []
+        self._listeners: List[_Subscription] = []
         self._validator = validator
         self._snapshot: Optional[dict] = None
+        self._schedule = schedule
+        self._pending: Dict[str, object] = {}
+        self._flush_scheduled = False
+
+    def subscribe(
+        self,
+        callback: Callable[[dict], None],
+        keys: Optional[Iterable[str]] = None,
+        deltas: bool = False,
+    ) -> Callable[[], None]:
+        """Register ``callback``.
 
-    def subscribe(self, callback: Callable[[dict], None]) -> Callable[[], None]:
-        if callback not in self._listeners:
-            self._listeners.append(callback)
+        Args:
+            keys: Only notify when one of these keys changed (None = any key).
+            deltas: Pass only the changed keys (restricted to ``keys``)
+                instead of the full state snapshot.
+        """
+        if any(sub.callback == callback for sub in self._listeners):
+            return self._unsubscriber(callback)
+        self._listeners.append(_Subscription(callback, frozenset(keys) if keys is not None else None, deltas))
+        return self._unsubscriber(callback)
 
+    def _unsubscriber(self, callback: Callable[[dict], None]) -> Callable[[], None]:
         def _unsubscribe() -> None:
-            try:
-                self._listeners.remove(callback)
-            except ValueError:
-                pass
+            self._listeners = [sub for sub in self._listeners if sub.callback != callback]
 
         return _unsubscribe
 
@@ -33,21 +69,49 @@ class AppState:
             for warning in warnings:
                 logging.warning("AppState payload warning: %s", warning)
         # Skip notification if no values actually changed
-        changed = False
-        for k, v in payload.items():
-            old = self._data.get(k)
-            if old != v:
-                changed = True
-                break
-        self._data.update(payload)
+        data = self._data
+        changed = {k: v for k, v in payload.items() if data.get(k, _MISSING) != v}
+        data.update(payload)
         if not changed:
             return
-        # Reuse snapshot object to reduce GC pressure
-        self._snapshot = dict(self._data)
-        snapshot = self._snapshot
-        for listener in list(self._listeners):
+        if self._schedule is None:
+            self._dispatch(changed)
+            return
+        self._pending.update(changed)
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        try:
+            self._schedule(self.flush)
+        except Exception:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver coalesced changes now (no-op without pending changes)."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        changed, self._pending = self._pending, {}
+        self._dispatch(changed)
+
+    def _dispatch(self, changed: Dict[str, object]) -> None:
+        snapshot = None
+        for sub in list(self._listeners):
+            if sub.keys is None:
+                relevant = changed
+            else:
+                relevant = {k: v for k, v in changed.items() if k in sub.keys}
+                if not relevant:
+                    continue
+            if sub.deltas:
+                arg = relevant
+            else:
+                if snapshot is None:
+                    # Reuse one snapshot object for all listeners of this dispatch
+                    self._snapshot = snapshot = dict(self._data)
+                arg = snapshot
             try:
-                listener(snapshot)
+                sub.callback(arg)
             except Exception:
                 logging.exception("AppState listener failed")
 
@@ -21,6 +21,8 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.cm as cm
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 
+from ui.text_cache import DEFAULT_FONT, get_text_cache
+
 # --- FARBEN ---
 # Dieses Widget hatte eine eigene (bläuliche) Glasmorphism-Palette.
 # Für ein konsistentes UI verwenden wir die globale Palette aus ui.styles.
@@ -248,13 +250,14 @@ class ModernBoilerWidget:
             y1 = h if i == 2 else (i + 1) * section_h
             draw.rectangle([0, y0, w, y1], fill=color)
 
-        draw.text((w // 2, section_h // 2), f"{temp_top:.0f}°C", fill="white", anchor="mm")
-        draw.text((w // 2, section_h + section_h // 2), f"{temp_mid:.0f}°C", fill="white", anchor="mm")
-        draw.text((w // 2, 2 * section_h + section_h // 2), f"{temp_bot:.0f}°C", fill="white", anchor="mm")
-
-        draw.text((6, 6), "Oben", fill=COLOR_SUBTEXT, anchor="la")
-        draw.text((6, section_h + 6), "Mitte", fill=COLOR_SUBTEXT, anchor="la")
-        draw.text((6, 2 * section_h + 6), "Unten", fill=COLOR_SUBTEXT, anchor="la")
+        # Beschriftungen als gecachte Text-Sprites (PIL-Standardfont)
+        texts = get_text_cache()
+        for i, temp in enumerate((temp_top, temp_mid, temp_bot)):
+            sprite = texts.text(f"{temp:.0f}°C", "white", candidates=DEFAULT_FONT, anchor="mm")
+            sprite.paste_into(img, w // 2, i * section_h + section_h // 2)
+        for i, label in enumerate(("Oben", "Mitte", "Unten")):
+            sprite = texts.text(label, COLOR_SUBTEXT, candidates=DEFAULT_FONT, anchor="la")
+            sprite.paste_into(img, 6, i * section_h + 6)
 
         img = img.filter(ImageFilter.GaussianBlur(radius=1))
         self.tk_img = ImageTk.PhotoImage(img)
@@ -0,0 +1,185 @@
+"""Persistentes Linien-Chart mit Blitting für die matplotlib-Tabs.
+
+Statt bei jedem Refresh ``fig.clear()`` + neue Achsen + neu geplottete
+Linien werden Achsen und ``Line2D``-Artists einmal angelegt und danach nur
+per ``set_data`` aktualisiert.
+
+Die Datenlinien (und Overlays wie die Jetzt-Linie) sind ``animated``: ein
+voller ``canvas.draw()`` zeichnet nur den statischen Teil (Achsen, Gitter,
+Ticks, Titel, Legende), der beim ``draw_event`` per ``copy_from_bbox``
+gecacht wird. Solange sich Grenzen, Titel und Größe nicht ändern, reicht
+ein Blit: Hintergrund zurückkopieren, Linien zeichnen, ``canvas.blit``.
+
+Die Achsengrenzen sind „klebrig“: sie springen nur, wenn Daten den
+sichtbaren Bereich verlassen, ihn nur noch zu einem kleinen Teil nutzen
+oder das Zeitfenster spürbar weitergewandert ist.
+
+Das Modul importiert matplotlib nicht selbst – Figure, Achse und Canvas
+werden vom Tab übergeben.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Limits = Tuple[float, float]
+
+
+def sticky_limits(
+    current: Optional[Limits],
+    lo: Optional[float],
+    hi: Optional[float],
+    margin: float = 0.05,
+    slack: float = 0.5,
+) -> Optional[Limits]:
+    """Grenzen für den Datenbereich ``lo..hi`` (mit Rand) – oder ``current``, wenn er noch passt.
+
+    ``current`` bleibt, solange alle Daten darin liegen und er höchstens
+    ``1 + slack`` mal so groß ist wie der benötigte Bereich.
+    """
+    if lo is None or hi is None:
+        return current
+    span = hi - lo
+    if span <= 0:
+        span = abs(hi) * 0.1 or 1.0
+    pad = span * margin
+    wanted = (lo - pad, hi + pad)
+    if current is not None:
+        c_lo, c_hi = current
+        if c_lo <= lo and hi <= c_hi and (c_hi - c_lo) <= (wanted[1] - wanted[0]) * (1.0 + slack):
+            return current
+    return wanted
+
+
+def window_moved(current: Optional[Limits], wanted: Limits, tolerance: float = 0.01) -> bool:
+    """True, wenn ein Zeitfenster um mehr als ``tolerance`` seiner Breite abweicht."""
+    if current is None:
+        return True
+    span = abs(wanted[1] - wanted[0]) or 1.0
+    return abs(current[0] - wanted[0]) > span * tolerance or abs(current[1] - wanted[1]) > span * tolerance
+
+
+class BlitLineChart:
+    """Einmal angelegte Linien einer Achse, aktualisiert per ``set_data`` und Blitting.
+
+    ``line_defs`` sind ``(key, label, color, linestyle)``-Tupel. Die Legende
+    legt der Aufrufer nach dem Konstruktor an; erst ``animate()`` nimmt die
+    Linien aus dem statischen Hintergrund (Legenden-Handles übernehmen das
+    ``animated``-Flag sonst und würden beim vollen Zeichnen fehlen).
+    """
+
+    def __init__(
+        self,
+        fig: Any,
+        ax: Any,
+        canvas: Any,
+        line_defs: Sequence[Tuple[str, str, str, str]],
+        linewidth: float = 1.6,
+        alpha: float = 0.95,
+    ):
+        self.fig = fig
+        self.ax = ax
+        self.canvas = canvas
+        self.lines: Dict[str, Any] = {}
+        for key, label, color, style in line_defs:
+            (line,) = ax.plot([], [], label=label, color=color, linewidth=linewidth, linestyle=style, alpha=alpha)
+            self.lines[key] = line
+        self._overlays: List[Any] = []
+        self._background = None
+        self._needs_full = True
+        self._animated = False
+        self.full_draws = 0
+        self.blits = 0
+        self._cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    # ------------------------------------------------------------------
+    # Artists
+    # ------------------------------------------------------------------
+    def add_overlay(self, artist: Any) -> Any:
+        """Weiteren beweglichen Artist (z. B. Jetzt-Linie) mit den Linien blitten."""
+        self._overlays.append(artist)
+        if self._animated:
+            artist.set_animated(True)
+        return artist
+
+    def animate(self) -> None:
+        for artist in self._artists():
+            artist.set_animated(True)
+        self._animated = True
+        self.invalidate()
+
+    def _artists(self) -> List[Any]:
+        return list(self.lines.values()) + self._overlays
+
+    def set_series(self, key: str, x: Sequence[float], y: Sequence[float]) -> None:
+        self.lines[key].set_data(x, y)
+
+    def clear_series(self) -> None:
+        for line in self.lines.values():
+            line.set_data([], [])
+
+    # ------------------------------------------------------------------
+    # Grenzen
+    # ------------------------------------------------------------------
+    def set_xwindow(self, lo: float, hi: float, tolerance: float = 0.01) -> bool:
+        """Zeitfenster setzen, wenn es sich um mehr als ``tolerance`` verschoben hat."""
+        current = tuple(self.ax.get_xlim())
+        if not window_moved(current, (lo, hi), tolerance):
+            return False
+        self.ax.set_xlim(lo, hi)
+        self.invalidate()
+        return True
+
+    def fit_y(self, lo: Optional[float], hi: Optional[float], margin: float = 0.05) -> bool:
+        """Y-Grenzen nur anpassen, wenn die Daten nicht mehr gut hineinpassen."""
+        current = tuple(self.ax.get_ylim())
+        limits = sticky_limits(current, lo, hi, margin=margin)
+        if limits is None or limits == current:
+            return False
+        self.ax.set_ylim(*limits)
+        self.invalidate()
+        return True
+
+    # ------------------------------------------------------------------
+    # Zeichnen
+    # ------------------------------------------------------------------
+    def invalidate(self) -> None:
+        """Statischer Teil hat sich geändert (Titel, Grenzen, Größe, Stil) – nächstes Mal voll zeichnen."""
+        self._needs_full = True
+
+    def _on_draw(self, _event: Any = None) -> None:
+        # Jeder volle Draw (auch Resize durch Tk) erneuert den Hintergrund-Cache
+        try:
+            self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+            self._draw_artists()
+        except Exception:
+            self._background = None
+            logger.debug("Chart-Hintergrund konnte nicht gecacht werden", exc_info=True)
+
+    def _draw_artists(self) -> None:
+        for artist in self._artists():
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+
+    def redraw(self) -> bool:
+        """Zeichnet neu; liefert True bei vollem Draw, False bei Blit."""
+        if self._needs_full or self._background is None:
+            self._needs_full = False
+            self.canvas.draw()
+            self.full_draws += 1
+            return True
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.fig.bbox)
+        self.blits += 1
+        return False
+
+    def disconnect(self) -> None:
+        try:
+            self.canvas.mpl_disconnect(self._cid)
+        except Exception:
+            pass
+        self._background = None
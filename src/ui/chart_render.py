@@ -0,0 +1,265 @@
+"""Chart-Rasterung außerhalb des Tk-Threads.
+
+matplotlib-Charts werden nicht mehr per ``FigureCanvasTkAgg.draw()`` im
+Tk-Thread gezeichnet, sondern so:
+
+    1. Der Tab liest Größe und Zeitraum im Tk-Thread und ruft
+       ``ChartRenderService.request`` auf.
+    2. Die Render-Funktion läuft in der ``render``-Lane des Worker-Pools,
+       aktualisiert eine eigene ``Figure`` mit Agg-Canvas und liefert ein
+       ``Raster`` (RGBA-Bytes) zurück.
+    3. Im Tk-Thread kopiert ``ChartImage.show`` das Raster in ein
+       bestehendes ``PhotoImage`` – ein einziges Bild-Update.
+
+Eine neuere Anfrage für denselben Chart ersetzt eine noch wartende; ein
+bereits laufendes Rendering wird verworfen, wenn inzwischen eine neuere
+Anfrage kam. Figures gehören nach dem Aufbau nur noch der Render-Lane
+(gleicher Key → nie parallel).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from core.workers import LANE_RENDER, WorkerPool, get_worker_pool
+from ui.frame_budget import FrameScheduler
+from ui.wakeup import WakeupQueue, start_callback_pump
+
+logger = logging.getLogger(__name__)
+
+MIN_RENDER_PX = 50
+
+
+@dataclass
+class Raster:
+    width: int
+    height: int
+    rgba: bytes
+
+
+def snapshot(canvas: Any) -> Raster:
+    """Aktuellen Agg-Puffer kopieren – der Worker darf danach weiterzeichnen."""
+    buf = canvas.buffer_rgba()
+    height, width = buf.shape[:2]
+    return Raster(int(width), int(height), bytes(buf))
+
+
+def rasterize(fig: Any) -> Raster:
+    """``fig`` vollständig mit Agg zeichnen und als RGBA-Raster liefern."""
+    canvas = fig.canvas
+    if not hasattr(canvas, "buffer_rgba"):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return snapshot(canvas)
+
+
+def fit_figure(fig: Any, width: int, height: int) -> bool:
+    """Figure auf die Pixelgröße des Widgets bringen; True bei Änderung.
+
+    Tk meldet beim Relayout kurzzeitig winzige Größen (1x1) – die werden ignoriert.
+    """
+    if width < MIN_RENDER_PX or height < MIN_RENDER_PX:
+        return False
+    dpi = float(fig.get_dpi() or 100.0)
+    size = (width / dpi, height / dpi)
+    if tuple(float(v) for v in fig.get_size_inches()) == size:
+        return False
+    fig.set_size_inches(*size, forward=False)
+    return True
+
+
+@dataclass
+class RenderStats:
+    name: str
+    renders: int = 0
+    stale: int = 0
+    failed: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+def _call(_name: str, fn: Callable[..., Any], *args: Any) -> Any:
+    return fn(*args)
+
+
+class ChartRenderService:
+    """Rendert Charts in der Render-Lane und liefert nur aktuelle Ergebnisse in den Tk-Thread."""
+
+    def __init__(
+        self,
+        post_ui: Callable[[Callable[[], None]], None],
+        pool: Optional[WorkerPool] = None,
+        lane: str = LANE_RENDER,
+        measure: Callable[..., Any] = _call,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._post_ui = post_ui
+        self._pool = pool
+        self._lane = lane
+        self._measure = measure
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generation: Dict[Hashable, int] = {}
+        self._stats: Dict[str, RenderStats] = {}
+
+    @classmethod
+    def for_root(cls, root: Any) -> "ChartRenderService":
+        """Gemeinsamer Dienst je Tk-Root; Ergebnisse kommen über eine eigene Wakeup-Queue."""
+        service = getattr(root, "_chart_renderer", None)
+        if service is None:
+            results: WakeupQueue = WakeupQueue()
+            scheduler = FrameScheduler.for_root(root)
+            service = cls(results.put, measure=scheduler.measure)
+            service._wakeup = start_callback_pump(root, results)
+            root._chart_renderer = service
+        return service
+
+    def request(
+        self,
+        key: Hashable,
+        render: Callable[[], Any],
+        on_ready: Callable[[Any], None],
+        name: Optional[str] = None,
+    ) -> int:
+        """``render()`` im Worker ausführen, danach ``on_ready(ergebnis)`` im Tk-Thread.
+
+        Liefert die Generation der Anfrage; ältere Generationen desselben
+        ``key`` werden nie mehr angezeigt.
+        """
+        label = name or str(key)
+        with self._lock:
+            generation = self._generation.get(key, 0) + 1
+            self._generation[key] = generation
+
+        def task() -> None:
+            if not self._is_current(key, generation):
+                self._count(label, "stale")
+                return
+            start = self._clock()
+            try:
+                result = render()
+            except Exception:
+                self._count(label, "failed")
+                logger.exception("Chart-Rendering %s fehlgeschlagen", label)
+                return
+            self._record(label, (self._clock() - start) * 1000.0)
+            if not self._is_current(key, generation):
+                self._count(label, "stale")
+                return
+            self._post_ui(lambda: self._deliver(key, generation, label, on_ready, result))
+
+        pool = self._pool or get_worker_pool()
+        pool.submit(task, lane=self._lane, key=("chart", key), name=f"chart:{label}")
+        return generation
+
+    def cancel(self, key: Hashable) -> None:
+        """Laufende und wartende Anfragen für ``key`` verwerfen."""
+        with self._lock:
+            if key in self._generation:
+                self._generation[key] += 1
+
+    def dispose(self, key: Hashable, teardown: Callable[[], None], name: Optional[str] = None) -> None:
+        """Anfragen für ``key`` verwerfen und ``teardown()`` danach in der Render-Lane ausführen.
+
+        Die Figure gehört der Render-Lane: ``teardown`` läuft erst, wenn ein
+        bereits laufendes Rendering desselben ``key`` fertig ist. Danach keine
+        neuen Anfragen für ``key`` stellen – sie würden den Abbau verdrängen.
+        """
+        self.cancel(key)
+        label = name or str(key)
+
+        def task() -> None:
+            try:
+                teardown()
+            except Exception:
+                logger.exception("Chart-Abbau %s fehlgeschlagen", label)
+
+        pool = self._pool or get_worker_pool()
+        try:
+            pool.submit(task, lane=self._lane, key=("chart", key), name=f"chart-dispose:{label}")
+        except RuntimeError:
+            # Pool beendet: nichts rendert mehr
+            task()
+
+    def _is_current(self, key: Hashable, generation: int) -> bool:
+        with self._lock:
+            return self._generation.get(key) == generation
+
+    def _deliver(self, key: Hashable, generation: int, label: str, on_ready: Callable[[Any], None], result: Any) -> None:
+        if not self._is_current(key, generation):
+            self._count(label, "stale")
+            return
+        self._measure(f"chart:{label}", on_ready, result)
+
+    def _entry(self, label: str) -> RenderStats:
+        stats = self._stats.get(label)
+        if stats is None:
+            stats = self._stats[label] = RenderStats(label)
+        return stats
+
+    def _count(self, label: str, field: str) -> None:
+        with self._lock:
+            stats = self._entry(label)
+            setattr(stats, field, getattr(stats, field) + 1)
+
+    def _record(self, label: str, ms: float) -> None:
+        with self._lock:
+            stats = self._entry(label)
+            stats.renders += 1
+            stats.last_ms = ms
+            stats.max_ms = max(stats.max_ms, ms)
+
+    def stats(self) -> Dict[str, RenderStats]:
+        with self._lock:
+            return {name: RenderStats(**vars(s)) for name, s in self._stats.items()}
+
+
+class ChartImage(tk.Canvas):
+    """Zeigt gerasterte Charts und meldet Größenänderungen für ein neues Rendering."""
+
+    def __init__(self, master: tk.Misc, bg: str, on_resize: Optional[Callable[[int, int], None]] = None, **kwargs: Any):
+        super().__init__(master, bg=bg, highlightthickness=0, bd=0, **kwargs)
+        self._photo = None
+        self._item = None
+        self._size: Tuple[int, int] = (0, 0)
+        self._on_resize = on_resize
+        self.bind("<Configure>", self._on_configure)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        if self._size == (0, 0):
+            try:
+                return int(self.winfo_width() or 0), int(self.winfo_height() or 0)
+            except Exception:
+                return self._size
+        return self._size
+
+    def _on_configure(self, event: Any) -> None:
+        size = (int(event.width), int(event.height))
+        if size == self._size or min(size) < MIN_RENDER_PX:
+            return
+        self._size = size
+        if self._on_resize is not None:
+            self._on_resize(*size)
+
+    def show(self, raster: Raster) -> None:
+        """Raster anzeigen; bei gleicher Größe wird das vorhandene PhotoImage überschrieben."""
+        from PIL import Image, ImageTk
+
+        image = Image.frombuffer("RGBA", (raster.width, raster.height), raster.rgba, "raw", "RGBA", 0, 1)
+        photo = self._photo
+        if photo is not None and (photo.width(), photo.height()) == (raster.width, raster.height):
+            photo.paste(image)
+            return
+        self._photo = ImageTk.PhotoImage(image)
+        if self._item is None:
+            self._item = self.create_image(0, 0, anchor="nw", image=self._photo)
+        else:
+            self.itemconfigure(self._item, image=self._photo)
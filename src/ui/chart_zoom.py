@@ -0,0 +1,149 @@
+"""Zoom und Pan für Zeitreihen-Charts auf dem Touchscreen.
+
+``ZoomWindow`` ist reine Logik: ein sichtbares Zeitfenster (Epoch-Sekunden),
+``None`` heißt "folgt dem gewählten Zeitraum". ``ZoomGesture`` bindet
+Ziehen (Pan), Mausrad/Scroll-Geste (Zoom um den Zeiger) und Doppeltipp
+(zurück zum Zeitraum) an ein Widget. Tk 8.6 liefert keine Pinch-Events;
+auf dem Touchscreen kommen Zwei-Finger-Gesten als Scroll-Events an.
+
+Jede Änderung ruft ``on_change`` – der Tab fordert dann ein neues
+Rendering an. Da Chart-Daten aus der LOD-Pyramide (``core.chart_data``)
+kommen, kostet das kein erneutes Laden.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Tuple
+
+Window = Tuple[float, float]
+
+MIN_SPAN_S = 15 * 60.0
+WHEEL_FACTOR = 0.8
+
+
+class ZoomWindow:
+    """Sichtbares Zeitfenster mit Grenzen für Spannweite und Lage."""
+
+    def __init__(self, min_span: float = MIN_SPAN_S, max_span: Optional[float] = None):
+        self.min_span = float(min_span)
+        self.max_span = max_span
+        self.view: Optional[Window] = None
+        self.bounds: Optional[Window] = None
+
+    @property
+    def active(self) -> bool:
+        return self.view is not None
+
+    def current(self, default: Window) -> Window:
+        return self.view if self.view is not None else default
+
+    def reset(self) -> bool:
+        changed = self.view is not None
+        self.view = None
+        return changed
+
+    def pan(self, dx_px: float, width_px: float, default: Window) -> Window:
+        """Um ``dx_px`` Pixel verschieben; Ziehen nach rechts zeigt ältere Daten."""
+        start, end = self.current(default)
+        shift = -float(dx_px) / max(1.0, float(width_px)) * (end - start)
+        return self._set(start + shift, end + shift)
+
+    def zoom(self, factor: float, anchor: float, default: Window) -> Window:
+        """Spannweite mit ``factor`` skalieren; ``anchor`` (0..1) bleibt unter dem Finger."""
+        start, end = self.current(default)
+        span = end - start
+        new_span = max(self.min_span, span * float(factor))
+        if self.max_span is not None:
+            new_span = min(float(self.max_span), new_span)
+        anchor = min(1.0, max(0.0, float(anchor)))
+        at = start + anchor * span
+        return self._set(at - anchor * new_span, at + (1.0 - anchor) * new_span)
+
+    def _set(self, start: float, end: float) -> Window:
+        if self.bounds is not None:
+            lo, hi = self.bounds
+            span = end - start
+            if span >= hi - lo:
+                start, end = lo, hi
+            elif start < lo:
+                start, end = lo, lo + span
+            elif end > hi:
+                start, end = hi - span, hi
+        self.view = (start, end)
+        return self.view
+
+
+class ZoomGesture:
+    """Touch-/Maus-Gesten eines Widgets auf ein ``ZoomWindow`` abbilden.
+
+    ``default`` liefert das Fenster des gewählten Zeitraums, ``plot_x`` den
+    horizontalen Anteil (links, rechts) der Achsen an der Widgetbreite.
+    """
+
+    def __init__(
+        self,
+        widget: Any,
+        zoom: ZoomWindow,
+        default: Callable[[], Window],
+        on_change: Callable[[], None],
+        plot_x: Tuple[float, float] = (0.0, 1.0),
+    ):
+        self.widget = widget
+        self.zoom = zoom
+        self._default = default
+        self._on_change = on_change
+        self.plot_x = plot_x
+        self._last_x: Optional[float] = None
+        widget.bind("<ButtonPress-1>", self._on_press, add="+")
+        widget.bind("<B1-Motion>", self._on_drag, add="+")
+        widget.bind("<ButtonRelease-1>", self._on_release, add="+")
+        widget.bind("<Double-Button-1>", self._on_reset, add="+")
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", lambda e: self._wheel(e, 1), add="+")
+        widget.bind("<Button-5>", lambda e: self._wheel(e, -1), add="+")
+
+    def _plot_width(self) -> float:
+        left, right = self.plot_x
+        try:
+            width = float(self.widget.winfo_width())
+        except Exception:
+            return 1.0
+        return max(1.0, width * (right - left))
+
+    def _anchor(self, x: float) -> float:
+        left, _right = self.plot_x
+        try:
+            offset = float(self.widget.winfo_width()) * left
+        except Exception:
+            offset = 0.0
+        return (float(x) - offset) / self._plot_width()
+
+    def _on_press(self, event: Any) -> None:
+        self._last_x = float(event.x)
+
+    def _on_drag(self, event: Any) -> None:
+        if self._last_x is None:
+            return
+        dx = float(event.x) - self._last_x
+        if abs(dx) < 2:
+            return
+        self._last_x = float(event.x)
+        self.zoom.pan(dx, self._plot_width(), self._default())
+        self._on_change()
+
+    def _on_release(self, _event: Any) -> None:
+        self._last_x = None
+
+    def _on_reset(self, _event: Any) -> None:
+        if self.zoom.reset():
+            self._on_change()
+
+    def _on_wheel(self, event: Any) -> None:
+        delta = getattr(event, "delta", 0) or 0
+        if delta:
+            self._wheel(event, 1 if delta > 0 else -1)
+
+    def _wheel(self, event: Any, direction: int) -> None:
+        factor = WHEEL_FACTOR if direction > 0 else 1.0 / WHEEL_FACTOR
+        self.zoom.zoom(factor, self._anchor(event.x), self._default())
+        self._on_change()
@@ -6,10 +6,12 @@ Visualisiert Energiefluss mit modernem Glasmorphism-Effekt
 
 import tkinter as tk
 from tkinter import Canvas
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import io
 import os
 
+from ui.text_cache import DEFAULT_FONT, get_font_registry, get_text_cache
+
 # Farbpalette
 # Ursprünglich hatte dieses Widget eine eigenständige (bläuliche) Glasmorphism-Palette.
 # Für ein konsistentes Dashboard leiten wir die Basisfarben aus ui.styles ab.
@@ -154,7 +156,7 @@ class EnergyFlowWidgetV2:
             img.paste(self.icons['pv'], (160, 45), mask=self.icons['pv'])
         else:
             self._draw_sun(draw, 190, 65)
-        draw.text((190, 115), f"{int(self.pv_power)}W", fill=COLOR_TEXT, anchor="mm", font=None)
+        self._paste_value(img, 190, 115, self.pv_power)
 
         # 2. GRID (Glass Card) rechts-oben
         self._draw_glass_card(draw, 440, 40, 580, 100, "Netz")
@@ -162,7 +164,7 @@ class EnergyFlowWidgetV2:
             img.paste(self.icons['grid'], (480, 45), mask=self.icons['grid'])
         else:
             self._draw_lightning(draw, 510, 65, COLOR_TEXT)
-        draw.text((510, 115), f"{int(abs(self.grid_power))}W", fill=COLOR_TEXT, anchor="mm")
+        self._paste_value(img, 510, 115, abs(self.grid_power))
 
         # 3. HAUS (Glass Card, Mitte)
         self._draw_glass_card(draw, 280, 170, 420, 240, "Verbrauch")
@@ -170,7 +172,7 @@ class EnergyFlowWidgetV2:
             img.paste(self.icons['house'], (310, 175), mask=self.icons['house'])
         else:
             self._draw_house(draw, 350, 200)
-        draw.text((350, 255), f"{int(self.load_power)}W", fill=COLOR_TEXT, anchor="mm", font=None)
+        self._paste_value(img, 350, 255, self.load_power)
 
         # 4. BATTERIE (Glass Card) unten mittig
         self._draw_glass_card(draw, 280, 290, 420, 350, f"Batterie {int(self.battery_soc)}%")
@@ -178,7 +180,7 @@ class EnergyFlowWidgetV2:
             img.paste(self.icons['battery'], (310, 295), mask=self.icons['battery'])
         else:
             self._draw_battery(draw, 350, 315, self.battery_soc)
-        draw.text((350, 365), f"{int(abs(self.battery_power))}W", fill=COLOR_TEXT, anchor="mm")
+        self._paste_value(img, 350, 365, abs(self.battery_power))
         
         # ===== GLOWING SMART ARROWS =====
 
@@ -204,6 +206,11 @@ class EnergyFlowWidgetV2:
         self.canvas.delete("all")
         self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo_image)
     
+    def _paste_value(self, img, x, y, watts):
+        """Leistungswert (PIL-Standardfont) aus dem gemeinsamen Text-Cache einfügen"""
+        sprite = get_text_cache().text(f"{int(watts)}W", COLOR_TEXT, candidates=DEFAULT_FONT, anchor="mm")
+        sprite.paste_into(img, x, y)
+
     def _draw_glass_card(self, draw, x1, y1, x2, y2, label=""):
         """Zeichnet Glasmorphism Card mit transparentem Effekt"""
         radius = 16
@@ -219,10 +226,8 @@ class EnergyFlowWidgetV2:
         
         # Label oben links (klein, gedimmt)
         if label:
-            try:
-                label_font = ImageFont.truetype("segoeui.ttf", 9)
-            except:
-                label_font = None
+            # Font nur einmal laden (fehlt Segoe UI: PIL-Standardfont)
+            label_font = get_font_registry().get(9, candidates=("segoeui.ttf",))
             draw.text((x1 + 10, y1 + 8), label, fill=COLOR_SUBTEXT, anchor="lm", font=label_font)
     
     def _draw_glow_arrow(self, draw, x1, y1, x2, y2, color, width=3):
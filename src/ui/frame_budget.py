@@ -0,0 +1,217 @@
+"""Kooperativer Scheduler mit Zeitbudget je Frame für den Tk-Thread.
+
+Schwere Arbeit (``canvas.draw()``, PIL-Rendering, DB-Abfragen für die
+Anzeige) läuft nicht mehr als beliebig lange ``after``-Callbacks, sondern
+als Job über ``FrameScheduler.submit``:
+
+    * Jobs laufen im Leerlauf (``after_idle``) – anstehende Touch-/Maus-
+      Events werden vorher verarbeitet.
+    * Pro Frame werden Jobs nur so lange ausgeführt, bis das Budget
+      (Standard 12 ms) verbraucht ist; der Rest folgt im nächsten Frame.
+    * Ein Job kann ein Generator sein: jedes ``yield`` beendet einen Chunk,
+      der nächste Chunk darf in einem späteren Frame laufen.
+    * Jobs mit gleichem ``key`` ersetzen einen noch wartenden (oder halb
+      abgearbeiteten) Vorgänger.
+
+Laufzeiten werden je Name erfasst; ``worst()`` liefert die größten Sünder.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0    # sichtbare Animation / Live-Werte
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2     # Charts, Health-Abfragen
+
+DEFAULT_BUDGET_MS = 12.0
+DEFAULT_FRAME_MS = 16
+
+
+@dataclass
+class CallbackStats:
+    name: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    over_budget: int = 0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class _Job:
+    __slots__ = ("name", "fn", "priority", "key", "seq", "gen")
+
+    def __init__(self, name: str, fn: Callable[[], Any], priority: int, key: Optional[Hashable], seq: int):
+        self.name = name
+        self.fn = fn
+        self.priority = priority
+        self.key = key
+        self.seq = seq
+        self.gen = None
+
+
+class FrameScheduler:
+    """Führt Jobs im Tk-Thread innerhalb eines Zeitbudgets je Frame aus."""
+
+    def __init__(
+        self,
+        root: Any,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._root = root
+        self.budget_ms = float(budget_ms)
+        self._frame_ms = max(1, int(frame_ms))
+        self._clock = clock
+        self._jobs: List[_Job] = []
+        self._seq = 0
+        self._scheduled = False
+        self._stats: Dict[str, CallbackStats] = {}
+
+    @classmethod
+    def for_root(cls, root: Any) -> "FrameScheduler":
+        """Gemeinsamer Scheduler je Tk-Root (wird beim ersten Zugriff angelegt)."""
+        scheduler = getattr(root, "_frame_scheduler", None)
+        if scheduler is None:
+            scheduler = cls(root)
+            try:
+                root._frame_scheduler = scheduler
+            except Exception:
+                pass
+        return scheduler
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        priority: int = PRIORITY_NORMAL,
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """Job einreihen; gibt ``fn`` einen Generator zurück, läuft er in Chunks."""
+        if key is not None:
+            for job in [j for j in self._jobs if j.key == key]:
+                self._drop(job)
+        self._seq += 1
+        self._jobs.append(_Job(name, fn, priority, key, self._seq))
+        self._request_frame(idle_only=True)
+
+    def after(self, ms: int, name: str, fn: Callable[[], Any], priority: int = PRIORITY_NORMAL, key: Optional[Hashable] = None):
+        """Wie ``root.after``, der Callback läuft aber als budgetierter Job."""
+        return self._root.after(ms, lambda: self.submit(name, fn, priority, key))
+
+    def measure(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """``fn`` sofort ausführen und die Dauer unter ``name`` erfassen."""
+        start = self._clock()
+        try:
+            return fn(*args)
+        finally:
+            self._record(name, (self._clock() - start) * 1000.0)
+
+    @property
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def cancel(self, key: Hashable) -> None:
+        """Wartende Jobs mit ``key`` verwerfen."""
+        for job in [j for j in self._jobs if j.key == key]:
+            self._drop(job)
+
+    def _drop(self, job: _Job) -> None:
+        self._jobs.remove(job)
+        if job.gen is not None:
+            try:
+                job.gen.close()
+            except Exception:
+                pass
+
+    def _request_frame(self, idle_only: bool = False) -> None:
+        if self._scheduled or not self._jobs:
+            return
+        self._scheduled = True
+        try:
+            if idle_only:
+                self._root.after_idle(self._run_frame)
+            else:
+                # Nächster Frame: erst Events verarbeiten lassen, dann im Leerlauf weiter
+                self._root.after(self._frame_ms, lambda: self._root.after_idle(self._run_frame))
+        except Exception:
+            self._scheduled = False
+
+    def _next_job(self) -> Optional[_Job]:
+        if not self._jobs:
+            return None
+        return min(self._jobs, key=lambda j: (j.priority, j.seq))
+
+    def _run_frame(self) -> int:
+        self._scheduled = False
+        frame_start = self._clock()
+        steps = 0
+        while True:
+            job = self._next_job()
+            if job is None:
+                break
+            if steps and (self._clock() - frame_start) * 1000.0 >= self.budget_ms:
+                break
+            steps += 1
+            self._step(job)
+        self._request_frame()
+        return steps
+
+    def _step(self, job: _Job) -> None:
+        start = self._clock()
+        finished = True
+        try:
+            if job.gen is None:
+                result = job.fn()
+                if hasattr(result, "__next__"):
+                    job.gen = result
+            if job.gen is not None:
+                try:
+                    next(job.gen)
+                    finished = False
+                except StopIteration:
+                    pass
+        except Exception:
+            logger.exception("Frame-Job %s fehlgeschlagen", job.name)
+        finally:
+            ms = (self._clock() - start) * 1000.0
+            self._record(job.name, ms)
+            if finished and job in self._jobs:
+                self._jobs.remove(job)
+
+    def _record(self, name: str, ms: float) -> None:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = CallbackStats(name)
+        stats.count += 1
+        stats.total_ms += ms
+        stats.max_ms = max(stats.max_ms, ms)
+        if ms > self.budget_ms:
+            stats.over_budget += 1
+            logger.debug("Frame-Budget überschritten: %s %.1f ms (Budget %.0f ms)", name, ms, self.budget_ms)
+
+    def stats(self) -> Dict[str, CallbackStats]:
+        return dict(self._stats)
+
+    def worst(self, n: int = 5) -> List[CallbackStats]:
+        """Die ``n`` Jobs mit der längsten Einzellaufzeit."""
+        return sorted(self._stats.values(), key=lambda s: s.max_ms, reverse=True)[:n]
+
+    def log_report(self, n: int = 5) -> None:
+        worst = self.worst(n)
+        if not worst:
+            return
+        lines = [
+            f"  {s.name:<24} max {s.max_ms:7.1f} ms  Ø {s.mean_ms:6.1f} ms  n={s.count}  >Budget {s.over_budget}"
+            for s in worst
+        ]
+        logger.info("[FRAME] Längste Tk-Jobs (Budget %.0f ms):\n%s", self.budget_ms, "\n".join(lines))
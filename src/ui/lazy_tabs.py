@@ -0,0 +1,166 @@
+"""Lazy Tabs: Registrierung als Factory, Aufbau bei erster Auswahl.
+
+Beim Start wird für jeden Tab nur der (leere) Reiter im CTkTabview angelegt.
+Modul-Import (spotipy, PyTado, icalendar, matplotlib, …) und Aufbau passieren
+erst, wenn der Tab ausgewählt wird – oder optional im Leerlauf nach dem
+Start (``warm_up``). Import- und Aufbauzeiten werden je Tab gemessen und
+über ``report()`` bzw. das Log ausgegeben.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TabSpec:
+    """Beschreibung eines lazy gebauten Tabs.
+
+    Attributes:
+        name: Reiter-Name im Tabview.
+        module: Modulpfad der Tab-Klasse (z.B. ``tabs.spotify``).
+        class_name: Name der Tab-Klasse im Modul.
+        build: ``build(cls, frame)`` erzeugt die Tab-Instanz im Reiter-Frame.
+        attr: Attributname am MainApp für die Instanz (z.B. ``spotify_tab``).
+        eager: Sofort beim Start bauen (z.B. wenn der Header den Tab braucht).
+    """
+
+    name: str
+    module: str
+    class_name: str
+    build: Callable[[type, Any], Any]
+    attr: str = ""
+    eager: bool = False
+
+
+@dataclass
+class TabTiming:
+    name: str
+    import_ms: float
+    build_ms: float
+    ok: bool
+    trigger: str
+
+
+class LazyTabRegistry:
+    """Verwaltet lazy Tabs eines CTkTabview."""
+
+    def __init__(
+        self,
+        tabview: Any,
+        prepare_frame: Optional[Callable[[Any], None]] = None,
+        on_built: Optional[Callable[[TabSpec, Any], None]] = None,
+    ):
+        self._tabview = tabview
+        self._prepare_frame = prepare_frame
+        self._on_built = on_built
+        self._specs: Dict[str, TabSpec] = {}
+        self._built: Dict[str, Any] = {}
+        self._timings: List[TabTiming] = []
+        self._warmup_queue: List[str] = []
+
+    def add(self, spec: TabSpec) -> None:
+        """Reiter anlegen (billig); der Inhalt folgt bei ``ensure``."""
+        self._tabview.add(spec.name)
+        self._specs[spec.name] = spec
+        if spec.eager:
+            self.ensure(spec.name, trigger="eager")
+
+    def is_built(self, name: str) -> bool:
+        return name in self._built
+
+    def get(self, name: str) -> Any:
+        return self._built.get(name)
+
+    def ensure(self, name: Optional[str], trigger: str = "select") -> Any:
+        """Tab ``name`` importieren und bauen, falls noch nicht geschehen."""
+        spec = self._specs.get(name or "")
+        if spec is None:
+            return None
+        if name in self._built:
+            return self._built[name]
+        # Vor dem Bauen markieren: verhindert Rekursion über Auswahl-Callbacks
+        self._built[name] = None
+        frame = self._tabview.tab(name)
+        if self._prepare_frame is not None:
+            try:
+                self._prepare_frame(frame)
+            except Exception:
+                pass
+        t0 = time.perf_counter()
+        try:
+            cls = getattr(importlib.import_module(spec.module), spec.class_name)
+        except Exception as exc:
+            import_ms = (time.perf_counter() - t0) * 1000.0
+            logger.warning("%s: Import von %s fehlgeschlagen: %s", name, spec.module, exc)
+            self._timings.append(TabTiming(name, import_ms, 0.0, False, trigger))
+            self._show_unavailable(frame, name, exc)
+            return None
+        t1 = time.perf_counter()
+        try:
+            tab = spec.build(cls, frame)
+        except Exception as exc:
+            logger.error("%s init failed: %s", spec.class_name, exc, exc_info=True)
+            tab = None
+        t2 = time.perf_counter()
+        timing = TabTiming(name, (t1 - t0) * 1000.0, (t2 - t1) * 1000.0, tab is not None, trigger)
+        self._timings.append(timing)
+        logger.info(
+            "[TABS] %s gebaut (%s): Import %.0f ms, Aufbau %.0f ms",
+            name, trigger, timing.import_ms, timing.build_ms,
+        )
+        self._built[name] = tab
+        if tab is not None and self._on_built is not None:
+            try:
+                self._on_built(spec, tab)
+            except Exception:
+                logger.exception("on_built für %s fehlgeschlagen", name)
+        return tab
+
+    def warm_up(self, root: Any, delay_ms: int, step_ms: int = 1500) -> None:
+        """Restliche Tabs im Leerlauf nacheinander bauen (ein Tab pro Schritt)."""
+        if delay_ms <= 0:
+            return
+        self._warmup_queue = [name for name in self._specs if name not in self._built]
+
+        def step() -> None:
+            while self._warmup_queue:
+                name = self._warmup_queue.pop(0)
+                if name in self._built:
+                    continue
+                self.ensure(name, trigger="warmup")
+                break
+            if self._warmup_queue:
+                root.after(step_ms, lambda: root.after_idle(step))
+            else:
+                self.log_report()
+
+        root.after(delay_ms, lambda: root.after_idle(step))
+
+    def report(self) -> List[TabTiming]:
+        """Gemessene Import-/Aufbauzeiten (in Bau-Reihenfolge)."""
+        return list(self._timings)
+
+    def log_report(self) -> None:
+        if not self._timings:
+            return
+        lines = [
+            f"  {t.name:<22} Import {t.import_ms:7.0f} ms  Aufbau {t.build_ms:7.0f} ms  ({t.trigger}{'' if t.ok else ', FEHLER'})"
+            for t in self._timings
+        ]
+        total = sum(t.import_ms + t.build_ms for t in self._timings)
+        logger.info("[TABS] Import-/Aufbauzeiten (gesamt %.0f ms):\n%s", total, "\n".join(lines))
+
+    @staticmethod
+    def _show_unavailable(frame: Any, name: str, exc: Exception) -> None:
+        try:
+            tk.Label(frame, text=f"{name} nicht verfügbar: {exc}").pack(padx=12, pady=12)
+        except Exception:
+            pass
@@ -34,6 +34,12 @@ KNOWN_KEYS = {
 
 OPTIONAL_KEYS = {TIMESTAMP, OUTDOOR_C}
 
+# Key-Gruppen für AppState.subscribe(keys=...): Views werden nur bei
+# Änderungen ihrer eigenen Eingänge benachrichtigt.
+PV_KEYS = frozenset({PV_POWER_KW, GRID_POWER_KW, BATTERY_POWER_KW, BATTERY_SOC_PCT, LOAD_POWER_KW})
+BUFFER_KEYS = frozenset({BUF_TOP_C, BUF_MID_C, BUF_BOTTOM_C, BMK_WARMWASSER_C, BMK_BETRIEBSMODUS})
+SPARKLINE_KEYS = frozenset({PV_POWER_KW, OUTDOOR_C})
+
 
 def validate_payload(payload: dict) -> list[str]:
     """Validate payload keys, returning warnings instead of raising errors."""
@@ -0,0 +1,122 @@
+"""Sichtbarkeits-Lebenszyklus für Tabs (on_show / on_hide / is_visible).
+
+Versteckte Tabs sollen keine periodische Arbeit (DB-Abfragen, Replots,
+Netzwerk-Polls) leisten. Tabs erben ``TabLifecycle`` und rufen in ihrem
+Timer-Callback ``defer_while_hidden()`` auf: Ist der Tab unsichtbar, wird
+die Arbeit übersprungen, der Timer nicht neu geplant und der Tab als
+veraltet markiert. Beim nächsten ``on_show`` holt ``on_catch_up`` einmalig
+nach (und startet damit den Timer wieder).
+
+Der ``TabLifecycleManager`` hängt sich an die Tab-Auswahl des CTkTabview
+und ruft ``on_hide``/``on_show`` der registrierten Tabs auf.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TabLifecycle:
+    """Mixin: Sichtbarkeitsstatus und Nachhol-Logik für einen Tab.
+
+    Ohne Manager gilt ein Tab als sichtbar (bisheriges Verhalten).
+    """
+
+    _tab_visible: bool = True
+    _tab_stale: bool = False
+
+    def is_visible(self) -> bool:
+        return self._tab_visible
+
+    def on_show(self) -> None:
+        self._tab_visible = True
+        if self._tab_stale:
+            self._tab_stale = False
+            try:
+                self.on_catch_up()
+            except Exception:
+                logger.exception("%s: Nachholen beim Anzeigen fehlgeschlagen", type(self).__name__)
+
+    def on_hide(self) -> None:
+        self._tab_visible = False
+
+    def defer_while_hidden(self) -> bool:
+        """True (und Tab als veraltet markiert), wenn periodische Arbeit ausfallen soll."""
+        if self._tab_visible:
+            return False
+        self._tab_stale = True
+        return True
+
+    def on_catch_up(self) -> None:
+        """Versäumte Aktualisierung nachholen (Standard: nichts)."""
+
+
+class TabLifecycleManager:
+    """Leitet Tab-Wechsel des CTkTabview als ``on_show``/``on_hide`` weiter."""
+
+    def __init__(self, tabview: Any, on_change: Optional[Callable[[str], None]] = None):
+        self._tabview = tabview
+        self._on_change = on_change
+        self._tabs: Dict[str, Any] = {}
+        self._current: Optional[str] = None
+        self._started = False
+
+    def register(self, name: str, tab: Any) -> None:
+        """Tab-Objekt unter seinem Tabview-Namen anmelden."""
+        if tab is None:
+            return
+        self._tabs[name] = tab
+        if self._started and name != self._current:
+            self._call(tab, "on_hide")
+
+    def start(self) -> None:
+        """An die Tab-Auswahl koppeln und alle nicht gewählten Tabs verstecken."""
+        self._started = True
+        try:
+            self._tabview.configure(command=self.sync)
+        except Exception:
+            logger.debug("Tabview ohne command-Option – nur sync() per Tick", exc_info=True)
+        self._current = self._selected()
+        for name, tab in self._tabs.items():
+            self._call(tab, "on_show" if name == self._current else "on_hide")
+
+    def sync(self) -> None:
+        """Aktuelle Auswahl prüfen und bei Wechsel on_hide/on_show auslösen."""
+        if not self._started:
+            return
+        selected = self._selected()
+        if selected is None or selected == self._current:
+            return
+        previous, self._current = self._current, selected
+        if previous in self._tabs:
+            self._call(self._tabs[previous], "on_hide")
+        if selected in self._tabs:
+            self._call(self._tabs[selected], "on_show")
+        if self._on_change is not None:
+            try:
+                self._on_change(selected)
+            except Exception:
+                logger.exception("Tab-Wechsel-Callback fehlgeschlagen")
+
+    @property
+    def current(self) -> Optional[str]:
+        return self._current
+
+    def _selected(self) -> Optional[str]:
+        try:
+            return self._tabview.get()
+        except Exception:
+            return None
+
+    @staticmethod
+    def _call(tab: Any, method: str) -> None:
+        func = getattr(tab, method, None)
+        if func is None:
+            return
+        try:
+            func()
+        except Exception:
+            logger.exception("%s.%s fehlgeschlagen", type(tab).__name__, method)
@@ -0,0 +1,207 @@
+"""Gemeinsame Fonts und gecachte Text-Raster für PIL-gezeichnete Views.
+
+``FontRegistry`` lädt jeden Font (Kandidatenliste + Größe) genau einmal;
+welcher Kandidat auf dem System existiert, kommt aus dem Startup-Probe-Cache
+(``find_font``).
+
+``TextCache`` hält fertig gerasterte Texte (inkl. Kontur und Drehung) als
+RGBA-Sprites in einem LRU. Ein Sprite wird beim ersten Gebrauch gezeichnet,
+danach nur noch per ``paste`` ins Zielbild kopiert – kein erneutes
+Font-Laden, Messen, Zeichnen oder bikubisches Drehen.
+
+Pillow wird erst beim Rendern importiert, damit die Cache-Logik ohne PIL
+testbar bleibt. Registry und Cache sind prozessweit geteilt
+(``get_font_registry`` / ``get_text_cache``).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from core.startup import find_font
+
+FONT_CANDIDATES: Dict[bool, Tuple[str, ...]] = {
+    False: ("arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf", "NotoSans-Regular.ttf"),
+    True: ("arialbd.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf", "NotoSans-Bold.ttf"),
+}
+
+# Kandidatenliste () = PIL-Standardfont
+DEFAULT_FONT: Tuple[str, ...] = ()
+
+
+def _truetype(name: str, size: int) -> Any:
+    from PIL import ImageFont
+
+    return ImageFont.truetype(name, size)
+
+
+def _load_default() -> Any:
+    from PIL import ImageFont
+
+    return ImageFont.load_default()
+
+
+class FontRegistry:
+    """Lädt Fonts einmal je (Kandidaten, Größe); fehlt jeder Kandidat, gibt es den PIL-Standardfont."""
+
+    def __init__(
+        self,
+        loader: Callable[[str, int], Any] = _truetype,
+        fallback: Callable[[], Any] = _load_default,
+        finder: Callable[..., Optional[str]] = find_font,
+    ):
+        self._loader = loader
+        self._fallback = fallback
+        self._finder = finder
+        self._lock = threading.Lock()
+        self._fonts: Dict[Tuple[Tuple[str, ...], int], Any] = {}
+        self.loads = 0
+
+    @staticmethod
+    def spec(size: int, bold: bool = False, candidates: Optional[Iterable[str]] = None) -> Tuple[Tuple[str, ...], int]:
+        """Hashbarer Schlüssel eines Fonts – auch Teil der Text-Cache-Schlüssel."""
+        names = FONT_CANDIDATES[bool(bold)] if candidates is None else tuple(candidates)
+        return names, int(size)
+
+    def get(self, size: int, bold: bool = False, candidates: Optional[Iterable[str]] = None) -> Any:
+        return self.font(self.spec(size, bold, candidates))
+
+    def font(self, spec: Tuple[Tuple[str, ...], int]) -> Any:
+        with self._lock:
+            font = self._fonts.get(spec)
+            if font is None:
+                font = self._fonts[spec] = self._load(*spec)
+            return font
+
+    def _load(self, names: Tuple[str, ...], size: int) -> Any:
+        self.loads += 1
+        if names:
+            name = self._finder(names, lambda n: self._loader(n, 12))
+            if name:
+                try:
+                    return self._loader(name, size)
+                except Exception:
+                    pass
+        return self._fallback()
+
+
+@dataclass(frozen=True)
+class TextSprite:
+    """Gerasterter Text; ``origin`` ist der Ankerpunkt von ``draw.text`` im Sprite."""
+
+    image: Any
+    origin: Tuple[int, int]
+    size: Tuple[int, int]  # Textbox (Breite, Höhe) wie ``textbbox`` sie misst
+
+    def paste_into(self, img: Any, x: float, y: float) -> None:
+        """Wie ``draw.text((x, y), ...)`` mit dem Anker, für den das Sprite gebaut wurde."""
+        ox, oy = self.origin
+        img.paste(self.image, (int(round(x - ox)), int(round(y - oy))), self.image)
+
+
+def render_text(
+    font: Any,
+    text: str,
+    color: str,
+    anchor: str = "la",
+    outline: Optional[str] = None,
+    outline_width: int = 1,
+) -> TextSprite:
+    """Text (optional mit Kontur) auf ein transparentes Sprite zeichnen."""
+    from PIL import Image, ImageDraw
+
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1), (0, 0, 0, 0)))
+    left, top, right, bottom = probe.textbbox((0, 0), text, font=font, anchor=anchor)
+    pad = (outline_width if outline else 0) + 1
+    origin = (pad - left, pad - top)
+    image = Image.new("RGBA", (right - left + 2 * pad, bottom - top + 2 * pad), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    if outline:
+        for dx in range(-outline_width, outline_width + 1):
+            for dy in range(-outline_width, outline_width + 1):
+                if dx or dy:
+                    draw.text((origin[0] + dx, origin[1] + dy), text, font=font, fill=outline, anchor=anchor)
+    draw.text(origin, text, font=font, fill=color, anchor=anchor)
+    return TextSprite(image, origin, (right - left, bottom - top))
+
+
+class TextCache:
+    """LRU gerasterter Texte.
+
+    ``text`` deckt den Normalfall ab (Schlüssel: Text, Font, Farbe, Anker,
+    Kontur); zusammengesetzte Beschriftungen nutzen ``get`` mit eigenem
+    Schlüssel und Builder.
+    """
+
+    def __init__(self, fonts: Optional[FontRegistry] = None, maxsize: int = 256):
+        self.fonts = fonts or get_font_registry()
+        self.maxsize = max(1, int(maxsize))
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return item
+            self.misses += 1
+        item = build()
+        with self._lock:
+            self._items[key] = item
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return item
+
+    def text(
+        self,
+        text: str,
+        color: str,
+        size: int = 12,
+        bold: bool = False,
+        candidates: Optional[Iterable[str]] = None,
+        anchor: str = "la",
+        outline: Optional[str] = None,
+        outline_width: int = 1,
+    ) -> TextSprite:
+        spec = self.fonts.spec(size, bold, candidates)
+        key = ("text", text, spec, color, anchor, outline, outline_width if outline else 0)
+        return self.get(
+            key, lambda: render_text(self.fonts.font(spec), text, color, anchor, outline, outline_width),
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_REGISTRY: Optional[FontRegistry] = None
+_CACHE: Optional[TextCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_font_registry() -> FontRegistry:
+    global _REGISTRY
+    with _SHARED_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = FontRegistry()
+        return _REGISTRY
+
+
+def get_text_cache() -> TextCache:
+    global _CACHE
+    registry = get_font_registry()
+    with _SHARED_LOCK:
+        if _CACHE is None:
+            _CACHE = TextCache(registry)
+        return _CACHE
@@ -9,7 +9,7 @@ import matplotlib.pyplot as plt
 import matplotlib.cm as cm
 import numpy as np
 import tkinter as tk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 from matplotlib.figure import Figure
 from matplotlib.patches import Ellipse, FancyBboxPatch, Rectangle
@@ -49,13 +49,16 @@ except ImportError:
     def get_shared_datastore():
         return None
 
+from core.downsample import LTTB, MINMAX, downsample_pairs
+from core.recent_series import get_recent_series, smooth
+from ui.chart_render import ChartImage, ChartRenderService, fit_figure, rasterize
+
 from core.schema import (
     BUF_TOP_C,
     BUF_MID_C,
     BUF_BOTTOM_C,
     BMK_WARMWASSER_C,
     BMK_BETRIEBSMODUS,
-    PV_POWER_KW,
 )
 
 DEBUG_LOG = os.environ.get("DASHBOARD_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
@@ -91,16 +94,16 @@ class BufferStorageView(tk.Frame):
         refresh_needed = (time.time() - getattr(self, "_spark_cache_ts", 0.0)) > 60.0
         if refresh_needed:
             try:
-                pv_series_db = self._load_pv_series(hours=24, bin_minutes=15)
+                pv_series_db = self._series.series("pv", hours=24, bin_minutes=15) if self._series else []
             except Exception as exc:
                 if DEBUG_LOG:
-                    print(f"[BUFFER] _load_pv_series error: {exc}")
+                    print(f"[BUFFER] pv series error: {exc}")
                 pv_series_db = []
             try:
-                temp_series_db = self._load_outdoor_temp_series(hours=24, bin_minutes=15)
+                temp_series_db = self._series.series("outdoor", hours=24, bin_minutes=15) if self._series else []
             except Exception as exc:
                 if DEBUG_LOG:
-                    print(f"[BUFFER] _load_outdoor_temp_series error: {exc}")
+                    print(f"[BUFFER] outdoor series error: {exc}")
                 temp_series_db = []
             self._spark_cache_pv = pv_series_db
             self._spark_cache_temp = temp_series_db
@@ -111,15 +114,15 @@ class BufferStorageView(tk.Frame):
 
         pv_series = list(pv_series_db)
         pv_hours = 24 if pv_series else 0
-        if not pv_series:
-            pv_series = self._history_to_series(self._spark_history_pv, hours=6, bin_minutes=5)
+        if not pv_series and self._series is not None:
+            pv_series = self._series.live("pv", hours=6, bin_minutes=5)
             if pv_series:
                 pv_hours = 6
 
         temp_series = list(temp_series_db)
         temp_hours = 24 if temp_series else 0
-        if not temp_series:
-            temp_series = self._history_to_series(self._spark_history_temp, hours=6, bin_minutes=5)
+        if not temp_series and self._series is not None:
+            temp_series = self._series.live("outdoor", hours=6, bin_minutes=5)
             if temp_series:
                 temp_hours = 6
 
@@ -158,6 +161,14 @@ class BufferStorageView(tk.Frame):
                 print(f"[BUFFER] Sparkline canvas draw error: {exc}")
             return
 
+        # Höchstens ~1 Punkt je Pixel: PV als Min/Max-Hülle (Peaks bleiben), Temperatur per LTTB
+        try:
+            max_points = max(50, int(self.spark_canvas.get_tk_widget().winfo_width() or 0))
+        except Exception:
+            max_points = 1000
+        pv_series = downsample_pairs(pv_series, max_points, MINMAX)
+        temp_series = downsample_pairs(temp_series, max_points, LTTB)
+
         if pv_series:
             xs_pv, ys_pv = zip(*pv_series)
             self.spark_ax.plot(xs_pv, ys_pv, color=COLOR_SUCCESS, linewidth=2.0, alpha=0.9)
@@ -220,32 +231,8 @@ class BufferStorageView(tk.Frame):
 
 
     def _record_spark_sample(self, data: dict) -> None:
-        now_ts = time.time()
-        if now_ts - getattr(self, "_last_spark_sample_ts", 0.0) < 60.0:
-            return
-        self._last_spark_sample_ts = now_ts
-        sample_time = datetime.now()
-        pv_kw = self._safe_float(data.get(PV_POWER_KW))
-        if pv_kw is not None:
-            self._spark_history_pv.append((sample_time, max(0.0, pv_kw)))
-        outdoor = self._safe_float(data.get('outdoor'))
-        if outdoor is not None:
-            self._spark_history_temp.append((sample_time, outdoor))
-
-    def _history_to_series(self, history: deque[tuple[datetime, float]], hours: int, bin_minutes: int) -> list[tuple[datetime, float]]:
-        if not history:
-            return []
-        cutoff = datetime.now() - timedelta(hours=hours)
-        samples: list[tuple[datetime, float]] = []
-        for ts, val in list(history):
-            if val is None or ts < cutoff:
-                continue
-            rounded = ts.replace(second=0, microsecond=0) - timedelta(minutes=ts.minute % bin_minutes)
-            samples.append((rounded, float(val)))
-        if not samples:
-            return []
-        return self._aggregate_series(samples)
-
+        if self._series is not None:
+            self._series.record(data)
 
     def _build_stratified_data(self, top, mid, bot):
         """
@@ -287,10 +274,18 @@ class BufferStorageView(tk.Frame):
             self.datastore = datastore
         else:
             self.datastore = get_shared_datastore()
+        # PV-/Außentemperatur-Reihen teilt sich die View mit der PV-Sparkline
+        self._series = get_recent_series(self.datastore) if self.datastore else None
         # Entfernt: configure(height) und pack_propagate(False) für flexibles Layout
 
         self.data = np.array([[60.0], [50.0], [40.0]])
         self._last_temps = None  # type: ignore
+        # Letzte Eingangswerte; AppState liefert nur geänderte Keys (deltas)
+        self._inputs: dict = {}
+        # Heatmap wird in der Render-Lane gezeichnet, der Tk-Thread zeigt nur das Bild
+        self._renderer = ChartRenderService.for_root(self.winfo_toplevel())
+        self._render_key = ("buffer_storage", id(self))
+        self._stopped = False
         self._last_spark_update = 0
 
         # Betriebsmodus timeline (in-memory only)
@@ -351,8 +346,14 @@ class BufferStorageView(tk.Frame):
         )
         self.mode_label.pack(side=tk.TOP, fill=tk.X, padx=6, pady=(2, 0))
 
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.canvas_widget = ChartImage(
+            self.plot_frame,
+            bg=COLOR_ROOT,
+            on_resize=lambda _w, _h: self._request_render(),
+            width=int(fig_width * 100),
+            height=int(fig_height * 100),
+        )
         # Flexible Skalierung ohne min_width Constraint für 50/50 Layout
         self.canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
@@ -547,10 +548,12 @@ class BufferStorageView(tk.Frame):
         return self._temp_color(temp)
 
     def update_data(self, data: dict):
-        """Update für BufferStorageView: erwartet dict mit final keys."""
+        """Update für BufferStorageView: geänderte final keys (Deltas) übernehmen."""
         import time
         # Always capture mode changes, even if we throttle heavy redraw.
         mode_changed = self._update_mode_state(data)
+        self._inputs.update(data)
+        data = self._inputs
 
         now_mono = time.monotonic()
         last = getattr(self, "_last_redraw_ts", 0.0)
@@ -621,13 +624,6 @@ class BufferStorageView(tk.Frame):
         except Exception:
             pass
 
-        # (Optional) keep text over boiler empty to avoid duplication.
-        try:
-            if hasattr(self, "boiler_mode_text"):
-                self.boiler_mode_text.set_text("")
-        except Exception:
-            pass
-
         dt = self._parse_payload_dt(payload)
 
         # Update segments (close previous on change)
@@ -745,6 +741,30 @@ class BufferStorageView(tk.Frame):
 
 
     def update_temperatures(self, top, mid, bot, boiler):
+        """Neue Werte merken und die Heatmap in der Render-Lane neu zeichnen."""
+        self._last_temps = (top, mid, bot, boiler)
+        self._request_render()
+
+    def _request_render(self) -> None:
+        if self._stopped or not hasattr(self, "canvas_widget"):
+            return
+        temps = self._last_temps
+        width, height = self.canvas_widget.size
+        self._renderer.request(
+            self._render_key,
+            lambda: self._render(temps, width, height),
+            self.canvas_widget.show,
+            name="buffer_storage",
+        )
+
+    def _render(self, temps, width: int, height: int):
+        """Läuft in der Render-Lane: Artists aktualisieren und rastern."""
+        fit_figure(self.fig, width, height)
+        if temps is not None:
+            self._apply_temperatures(*temps)
+        return rasterize(self.fig)
+
+    def _apply_temperatures(self, top, mid, bot, boiler):
         # Update heatmap with stratified 2D array
         self.data = self._build_stratified_data(top, mid, bot)
         
@@ -761,216 +781,32 @@ class BufferStorageView(tk.Frame):
             self.boiler_text.set_text(f"{boiler:.1f}°C")
         if hasattr(self, 'boiler_rect'):
             self.boiler_rect.set_facecolor(self._temp_color(boiler))
-        # Redraw canvas only if widget exists
-        if hasattr(self, 'canvas') and hasattr(self, 'canvas_widget') and self.canvas_widget.winfo_exists():
-            try:
-                self.canvas.draw_idle()
-            except Exception:
-                try:
-                    self.canvas.draw()
-                except Exception:
-                    pass
-
-    def _load_pv_series(self, hours: int = 24, bin_minutes: int = 15) -> list[tuple[datetime, float]]:
-        if not self.datastore:
-            if DEBUG_LOG:
-                print("[DEBUG] Kein Datastore für PV-Serie!")
-            return []
-        cutoff = datetime.now() - timedelta(hours=hours)
-        now = datetime.now()
-
-        # DB timestamps may come in different string formats; don't rely on SQL text filtering/order.
-        rows = self.datastore.get_recent_fronius(hours=None, limit=4000)
-        if DEBUG_LOG:
-            print(f"[DEBUG] get_recent_fronius liefert {len(rows)} Zeilen")
-            if rows:
-                print(f"[DEBUG] Beispiel-Eintrag Fronius: {rows[-1]}")
-                print(f"[DEBUG] Alle Keys im letzten Eintrag: {list(rows[-1].keys())}")
-
-        parsed_rows: list[tuple[datetime, dict]] = []
-        for entry in rows:
-            ts = self._parse_ts(entry.get('timestamp'))
-            if ts is None:
-                continue
-            # Cap future timestamps (clock drift)
-            if ts > now:
-                ts = now
-            parsed_rows.append((ts, entry))
-        parsed_rows.sort(key=lambda t: t[0])
-
-        samples: list[tuple[datetime, float]] = []
-        for ts, entry in parsed_rows[-2500:]:
-            pv_kw = self._safe_float(entry.get('pv'))
-            if pv_kw is None or ts < cutoff:
-                continue
-            # Some historical sources (older CSV/API logs) may have stored PV power in W
-            # while the dashboard expects kW everywhere. Heuristic: values above ~200 kW
-            # are extremely unlikely for this setup -> treat as W and convert.
-            if pv_kw > 200.0:
-                pv_kw = pv_kw / 1000.0
-            # PV should never be significantly negative; treat small noise as 0.
-            if pv_kw < -0.2:
-                continue
-            pv_kw = max(0.0, pv_kw)
-            ts_bin = ts - timedelta(minutes=ts.minute % bin_minutes,
-                                    seconds=ts.second,
-                                    microseconds=ts.microsecond)
-            samples.append((ts_bin, pv_kw))
-        if DEBUG_LOG:
-            print(f"[DEBUG] PV-Samples: {len(samples)}")
-        return self._aggregate_series(samples)
-
-    def _load_outdoor_temp_series(self, hours: int = 24, bin_minutes: int = 15) -> list[tuple[datetime, float]]:
-        if not self.datastore:
-            if DEBUG_LOG:
-                print("[DEBUG] Kein Datastore für Außentemperatur!")
-            return []
-        cutoff = datetime.now() - timedelta(hours=hours)
-        now = datetime.now()
-
-        rows = self.datastore.get_recent_heating(hours=None, limit=4000)
-        if DEBUG_LOG:
-            print(f"[DEBUG] get_recent_heating liefert {len(rows)} Zeilen (outdoor)")
-            if rows:
-                print(f"[DEBUG] Beispiel-Eintrag (outdoor): {rows[0]}")
-                print(f"[DEBUG] Keys im ersten Eintrag: {list(rows[0].keys())}")
-            else:
-                print("[DEBUG] Keine Daten von get_recent_heating (outdoor)")
-
-        parsed_rows: list[tuple[datetime, dict]] = []
-        for entry in rows:
-            ts = self._parse_ts(entry.get('timestamp'))
-            if ts is None:
-                continue
-            if ts > now:
-                ts = now
-            parsed_rows.append((ts, entry))
-        parsed_rows.sort(key=lambda t: t[0])
-
-        samples: list[tuple[datetime, float]] = []
-        for ts, entry in parsed_rows[-2500:]:
-            val = self._safe_float(entry.get('outdoor'))
-            if val is None or ts < cutoff:
-                continue
-            # Plausibility clamp (sensor glitches)
-            if not (-40.0 <= val <= 60.0):
-                continue
-            ts_bin = ts - timedelta(minutes=ts.minute % bin_minutes,
-                                    seconds=ts.second,
-                                    microseconds=ts.microsecond)
-            samples.append((ts_bin, val))
-        if DEBUG_LOG:
-            print(f"[DEBUG] Outdoor-Samples: {len(samples)}")
-        return self._aggregate_series(samples)
 
     def _load_puffer_series(self, hours: int = 24, bin_minutes: int = 15) -> list[tuple[datetime, float]]:
-        if not self.datastore:
-            if DEBUG_LOG:
-                print("[DEBUG] Kein Datastore für Puffer-Serie!")
+        if self._series is None:
             return []
-        cutoff = datetime.now() - timedelta(hours=hours)
-        now = datetime.now()
-
-        rows = self.datastore.get_recent_heating(hours=None, limit=4000)
-        if DEBUG_LOG:
-            print(f"[DEBUG] get_recent_heating liefert {len(rows)} Zeilen (puffer)")
-            if rows:
-                print(f"[DEBUG] Beispiel-Eintrag (puffer): {rows[0]}")
-                print(f"[DEBUG] Keys im ersten Eintrag: {list(rows[0].keys())}")
-            else:
-                print("[DEBUG] Keine Daten von get_recent_heating (puffer)")
-
-        parsed_rows: list[tuple[datetime, dict]] = []
-        for entry in rows:
-            ts = self._parse_ts(entry.get('timestamp'))
-            if ts is None:
-                continue
-            if ts > now:
-                ts = now
-            parsed_rows.append((ts, entry))
-        parsed_rows.sort(key=lambda t: t[0])
-
-        samples: list[tuple[datetime, float]] = []
-        for ts, entry in parsed_rows[-2500:]:
-            mid = self._safe_float(entry.get('mid'))
-            if mid is None or ts < cutoff:
-                continue
-            if not (-40.0 <= mid <= 120.0):
-                continue
-            ts_bin = ts - timedelta(minutes=ts.minute % bin_minutes,
-                                    seconds=ts.second,
-                                    microseconds=ts.microsecond)
-            samples.append((ts_bin, mid))
-        if DEBUG_LOG:
-            print(f"[DEBUG] Puffer-Samples: {len(samples)}")
-        aggregated = self._aggregate_series(samples)
+        aggregated = self._series.series("mid", hours=hours, bin_minutes=bin_minutes)
         if len(aggregated) < 3:
             return aggregated
-        smoothed: list[tuple[datetime, float]] = []
-        for idx, current in enumerate(aggregated):
-            window_vals = aggregated[max(0, idx - 1): min(len(aggregated), idx + 2)]
-            smoothed.append((current[0], sum(val for _, val in window_vals) / len(window_vals)))
-        return smoothed
-
-    def _aggregate_series(self, samples: list[tuple[datetime, float]]) -> list[tuple[datetime, float]]:
-        if not samples:
-            return []
-        agg: dict[datetime, tuple[float, int]] = {}
-        for ts, val in samples:
-            total, count = agg.get(ts, (0.0, 0))
-            agg[ts] = (total + val, count + 1)
-        averaged = [(ts, total / count) for ts, (total, count) in sorted(agg.items())]
-        return self._smooth_series(averaged, window=5)
-
-    def _smooth_series(self, series: list[tuple[datetime, float]], window: int = 5) -> list[tuple[datetime, float]]:
-        if len(series) < window:
-            return series
-        smoothed: list[tuple[datetime, float]] = []
-        half_window = window // 2
-        for idx in range(len(series)):
-            start = max(0, idx - half_window)
-            end = min(len(series), idx + half_window + 1)
-            values = [val for _, val in series[start:end]]
-            smoothed.append((series[idx][0], sum(values) / len(values)))
-        return smoothed
+        values = smooth([val for _, val in aggregated], window=3)
+        return [(ts, float(val)) for (ts, _), val in zip(aggregated, values)]
 
-    @staticmethod
-    def _parse_ts(value):
-        # Parse timestamps coming from different sources.
-        # Some are naive ("YYYY-MM-DD HH:MM:SS"), some are offset-aware ("...+01:00").
-        # For UI charting we normalize to *naive local time* to avoid TypeError
-        # when comparing offset-aware vs. naive datetimes.
-        from datetime import datetime
-        if not value:
-            return None
+    def stop(self):
+        """Cleanup resources to prevent memory leaks and segfaults."""
+        self._stopped = True
+        # Figure gehört der Render-Lane: Abbau erst nach einem laufenden Rendering
+        self._renderer.dispose(self._render_key, self._close_figure, name="buffer_storage")
         try:
-            s = str(value).strip()
-            if s.endswith("Z"):
-                s = s[:-1] + "+00:00"
-            dt = datetime.fromisoformat(s)
-            if getattr(dt, "tzinfo", None) is not None:
-                dt = dt.astimezone().replace(tzinfo=None)
-            return dt
+            if hasattr(self, 'canvas_widget') and self.canvas_widget:
+                self.canvas_widget.destroy()
         except Exception:
-            return None
-
-    @staticmethod
-    def _safe_float(value):
-        if value in (None, ""):
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+            pass
 
-    def stop(self):
-        """Cleanup resources to prevent memory leaks and segfaults."""
+    def _close_figure(self) -> None:
         try:
             import matplotlib.pyplot as plt
             if hasattr(self, 'fig') and self.fig:
                 plt.close(self.fig)
                 self.fig = None
-            if hasattr(self, 'canvas_widget') and self.canvas_widget:
-                self.canvas_widget.destroy()
         except Exception:
             pass
@@ -9,6 +9,8 @@ import matplotlib.dates as mdates
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
+from core.downsample import select_union
+from core.time_utils import to_utc_datetime
 from ui.styles import (
     COLOR_BORDER,
     COLOR_DANGER,
@@ -22,6 +24,9 @@ from ui.styles import (
 )
 
 
+_DEFAULT_MAX_POINTS = 1000
+
+
 @dataclass
 class EnergyChartDataPoint:
     timestamp: datetime
@@ -33,11 +38,12 @@ def _normalize_data(data: Iterable[dict]) -> list[EnergyChartDataPoint]:
     out: list[EnergyChartDataPoint] = []
     for item in data:
         try:
+            # Datensatz-Zeitstempel sind UTC; gezeichnet wird in Ortszeit
             ts = item.get("timestamp")
-            if isinstance(ts, str):
-                ts = datetime.fromisoformat(ts)
-            if not isinstance(ts, datetime):
+            ts = to_utc_datetime(ts) if isinstance(ts, (str, datetime)) else None
+            if ts is None:
                 continue
+            ts = ts.astimezone().replace(tzinfo=None)
             pv = float(item.get("pv_power"))
             cons = float(item.get("house_consumption"))
             out.append(EnergyChartDataPoint(timestamp=ts, pv_power=pv, house_consumption=cons))
@@ -206,6 +212,7 @@ class EnergyChart:
 
     def render(self, data: Iterable[dict]) -> None:
         # Ensure the render buffer matches the current widget size.
+        w = 0
         try:
             w = int(self.canvas_widget.winfo_width() or 0)
             h = int(self.canvas_widget.winfo_height() or 0)
@@ -239,11 +246,19 @@ class EnergyChart:
             return
 
         xs = [p.timestamp for p in points]
+        x_num = mdates.date2num(xs)
         pv = np.array([p.pv_power for p in points], dtype=float)
         cons = np.array([p.house_consumption for p in points], dtype=float)
 
+        # Höchstens ~1 Punkt je Pixel; gemeinsame LTTB-Auswahl, damit die Flächen passen
+        max_points = w if w >= 50 else _DEFAULT_MAX_POINTS
+        if len(points) > max_points:
+            idx = select_union(x_num, (pv, cons), max_points)
+            xs = [xs[i] for i in idx.tolist()]
+            x_num, pv, cons = x_num[idx], pv[idx], cons[idx]
+
         self._timestamps = xs
-        self._x_num = mdates.date2num(xs)
+        self._x_num = x_num
         self._pv = pv
         self._cons = cons
 
@@ -282,7 +297,7 @@ def build_energy_chart(parent, data: Iterable[dict]):
     """Builds a modern PV vs consumption chart.
 
     data items must provide:
-      - timestamp: datetime or ISO string
+      - timestamp: datetime or ISO string (naiv = UTC)
       - pv_power: float
       - house_consumption: float
     """
@@ -5,6 +5,11 @@ import math
 import time
 import os
 from PIL import Image, ImageDraw, ImageFont, ImageTk
+from core.startup import find_font
+from ui.frame_budget import PRIORITY_HIGH, FrameScheduler
+from ui.text_cache import get_font_registry, get_text_cache
+from collections import OrderedDict
+from ui.views.flow_overlay import Flow, FlowOverlay, edge_points, frame_index, hex_to_rgb, quantize_watts, tint
 from ui.styles import (
     COLOR_CARD,
     COLOR_BORDER,
@@ -20,6 +25,10 @@ from ui.styles import (
 
 DEBUG_LOG = False  # Enable for verbose energy-flow debugging
 
+def _load_probe_font(name: str):
+    return ImageFont.truetype(name, 12)
+
+
 # Feste Größe ohne UI-Scaling: alles bleibt konstant
 _EF_SCALE = 1.0
 
@@ -33,6 +42,15 @@ MISSING_LOG_COOLDOWN = 60.0  # seconds
 from core.schema import PV_POWER_KW, GRID_POWER_KW, BATTERY_POWER_KW, BATTERY_SOC_PCT, LOAD_POWER_KW
 
 class EnergyFlowView(tk.Frame):
+    """Energiefluss-Diagramm in drei Ebenen.
+
+    * ``_base_img``: statischer Hintergrund (Verlauf, Knoten, Icons) – nur bei Größenänderung neu.
+    * Wert-Bild (``render_frame``): Beschriftungen, SoC-Ring, Batterie, Hausverbrauch –
+      nur wenn ``update_flows`` neue Werte bringt.
+    * Pfeile, Puls und Flusspunkte als native Canvas-Items (``FlowOverlay``) –
+      ein Animations-Tick verschiebt nur deren Koordinaten.
+    """
+
     def _request_redraw(self):
         """Request canvas redraw without blocking. Avoids update_idletasks() which can freeze UI."""
         # Tkinter Canvas doesn't need explicit redraw calls after itemconfig
@@ -40,7 +58,9 @@ class EnergyFlowView(tk.Frame):
         pass
 
     def update_data(self, data: dict):
-        """Update für Energiefluss-View: erwartet dict mit final keys."""
+        """Update für Energiefluss-View: geänderte final keys (Deltas) übernehmen."""
+        self._inputs.update(data)
+        data = self._inputs
         pv_kw = float(data.get(PV_POWER_KW) or 0.0)
         grid_kw = float(data.get(GRID_POWER_KW) or 0.0)
         raw_batt_kw = float(data.get(BATTERY_POWER_KW) or 0.0)
@@ -94,23 +114,24 @@ class EnergyFlowView(tk.Frame):
             self.width, self.height = cw, ch
             self.nodes = self._define_nodes()
             self._base_img = self._render_background()
-        try:
-            frame = self.render_frame(pv_kw, load_kw, grid_kw, batt_kw, soc)
-        except Exception as e:
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        """Wert-Ebene als Frame-Job neu rendern (nur bei neuen Werten, nicht pro Animations-Tick)."""
+        FrameScheduler.for_root(self.winfo_toplevel()).submit(
+            "energy_flow.render", self._render_latest, priority=PRIORITY_HIGH, key=("energy_flow", id(self)),
+        )
+
+    def _render_latest(self) -> None:
+        if not self._last_flows or not self.winfo_exists():
             return
         try:
-            # Fix memory leak: delete old PhotoImage before creating new
-            old_img = getattr(self, '_tk_img', None)
-            self._tk_img = ImageTk.PhotoImage(frame)
-            if old_img is not None:
-                try:
-                    del old_img
-                except Exception:
-                    pass
+            self._tk_img = self._value_image(*self._last_flows)
         except Exception as e:
             return
         try:
             self.canvas.itemconfig(self._canvas_img, image=self._tk_img)
+            self._overlay.set_flows(self._overlay_flows(*self._last_flows[:4]), self._anim_frame)
         except Exception as e:
             return
         self._request_redraw()
@@ -119,12 +140,17 @@ class EnergyFlowView(tk.Frame):
         super().__init__(parent, bg=COLOR_ROOT)
         self._last_missing_log = {"pv": 0.0, "batt": 0.0}
         self._start_time = time.time()
+        # Letzte Eingangswerte; AppState liefert nur geänderte Keys (deltas)
+        self._inputs: dict = {}
         # UI-only animation to make flow direction clearer (no data changes).
         self._anim_enabled = True
         # Increased from 350ms to 500ms to reduce CPU load
         self._anim_interval_ms = 500
         self._anim_job = None
-        self._anim_phase = 0.0
+        self._anim_frame = 0
+        # Fertige Wert-Bilder je angezeigtem Zustand (LRU, nur Tk-Thread)
+        self._value_images: OrderedDict = OrderedDict()
+        self._value_cache_size = 6
         self.canvas = tk.Canvas(self, width=width, height=height, highlightthickness=0, bg=COLOR_ROOT)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self._resize_pending = False  # Debounce Configure events
@@ -135,14 +161,15 @@ class EnergyFlowView(tk.Frame):
         self.node_radius = _s(46)
         self.ring_gap = _s(14)
         self._tk_img = None
-        self._font_big = ImageFont.truetype("arial.ttf", _s(54)) if self._has_font("arial.ttf") else None
-        self._font_small = ImageFont.truetype("arial.ttf", _s(32)) if self._has_font("arial.ttf") else None
-        self._font_tiny = ImageFont.truetype("arial.ttf", _s(22)) if self._has_font("arial.ttf") else None
+        # Fonts und gerasterte Texte teilen sich alle PIL-Views
+        self._fonts = get_font_registry()
+        self._texts = get_text_cache()
         self._flow_value_size = _s(24)
         self._flow_unit_size = _s(10)
         self._node_value_size = _s(24)
         self._node_unit_size = _s(10)
         # Emoji font support with multiple fallbacks
+        self._font_emoji_candidates = None
         self._font_emoji = self._find_emoji_font(_s(42))
         # Load PNG icons - will be pasted onto PIL image
         self._icons_pil = {}  # PIL Images for embedding
@@ -151,6 +178,8 @@ class EnergyFlowView(tk.Frame):
         self.nodes = self._define_nodes()
         self._base_img = self._render_background()
         self._canvas_img = self.canvas.create_image(0, 0, anchor="nw")
+        # Animierte Ebene über dem Wert-Bild (später angelegt = darüber)
+        self._overlay = FlowOverlay(self.canvas, backdrop=COLOR_ROOT)
         # Performance optimization: track last values to skip rendering when unchanged
         self._last_flows = None
         self._start_animation()
@@ -168,9 +197,8 @@ class EnergyFlowView(tk.Frame):
         if not self.winfo_exists():
             self._anim_job = None
             return
-        now = time.time()
-        # Slow, subtle pulse: ~0.7 Hz
-        self._anim_phase = 0.5 + 0.5 * math.sin(now * 2 * math.pi * 0.7)
+        # Slow, subtle pulse: ~0.7 Hz – Index in den vorberechneten Zyklus
+        self._anim_frame = frame_index(time.time())
         if self._last_flows:
             pv, load, grid, batt, soc = self._last_flows
             # Skip animation if power flow is minimal (idle state)
@@ -179,17 +207,8 @@ class EnergyFlowView(tk.Frame):
                 # Use longer interval during idle (1000ms instead of 500ms)
                 self._anim_job = self.after(1000, self._anim_tick)
                 return
-            frame = self.render_frame(pv, load, grid, batt, soc)
-            # Fix memory leak: delete old PhotoImage before creating new
-            old_img = getattr(self, '_tk_img', None)
-            self._tk_img = ImageTk.PhotoImage(frame)
-            if old_img is not None:
-                try:
-                    del old_img
-                except Exception:
-                    pass
-            self.canvas.itemconfig(self._canvas_img, image=self._tk_img)
-            self._request_redraw()
+            # Nur vorberechnete Coords setzen – das Wert-Bild bleibt unverändert
+            self._overlay.animate(self._anim_frame)
         self._anim_job = self.after(self._anim_interval_ms, self._anim_tick)
 
     def _on_canvas_resize(self, event):
@@ -209,15 +228,21 @@ class EnergyFlowView(tk.Frame):
         self.nodes = self._define_nodes()
         self._base_img = self._render_background()
         self.canvas.config(width=new_w, height=new_h)
+        # Alte Bilder und Zyklen passen nicht mehr zur Geometrie
+        self._value_images.clear()
+        self._overlay.cycles.clear()
 
         if self._last_flows:
             pv, load, grid, batt, soc = self._last_flows
-            frame = self.render_frame(pv, load, grid, batt, soc)
+            self._tk_img = self._value_image(pv, load, grid, batt, soc)
         else:
-            frame = self._base_img
+            self._tk_img = ImageTk.PhotoImage(self._base_img)
 
-        self._tk_img = ImageTk.PhotoImage(frame)
         self.canvas.itemconfig(self._canvas_img, image=self._tk_img)
+        if self._last_flows:
+            self._overlay.set_flows(self._overlay_flows(pv, load, grid, batt), self._anim_frame)
+        else:
+            self._overlay.clear()
         self._resize_pending = False
 
     def resize(self, width: int, height: int):
@@ -245,13 +270,6 @@ class EnergyFlowView(tk.Frame):
             if DEBUG_LOG:
                 print(f"[ENERGY] Small change, skipping background recreate")
 
-    def _has_font(self, name: str) -> bool:
-        try:
-            ImageFont.truetype(name, 12)
-            return True
-        except Exception:
-            return False
-
     def _load_icons(self):
         """Load and cache PNG icons from icons directory."""
         elapsed = time.time() - self._start_time
@@ -303,11 +321,10 @@ class EnergyFlowView(tk.Frame):
             "DejaVuSans.ttf",  # Generic fallback
         ]
         
-        for font_path in emoji_fonts:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except Exception:
-                pass
+        font_path = find_font(emoji_fonts, _load_probe_font)
+        if font_path:
+            self._font_emoji_candidates = (font_path,)
+            return self._fonts.get(size, candidates=self._font_emoji_candidates)
         
         # If no emoji font found, return None and use default
         return None
@@ -452,123 +469,40 @@ class EnergyFlowView(tk.Frame):
         self._draw_radial(draw, x, y, r, fill)
         draw.ellipse([x - r, y - r, x + r, y + r], fill=fill, outline=None, width=0)
 
-    def _text_center(self, draw: ImageDraw.ImageDraw, text: str, x: int, y: int, size: int, color: str = COLOR_TEXT, fontweight: str = "normal", outline: bool = False):
-        # Use emoji font for emoji characters, otherwise use bold font
+    def _text_center(self, img: Image.Image, text: str, x: int, y: int, size: int, color: str = COLOR_TEXT, fontweight: str = "normal", outline: bool = False):
+        # Use emoji font for emoji characters, otherwise the shared text font
         is_emoji = any(ord(c) > 0x1F000 for c in text)
-        
+        candidates = None
         if is_emoji and self._font_emoji:
-            font = self._font_emoji
-        else:
-            try:
-                font = ImageFont.truetype("arial.ttf", size, weight="bold" if fontweight == "bold" else "normal")
-            except Exception:
-                font = self._font_big if size > 20 and self._font_big else ImageFont.load_default()
-                if size <= 20:
-                    font = self._font_small if self._font_small else ImageFont.load_default()
-        bbox = draw.textbbox((0, 0), text, font=font)
-        tw = bbox[2] - bbox[0]
-        th = bbox[3] - bbox[1]
-        text_x = x - tw / 2
-        text_y = y - th / 2
-        
-        # Draw black outline for better readability
-        if outline:
-            outline_color = "#000000"
-            # Draw outline in 8 directions + thicker center
-            for dx in [-2, -1, 0, 1, 2]:
-                for dy in [-2, -1, 0, 1, 2]:
-                    if dx != 0 or dy != 0:  # Skip center
-                        draw.text((text_x + dx, text_y + dy), text, font=font, fill=outline_color)
-        
-        # Draw main text on top
-        draw.text((text_x, text_y), text, font=font, fill=color)
+            candidates, size = self._font_emoji_candidates, _s(42)
+        # Black outline (2 px) for better readability
+        sprite = self._texts.text(
+            text, color, size=size, bold=fontweight == "bold", candidates=candidates,
+            outline="#000000" if outline else None, outline_width=2,
+        )
+        tw, th = sprite.size
+        sprite.paste_into(img, x - tw / 2, y - th / 2)
 
     def _get_font(self, size: int, bold: bool = False):
-        candidates = [
-            "arialbd.ttf" if bold else "arial.ttf",
-            "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf",
-            "LiberationSans-Bold.ttf" if bold else "LiberationSans-Regular.ttf",
-            "NotoSans-Bold.ttf" if bold else "NotoSans-Regular.ttf",
-        ]
-        for name in candidates:
-            try:
-                return ImageFont.truetype(name, size)
-            except Exception:
-                continue
-        return ImageFont.load_default()
+        return self._fonts.get(size, bold=bold)
 
-    def _draw_value_unit(self, draw: ImageDraw.ImageDraw, value: str, unit: str, x: int, y: int, value_size: int, unit_size: int, value_color: str, unit_color: str):
+    def _draw_value_unit(self, img: Image.Image, value: str, unit: str, x: int, y: int, value_size: int, unit_size: int, value_color: str, unit_color: str):
         """Draw a dominant value with a smaller unit underneath for clear hierarchy."""
-        value_font = self._get_font(value_size, bold=True)
-        unit_font = self._get_font(unit_size, bold=False)
-
-        vbox = draw.textbbox((0, 0), value, font=value_font)
-        ubox = draw.textbbox((0, 0), unit, font=unit_font)
-        vw, vh = vbox[2] - vbox[0], vbox[3] - vbox[1]
-        uw, uh = ubox[2] - ubox[0], ubox[3] - ubox[1]
+        value_sprite = self._texts.text(value, value_color, size=value_size, bold=True)
+        unit_sprite = self._texts.text(unit, unit_color, size=unit_size)
+        vw, vh = value_sprite.size
+        uw, uh = unit_sprite.size
 
         value_x = x - vw / 2
         value_y = y - (vh + uh + 4) / 2
         unit_x = x - uw / 2
         unit_y = value_y + vh + 4
 
-        draw.text((value_x, value_y), value, font=value_font, fill=value_color)
-        draw.text((unit_x, unit_y), unit, font=unit_font, fill=unit_color)
+        value_sprite.paste_into(img, value_x, value_y)
+        unit_sprite.paste_into(img, unit_x, unit_y)
 
     def _edge_points(self, src, dst, offset: float):
-        x0, y0 = src
-        x1, y1 = dst
-        vx, vy = x1 - x0, y1 - y0
-        length = max((vx ** 2 + vy ** 2) ** 0.5, 1e-3)
-        ux, uy = vx / length, vy / length
-        return (
-            (x0 + ux * offset, y0 + uy * offset),
-            (x1 - ux * offset, y1 - uy * offset),
-        )
-
-    def _draw_arrow(self, draw: ImageDraw.ImageDraw, src, dst, color: str, width: float, pulse: float = 0.0, gap: float = 0.0):
-        start, end = self._edge_points(src, dst, self.node_radius + gap)
-        x0, y0 = start
-        x1, y1 = end
-        base_w = int(width)
-        pulse_w = int(max(1, base_w + 1 + 2 * pulse))
-        glow_alpha = int(18 + 50 * pulse)
-        glow_color = self._with_alpha(self._tint(color, 0.35), glow_alpha)
-        line_color = self._with_alpha(color, 170)
-        draw.line((x0, y0, x1, y1), fill=glow_color, width=pulse_w + 1)
-        draw.line((x0, y0, x1, y1), fill=line_color, width=base_w)
-        # Start cap to make source/direction clearer (visual-only)
-        draw.ellipse([x0 - 3, y0 - 3, x0 + 3, y0 + 3], fill=line_color, outline=None)
-        # Arrow head
-        vx, vy = x1 - x0, y1 - y0
-        length = max((vx ** 2 + vy ** 2) ** 0.5, 1e-3)
-        ux, uy = vx / length, vy / length
-        size = 14 + width
-        left = (x1 - ux * size + uy * size * 0.6, y1 - uy * size - ux * size * 0.6)
-        right = (x1 - ux * size - uy * size * 0.6, y1 - uy * size + ux * size * 0.6)
-        draw.polygon([left, right, (x1, y1)], fill=line_color)
-
-    def _draw_flow_dots(self, draw: ImageDraw.ImageDraw, src, dst, color: str, strength: float, gap: float = 0.0):
-        start, end = self._edge_points(src, dst, self.node_radius + gap)
-        x0, y0 = start
-        x1, y1 = end
-        vx, vy = x1 - x0, y1 - y0
-        length = max((vx ** 2 + vy ** 2) ** 0.5, 1e-3)
-        ux, uy = vx / length, vy / length
-
-        dot_count = 5
-        speed = 0.25 + 0.75 * strength
-        radius = 1.2 + 3.2 * strength
-        base_alpha = int(120 + 80 * strength)
-        dot_color = self._with_alpha(color, base_alpha)
-
-        phase = (self._anim_phase * speed) % 1.0
-        for idx in range(dot_count):
-            t = (phase + idx / dot_count) % 1.0
-            px = x0 + ux * length * t
-            py = y0 + uy * length * t
-            r = radius * (0.75 + 0.25 * (idx + 1) / dot_count)
-            draw.ellipse([px - r, py - r, px + r, py + r], fill=dot_color, outline=None)
+        return edge_points(src, dst, offset)
 
     def _draw_flow_label(
         self,
@@ -613,6 +547,14 @@ class EnergyFlowView(tk.Frame):
         if abs(angle) > 90:
             angle += 180
         value_text, unit_text = self._format_power_parts(abs(watts))
+        # Gedrehtes Label einmal rastern, danach nur noch einfügen
+        key = ("flow_label", value_text, unit_text, self._flow_value_size, self._flow_unit_size, color, round(angle, 1))
+        rotated = self._texts.get(key, lambda: self._render_flow_label(value_text, unit_text, color, angle))
+
+        rx, ry = rotated.size
+        base_img.paste(rotated, (int(px - rx / 2), int(py - ry / 2)), rotated)
+
+    def _render_flow_label(self, value_text: str, unit_text: str, color: str, angle: float) -> Image.Image:
         font_val = self._get_font(self._flow_value_size, bold=True)
         font_unit = self._get_font(self._flow_unit_size, bold=False)
 
@@ -643,10 +585,7 @@ class EnergyFlowView(tk.Frame):
                 tdraw.text((text_x + vw + 4 + dx, unit_y + dy), unit_text, font=font_unit, fill=outline_color)
         tdraw.text((text_x, value_y), value_text, font=font_val, fill=color)
         tdraw.text((text_x + vw + 4, unit_y), unit_text, font=font_unit, fill=unit_color)
-        rotated = txt_img.rotate(angle, resample=Image.BICUBIC, expand=True)
-
-        rx, ry = rotated.size
-        base_img.paste(rotated, (int(px - rx / 2), int(py - ry / 2)), rotated)
+        return txt_img.rotate(angle, resample=Image.BICUBIC, expand=True)
 
     def _format_power(self, watts: float) -> str:
         if abs(watts) < 1000:
@@ -659,15 +598,10 @@ class EnergyFlowView(tk.Frame):
         return f"{watts/1000:.2f}", "kW"
 
     def _hex_to_rgb(self, color: str) -> tuple[int, int, int]:
-        c = color.lstrip("#")
-        return tuple(int(c[i:i+2], 16) for i in (0, 2, 4))
+        return hex_to_rgb(color)
 
     def _tint(self, color: str, amount: float) -> str:
-        r, g, b = self._hex_to_rgb(color)
-        r = int(r + (255 - r) * amount)
-        g = int(g + (255 - g) * amount)
-        b = int(b + (255 - b) * amount)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return tint(color, amount)
 
     def _with_alpha(self, color: str, alpha: int) -> tuple[int, int, int, int]:
         r, g, b = self._hex_to_rgb(color)
@@ -736,58 +670,77 @@ class EnergyFlowView(tk.Frame):
             color = COLOR_SUCCESS
         draw.arc(bbox, start=-90, end=-90 + extent, fill=color, width=5)
 
-    def render_frame(self, pv_w: float, load_w: float, grid_w: float, batt_w: float, soc: float) -> Image.Image:
-        img = self._base_img.copy()
-        draw = ImageDraw.Draw(img)
-
+    def _active_flows(self, pv_w: float, grid_w: float, batt_w: float) -> list[tuple]:
+        """Aktive Verbindungen als (src, dst, color, watts, gap, label_kwargs); Richtung nach Vorzeichen."""
         pv = self.nodes["pv"]
         grid = self.nodes["grid"]
         home = self.nodes["home"]
         bat = self.nodes["battery"]
-
-        def clamp(val, lo, hi):
-            return max(lo, min(hi, val))
-
-        def flow_strength(watts: float) -> float:
-            return clamp(abs(watts) / 3000, 0.0, 1.0)
-
-        def thickness(watts):
-            return clamp(2 + abs(watts) / 1500, 2, 8)
-
         min_flow_w = 50
+        flows = []
 
         # PV -> Haus
         if pv_w > min_flow_w:
-            pulse = self._anim_phase * flow_strength(pv_w)
-            self._draw_arrow(draw, pv, home, COLOR_SUCCESS, thickness(pv_w), pulse=pulse)
-            self._draw_flow_dots(draw, pv, home, COLOR_SUCCESS, flow_strength(pv_w))
-            self._draw_flow_label(img, pv, home, pv_w, offset=28, outside_pad=26, along=0, color=COLOR_SUCCESS, outside="above")
+            flows.append((pv, home, COLOR_SUCCESS, pv_w, 0, dict(offset=28, outside_pad=26, outside="above")))
 
         # Grid Import/Export
         if grid_w > min_flow_w:
-            pulse = self._anim_phase * flow_strength(grid_w)
-            self._draw_arrow(draw, grid, home, COLOR_INFO, thickness(grid_w), pulse=pulse)
-            self._draw_flow_dots(draw, grid, home, COLOR_INFO, flow_strength(grid_w))
-            self._draw_flow_label(img, grid, home, grid_w, offset=28, along=0, color=COLOR_INFO)
+            flows.append((grid, home, COLOR_INFO, grid_w, 0, dict(offset=28)))
         elif grid_w < -min_flow_w:
-            pulse = self._anim_phase * flow_strength(grid_w)
-            self._draw_arrow(draw, home, grid, COLOR_INFO, thickness(grid_w), pulse=pulse)
-            self._draw_flow_dots(draw, home, grid, COLOR_INFO, flow_strength(grid_w))
-            self._draw_flow_label(img, home, grid, grid_w, offset=28, along=0, color=COLOR_INFO)
+            flows.append((home, grid, COLOR_INFO, grid_w, 0, dict(offset=28)))
 
         # Batterie Laden/Entladen (Richtung dynamisch nach Vorzeichen)
         if batt_w > min_flow_w:
             # Entladen: Batterie -> Haus
-            pulse = self._anim_phase * flow_strength(batt_w)
-            self._draw_arrow(draw, bat, home, COLOR_SUCCESS, thickness(batt_w), pulse=pulse, gap=8)
-            self._draw_flow_dots(draw, bat, home, COLOR_SUCCESS, flow_strength(batt_w), gap=8)
-            self._draw_flow_label(img, bat, home, batt_w, offset=15, outside_pad=32, along=0, color=COLOR_SUCCESS, outside="below")
+            flows.append((bat, home, COLOR_SUCCESS, batt_w, 8, dict(offset=15, outside_pad=32, outside="below")))
         elif batt_w < -min_flow_w:
             # Laden: Haus -> Batterie
-            pulse = self._anim_phase * flow_strength(batt_w)
-            self._draw_arrow(draw, home, bat, COLOR_WARNING, thickness(batt_w), pulse=pulse, gap=8)
-            self._draw_flow_dots(draw, home, bat, COLOR_WARNING, flow_strength(batt_w), gap=8)
-            self._draw_flow_label(img, home, bat, batt_w, offset=15, outside_pad=32, along=0, color=COLOR_WARNING, outside="below")
+            flows.append((home, bat, COLOR_WARNING, batt_w, 8, dict(offset=15, outside_pad=32, outside="below")))
+        return flows
+
+    def _overlay_flows(self, pv_w: float, load_w: float, grid_w: float, batt_w: float) -> list[Flow]:
+        """Pfeil-Geometrie für die Canvas-Ebene."""
+        out = []
+        for src, dst, color, watts, gap, _label in self._active_flows(pv_w, grid_w, batt_w):
+            start, end = edge_points(src, dst, self.node_radius + gap)
+            out.append(Flow(start, end, color, quantize_watts(watts)))
+        return out
+
+    def _value_key(self, pv_w: float, load_w: float, grid_w: float, batt_w: float, soc: float) -> tuple:
+        """Alles, was im Wert-Bild sichtbar ist: Geometrie, aktive Flüsse mit Beschriftung, Last, SoC."""
+        flows = tuple(
+            (src, dst, color, self._format_power_parts(abs(watts)))
+            for src, dst, color, watts, _gap, _label in self._active_flows(pv_w, grid_w, batt_w)
+        )
+        return (self.width, self.height, flows, self._format_power_parts(load_w), round(soc))
+
+    def _value_image(self, pv_w: float, load_w: float, grid_w: float, batt_w: float, soc: float):
+        """PhotoImage der Wert-Ebene aus dem LRU; gerendert wird nur bei neuem Schlüssel.
+
+        Der SoC wird auf ganze Prozent gerundet gerendert, damit das Bild
+        eindeutig zum Schlüssel passt.
+        """
+        key = self._value_key(pv_w, load_w, grid_w, batt_w, soc)
+        photo = self._value_images.get(key)
+        if photo is not None:
+            self._value_images.move_to_end(key)
+            return photo
+        photo = ImageTk.PhotoImage(self.render_frame(pv_w, load_w, grid_w, batt_w, float(key[-1])))
+        self._value_images[key] = photo
+        while len(self._value_images) > self._value_cache_size:
+            self._value_images.popitem(last=False)
+        return photo
+
+    def render_frame(self, pv_w: float, load_w: float, grid_w: float, batt_w: float, soc: float) -> Image.Image:
+        """Wert-Ebene: Hintergrund plus Beschriftungen und Anzeigen (ohne Pfeile/Animation)."""
+        img = self._base_img.copy()
+        draw = ImageDraw.Draw(img)
+
+        home = self.nodes["home"]
+        bat = self.nodes["battery"]
+
+        for src, dst, color, watts, _gap, label in self._active_flows(pv_w, grid_w, batt_w):
+            self._draw_flow_label(img, src, dst, watts, along=0, color=color, **label)
 
         # SoC Ring um Batterie
         self._draw_soc_ring(draw, bat, soc)
@@ -798,7 +751,7 @@ class EnergyFlowView(tk.Frame):
         # Hausverbrauch: Zahl dominant, Einheit sekundär
         load_val, load_unit = self._format_power_parts(load_w)
         self._draw_value_unit(
-            draw,
+            img,
             load_val,
             load_unit,
             home[0],
@@ -811,7 +764,7 @@ class EnergyFlowView(tk.Frame):
 
         # SoC inside battery with outline for readability - moved down to avoid emoji overlap
         soc_color = COLOR_DANGER if soc < 20 else (COLOR_WARNING if soc < 35 else COLOR_TEXT)
-        self._text_center(draw, f"{soc:.0f}%", bat[0], bat[1], size=26, color=soc_color, outline=True)
+        self._text_center(img, f"{soc:.0f}%", bat[0], bat[1], size=26, color=soc_color, outline=True)
         return img
 
     def stop(self):
@@ -825,6 +778,8 @@ class EnergyFlowView(tk.Frame):
                 self._anim_job = None
             if hasattr(self, '_tk_img') and self._tk_img:
                 self._tk_img = None  # Remove reference to PhotoImage
+            if hasattr(self, '_value_images'):
+                self._value_images.clear()
             if hasattr(self, 'canvas') and self.canvas:
                 self.canvas.destroy()
         except Exception:
@@ -0,0 +1,270 @@
+"""Animierte Ebene des Energiefluss-Diagramms als native Canvas-Items.
+
+Pfeile, Puls-Glow und Flusspunkte liegen als Tk-Canvas-Items über dem
+Wert-Bild von ``EnergyFlowView``. Ein Animations-Tick ändert nur
+Koordinaten, Breite und Farbe dieser Items – kein PIL-Rendering und kein
+neues ``PhotoImage``.
+
+Der Puls ist periodisch (Sinus, 0.7 Hz): pro (quantisiertem) Flusszustand
+wird ein Zyklus aus ``PHASE_FRAMES`` Phasen einmal vorberechnet und in
+einem kleinen LRU (``CycleCache``) gehalten. Ein Tick setzt danach nur
+noch die vorbereiteten Werte des passenden Frames.
+
+Tk-Items kennen kein Alpha: halbtransparente Farben werden gegen den
+Canvas-Hintergrund gemischt (``blend``). Das entspricht dem bisherigen
+PIL-Zeichnen – ``ImageDraw`` ersetzte die RGBA-Pixel, Tk mischte sie
+dann gegen den Canvas-Hintergrund.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+Point = Tuple[float, float]
+RGB = Tuple[int, int, int]
+
+DOT_COUNT = 5
+LINE_ALPHA = 170
+TAG = "flow"
+
+PHASE_FRAMES = 12
+PULSE_HZ = 0.7
+# Leistungen werden für Geometrie/Cache auf diese Schrittweite gerundet
+WATTS_STEP = 100.0
+
+
+def hex_to_rgb(color: str) -> RGB:
+    c = color.lstrip("#")
+    return tuple(int(c[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def tint(color: str, amount: float) -> str:
+    r, g, b = hex_to_rgb(color)
+    r = int(r + (255 - r) * amount)
+    g = int(g + (255 - g) * amount)
+    b = int(b + (255 - b) * amount)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def blend(color: str, alpha: int, backdrop: RGB) -> str:
+    """``color`` mit Deckkraft ``alpha`` (0..255) über ``backdrop`` als deckende Hex-Farbe."""
+    a = max(0, min(255, int(alpha))) / 255.0
+    r, g, b = (int(round(c * a + bg * (1.0 - a))) for c, bg in zip(hex_to_rgb(color), backdrop))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def quantize_watts(watts: float) -> float:
+    return round(watts / WATTS_STEP) * WATTS_STEP
+
+
+def phase_at(index: int, frames: int = PHASE_FRAMES) -> float:
+    """Pulsphase (0..1) des Zyklus-Frames ``index`` – gleiche Sinusform wie der frühere Live-Wert."""
+    return 0.5 + 0.5 * math.sin(2 * math.pi * (index % frames) / frames)
+
+
+def frame_index(now: float, frames: int = PHASE_FRAMES, hz: float = PULSE_HZ) -> int:
+    """Zyklus-Frame für den Zeitpunkt ``now`` (Sekunden)."""
+    return int((now * hz % 1.0) * frames) % frames
+
+
+def flow_strength(watts: float) -> float:
+    return max(0.0, min(1.0, abs(watts) / 3000))
+
+
+def flow_width(watts: float) -> float:
+    return max(2.0, min(8.0, 2 + abs(watts) / 1500))
+
+
+def edge_points(src: Point, dst: Point, offset: float) -> Tuple[Point, Point]:
+    """Start/Ende der Verbindung, jeweils um ``offset`` vom Knotenmittelpunkt eingerückt."""
+    x0, y0 = src
+    x1, y1 = dst
+    vx, vy = x1 - x0, y1 - y0
+    length = max((vx ** 2 + vy ** 2) ** 0.5, 1e-3)
+    ux, uy = vx / length, vy / length
+    return (x0 + ux * offset, y0 + uy * offset), (x1 - ux * offset, y1 - uy * offset)
+
+
+def arrow_head(start: Point, end: Point, width: float) -> List[float]:
+    """Dreieck der Pfeilspitze als flache Koordinatenliste."""
+    x0, y0 = start
+    x1, y1 = end
+    vx, vy = x1 - x0, y1 - y0
+    length = max((vx ** 2 + vy ** 2) ** 0.5, 1e-3)
+    ux, uy = vx / length, vy / length
+    size = 14 + width
+    return [
+        x1 - ux * size + uy * size * 0.6, y1 - uy * size - ux * size * 0.6,
+        x1 - ux * size - uy * size * 0.6, y1 - uy * size + ux * size * 0.6,
+        x1, y1,
+    ]
+
+
+def glow_width(width: float, pulse: float) -> int:
+    return int(max(1, int(width) + 1 + 2 * pulse)) + 1
+
+
+def dot_boxes(start: Point, end: Point, phase: float, strength: float, count: int = DOT_COUNT) -> List[List[float]]:
+    """Bounding-Boxen der Flusspunkte für die Animationsphase ``phase`` (0..1)."""
+    x0, y0 = start
+    x1, y1 = end
+    speed = 0.25 + 0.75 * strength
+    radius = 1.2 + 3.2 * strength
+    offset = (phase * speed) % 1.0
+    boxes = []
+    for idx in range(count):
+        t = (offset + idx / count) % 1.0
+        px = x0 + (x1 - x0) * t
+        py = y0 + (y1 - y0) * t
+        r = radius * (0.75 + 0.25 * (idx + 1) / count)
+        boxes.append([px - r, py - r, px + r, py + r])
+    return boxes
+
+
+@dataclass(frozen=True)
+class Flow:
+    """Eine aktive Verbindung (Koordinaten bereits um die Knotenradien eingerückt).
+
+    ``watts`` sollte per ``quantize_watts`` gerundet sein – gleiche Zustände
+    teilen sich dann Items und vorberechneten Zyklus.
+    """
+
+    start: Point
+    end: Point
+    color: str
+    watts: float
+
+    @property
+    def strength(self) -> float:
+        return flow_strength(self.watts)
+
+    @property
+    def width(self) -> float:
+        return flow_width(self.watts)
+
+
+def glow_color(flow: Flow, pulse: float, backdrop: RGB) -> str:
+    return blend(tint(flow.color, 0.35), int(18 + 50 * pulse), backdrop)
+
+
+# Ein Frame: je Fluss (Glow-Breite, Glow-Farbe, Punkt-Boxen)
+CycleFrame = List[Tuple[int, str, List[List[float]]]]
+
+
+def build_cycle(flows: Sequence[Flow], backdrop: RGB, frames: int = PHASE_FRAMES) -> List[CycleFrame]:
+    """Alle Phasen eines Puls-Zyklus für ``flows`` vorberechnen."""
+    cycle = []
+    for index in range(frames):
+        phase = phase_at(index, frames)
+        cycle.append([
+            (
+                glow_width(flow.width, phase * flow.strength),
+                glow_color(flow, phase * flow.strength, backdrop),
+                dot_boxes(flow.start, flow.end, phase, flow.strength),
+            )
+            for flow in flows
+        ])
+    return cycle
+
+
+class CycleCache:
+    """LRU der vorberechneten Zyklen je Flusszustand."""
+
+    def __init__(self, backdrop: RGB, maxsize: int = 8, frames: int = PHASE_FRAMES):
+        self.backdrop = backdrop
+        self.maxsize = max(1, int(maxsize))
+        self.frames = frames
+        self._cycles: "OrderedDict[Tuple[Flow, ...], List[CycleFrame]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, flows: Tuple[Flow, ...]) -> List[CycleFrame]:
+        cycle = self._cycles.get(flows)
+        if cycle is not None:
+            self._cycles.move_to_end(flows)
+            self.hits += 1
+            return cycle
+        self.misses += 1
+        cycle = build_cycle(flows, self.backdrop, self.frames)
+        self._cycles[flows] = cycle
+        while len(self._cycles) > self.maxsize:
+            self._cycles.popitem(last=False)
+        return cycle
+
+    def __len__(self) -> int:
+        return len(self._cycles)
+
+    def clear(self) -> None:
+        self._cycles.clear()
+
+
+class FlowOverlay:
+    """Verwaltet die Canvas-Items der Flüsse; ``animate`` ist der billige Pfad pro Tick."""
+
+    def __init__(self, canvas: Any, backdrop: str, tag: str = TAG, cache_size: int = 8):
+        self.canvas = canvas
+        self.backdrop = hex_to_rgb(backdrop)
+        self.tag = tag
+        self.cycles = CycleCache(self.backdrop, maxsize=cache_size)
+        self._flows: Tuple[Flow, ...] = ()
+        self._cycle: List[CycleFrame] = []
+        self._frame = -1
+        self._items: List[Dict[str, Any]] = []
+
+    @property
+    def flows(self) -> Tuple[Flow, ...]:
+        return self._flows
+
+    def set_flows(self, flows: Sequence[Flow], frame: int = 0) -> None:
+        """Items nur neu anlegen, wenn sich der Flusszustand geändert hat."""
+        flows = tuple(flows)
+        if flows == self._flows:
+            return
+        self.clear()
+        self._flows = flows
+        self._cycle = self.cycles.get(flows)
+        self._frame = frame % len(self._cycle)
+        for flow, (width, color, boxes) in zip(flows, self._cycle[self._frame]):
+            self._items.append(self._create(flow, width, color, boxes))
+
+    def _create(self, flow: Flow, glow_w: int, glow_fill: str, boxes: List[List[float]]) -> Dict[str, Any]:
+        canvas = self.canvas
+        (x0, y0), (x1, y1) = flow.start, flow.end
+        line_color = blend(flow.color, LINE_ALPHA, self.backdrop)
+        items = {
+            # Reihenfolge = Z-Ordnung: Glow unter Linie, Punkte zuoberst
+            "glow": canvas.create_line(x0, y0, x1, y1, fill=glow_fill, width=glow_w, tags=self.tag),
+            "line": canvas.create_line(x0, y0, x1, y1, fill=line_color, width=int(flow.width), tags=self.tag),
+            "cap": canvas.create_oval(x0 - 3, y0 - 3, x0 + 3, y0 + 3, fill=line_color, outline="", tags=self.tag),
+            "head": canvas.create_polygon(
+                *arrow_head(flow.start, flow.end, flow.width), fill=line_color, outline="", tags=self.tag,
+            ),
+        }
+        dot_color = blend(flow.color, int(120 + 80 * flow.strength), self.backdrop)
+        items["dots"] = [canvas.create_oval(*box, fill=dot_color, outline="", tags=self.tag) for box in boxes]
+        return items
+
+    def animate(self, frame: int) -> None:
+        """Vorberechneten Zyklus-Frame anzeigen (nur coords/itemconfigure, nichts wird berechnet)."""
+        if not self._cycle:
+            return
+        frame %= len(self._cycle)
+        if frame == self._frame:
+            return
+        self._frame = frame
+        canvas = self.canvas
+        for items, (width, color, boxes) in zip(self._items, self._cycle[frame]):
+            canvas.itemconfigure(items["glow"], width=width, fill=color)
+            for item, box in zip(items["dots"], boxes):
+                canvas.coords(item, *box)
+
+    def clear(self) -> None:
+        if self._items:
+            self.canvas.delete(self.tag)
+        self._items = []
+        self._flows = ()
+        self._cycle = []
+        self._frame = -1
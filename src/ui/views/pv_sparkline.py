@@ -2,17 +2,18 @@ import json
 import os
 from pathlib import Path
 import time
-from collections import deque
 from datetime import datetime, timedelta
 
 import tkinter as tk
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 from matplotlib.ticker import FixedLocator
 
 from core.datastore import get_shared_datastore
-from core.schema import PV_POWER_KW
+from core.downsample import LTTB, MINMAX, downsample_pairs
+from core.recent_series import get_recent_series
+from ui.chart_render import ChartImage, ChartRenderService, fit_figure, rasterize
 from ui.styles import (
     COLOR_ROOT,
     COLOR_BORDER,
@@ -26,34 +27,20 @@ from ui.styles import (
 DEBUG_LOG = os.environ.get("DASHBOARD_DEBUG", "").strip().lower() in ("1", "true", "yes", "on")
 
 
-def _sparkline_db_limit() -> int:
-    """Safety cap for DB reads.
-
-    We primarily rely on the SQL time cutoff (hours=...) to select the correct
-    window. This limit is just a guardrail against unexpectedly huge result sets.
-    """
-    raw = os.environ.get("DASHBOARD_SPARKLINE_DB_LIMIT", "200000").strip()
-    try:
-        limit = int(raw)
-    except Exception:
-        limit = 200000
-    # Keep it within reasonable bounds.
-    return max(5000, min(500000, limit))
-
-
 class PVSparklineView(tk.Frame):
     """PV + Outdoor temperature sparkline for the energy tab."""
 
     def __init__(self, parent: tk.Widget, datastore=None):
         super().__init__(parent, bg=COLOR_ROOT)
         self.datastore = datastore or get_shared_datastore()
+        # Reihen teilt sich die View mit dem Puffer-Sparkline (ein Cache je Store)
+        self._series = get_recent_series(self.datastore) if self.datastore else None
 
-        self._spark_history_pv = deque(maxlen=2000)
-        self._spark_history_temp = deque(maxlen=2000)
-        self._last_spark_sample_ts = 0.0
         self._spark_cache_pv = []
         self._spark_cache_temp = []
         self._spark_cache_ts = 0.0
+        # Erzwungener Reload überlebt das Ersetzen eines wartenden Auftrags
+        self._force_pending = False
         self._spark_cache_file = Path(__file__).resolve().parents[3] / "data" / "sparkline_cache.json"
 
         header = tk.Frame(self, bg=COLOR_ROOT)
@@ -67,17 +54,25 @@ class PVSparklineView(tk.Frame):
             font=("Segoe UI", 10, "bold"),
         ).pack(anchor="w")
 
+        # Eigene Figure mit Agg-Canvas: Laden und Zeichnen in der Render-Lane,
+        # im Tk-Thread nur noch das fertige Bild (ChartImage)
         self.spark_fig = Figure(figsize=(7.5, 1.8), dpi=100)
         self.spark_fig.patch.set_facecolor(COLOR_ROOT)
         self.spark_ax = self.spark_fig.add_subplot(111)
         self.spark_ax.set_facecolor(COLOR_ROOT)
-        self.spark_canvas = FigureCanvasTkAgg(self.spark_fig, master=self)
-        self._canvas_widget = self.spark_canvas.get_tk_widget()
-        self._canvas_widget.pack(fill=tk.BOTH, expand=True, padx=6, pady=(0, 6))
+        self.spark_canvas = FigureCanvasAgg(self.spark_fig)
         self.spark_ax.tick_params(axis='both', which='major', labelsize=9, colors=COLOR_SUBTEXT)
         self.spark_ax.set_axisbelow(True)
         self.spark_ax.grid(True, alpha=0.12)
-        self.spark_fig.subplots_adjust(left=0.06, right=0.98, top=0.90, bottom=0.22)
+        self._bottom_margin = 0.22
+        self._stopped = False
+        self._renderer = ChartRenderService.for_root(self.winfo_toplevel())
+        self._render_key = ("pv_sparkline", id(self))
+        self.chart_image = ChartImage(
+            self, bg=COLOR_ROOT, on_resize=lambda _w, _h: self._update_sparkline(), width=750, height=180,
+        )
+        self._canvas_widget = self.chart_image
+        self._canvas_widget.pack(fill=tk.BOTH, expand=True, padx=6, pady=(0, 6))
 
         # On startup, render from persisted cache immediately so the sparkline
         # isn't empty after a restart. Then refresh from DB shortly after.
@@ -100,8 +95,7 @@ class PVSparklineView(tk.Frame):
         def _refresh_from_db() -> None:
             try:
                 # Force DB refresh on next update.
-                self._spark_cache_ts = 0.0
-                self._update_sparkline()
+                self._update_sparkline(force_refresh=True)
             except Exception:
                 pass
 
@@ -139,22 +133,13 @@ class PVSparklineView(tk.Frame):
         # Approximate remaining height for the matplotlib canvas.
         canvas_px = max(60, total_px - max(18, header_h) - 14)
 
+        # Tighter margins in compact mode; die Figure-Größe folgt beim Rendern dem Widget.
+        self._bottom_margin = 0.26
         try:
             self._canvas_widget.configure(height=canvas_px)
         except Exception:
             pass
-
-        try:
-            dpi = float(self.spark_fig.get_dpi() or 100)
-            cur_w_in, _cur_h_in = self.spark_fig.get_size_inches()
-            new_h_in = max(0.75, canvas_px / dpi)
-            self.spark_fig.set_size_inches(cur_w_in, new_h_in, forward=True)
-
-            # Tighter margins in compact mode.
-            self.spark_fig.subplots_adjust(left=0.06, right=0.98, top=0.90, bottom=0.26)
-            self.spark_canvas.draw_idle()
-        except Exception:
-            pass
+        self._update_sparkline()
 
     def update_data(self, data: dict) -> None:
         self._record_spark_sample(data)
@@ -169,40 +154,48 @@ class PVSparklineView(tk.Frame):
     def rebuild_cache_now(self) -> None:
         """Force a DB refresh and rewrite the persisted sparkline cache."""
         try:
-            self._spark_cache_ts = 0.0
-            self._update_sparkline()
+            self._update_sparkline(force_refresh=True)
         except Exception:
             pass
 
     def _record_spark_sample(self, data: dict) -> None:
-        now_ts = time.time()
-        if now_ts - self._last_spark_sample_ts < 60.0:
+        if self._series is not None:
+            self._series.record(data)
+
+    def _update_sparkline(self, force_refresh: bool = False) -> None:
+        """Größe und Ränder im Tk-Thread lesen, Laden und Zeichnen in der Render-Lane."""
+        if self._stopped:
             return
-        self._last_spark_sample_ts = now_ts
-        sample_time = datetime.now()
-        pv_kw = self._safe_float(data.get(PV_POWER_KW))
-        if pv_kw is not None:
-            self._spark_history_pv.append((sample_time, max(0.0, pv_kw)))
-        outdoor = self._safe_float(data.get('outdoor'))
-        if outdoor is not None:
-            self._spark_history_temp.append((sample_time, outdoor))
-
-    def _update_sparkline(self) -> None:
-        refresh_needed = (time.time() - self._spark_cache_ts) > 60.0
+        width, height = self.chart_image.size
+        bottom = self._bottom_margin
+        self._force_pending |= force_refresh
+        self._renderer.request(
+            self._render_key,
+            lambda: self._render(width, height, bottom),
+            self.chart_image.show,
+            name="pv_sparkline",
+        )
+
+    def _render(self, width: int, height: int, bottom: float):
+        """Läuft in der Render-Lane: Reihen holen, plotten, rastern."""
+        fit_figure(self.spark_fig, width, height)
+        self.spark_fig.subplots_adjust(left=0.06, right=0.98, top=0.90, bottom=bottom)
+        force_refresh, self._force_pending = self._force_pending, False
+        refresh_needed = force_refresh or (time.time() - self._spark_cache_ts) > 60.0
         if refresh_needed:
             prev_pv = list(self._spark_cache_pv)
             prev_temp = list(self._spark_cache_temp)
             try:
-                pv_series_db = self._load_pv_series(hours=48, bin_minutes=15)
+                pv_series_db = self._series.series("pv", hours=48, bin_minutes=15) if self._series else []
             except Exception as exc:
                 if DEBUG_LOG:
-                    print(f"[SPARKLINE] _load_pv_series error: {exc}")
+                    print(f"[SPARKLINE] pv series error: {exc}")
                 pv_series_db = []
             try:
-                temp_series_db = self._load_outdoor_temp_series(hours=48, bin_minutes=15)
+                temp_series_db = self._series.series("outdoor", hours=48, bin_minutes=15) if self._series else []
             except Exception as exc:
                 if DEBUG_LOG:
-                    print(f"[SPARKLINE] _load_outdoor_temp_series error: {exc}")
+                    print(f"[SPARKLINE] outdoor series error: {exc}")
                 temp_series_db = []
 
             # Do not wipe previously cached series when a refresh returns empty.
@@ -229,12 +222,12 @@ class PVSparklineView(tk.Frame):
                 temp_series_db = cached.get("temp", [])
 
         pv_series = list(pv_series_db)
-        if not pv_series:
-            pv_series = self._history_to_series(self._spark_history_pv, hours=6, bin_minutes=5)
+        if not pv_series and self._series is not None:
+            pv_series = self._series.live("pv", hours=6, bin_minutes=5)
 
         temp_series = list(temp_series_db)
-        if not temp_series:
-            temp_series = self._history_to_series(self._spark_history_temp, hours=6, bin_minutes=5)
+        if not temp_series and self._series is not None:
+            temp_series = self._series.live("outdoor", hours=6, bin_minutes=5)
 
         self.spark_ax.clear()
         now = datetime.now()
@@ -276,8 +269,12 @@ class PVSparklineView(tk.Frame):
             self.spark_ax.set_xticks([])
             self.spark_ax.set_yticks([])
             ax2.set_yticks([])
-            self.spark_canvas.draw_idle()
-            return
+            return rasterize(self.spark_fig)
+
+        # Höchstens ~1 Punkt je Pixel: PV als Min/Max-Hülle (Peaks bleiben), Temperatur per LTTB
+        max_points = max(50, int(width or 0))
+        pv_series = downsample_pairs(pv_series, max_points, MINMAX)
+        temp_series = downsample_pairs(temp_series, max_points, LTTB)
 
         if pv_series:
             xs_pv, ys_pv = zip(*pv_series)
@@ -323,7 +320,7 @@ class PVSparklineView(tk.Frame):
         except Exception:
             pass
         self.spark_ax.margins(x=0.01)
-        self.spark_canvas.draw_idle()
+        return rasterize(self.spark_fig)
 
     def _save_cache(self, pv_series: list[tuple[datetime, float]], temp_series: list[tuple[datetime, float]]) -> None:
         try:
@@ -363,143 +360,6 @@ class PVSparklineView(tk.Frame):
         except Exception:
             return None
 
-    def _history_to_series(self, history: deque[tuple[datetime, float]], hours: int, bin_minutes: int) -> list[tuple[datetime, float]]:
-        if not history:
-            return []
-        cutoff = datetime.now() - timedelta(hours=hours)
-        samples: list[tuple[datetime, float]] = []
-        for ts, val in list(history):
-            if val is None or ts < cutoff:
-                continue
-            rounded = ts.replace(second=0, microsecond=0) - timedelta(minutes=ts.minute % bin_minutes)
-            samples.append((rounded, float(val)))
-        if not samples:
-            return []
-        return self._aggregate_series(samples)
-
-    def _load_pv_series(self, hours: int = 24, bin_minutes: int = 15) -> list[tuple[datetime, float]]:
-        if not self.datastore:
-            return []
-        now = datetime.now()
-        cutoff = now - timedelta(hours=hours)
-        # IMPORTANT: Use the hours cutoff in SQL.
-        # A fixed LIMIT can result in only "recent" rows if ingest frequency is high,
-        # which makes the sparkline lose older data.
-        rows = self.datastore.get_recent_fronius(hours=hours, limit=_sparkline_db_limit())
-        parsed_rows: list[tuple[datetime, dict]] = []
-        for entry in rows:
-            ts = self._parse_ts(entry.get('timestamp'))
-            if ts is None:
-                continue
-            if ts > now:
-                ts = now
-            parsed_rows.append((ts, entry))
-        parsed_rows.sort(key=lambda t: t[0])
-
-        # If the data stream is stale (or paused) the "last N hours" window based on
-        # wall-clock time can be almost empty. In that case, anchor the window at the
-        # newest available DB sample so the sparkline still shows the last N hours of data.
-        if not parsed_rows or (now - parsed_rows[-1][0]) > timedelta(hours=1):
-            fallback_rows = self.datastore.get_recent_fronius(hours=None, limit=_sparkline_db_limit())
-            fallback_parsed: list[tuple[datetime, dict]] = []
-            for entry in fallback_rows:
-                ts = self._parse_ts(entry.get('timestamp'))
-                if ts is None:
-                    continue
-                if ts > now:
-                    ts = now
-                fallback_parsed.append((ts, entry))
-            fallback_parsed.sort(key=lambda t: t[0])
-            if fallback_parsed:
-                anchor = fallback_parsed[-1][0]
-                cutoff = anchor - timedelta(hours=hours)
-                parsed_rows = fallback_parsed
-
-        samples: list[tuple[datetime, float]] = []
-        for ts, entry in parsed_rows:
-            pv_kw = self._safe_float(entry.get('pv'))
-            if pv_kw is None or ts < cutoff:
-                continue
-            if pv_kw > 200.0:
-                pv_kw = pv_kw / 1000.0
-            if pv_kw < -0.2:
-                continue
-            pv_kw = max(0.0, pv_kw)
-            ts_bin = ts - timedelta(minutes=ts.minute % bin_minutes,
-                                    seconds=ts.second,
-                                    microseconds=ts.microsecond)
-            samples.append((ts_bin, pv_kw))
-        return self._aggregate_series(samples)
-
-    def _load_outdoor_temp_series(self, hours: int = 24, bin_minutes: int = 15) -> list[tuple[datetime, float]]:
-        if not self.datastore:
-            return []
-        now = datetime.now()
-        cutoff = now - timedelta(hours=hours)
-
-        # Use the hours cutoff in SQL for the same reason as PV.
-        rows = self.datastore.get_recent_heating(hours=hours, limit=_sparkline_db_limit())
-        parsed_rows: list[tuple[datetime, dict]] = []
-        for entry in rows:
-            ts = self._parse_ts(entry.get('timestamp'))
-            if ts is None:
-                continue
-            if ts > now:
-                ts = now
-            parsed_rows.append((ts, entry))
-        parsed_rows.sort(key=lambda t: t[0])
-
-        if not parsed_rows or (now - parsed_rows[-1][0]) > timedelta(hours=1):
-            fallback_rows = self.datastore.get_recent_heating(hours=None, limit=_sparkline_db_limit())
-            fallback_parsed: list[tuple[datetime, dict]] = []
-            for entry in fallback_rows:
-                ts = self._parse_ts(entry.get('timestamp'))
-                if ts is None:
-                    continue
-                if ts > now:
-                    ts = now
-                fallback_parsed.append((ts, entry))
-            fallback_parsed.sort(key=lambda t: t[0])
-            if fallback_parsed:
-                anchor = fallback_parsed[-1][0]
-                cutoff = anchor - timedelta(hours=hours)
-                parsed_rows = fallback_parsed
-
-        samples: list[tuple[datetime, float]] = []
-        for ts, entry in parsed_rows:
-            val = self._safe_float(entry.get('outdoor'))
-            if val is None or ts < cutoff:
-                continue
-            if not (-40.0 <= val <= 60.0):
-                continue
-            ts_bin = ts - timedelta(minutes=ts.minute % bin_minutes,
-                                    seconds=ts.second,
-                                    microseconds=ts.microsecond)
-            samples.append((ts_bin, val))
-        return self._aggregate_series(samples)
-
-    def _aggregate_series(self, samples: list[tuple[datetime, float]]) -> list[tuple[datetime, float]]:
-        if not samples:
-            return []
-        agg: dict[datetime, tuple[float, int]] = {}
-        for ts, val in samples:
-            total, count = agg.get(ts, (0.0, 0))
-            agg[ts] = (total + val, count + 1)
-        averaged = [(ts, total / count) for ts, (total, count) in sorted(agg.items())]
-        return self._smooth_series(averaged, window=5)
-
-    def _smooth_series(self, series: list[tuple[datetime, float]], window: int = 5) -> list[tuple[datetime, float]]:
-        if len(series) < window:
-            return series
-        smoothed: list[tuple[datetime, float]] = []
-        half_window = window // 2
-        for idx in range(len(series)):
-            start = max(0, idx - half_window)
-            end = min(len(series), idx + half_window + 1)
-            values = [val for _, val in series[start:end]]
-            smoothed.append((series[idx][0], sum(values) / len(values)))
-        return smoothed
-
     @staticmethod
     def _parse_ts(value):
         if not value:
@@ -525,6 +385,11 @@ class PVSparklineView(tk.Frame):
             return None
 
     def stop(self):
+        """Figure in der Render-Lane abbauen (erst nach einem laufenden Rendering)."""
+        self._stopped = True
+        self._renderer.dispose(self._render_key, self._close_figure, name="pv_sparkline")
+
+    def _close_figure(self) -> None:
         """Clean up matplotlib figure to prevent memory leak."""
         try:
             import matplotlib.pyplot as plt
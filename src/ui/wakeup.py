@@ -0,0 +1,180 @@
+"""Event-getriebenes Aufwecken der Tk-Mainloop aus Worker-Threads.
+
+Statt Queues im festen Intervall per ``after()`` zu pollen, signalisiert der
+Producer beim ``put`` die Mainloop; die Queue wird dann sofort im Tk-Thread
+geleert – und im Leerlauf gar nicht.
+
+Mechanismus:
+    * POSIX: ``os.pipe`` + ``tk.createfilehandler`` – der Worker schreibt ein
+      Byte, Tk meldet den Deskriptor als lesbar.
+    * Sonst (Windows): ``event_generate(<<...>>, when="tail")`` plus ein
+      langsamer Sicherheits-Poll, falls das Signal nicht zugestellt wird.
+
+Mehrere Signale bis zum nächsten Leeren werden zu einem Aufruf zusammengefasst.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class UiWakeup:
+    """Ruft ``drain`` im Tk-Thread auf, sobald ``notify()`` (beliebiger Thread) kommt."""
+
+    def __init__(self, root: tk.Misc, drain: Callable[[], None], fallback_ms: int = 1000):
+        self._root = root
+        self._drain = drain
+        self._fallback_ms = max(50, int(fallback_ms))
+        self._pending = threading.Event()
+        self._closed = False
+        self._rfd: Optional[int] = None
+        self._wfd: Optional[int] = None
+        self._event = f"<<UiWakeup{id(self)}>>"
+        self._fallback_id = None
+
+        if os.name != "nt" and hasattr(root.tk, "createfilehandler"):
+            rfd = wfd = None
+            try:
+                rfd, wfd = os.pipe()
+                os.set_blocking(rfd, False)
+                os.set_blocking(wfd, False)
+                root.tk.createfilehandler(rfd, tk.READABLE, self._on_readable)
+                self._rfd, self._wfd = rfd, wfd
+            except Exception:
+                logger.debug("createfilehandler nicht verfügbar, nutze event_generate", exc_info=True)
+                for fd in (rfd, wfd):
+                    if fd is not None:
+                        try:
+                            os.close(fd)
+                        except OSError:
+                            pass
+        if self._wfd is None:
+            root.bind(self._event, lambda _e: self._run(), add="+")
+            self._fallback_id = root.after(self._fallback_ms, self._fallback_poll)
+        try:
+            root.bind("<Destroy>", self._on_destroy, add="+")
+        except Exception:
+            pass
+
+    @property
+    def uses_pipe(self) -> bool:
+        return self._wfd is not None
+
+    def notify(self) -> None:
+        """Mainloop wecken (thread-safe, zusammengefasst bis zum nächsten drain)."""
+        if self._closed or self._pending.is_set():
+            return
+        self._pending.set()
+        if self._wfd is not None:
+            try:
+                os.write(self._wfd, b"\0")
+            except (BlockingIOError, OSError):
+                pass
+            return
+        try:
+            self._root.event_generate(self._event, when="tail")
+        except Exception:
+            # Mainloop (noch) nicht aktiv – der Sicherheits-Poll übernimmt
+            pass
+
+    def _on_readable(self, fd: int, _mask: int) -> None:
+        try:
+            while os.read(fd, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self._run()
+
+    def _run(self) -> None:
+        if self._closed:
+            return
+        # Vor dem Leeren zurücksetzen: put() während drain weckt erneut
+        self._pending.clear()
+        try:
+            self._drain()
+        except Exception:
+            logger.exception("UI-Queue drain fehlgeschlagen")
+
+    def _fallback_poll(self) -> None:
+        if self._closed:
+            return
+        self._run()
+        try:
+            self._fallback_id = self._root.after(self._fallback_ms, self._fallback_poll)
+        except Exception:
+            self._fallback_id = None
+
+    def _on_destroy(self, event) -> None:
+        if event.widget is self._root:
+            self.close()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._rfd is not None:
+            try:
+                self._root.tk.deletefilehandler(self._rfd)
+            except Exception:
+                pass
+        for fd in (self._rfd, self._wfd):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._rfd = self._wfd = None
+        if self._fallback_id is not None:
+            try:
+                self._root.after_cancel(self._fallback_id)
+            except Exception:
+                pass
+            self._fallback_id = None
+
+
+class WakeupQueue(queue.Queue):
+    """``queue.Queue``, die bei jedem ``put`` einen gebundenen ``UiWakeup`` auslöst."""
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._wakeup: Optional[UiWakeup] = None
+
+    def bind(self, wakeup: Optional[UiWakeup]) -> None:
+        self._wakeup = wakeup
+        if wakeup is not None and not self.empty():
+            wakeup.notify()
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        super().put(item, block, timeout)
+        wakeup = self._wakeup
+        if wakeup is not None:
+            wakeup.notify()
+
+
+def drain_queue(q: queue.Queue, handler: Callable[[Any], None]) -> int:
+    """Alle anstehenden Einträge an ``handler`` übergeben (Fehler je Eintrag geloggt)."""
+    count = 0
+    while True:
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            return count
+        count += 1
+        try:
+            handler(item)
+        except Exception:
+            logger.exception("UI-Callback fehlgeschlagen")
+
+
+def start_callback_pump(root: tk.Misc, q: WakeupQueue, fallback_ms: int = 1000) -> UiWakeup:
+    """Callback-Queue (``q.put(callable)``) event-getrieben im Tk-Thread ausführen."""
+    wakeup = UiWakeup(root, lambda: drain_queue(q, lambda cb: cb()), fallback_ms=fallback_ms)
+    q.bind(wakeup)
+    return wakeup
@@ -0,0 +1,88 @@
+"""Unit tests for core.align – as-of join and grid resampling."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.align import align_series, align_to_grid, asof, resample, series_from_rows, timestamps_to_epoch
+
+
+class TestTimestamps(unittest.TestCase):
+    def test_canonical_and_aware(self):
+        t = timestamps_to_epoch(["2023-11-14 22:13:20", "2023-11-15T00:13:30+02:00"])
+        np.testing.assert_array_equal(t, [1700000000.0, 1700000010.0])
+
+    def test_invalid_is_nan(self):
+        t = timestamps_to_epoch(["garbage", "2023-11-14 22:13:20"])
+        self.assertTrue(np.isnan(t[0]))
+
+    def test_series_from_rows_sorts_and_skips(self):
+        rows = [
+            {"timestamp": "2023-11-14 22:13:30", "pv": 2.0},
+            {"timestamp": "2023-11-14 22:13:20", "pv": 1.0},
+            {"timestamp": "2023-11-14 22:13:40", "pv": None},
+        ]
+        t, v = series_from_rows(rows, "pv")
+        np.testing.assert_array_equal(t, [1700000000.0, 1700000010.0])
+        np.testing.assert_array_equal(v, [1.0, 2.0])
+
+
+class TestAsof(unittest.TestCase):
+    right = (np.array([0.0, 10.0, 20.0]), np.array([1.0, 2.0, 3.0]))
+
+    def test_nearest(self):
+        np.testing.assert_array_equal(asof(self.right, [4.0, 6.0, 25.0]), [1.0, 2.0, 3.0])
+
+    def test_backward_and_forward(self):
+        np.testing.assert_array_equal(asof(self.right, [9.0, 10.0], direction="backward"), [1.0, 2.0])
+        out = asof(self.right, [-1.0, 21.0], direction="forward")
+        self.assertEqual(out[0], 1.0)
+        self.assertTrue(np.isnan(out[1]))
+
+    def test_backward_before_first_is_nan(self):
+        self.assertTrue(np.isnan(asof(self.right, [-1.0], direction="backward")[0]))
+
+    def test_tolerance(self):
+        out = asof(self.right, [2.0, 5.0], tolerance=3.0)
+        self.assertEqual(out[0], 1.0)
+        self.assertTrue(np.isnan(out[1]))
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            asof(self.right, [0.0], direction="sideways")
+
+    def test_align_series_shapes(self):
+        left = (np.array([1.0, 11.0]), np.array([5.0, 6.0]))
+        t, lv, rv = align_series(left, self.right, tolerance=2.0)
+        np.testing.assert_array_equal(t, [1.0, 11.0])
+        np.testing.assert_array_equal(lv, [5.0, 6.0])
+        np.testing.assert_array_equal(rv, [1.0, 2.0])
+
+
+class TestGrid(unittest.TestCase):
+    def test_resample_mean(self):
+        series = (np.array([0.0, 5.0, 10.0, 12.0]), np.array([1.0, 3.0, 10.0, 20.0]))
+        out = resample(series, np.array([0.0, 10.0, 20.0]), how="mean")
+        np.testing.assert_array_equal(out[:2], [2.0, 15.0])
+        self.assertTrue(np.isnan(out[2]))
+
+    def test_align_to_grid_overlap(self):
+        a = (np.array([0.0, 10.0, 20.0, 30.0]), np.array([0.0, 1.0, 2.0, 3.0]))
+        b = (np.array([7.0, 27.0]), np.array([70.0, 270.0]))
+        grid, (va, vb) = align_to_grid(10.0, a, b)
+        np.testing.assert_array_equal(grid, [10.0, 20.0])
+        np.testing.assert_array_equal(va, [1.0, 2.0])
+        np.testing.assert_array_equal(vb, [70.0, 70.0])
+
+    def test_align_to_grid_empty(self):
+        grid, values = align_to_grid(10.0, (np.empty(0), np.empty(0)))
+        self.assertEqual(grid.size, 0)
+        self.assertEqual(len(values), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 """Unit tests for ui.app_helpers – UI helper functions."""
 
+import os
 import sys
+import time
 import unittest
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -12,11 +15,28 @@ from ui.app_helpers import (
     format_age_short,
     format_age_compact,
     age_seconds,
+    parse_timestamp_as_epoch,
     format_bmk_mode,
     compose_status_text,
 )
 
 
+@contextmanager
+def _local_tz(name):
+    """Prozess-Zeitzone für die Dauer des Blocks umstellen."""
+    old = os.environ.get("TZ")
+    os.environ["TZ"] = name
+    time.tzset()
+    try:
+        yield
+    finally:
+        if old is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = old
+        time.tzset()
+
+
 class TestParseIsoDatetime(unittest.TestCase):
     """Tests for ISO datetime parsing."""
 
@@ -36,6 +56,15 @@ class TestParseIsoDatetime(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.tzinfo, timezone.utc)
 
+    def test_naive_db_timestamp_is_utc_in_any_zone(self):
+        with _local_tz("Europe/Vienna"):
+            result = parse_iso_datetime("2024-07-15 10:30:00")
+            epoch = parse_timestamp_as_epoch("2024-07-15 10:30:00")
+        expected = datetime(2024, 7, 15, 10, 30, tzinfo=timezone.utc)
+        self.assertEqual(result, expected)
+        self.assertEqual(result.utcoffset(), timedelta(0))
+        self.assertEqual(epoch, expected.timestamp())
+
     def test_none_input(self):
         self.assertIsNone(parse_iso_datetime(None))
         self.assertIsNone(parse_iso_datetime(""))
@@ -95,8 +124,10 @@ class TestAgeSeconds(unittest.TestCase):
         self.assertIsNone(age_seconds(None))
 
     def test_recent_datetime(self):
-        one_minute_ago = datetime.now() - timedelta(minutes=1)
-        result = age_seconds(one_minute_ago)
+        # Naiv wie in der DB: UTC
+        one_minute_ago = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=1)
+        with _local_tz("America/New_York"):
+            result = age_seconds(one_minute_ago)
         self.assertIsNotNone(result)
         self.assertGreater(result, 55)
         self.assertLess(result, 65)
@@ -0,0 +1,100 @@
+"""Unit tests for ui.app_state – key-scoped subscriptions and coalescing."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.schema import BUF_TOP_C, GRID_POWER_KW, PV_POWER_KW
+from ui.app_state import AppState
+from ui.state_schema import BUFFER_KEYS, PV_KEYS, validate_payload
+
+
+class TestAppStateSubscriptions(unittest.TestCase):
+    def test_unscoped_listener_gets_snapshot(self):
+        state = AppState()
+        seen = []
+        state.subscribe(seen.append)
+        state.update({"a": 1})
+        state.update({"b": 2})
+        self.assertEqual(seen, [{"a": 1}, {"a": 1, "b": 2}])
+
+    def test_unchanged_values_do_not_notify(self):
+        state = AppState()
+        seen = []
+        state.subscribe(seen.append)
+        state.update({"a": 1})
+        state.update({"a": 1})
+        self.assertEqual(len(seen), 1)
+
+    def test_key_scoped_listener(self):
+        state = AppState()
+        pv, heat = [], []
+        state.subscribe(pv.append, keys={"pv"})
+        state.subscribe(heat.append, keys={"top"})
+        state.update({"pv": 3.0, "timestamp": "t1"})
+        state.update({"top": 60.0, "timestamp": "t2"})
+        self.assertEqual(len(pv), 1)
+        self.assertEqual(len(heat), 1)
+        self.assertEqual(heat[0]["pv"], 3.0)  # snapshot still carries all keys
+
+    def test_delta_delivery(self):
+        state = AppState()
+        seen = []
+        state.subscribe(seen.append, keys={"pv", "soc"}, deltas=True)
+        state.update({"pv": 1.0, "soc": 50, "top": 60.0})
+        state.update({"pv": 1.0, "soc": 51})
+        self.assertEqual(seen, [{"pv": 1.0, "soc": 50}, {"soc": 51}])
+
+    def test_keyed_view_receives_only_changed_keys(self):
+        # Verdrahtung wie in MainApp: Energiefluss- und Puffer-View abonnieren Deltas
+        scheduled = []
+        state = AppState(validator=validate_payload, schedule=scheduled.append)
+        energy, buffer = [], []
+        state.subscribe(energy.append, keys=PV_KEYS, deltas=True)
+        state.subscribe(buffer.append, keys=BUFFER_KEYS, deltas=True)
+        state.update({PV_POWER_KW: 3.0, GRID_POWER_KW: -1.0, BUF_TOP_C: 60.0})
+        scheduled.pop()()
+        state.update({PV_POWER_KW: 3.0, GRID_POWER_KW: -0.5})
+        scheduled.pop()()
+        self.assertEqual(energy, [{PV_POWER_KW: 3.0, GRID_POWER_KW: -1.0}, {GRID_POWER_KW: -0.5}])
+        self.assertEqual(buffer, [{BUF_TOP_C: 60.0}])
+
+    def test_unsubscribe(self):
+        state = AppState()
+        seen = []
+        unsubscribe = state.subscribe(seen.append, keys={"a"})
+        unsubscribe()
+        state.update({"a": 1})
+        self.assertEqual(seen, [])
+
+    def test_coalesced_updates(self):
+        scheduled = []
+        state = AppState(schedule=scheduled.append)
+        snaps, deltas = [], []
+        state.subscribe(snaps.append)
+        state.subscribe(deltas.append, deltas=True)
+        state.update({"pv": 1.0})
+        state.update({"pv": 2.0, "top": 60.0})
+        self.assertEqual(len(scheduled), 1)
+        self.assertEqual(snaps, [])
+        scheduled[0]()
+        self.assertEqual(snaps, [{"pv": 2.0, "top": 60.0}])
+        self.assertEqual(deltas, [{"pv": 2.0, "top": 60.0}])
+        # Next update schedules a new flush
+        state.update({"pv": 3.0})
+        self.assertEqual(len(scheduled), 2)
+
+    def test_failing_listener_isolated(self):
+        state = AppState()
+        seen = []
+        state.subscribe(lambda _d: 1 / 0)
+        state.subscribe(seen.append)
+        with self.assertLogs(level="ERROR"):
+            state.update({"a": 1})
+        self.assertEqual(len(seen), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
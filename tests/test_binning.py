@@ -0,0 +1,75 @@
+"""Unit tests for core.binning – vectorized NaN-aware bucket statistics."""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.binning import bin_series, bucket_stats, dense_grid, in_range, trapezoid_energy
+
+
+class TestBucketStats(unittest.TestCase):
+    def test_sum_count_min_max_nan_aware(self):
+        t = np.array([0, 10, 20, 60, 70], dtype=float)
+        v = np.array([1.0, np.nan, 3.0, np.nan, np.nan])
+        ids, stats = bucket_stats(t, {"a": v}, 60)
+        self.assertEqual(ids.tolist(), [0, 1])
+        sums, counts, mins, maxs = stats["a"]
+        self.assertEqual(sums.tolist(), [4.0, 0.0])
+        self.assertEqual(counts.tolist(), [2, 0])
+        self.assertEqual(mins[0], 1.0)
+        self.assertEqual(maxs[0], 3.0)
+        self.assertTrue(np.isnan(mins[1]) and np.isnan(maxs[1]))
+
+
+class TestBinSeries(unittest.TestCase):
+    def test_unsorted_input_and_empty_channel(self):
+        t = [130.0, 0.0, 50.0, np.nan, 120.0]
+        bins = bin_series(t, {"a": [5.0, 1.0, 3.0, 9.0, np.nan], "b": [np.nan] * 5}, 60)
+        self.assertEqual(bins.start.tolist(), [0.0, 120.0])
+        self.assertEqual(bins.mean["a"].tolist(), [2.0, 5.0])
+        self.assertEqual((bins.min["a"][0], bins.max["a"][0]), (1.0, 3.0))
+        self.assertEqual(bins.count["a"].tolist(), [2, 1])
+        self.assertTrue(np.all(np.isnan(bins.mean["b"])))
+
+    def test_matches_python_reference(self):
+        rng = np.random.default_rng(1)
+        t = np.sort(rng.uniform(0, 86400, 500))
+        v = rng.normal(50, 10, 500)
+        v[rng.integers(0, 500, 50)] = np.nan
+        bins = bin_series(t, {"v": v}, 3600)
+        for start, mean in zip(bins.start, bins.mean["v"]):
+            sel = v[(t >= start) & (t < start + 3600)]
+            self.assertAlmostEqual(mean, float(np.nanmean(sel)))
+
+    def test_thirty_days_of_ten_second_samples_is_fast(self):
+        t = np.arange(0, 30 * 86400, 10, dtype=float)
+        cols = {name: np.sin(t / 3600.0 + i) for i, name in enumerate(("top", "mid", "bot", "kessel", "warm", "outdoor"))}
+        start = time.perf_counter()
+        bins = bin_series(t, {k: in_range(v, -0.9, 0.9) for k, v in cols.items()}, 3 * 3600)
+        self.assertEqual(len(bins), 240)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class TestHelpers(unittest.TestCase):
+    def test_in_range_with_placeholder(self):
+        out = in_range([0.0, 20.0, 130.0, np.nan, -40.0], -40.0, 120.0, missing=0.0)
+        self.assertEqual(np.isnan(out).tolist(), [True, False, True, True, False])
+
+    def test_trapezoid_energy_skips_gaps(self):
+        energy = trapezoid_energy([0, 3600, 7200, 100000, 103600], [1.0, 3.0, -1.0, 5.0, np.nan], 6 * 3600)
+        self.assertEqual(energy.tolist(), [2.0, 1.0, 0.0, 0.0])
+        self.assertEqual(trapezoid_energy([0], [1.0], 60).tolist(), [])
+
+    def test_dense_grid(self):
+        out = dense_grid([3, 5, 9, 1], [1.0, 2.0, 3.0, 4.0], 3, 4)
+        self.assertEqual(out[[0, 2]].tolist(), [1.0, 2.0])
+        self.assertTrue(np.isnan(out[[1, 3]]).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
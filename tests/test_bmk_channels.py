@@ -0,0 +1,92 @@
+"""Unit tests for core.bmk_channels – BMK channel packing and response parsing."""
+
+import math
+import sys
+import unittest
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.bmk_channels import (
+    BLOB_SIZE,
+    CHANNEL_COUNT,
+    channels_from_record,
+    pack_channels,
+    parse_into,
+    parse_many,
+    parse_sample,
+    unpack_channels,
+)
+
+
+def _payload(values):
+    return "\r\n".join(str(v) for v in values) + "\r\n"
+
+
+class TestPacking(unittest.TestCase):
+    def test_roundtrip(self):
+        values = [float(i) for i in range(CHANNEL_COUNT)]
+        blob = pack_channels(values)
+        self.assertEqual(len(blob), BLOB_SIZE)
+        self.assertEqual(list(unpack_channels(blob)), values)
+
+    def test_short_vector_padded_with_nan(self):
+        out = unpack_channels(pack_channels([1.0, 2.0]))
+        self.assertEqual(out[:2], (1.0, 2.0))
+        self.assertTrue(all(math.isnan(v) for v in out[2:]))
+
+    def test_channels_from_record(self):
+        vec = channels_from_record({"Kesseltemperatur": "71.5", "Betriebsmodus": "Auto"})
+        self.assertEqual(vec[1], 71.5)
+        self.assertTrue(math.isnan(vec[0]))
+        self.assertIsNone(channels_from_record({"Zeitstempel": "x"}))
+
+
+class TestParser(unittest.TestCase):
+    def test_parse_by_index(self):
+        sample = parse_sample(_payload([2, 68.5, -3.0, 0, 60, 50, 40]), "2025-01-01T00:00:00+01:00")
+        self.assertIsNotNone(sample)
+        self.assertEqual(sample.kessel, 68.5)
+        self.assertEqual(sample.aussen, -3.0)
+        self.assertEqual(sample.puffer_unten, 40.0)
+        self.assertIsNone(sample.warmwasser)
+
+    def test_blank_lines_skipped_and_text_is_nan(self):
+        buf = array("d", [0.0] * CHANNEL_COUNT)
+        count = parse_into(" 1 \n\n  \nfoo\n3\n", buf)
+        self.assertEqual(count, 3)
+        self.assertEqual(buf[0], 1.0)
+        self.assertTrue(math.isnan(buf[1]))
+        self.assertEqual(buf[2], 3.0)
+        self.assertTrue(math.isnan(buf[CHANNEL_COUNT - 1]))
+
+    def test_buffer_reuse_resets_tail(self):
+        buf = array("d", [0.0] * CHANNEL_COUNT)
+        parse_into(_payload(range(CHANNEL_COUNT)), buf)
+        parse_into("5\n", buf)
+        self.assertEqual(buf[0], 5.0)
+        self.assertTrue(math.isnan(buf[1]))
+
+    def test_extra_lines_ignored(self):
+        sample = parse_sample(_payload(range(CHANNEL_COUNT + 10)), "ts")
+        self.assertEqual(len(sample.channels), CHANNEL_COUNT)
+
+    def test_empty_response(self):
+        self.assertIsNone(parse_sample("", "ts"))
+        self.assertIsNone(parse_sample("\n \n", "ts"))
+
+    def test_to_dict_has_legacy_aliases(self):
+        data = parse_sample(_payload([0, 70, 5, 0, 61, 51, 41]), "ts").to_dict()
+        self.assertEqual(data["Zeitstempel"], "ts")
+        self.assertEqual(data["Pufferspeicher Oben"], 61.0)
+        self.assertEqual(data["Puffer_Oben"], 61.0)
+        self.assertIsNone(data["Warmwasser"])
+
+    def test_parse_many(self):
+        samples = list(parse_many([("a", "1\n2\n"), ("b", ""), ("c", "3\n")]))
+        self.assertEqual([s.timestamp for s in samples], ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
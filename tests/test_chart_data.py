@@ -0,0 +1,145 @@
+"""Unit tests for core.chart_data – incremental chart sources over LOD pyramids."""
+
+import sqlite3
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.chart_data import (
+    FRONIUS_CHANNELS,
+    HEATING_CHANNELS,
+    ChartSource,
+    clean_fronius,
+    clean_heating,
+    fronius_sql,
+    heating_sql,
+    rows_to_columns,
+)
+from core.lod import RAW_SECONDS
+from core.time_utils import db_timestamp_to_epoch, epoch_to_db_timestamp
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestCleanParity(unittest.TestCase):
+    """Vektor-Masken und SQL-Ausdrücke müssen dasselbe liefern."""
+
+    def _sql(self, expr, column, values):
+        con = sqlite3.connect(":memory:")
+        con.execute(f"CREATE TABLE t ({column} REAL)")
+        con.executemany("INSERT INTO t VALUES (?)", [(v,) for v in values])
+        out = [row[0] for row in con.execute(f"SELECT {expr} FROM t ORDER BY rowid")]
+        con.close()
+        return np.array([np.nan if v is None else v for v in out], dtype=float)
+
+    def test_heating(self):
+        values = [0.0, 21.5, -50.0, 130.0, 60.5, -40.0, 119.0]
+        for name, column in (("outdoor", "aussentemp"), ("top", "puffer_top")):
+            expected = clean_heating(name, np.array(values))
+            np.testing.assert_array_equal(self._sql(heating_sql(name), column, values), expected)
+
+    def test_fronius(self):
+        values = [-3000.0, -1.5, 0.0, 2.5, 4500.0]
+        for name, column in (("pv", "pv_power"), ("load", "load_power"), ("grid", "grid_power")):
+            expected = clean_fronius(name, np.array(values))
+            np.testing.assert_allclose(self._sql(fronius_sql(name), column, values), expected)
+
+
+class TestRowsToColumns(unittest.TestCase):
+    def test_bad_rows_become_nan_or_dropped(self):
+        rows = [
+            {"timestamp": "2026-01-01 00:00:00", "a": 1},
+            {"timestamp": None, "a": 2},
+            {"timestamp": "2026-01-01 00:00:10", "a": "x"},
+        ]
+        t, cols = rows_to_columns(rows, ["a"])
+        self.assertEqual(t.tolist(), [db_timestamp_to_epoch("2026-01-01 00:00:00"), db_timestamp_to_epoch("2026-01-01 00:00:10")])
+        self.assertEqual(cols["a"][0], 1.0)
+        self.assertTrue(np.isnan(cols["a"][1]))
+
+
+class TestChartSource(unittest.TestCase):
+    def setUp(self):
+        self.now = db_timestamp_to_epoch("2026-03-10 12:00:00")
+        self.clock = _Clock(self.now)
+        self.since_calls = []
+        self.rollup_calls = []
+        self.rows = []
+
+    def _fetch_since(self, since, hours):
+        self.since_calls.append(since)
+        cut = db_timestamp_to_epoch(since) if since else -np.inf
+        return [r for r in self.rows if db_timestamp_to_epoch(r["timestamp"]) > cut]
+
+    def _fetch_rollup(self, bucket_s, hours, before):
+        self.rollup_calls.append((bucket_s, before))
+        start = db_timestamp_to_epoch(before) - 3 * bucket_s
+        return [
+            {"bucket": int(start + i * bucket_s), "top_avg": 40.0 + i, "top_min": 39.0, "top_max": 45.0, "top_count": 30}
+            for i in range(3)
+        ]
+
+    def _row(self, offset, top):
+        return {"timestamp": epoch_to_db_timestamp(self.now + offset), "top": top}
+
+    def _source(self, rollup=True):
+        return ChartSource(
+            self._fetch_since,
+            ["top"],
+            clean_heating,
+            fetch_rollup=self._fetch_rollup if rollup else None,
+            refresh_s=30,
+            clock=self.clock,
+        )
+
+    def test_backfill_then_raw_since_boundary(self):
+        self.rows = [self._row(-60, 50.0), self._row(-30, 0.0)]
+        src = self._source()
+        self.assertTrue(src.refresh())
+        boundary = (self.now - RAW_SECONDS) // 300 * 300
+        self.assertEqual(self.rollup_calls, [(300, epoch_to_db_timestamp(boundary))])
+        self.assertEqual(self.since_calls, [epoch_to_db_timestamp(boundary - 1)])
+        out = src.window(boundary - 900, self.now, pixels=2000)
+        self.assertEqual(out.level, 1)
+        self.assertEqual(out.avg["top"][:3].tolist(), [40.0, 41.0, 42.0])
+        # 0.0 ist Platzhalter und wird verworfen
+        self.assertEqual(float(np.nanmax(out.max["top"])), 50.0)
+
+    def test_incremental_refresh_fetches_only_new_rows(self):
+        self.rows = [self._row(-20, 40.0), self._row(-10, 41.0)]
+        src = self._source(rollup=False)
+        src.refresh()
+        self.assertEqual(src.pyramid.raw_count, 2)
+        self.assertFalse(src.refresh())  # innerhalb von refresh_s
+        self.rows.append(self._row(0, 42.0))
+        self.clock.now += 31
+        self.assertTrue(src.refresh())
+        self.assertEqual(self.since_calls[-1], epoch_to_db_timestamp(self.now - 10))
+        self.assertEqual(src.pyramid.raw_count, 3)
+        self.assertFalse(src.refresh(force=True))
+
+    def test_window_uses_raw_for_short_spans(self):
+        self.rows = [self._row(-i * 10, 40.0 + i) for i in range(30, 0, -1)]
+        src = self._source(rollup=False)
+        out = src.window(self.now - 120, self.now, pixels=100)
+        self.assertEqual(out.level, 0)
+        self.assertEqual(out.bucket_s, 0)
+        self.assertTrue(np.all(np.diff(out.t) > 0))
+
+    def test_channel_tuples(self):
+        self.assertIn("outdoor", HEATING_CHANNELS)
+        self.assertEqual(FRONIUS_CHANNELS, ("pv", "load", "grid"))
+
+
+if __name__ == "__main__":
+    unittest.main()
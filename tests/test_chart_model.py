@@ -0,0 +1,173 @@
+"""Unit tests for ui.chart_model – persistent line chart with blitting."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.chart_model import BlitLineChart, sticky_limits, window_moved
+
+
+class _Artist:
+    def __init__(self):
+        self.data = None
+        self.animated = False
+        self.visible = True
+
+    def set_data(self, x, y):
+        self.data = (list(x), list(y))
+
+    def set_animated(self, value):
+        self.animated = value
+
+    def get_visible(self):
+        return self.visible
+
+
+class _Axes:
+    def __init__(self):
+        self.plotted = []
+        self.xlim = (0.0, 1.0)
+        self.ylim = (0.0, 1.0)
+        self.set_xlim_calls = 0
+
+    def plot(self, x, y, **kwargs):
+        line = _Artist()
+        self.plotted.append(kwargs["label"])
+        return [line]
+
+    def get_xlim(self):
+        return self.xlim
+
+    def set_xlim(self, lo, hi):
+        self.set_xlim_calls += 1
+        self.xlim = (lo, hi)
+
+    def get_ylim(self):
+        return self.ylim
+
+    def set_ylim(self, lo, hi):
+        self.ylim = (lo, hi)
+
+
+class _Figure:
+    bbox = "figbbox"
+
+    def __init__(self):
+        self.drawn = []
+
+    def draw_artist(self, artist):
+        self.drawn.append(artist)
+
+
+class _Canvas:
+    def __init__(self):
+        self.callbacks = {}
+        self.draws = 0
+        self.blitted = []
+        self.restored = []
+
+    def mpl_connect(self, event, cb):
+        self.callbacks[event] = cb
+        return 7
+
+    def mpl_disconnect(self, cid):
+        self.callbacks.clear()
+
+    def draw(self):
+        self.draws += 1
+        callback = self.callbacks.get("draw_event")
+        if callback is not None:
+            callback(None)
+
+    def copy_from_bbox(self, bbox):
+        return ("bg", self.draws)
+
+    def restore_region(self, bg):
+        self.restored.append(bg)
+
+    def blit(self, bbox):
+        self.blitted.append(bbox)
+
+
+DEFS = [("top", "Puffer oben", "#fff", "-"), ("outdoor", "Außen", "#aaa", "--")]
+
+
+class TestLimits(unittest.TestCase):
+    def test_sticky_limits_keeps_fitting_range(self):
+        self.assertEqual(sticky_limits((0.0, 100.0), 10.0, 90.0), (0.0, 100.0))
+
+    def test_sticky_limits_grows_and_shrinks(self):
+        lo, hi = sticky_limits((0.0, 100.0), 10.0, 120.0)
+        self.assertAlmostEqual(lo, 4.5)
+        self.assertAlmostEqual(hi, 125.5)
+        # far too wide for the data -> tighten
+        lo, hi = sticky_limits((0.0, 100.0), 40.0, 50.0)
+        self.assertAlmostEqual(lo, 39.5)
+        self.assertAlmostEqual(hi, 50.5)
+
+    def test_sticky_limits_flat_and_missing(self):
+        lo, hi = sticky_limits(None, 20.0, 20.0)
+        self.assertAlmostEqual(lo, 19.9)
+        self.assertAlmostEqual(hi, 20.1)
+        self.assertEqual(sticky_limits((1.0, 2.0), None, None), (1.0, 2.0))
+
+    def test_window_moved(self):
+        self.assertTrue(window_moved(None, (0.0, 100.0)))
+        self.assertFalse(window_moved((0.5, 100.5), (0.0, 100.0)))
+        self.assertTrue(window_moved((2.0, 102.0), (0.0, 100.0)))
+
+
+class TestBlitLineChart(unittest.TestCase):
+    def setUp(self):
+        self.fig = _Figure()
+        self.ax = _Axes()
+        self.canvas = _Canvas()
+        self.chart = BlitLineChart(self.fig, self.ax, self.canvas, DEFS)
+        self.now_line = self.chart.add_overlay(_Artist())
+        self.chart.animate()
+
+    def test_lines_created_once_and_animated(self):
+        self.assertEqual(self.ax.plotted, ["Puffer oben", "Außen"])
+        self.assertTrue(all(a.animated for a in self.chart.lines.values()))
+        self.assertTrue(self.now_line.animated)
+
+    def test_first_redraw_full_then_blit(self):
+        self.assertTrue(self.chart.redraw())
+        self.assertEqual(self.canvas.draws, 1)
+        # background cached on draw_event, animated artists painted on top
+        self.assertEqual(len(self.fig.drawn), 3)
+
+        self.chart.set_series("top", [1, 2], [40.0, 41.0])
+        self.assertFalse(self.chart.redraw())
+        self.assertEqual(self.canvas.draws, 1)
+        self.assertEqual(self.canvas.restored, [("bg", 1)])
+        self.assertEqual(self.canvas.blitted, ["figbbox"])
+        self.assertEqual(self.chart.lines["top"].data, ([1, 2], [40.0, 41.0]))
+
+    def test_limit_changes_force_full_draw(self):
+        self.chart.set_xwindow(0.0, 100.0)
+        self.chart.redraw()
+        # small drift: no new limits, blit only
+        self.assertFalse(self.chart.set_xwindow(0.5, 100.5))
+        self.assertFalse(self.chart.fit_y(0.1, 0.9))
+        self.assertFalse(self.chart.redraw())
+        self.assertTrue(self.chart.fit_y(10.0, 60.0))
+        self.assertTrue(self.chart.redraw())
+        self.assertEqual(self.canvas.draws, 2)
+        self.assertEqual(self.ax.set_xlim_calls, 1)
+
+    def test_hidden_artists_skipped_and_disconnect(self):
+        self.chart.lines["outdoor"].visible = False
+        self.chart.redraw()
+        self.assertNotIn(self.chart.lines["outdoor"], self.fig.drawn)
+        self.chart.disconnect()
+        self.assertEqual(self.canvas.callbacks, {})
+        # without a cached background the next redraw is a full one again
+        self.chart._needs_full = False
+        self.assertTrue(self.chart.redraw())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Unit tests for ui.chart_render – chart rasterization off the Tk thread."""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.workers import LANE_RENDER, WorkerPool
+from ui.chart_render import ChartRenderService, Raster, fit_figure, snapshot
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class _Figure:
+    def __init__(self):
+        self.size = (10.0, 4.8)
+
+    def get_dpi(self):
+        return 100.0
+
+    def get_size_inches(self):
+        return np.array(self.size)
+
+    def set_size_inches(self, w, h, forward=True):
+        self.size = (w, h)
+
+
+class _AggCanvas:
+    def __init__(self, width, height):
+        self.buf = np.zeros((height, width, 4), dtype=np.uint8)
+
+    def buffer_rgba(self):
+        return memoryview(self.buf)
+
+
+class TestRasterHelpers(unittest.TestCase):
+    def test_snapshot_copies_buffer(self):
+        canvas = _AggCanvas(3, 2)
+        raster = snapshot(canvas)
+        self.assertEqual((raster.width, raster.height, len(raster.rgba)), (3, 2, 24))
+        canvas.buf[:] = 255
+        self.assertEqual(raster.rgba[0], 0)
+
+    def test_fit_figure(self):
+        fig = _Figure()
+        self.assertTrue(fit_figure(fig, 800, 400))
+        self.assertEqual(fig.size, (8.0, 4.0))
+        self.assertFalse(fit_figure(fig, 800, 400))
+        # transient relayout sizes are ignored
+        self.assertFalse(fit_figure(fig, 1, 1))
+        self.assertEqual(fig.size, (8.0, 4.0))
+
+
+class TestChartRenderService(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool({LANE_RENDER: 1}, idle_timeout_s=0.2)
+        self.posted = []
+        self.service = ChartRenderService(self.posted.append, pool=self.pool)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def _drain(self):
+        callbacks, self.posted[:] = list(self.posted), []
+        for cb in callbacks:
+            cb()
+
+    def test_renders_in_worker_and_delivers_on_ui_thread(self):
+        render_threads = []
+        shown = []
+
+        def render():
+            render_threads.append(threading.current_thread())
+            return Raster(1, 1, b"\0\0\0\0")
+
+        self.service.request("hist", render, shown.append, name="historical")
+        self.assertTrue(_wait_until(lambda: self.posted))
+        self.assertEqual(shown, [])
+        self._drain()
+        self.assertEqual(len(shown), 1)
+        self.assertIsNot(render_threads[0], threading.current_thread())
+        stats = self.service.stats()["historical"]
+        self.assertEqual((stats.renders, stats.stale), (1, 0))
+
+    def test_newer_request_supersedes_queued_and_running(self):
+        gate = threading.Event()
+        started = threading.Event()
+        shown = []
+
+        def slow():
+            started.set()
+            gate.wait(2.0)
+            return "old"
+
+        self.service.request("hist", slow, shown.append, name="historical")
+        self.assertTrue(started.wait(1.0))
+        self.service.request("hist", lambda: "middle", shown.append, name="historical")
+        self.service.request("hist", lambda: "new", shown.append, name="historical")
+        gate.set()
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_RENDER].completed == 2))
+        self._drain()
+        self.assertEqual(shown, ["new"])
+        self.assertEqual(self.pool.stats()[LANE_RENDER].superseded, 1)
+        self.assertEqual(self.service.stats()["historical"].stale, 1)
+
+    def test_result_dropped_if_newer_request_arrives_before_display(self):
+        shown = []
+        self.service.request("hist", lambda: "old", shown.append)
+        self.assertTrue(_wait_until(lambda: self.posted))
+        self.service.request("hist", lambda: "new", shown.append)
+        self.assertTrue(_wait_until(lambda: len(self.posted) == 2))
+        self._drain()
+        self.assertEqual(shown, ["new"])
+
+    def test_cancel_and_independent_keys(self):
+        shown = []
+        self.service.request("a", lambda: "a", shown.append)
+        self.service.request("b", lambda: "b", shown.append)
+        self.service.cancel("a")
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_RENDER].completed == 2))
+        self._drain()
+        self.assertEqual(shown, ["b"])
+
+    def test_dispose_runs_after_running_render(self):
+        gate = threading.Event()
+        started = threading.Event()
+        order = []
+
+        def slow():
+            started.set()
+            gate.wait(2.0)
+            order.append("render")
+            return "old"
+
+        self.service.request("hist", slow, order.append)
+        self.assertTrue(started.wait(1.0))
+        self.service.dispose("hist", lambda: order.append("teardown"))
+        gate.set()
+        self.assertTrue(_wait_until(lambda: "teardown" in order))
+        self._drain()
+        self.assertEqual(order, ["render", "teardown"])
+
+    def test_failure_is_logged_and_counted(self):
+        def boom():
+            raise RuntimeError("x")
+
+        with self.assertLogs("ui.chart_render", level="ERROR"):
+            self.service.request("hist", boom, lambda _r: None, name="historical")
+            self.assertTrue(_wait_until(lambda: self.service.stats().get("historical") is not None))
+        self.assertEqual(self.service.stats()["historical"].failed, 1)
+        self.assertEqual(self.posted, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Unit tests for ui.chart_zoom – zoom/pan window logic and gesture bindings."""
+
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.chart_zoom import ZoomGesture, ZoomWindow
+
+
+class _Widget:
+    def __init__(self, width=1000):
+        self.width = width
+        self.bindings = {}
+
+    def bind(self, sequence, fn, add=None):
+        self.bindings[sequence] = fn
+
+    def winfo_width(self):
+        return self.width
+
+
+class TestZoomWindow(unittest.TestCase):
+    def test_follows_default_until_changed(self):
+        zoom = ZoomWindow()
+        self.assertFalse(zoom.active)
+        self.assertEqual(zoom.current((0.0, 100.0)), (0.0, 100.0))
+
+    def test_pan_drag_right_shows_older_data(self):
+        zoom = ZoomWindow(min_span=1)
+        self.assertEqual(zoom.pan(100, 1000, (0.0, 1000.0)), (-100.0, 900.0))
+        self.assertTrue(zoom.active)
+
+    def test_zoom_keeps_anchor_fixed(self):
+        zoom = ZoomWindow(min_span=1)
+        start, end = zoom.zoom(0.5, 0.25, (0.0, 1000.0))
+        self.assertEqual((start, end), (125.0, 625.0))
+        self.assertEqual(start + 0.25 * (end - start), 250.0)
+
+    def test_span_and_bounds_clamped(self):
+        zoom = ZoomWindow(min_span=100, max_span=2000)
+        self.assertEqual(zoom.zoom(0.01, 0.5, (0.0, 1000.0)), (450.0, 550.0))
+        zoom.bounds = (0.0, 1000.0)
+        self.assertEqual(zoom.pan(-5000, 1000, (0.0, 1000.0)), (900.0, 1000.0))
+        self.assertEqual(zoom.zoom(10.0, 0.5, (0.0, 1000.0)), (0.0, 1000.0))
+        self.assertTrue(zoom.reset())
+        self.assertFalse(zoom.reset())
+
+
+class TestZoomGesture(unittest.TestCase):
+    def setUp(self):
+        self.widget = _Widget(1000)
+        self.zoom = ZoomWindow(min_span=1)
+        self.changes = []
+        ZoomGesture(self.widget, self.zoom, lambda: (0.0, 800.0), lambda: self.changes.append(self.zoom.view), plot_x=(0.1, 0.9))
+
+    def _fire(self, sequence, x, **kw):
+        self.widget.bindings[sequence](SimpleNamespace(x=x, **kw))
+
+    def test_drag_pans_in_plot_pixels(self):
+        self._fire("<ButtonPress-1>", 500)
+        self._fire("<B1-Motion>", 501)  # Zittern ignorieren
+        self._fire("<B1-Motion>", 580)
+        self._fire("<ButtonRelease-1>", 580)
+        self.assertEqual(self.changes, [(-80.0, 720.0)])
+
+    def test_wheel_zooms_around_pointer_and_double_tap_resets(self):
+        self._fire("<MouseWheel>", 500, delta=120)
+        start, end = self.changes[-1]
+        self.assertAlmostEqual(end - start, 640.0)
+        self.assertAlmostEqual((start + end) / 2, 400.0)
+        self._fire("<Button-5>", 500)
+        self.assertAlmostEqual(self.changes[-1][1] - self.changes[-1][0], 800.0)
+        self._fire("<Double-Button-1>", 500)
+        self.assertIsNone(self.changes[-1])
+        self.assertFalse(self.zoom.active)
+
+
+if __name__ == "__main__":
+    unittest.main()
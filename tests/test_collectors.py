@@ -0,0 +1,175 @@
+"""Unit tests for core.collectors – registry, scheduler cycle and samples storage."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.collectors import (
+    Collector,
+    CollectorScheduler,
+    get_collectors,
+    register_collector,
+    subscribe,
+    unregister_collector,
+)
+from core.datastore import DataStore
+from core.health import get_health_snapshot, get_stage_snapshot
+
+
+class _FakeCollector(Collector):
+    name = "test_fake"
+    interval_s = 0.1
+    schema = ("temp_c", "humidity_pct")
+
+    def __init__(self, values=None, fail=False):
+        self.values = values if values is not None else {"temp_c": 21.5, "humidity_pct": 48.0}
+        self.fail = fail
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("device offline")
+        return dict(self.values)
+
+    def parse(self, raw):
+        if not raw:
+            return None
+        return {"timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"), **raw}
+
+
+class TestCollectorScheduler(unittest.TestCase):
+    def setUp(self):
+        self._tmpfile = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        self._tmpfile.close()
+        self.store = DataStore(db_path=self._tmpfile.name)
+        self.scheduler = CollectorScheduler(store_getter=lambda: self.store)
+
+    def tearDown(self):
+        self.scheduler.stop(timeout=1.0)
+        unregister_collector(_FakeCollector.name)
+        self.store.close()
+        try:
+            os.unlink(self._tmpfile.name)
+        except Exception:
+            pass
+
+    def test_run_once_persists_and_notifies(self):
+        received = []
+        unsubscribe = subscribe(_FakeCollector.name, received.append)
+        try:
+            record = self.scheduler.run_once(_FakeCollector())
+        finally:
+            unsubscribe()
+        self.assertEqual(received, [record])
+        last = self.store.get_last_sample(_FakeCollector.name, "temp_c")
+        self.assertAlmostEqual(last["value"], 21.5)
+        self.assertIsNotNone(get_health_snapshot()[_FakeCollector.name].last_ok)
+        stages = get_stage_snapshot()[_FakeCollector.name]
+        for stage in ("fetch", "parse", "persist", "total"):
+            self.assertIn(stage, stages)
+
+    def test_run_once_failure_updates_health(self):
+        before = getattr(get_health_snapshot().get(_FakeCollector.name), "error_count", 0)
+        self.assertIsNone(self.scheduler.run_once(_FakeCollector(fail=True)))
+        entry = get_health_snapshot()[_FakeCollector.name]
+        self.assertEqual(entry.error_count, before + 1)
+        self.assertEqual(entry.last_error_msg, "device offline")
+
+    def test_none_values_skipped(self):
+        self.scheduler.run_once(_FakeCollector(values={"temp_c": 20.0, "humidity_pct": None}))
+        self.assertIsNone(self.store.get_last_sample(_FakeCollector.name, "humidity_pct"))
+
+    def test_registry_and_loop(self):
+        fake = _FakeCollector()
+        register_collector(fake)
+        self.assertIs(get_collectors()[fake.name], fake)
+        self.scheduler.start()
+        deadline = time.monotonic() + 2.0
+        while fake.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertGreaterEqual(fake.calls, 2)
+
+    def test_stop_waits_for_running_cycle(self):
+        import threading
+        started = threading.Event()
+        persisted = []
+
+        class _Slow(_FakeCollector):
+            def persist(self, store, record):
+                started.set()
+                time.sleep(0.3)
+                super().persist(store, record)
+                persisted.append(record)
+
+        register_collector(_Slow())
+        self.scheduler.start()
+        self.assertTrue(started.wait(2.0))
+        self.scheduler.stop(timeout=2.0)
+        self.assertEqual(len(persisted), 1)
+        # Store kann jetzt gefahrlos geschlossen werden
+        self.store.close()
+        self.assertIsNone(self.store.conn)
+
+    def test_stop_flushes_pending_record(self):
+        class _Buffered(_FakeCollector):
+            def on_stop(self):
+                return self.parse({"temp_c": 19.0, "humidity_pct": 40.0})
+
+        register_collector(_Buffered())
+        self.scheduler.stop(timeout=1.0)
+        last = self.store.get_last_sample(_FakeCollector.name, "temp_c")
+        self.assertAlmostEqual(last["value"], 19.0)
+
+    def test_fetch_is_abstract(self):
+        class _Incomplete(Collector):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            _Incomplete()
+
+    def test_register_requires_name(self):
+        class _Unnamed(_FakeCollector):
+            name = ""
+
+        with self.assertRaises(ValueError):
+            register_collector(_Unnamed())
+
+
+class TestSamplesRollup(unittest.TestCase):
+    def setUp(self):
+        self._tmpfile = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        self._tmpfile.close()
+        self.store = DataStore(db_path=self._tmpfile.name)
+
+    def tearDown(self):
+        self.store.close()
+        try:
+            os.unlink(self._tmpfile.name)
+        except Exception:
+            pass
+
+    def test_rollup_buckets(self):
+        base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+        for i, val in enumerate((10.0, 20.0, 30.0)):
+            ts = (base + timedelta(minutes=i * 10)).strftime("%Y-%m-%d %H:%M:%S")
+            self.store.insert_samples("src", ts, {"ch": val})
+        ts = (base + timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        self.store.insert_samples("src", ts, {"ch": 5.0})
+
+        rollup = self.store.get_sample_rollup("src", "ch", hours=4, bucket_minutes=60)
+        self.assertEqual(len(rollup), 2)
+        self.assertEqual(rollup[0]["bucket"], base.strftime("%Y-%m-%d %H:%M:%S"))
+        self.assertAlmostEqual(rollup[0]["avg"], 20.0)
+        self.assertEqual((rollup[0]["min"], rollup[0]["max"], rollup[0]["count"]), (10.0, 30.0, 3))
+        self.assertEqual(len(self.store.get_samples("src", "ch", hours=4)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,38 @@
 """Unit tests for core.datastore – DataStore CRUD and retention cleanup."""
 
+import math
 import os
 import sys
 import tempfile
+import time
 import unittest
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Ensure src/ is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+from core.bmk_channels import parse_many
 from core.datastore import DataStore
 
 
+@contextmanager
+def _local_tz(name):
+    """Prozess-Zeitzone für die Dauer des Blocks umstellen."""
+    old = os.environ.get("TZ")
+    os.environ["TZ"] = name
+    time.tzset()
+    try:
+        yield
+    finally:
+        if old is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = old
+        time.tzset()
+
+
 class TestDataStoreBasic(unittest.TestCase):
     """Basic insert / read / cleanup operations on an in-memory-like temp DB."""
 
@@ -48,6 +68,22 @@ class TestDataStoreBasic(unittest.TestCase):
         self.assertEqual(rec["timestamp"], ts)
         self.assertAlmostEqual(rec["pv_power_kw"], 3.5, places=1)
 
+    def test_envelope_normalized_to_kw(self):
+        self.store.insert_fronius_record({
+            "timestamp": "2025-06-15 12:00:00",
+            "pv": 3200.0, "pv_min": 150.0, "pv_max": 5400.0,
+            "grid": -1.2, "grid_min": -2.0, "grid_max": 0.5,
+            "soc": 45.0, "soc_min": 40.0, "soc_max": 300.0,
+            "samples": 12,
+        })
+        row = self.store.get_fronius_envelope(hours=None)[-1]
+        self.assertAlmostEqual(row["pv"], 3.2)
+        self.assertAlmostEqual(row["pv_min"], 0.15)
+        self.assertAlmostEqual(row["pv_max"], 5.4)
+        self.assertAlmostEqual(row["grid_min"], -2.0)
+        self.assertAlmostEqual(row["grid_max"], 0.5)
+        self.assertEqual((row["soc_min"], row["soc_max"]), (40.0, 300.0))
+
     def test_fronius_cache_invalidation(self):
         self.store.insert_fronius_record({
             "Zeitstempel": "2025-06-15 12:00:00",
@@ -61,8 +97,38 @@ class TestDataStoreBasic(unittest.TestCase):
         rec2 = self.store.get_last_fronius_record()
         self.assertEqual(rec2["timestamp"], "2025-06-15 12:01:00")
 
+    def test_aware_timestamp_stored_as_utc(self):
+        self.store.insert_fronius_record({
+            "Zeitstempel": "2025-06-15T14:00:00+02:00",
+            "PV-Leistung (kW)": 1.0,
+        })
+        self.assertEqual(self.store.get_last_fronius_record()["timestamp"], "2025-06-15 12:00:00")
+
     # --- Heating ---
 
+    def test_legacy_timestamps_migrated_to_utc(self):
+        import sqlite3
+        self.store.close()
+        conn = sqlite3.connect(self._tmpfile.name)
+        # Alt-Zeilen: Heizung mit Offset bzw. naiv, Fronius naiv in Ortszeit (Sommer und Winter)
+        conn.execute("INSERT INTO heating (timestamp, kesseltemp) VALUES ('2025-06-15T14:00:00.123456+02:00', 60.0)")
+        conn.execute("INSERT INTO heating (timestamp, kesseltemp) VALUES ('2025-01-15 13:00:00', 55.0)")
+        conn.execute("INSERT INTO fronius (timestamp, pv_power) VALUES ('2025-06-15 14:00:00', 1.0)")
+        conn.execute("INSERT INTO fronius (timestamp, pv_power) VALUES ('2025-01-15 13:10:00', 2.0)")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+        with _local_tz("Europe/Vienna"):
+            self.store = DataStore(db_path=self._tmpfile.name)
+        heating = self.store.conn.execute("SELECT timestamp FROM heating ORDER BY timestamp").fetchall()
+        self.assertEqual(heating, [("2025-01-15 12:00:00",), ("2025-06-15 12:00:00",)])
+        fronius = self.store.conn.execute("SELECT timestamp, pv_power FROM fronius ORDER BY timestamp").fetchall()
+        self.assertEqual(fronius, [("2025-01-15 12:10:00", 2.0), ("2025-06-15 12:00:00", 1.0)])
+        # Einmalig: ein weiterer Start verschiebt nichts mehr
+        self.store.close()
+        self.store = DataStore(db_path=self._tmpfile.name)
+        self.assertEqual(self.store.conn.execute("SELECT MIN(timestamp) FROM fronius").fetchone()[0], "2025-01-15 12:10:00")
+
     def test_insert_and_read_heating(self):
         ts = "2025-06-15 12:00:00"
         self.store.insert_heating_record({
@@ -79,6 +145,46 @@ class TestDataStoreBasic(unittest.TestCase):
         self.assertEqual(rec["timestamp"], ts)
         self.assertAlmostEqual(rec["bmk_kessel_c"], 75.0, places=1)
 
+    def test_heating_channels_roundtrip(self):
+        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self.store.insert_heating_record({
+            "Zeitstempel": ts,
+            "Kesseltemperatur": 75.0,
+            "Rauchgastemperatur": 140.5,
+            "Heizkreispumpe_EG": 1.0,
+            "Betriebsstunden": 12345.0,
+        })
+        data = self.store.get_heating_channels(["Rauchgastemperatur", 53, "Wert_54"], hours=1)
+        self.assertEqual(data["timestamp"], [ts])
+        self.assertAlmostEqual(float(data["Rauchgastemperatur"][0]), 140.5, places=3)
+        self.assertAlmostEqual(float(data["Betriebsstunden"][0]), 12345.0, places=1)
+        self.assertTrue(math.isnan(data["Wert_54"][0]))
+
+    def test_heating_channels_skipped_without_channel_keys(self):
+        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self.store.insert_heating_record({"Zeitstempel": ts, "kesseltemp": 60.0})
+        data = self.store.get_heating_channels(hours=1)
+        self.assertEqual(data["timestamp"], [])
+        self.assertEqual(len(data["Kesseltemperatur"]), 0)
+
+    def test_insert_heating_samples_bulk(self):
+        base = datetime.now(timezone.utc)
+        payloads = [
+            ((base - timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"), f"0\n{60 + i}\n5\n0\n55\n45\n35\n")
+            for i in range(3)
+        ]
+        written = self.store.insert_heating_samples(parse_many(payloads))
+        self.assertEqual(written, 3)
+        rec = self.store.get_last_heating_record()
+        self.assertAlmostEqual(rec["bmk_kessel_c"], 60.0, places=1)
+        self.assertAlmostEqual(rec["buf_top_c"], 55.0, places=1)
+        data = self.store.get_heating_channels(["Kesseltemperatur"], hours=1)
+        self.assertEqual(list(data["Kesseltemperatur"]), [62.0, 61.0, 60.0])
+
+    def test_heating_channels_unknown_channel(self):
+        with self.assertRaises(KeyError):
+            self.store.get_heating_channels(["NichtVorhanden"])
+
     # --- Recent queries ---
 
     def test_get_recent_fronius(self):
@@ -103,6 +209,46 @@ class TestDataStoreBasic(unittest.TestCase):
         recent = self.store.get_recent_heating(hours=1)
         self.assertGreaterEqual(len(recent), 5)
 
+    def test_rows_since_are_incremental(self):
+        for minute in range(3):
+            self.store.insert_heating_record({
+                "Zeitstempel": f"2025-06-15 12:0{minute}:00",
+                "Pufferspeicher Oben": 50.0 + minute,
+            })
+            self.store.insert_fronius_record({
+                "Zeitstempel": f"2025-06-15 12:0{minute}:00",
+                "PV-Leistung (kW)": float(minute),
+            })
+        heating = self.store.get_heating_since(None)
+        self.assertEqual([r["top"] for r in heating], [50.0, 51.0, 52.0])
+        newer = self.store.get_heating_since("2025-06-15 12:01:00")
+        self.assertEqual([r["timestamp"] for r in newer], ["2025-06-15 12:02:00"])
+        fronius = self.store.get_fronius_since("2025-06-15 12:00:00")
+        self.assertEqual([r["pv"] for r in fronius], [1.0, 2.0])
+        # without since: the hours window applies (records above are old)
+        self.assertEqual(self.store.get_fronius_since(None, hours=1), [])
+
+    def test_rollup_buckets_with_expressions(self):
+        for minute, value in enumerate([50.0, 0.0, 54.0, 60.0]):
+            self.store.insert_heating_record({
+                "Zeitstempel": f"2025-06-15 12:0{minute * 3}:00",
+                "Pufferspeicher Oben": value,
+            })
+        rows = self.store.get_rollup(
+            "heating",
+            {"top": "CASE WHEN puffer_top != 0 THEN puffer_top END"},
+            bucket_s=300,
+            before="2025-06-15 12:09:00",
+        )
+        self.assertEqual(len(rows), 2)
+        first, second = rows
+        self.assertEqual(first["bucket"] % 300, 0)
+        # 12:00 + 12:03 (0.0 counts as missing)
+        self.assertEqual((first["top_avg"], first["top_count"]), (50.0, 1))
+        self.assertEqual((second["top_min"], second["top_max"], second["top_count"]), (54.0, 54.0, 1))
+        with self.assertRaises(ValueError):
+            self.store.get_rollup("samples; DROP", {"x": "1"}, 60)
+
     # --- Cleanup / Retention ---
 
     def test_cleanup_old_records(self):
@@ -144,6 +290,20 @@ class TestDataStoreBasic(unittest.TestCase):
         self.assertGreaterEqual(len(daily), 1)
         self.assertIn("pv_kwh", daily[0])
 
+    def test_daily_totals_bucket_by_local_day(self):
+        # 21:30–22:30 UTC = 23:30–00:30 in Wien (Sommerzeit), 2 kW konstant
+        start = datetime(2025, 6, 14, 21, 30, tzinfo=timezone.utc)
+        for i in range(5):
+            self.store.insert_fronius_record({
+                "timestamp": start + timedelta(minutes=15 * i),
+                "PV-Leistung (kW)": 2.0,
+            })
+        with _local_tz("Europe/Vienna"):
+            daily = self.store.get_daily_totals(days=None)
+        self.assertEqual([d["day"] for d in daily], ["2025-06-14", "2025-06-15"])
+        self.assertAlmostEqual(daily[0]["pv_kwh"], 1.0)
+        self.assertAlmostEqual(daily[1]["pv_kwh"], 1.0)
+
     def test_monthly_totals(self):
         base = datetime.now(timezone.utc)
         # Insert records every 6 hours for 60 days so trapezoid integration works
@@ -171,6 +331,14 @@ class TestDataStoreBasic(unittest.TestCase):
         ts = self.store.get_latest_timestamp()
         self.assertIsNone(ts)
 
+    def test_table_latest_timestamp(self):
+        self.assertIsNone(self.store.get_table_latest_timestamp("fronius"))
+        for ts in ("2025-06-15 12:00:00", "2025-06-15 12:00:10"):
+            self.store.insert_fronius_record({"Zeitstempel": ts, "PV-Leistung (kW)": 1.0})
+        self.assertEqual(self.store.get_table_latest_timestamp("fronius"), "2025-06-15 12:00:10")
+        with self.assertRaises(ValueError):
+            self.store.get_table_latest_timestamp("samples; DROP TABLE fronius")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for tools/device_simulator.py – local Fronius/BMK stand-in server."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from core import BMKDATEN, Wechselrichter
+from core.bmk_channels import CHANNEL_COUNT
+from device_simulator import SimulatorConfig, start_simulator
+
+
+class TestDeviceSimulator(unittest.TestCase):
+    def _start(self, **kwargs):
+        server, _ = start_simulator(config=SimulatorConfig(seed=1, **kwargs))
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_synthetic_fronius_parses(self):
+        server = self._start(speed=100.0)
+        record = Wechselrichter.parse(Wechselrichter.fetch_raw(server.url_for("pv")))
+        self.assertIsNotNone(record)
+        self.assertGreaterEqual(record["PV-Leistung (kW)"], 0.0)
+        self.assertTrue(0.0 <= record["Batterieladestand (%)"] <= 100.0)
+
+    def test_synthetic_bmk_parses(self):
+        server = self._start()
+        sample = BMKDATEN.parse(BMKDATEN.fetch_raw(server.url_for("heating")))
+        self.assertIsNotNone(sample)
+        self.assertEqual(len(sample.channels), CHANNEL_COUNT)
+        self.assertIsNotNone(sample.kessel)
+        self.assertIsNotNone(sample.puffer_oben)
+
+    def test_error_injection(self):
+        server = self._start(error_rate=1.0)
+        self.assertIsNone(Wechselrichter.fetch_raw(server.url_for("pv")))
+        self.assertIsNone(BMKDATEN.fetch_raw(server.url_for("heating")))
+
+    def test_replay_cycles_recording(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False, encoding="utf-8") as f:
+            for kessel in (61.0, 62.0):
+                f.write(json.dumps({"source": "heating", "status": 200, "body": f"1\n{kessel}\n"}) + "\n")
+            path = f.name
+        self.addCleanup(os.unlink, path)
+        server = self._start(replay_path=path)
+        values = [BMKDATEN.parse(BMKDATEN.fetch_raw(server.url_for("heating"))).kessel for _ in range(3)]
+        self.assertEqual(values, [61.0, 62.0, 61.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
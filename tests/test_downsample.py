@@ -0,0 +1,137 @@
+"""Unit tests for core.downsample – LTTB and min/max envelope selection."""
+
+import sys
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.downsample import (
+    MINMAX,
+    downsample,
+    downsample_pairs,
+    envelope,
+    lttb_indices,
+    minmax_indices,
+    select,
+    select_union,
+)
+
+
+def _lttb_reference(x, y, threshold):
+    """Straight port of the original LTTB description (Steinarsson 2013)."""
+    n = len(x)
+    every = (n - 2) / (threshold - 2)
+    out = [0]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = np.mean(x[avg_start:avg_end])
+        avg_y = np.mean(y[avg_start:avg_end])
+        start = int(np.floor(i * every)) + 1
+        end = int(np.floor((i + 1) * every)) + 1
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(best)
+        a = best
+    out.append(n - 1)
+    return out
+
+
+class TestLttb(unittest.TestCase):
+    def test_matches_reference(self):
+        rng = np.random.default_rng(3)
+        x = np.arange(997, dtype=float)
+        y = np.cumsum(rng.normal(size=997))
+        self.assertEqual(lttb_indices(x, y, 100).tolist(), _lttb_reference(x, y, 100))
+
+    def test_keeps_spike_and_point_budget(self):
+        x = np.arange(20000, dtype=float)
+        y = np.sin(x / 400.0)
+        y[12345] = 25.0
+        idx = lttb_indices(x, y, 500)
+        self.assertEqual(len(idx), 500)
+        self.assertIn(12345, idx)
+        self.assertEqual((idx[0], idx[-1]), (0, 19999))
+
+    def test_short_series_unchanged_and_gaps_kept(self):
+        self.assertEqual(lttb_indices([0, 1, 2], [1, 2, 3], 10).tolist(), [0, 1, 2])
+        x = np.arange(1000, dtype=float)
+        y = np.ones(1000)
+        y[400:450] = np.nan
+        idx = lttb_indices(x, y, 50)
+        self.assertIn(400, idx)
+        self.assertEqual(int(np.isnan(y[idx]).sum()), 1)
+
+
+class TestMinMax(unittest.TestCase):
+    def test_every_bucket_extreme_kept(self):
+        rng = np.random.default_rng(5)
+        y = rng.normal(size=10000)
+        idx = minmax_indices(np.arange(10000.0), y, 100)
+        self.assertLessEqual(len(idx), 202)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+        self.assertEqual(y[idx].max(), y.max())
+        self.assertEqual(y[idx].min(), y.min())
+        for b in range(100):
+            chunk = y[b * 100:(b + 1) * 100]
+            self.assertIn(b * 100 + int(np.argmax(chunk)), idx)
+            self.assertIn(b * 100 + int(np.argmin(chunk)), idx)
+
+
+class TestHelpers(unittest.TestCase):
+    def test_select_methods(self):
+        x = np.arange(5000.0)
+        y = np.cos(x / 50.0)
+        self.assertLessEqual(len(select(x, y, 200, MINMAX)), 202)
+        with self.assertRaises(ValueError):
+            select(x, y, 200, "mean")
+
+    def test_union_shares_x_axis(self):
+        x = np.arange(3000.0)
+        a = np.zeros(3000)
+        a[100] = 5.0
+        b = np.zeros(3000)
+        b[2000] = -5.0
+        idx = select_union(x, (a, b), 100)
+        self.assertIn(100, idx)
+        self.assertIn(2000, idx)
+        self.assertLessEqual(len(idx), 200)
+
+    def test_envelope_keeps_bucket_extremes(self):
+        x = np.arange(4000.0)
+        avg = np.full(4000, 50.0)
+        lo, hi = avg - 1.0, avg + 1.0
+        hi[2500] = 80.0  # Aufheizspitze innerhalb eines Buckets, im Mittel unsichtbar
+        lo[1000:1010] = np.nan
+        hi[1000:1010] = np.nan
+        xs, ys = envelope(x, lo, hi, 400)
+        self.assertLessEqual(len(xs), 402 + 1)
+        self.assertEqual(np.nanmax(ys), 80.0)
+        self.assertEqual(np.nanmin(ys), 49.0)
+        self.assertTrue(np.isnan(ys).any())
+        self.assertTrue(np.all(np.diff(xs) >= 0))
+        # steigender Trend: erst Min, dann Max
+        xs, ys = envelope([0.0, 1.0], [1.0, 3.0], [2.0, 4.0], 100)
+        self.assertEqual(ys.tolist(), [1.0, 2.0, 3.0, 4.0])
+
+    def test_downsample_and_pairs(self):
+        xs, ys = downsample(np.arange(1000.0), np.arange(1000.0), 10)
+        self.assertEqual(len(xs), 10)
+        start = datetime(2026, 1, 1)
+        pairs = [(start + timedelta(minutes=i), float(i % 7)) for i in range(600)]
+        thinned = downsample_pairs(pairs, 60, MINMAX)
+        self.assertLessEqual(len(thinned), 62)
+        self.assertIs(thinned[0], pairs[0])
+        self.assertEqual(downsample_pairs(pairs[:5], 60), pairs[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""Unit tests for ui.views.flow_overlay – animated energy-flow layer as canvas items."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.views.flow_overlay import (
+    DOT_COUNT,
+    PHASE_FRAMES,
+    CycleCache,
+    Flow,
+    FlowOverlay,
+    blend,
+    build_cycle,
+    dot_boxes,
+    edge_points,
+    frame_index,
+    glow_width,
+    phase_at,
+    quantize_watts,
+)
+
+
+class _Canvas:
+    def __init__(self):
+        self.items = {}
+        self.calls = []
+        self._next = 0
+
+    def _create(self, kind, coords, kwargs):
+        self._next += 1
+        self.items[self._next] = {"kind": kind, "coords": list(coords), **kwargs}
+        self.calls.append(("create", kind))
+        return self._next
+
+    def create_line(self, *coords, **kwargs):
+        return self._create("line", coords, kwargs)
+
+    def create_oval(self, *coords, **kwargs):
+        return self._create("oval", coords, kwargs)
+
+    def create_polygon(self, *coords, **kwargs):
+        return self._create("polygon", coords, kwargs)
+
+    def coords(self, item, *coords):
+        self.items[item]["coords"] = list(coords)
+        self.calls.append(("coords", item))
+
+    def itemconfigure(self, item, **kwargs):
+        self.items[item].update(kwargs)
+        self.calls.append(("itemconfigure", item))
+
+    def delete(self, tag):
+        self.items = {k: v for k, v in self.items.items() if v.get("tags") != tag}
+        self.calls.append(("delete", tag))
+
+
+class TestGeometry(unittest.TestCase):
+    def test_blend_against_backdrop(self):
+        self.assertEqual(blend("#ffffff", 255, (0, 0, 0)), "#ffffff")
+        self.assertEqual(blend("#ffffff", 0, (16, 32, 48)), "#102030")
+        self.assertEqual(blend("#ff0000", 128, (0, 0, 0)), "#800000")
+
+    def test_edge_points_inset_by_offset(self):
+        start, end = edge_points((0, 0), (100, 0), 10)
+        self.assertEqual((start, end), ((10.0, 0.0), (90.0, 0.0)))
+
+    def test_dots_follow_phase_along_edge(self):
+        boxes = dot_boxes((0, 0), (100, 0), phase=0.0, strength=1.0)
+        self.assertEqual(len(boxes), DOT_COUNT)
+        centers = [(b[0] + b[2]) / 2 for b in boxes]
+        self.assertEqual([round(c) for c in centers], [0, 20, 40, 60, 80])
+        moved = dot_boxes((0, 0), (100, 0), phase=0.1, strength=1.0)
+        self.assertAlmostEqual((moved[0][0] + moved[0][2]) / 2, 10.0)
+
+    def test_glow_width_pulses(self):
+        self.assertEqual(glow_width(4.0, 0.0), 6)
+        self.assertEqual(glow_width(4.0, 1.0), 8)
+
+
+class TestCycle(unittest.TestCase):
+    def test_phase_and_frame_index(self):
+        self.assertAlmostEqual(phase_at(0), 0.5)
+        self.assertAlmostEqual(phase_at(PHASE_FRAMES // 4), 1.0)
+        self.assertEqual(frame_index(0.0), 0)
+        # 0.7 Hz: one cycle every 1/0.7 s
+        self.assertEqual(frame_index(1 / 0.7), 0)
+        self.assertEqual(frame_index(0.5 / 0.7), PHASE_FRAMES // 2)
+
+    def test_quantize_watts(self):
+        self.assertEqual(quantize_watts(1449.0), 1400.0)
+        self.assertEqual(quantize_watts(-630.0), -600.0)
+        a = Flow((0, 0), (1, 1), "#fff", quantize_watts(1510.0))
+        b = Flow((0, 0), (1, 1), "#fff", quantize_watts(1490.0))
+        self.assertEqual(a, b)
+
+    def test_build_cycle_shape(self):
+        flows = [Flow((0, 0), (100, 0), "#00ff00", 3000.0)]
+        cycle = build_cycle(flows, (0, 0, 0))
+        self.assertEqual(len(cycle), PHASE_FRAMES)
+        width, color, boxes = cycle[0][0]
+        self.assertEqual((width, len(boxes)), (glow_width(flows[0].width, 0.5), DOT_COUNT))
+        self.assertTrue(color.startswith("#"))
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = CycleCache((0, 0, 0), maxsize=2)
+        states = [(Flow((0, 0), (10, 0), "#ffffff", w),) for w in (100.0, 200.0, 300.0)]
+        first = cache.get(states[0])
+        cache.get(states[1])
+        self.assertIs(cache.get(states[0]), first)
+        cache.get(states[2])
+        self.assertEqual(len(cache), 2)
+        cache.get(states[1])
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+
+class TestFlowOverlay(unittest.TestCase):
+    def setUp(self):
+        self.canvas = _Canvas()
+        self.overlay = FlowOverlay(self.canvas, backdrop="#000000")
+        self.flows = [Flow((0, 0), (100, 0), "#00ff00", 1500.0), Flow((0, 50), (100, 50), "#0000ff", -600.0)]
+
+    def test_items_created_once_per_flow_set(self):
+        self.overlay.set_flows(self.flows)
+        per_flow = 4 + DOT_COUNT
+        self.assertEqual(len(self.canvas.items), 2 * per_flow)
+        self.canvas.calls.clear()
+        self.overlay.set_flows(list(self.flows))
+        self.assertEqual(self.canvas.calls, [])
+
+    def test_animate_only_moves_items(self):
+        self.overlay.set_flows(self.flows)
+        self.canvas.calls.clear()
+        self.overlay.animate(3)
+        kinds = {call[0] for call in self.canvas.calls}
+        self.assertEqual(kinds, {"coords", "itemconfigure"})
+        self.assertEqual(sum(1 for c in self.canvas.calls if c[0] == "coords"), 2 * DOT_COUNT)
+
+    def test_animate_applies_precomputed_frame(self):
+        self.overlay.set_flows(self.flows)
+        self.overlay.animate(5)
+        expected = build_cycle(self.flows, (0, 0, 0))[5]
+        first_dot = self.overlay._items[0]["dots"][0]
+        self.assertEqual(self.canvas.items[first_dot]["coords"], expected[0][2][0])
+        # same frame again: nothing to do
+        self.canvas.calls.clear()
+        self.overlay.animate(5 + PHASE_FRAMES)
+        self.assertEqual(self.canvas.calls, [])
+
+    def test_cycles_cached_per_flow_state(self):
+        self.overlay.set_flows(self.flows)
+        self.overlay.set_flows(self.flows[:1])
+        self.overlay.set_flows(self.flows)
+        self.assertEqual((self.overlay.cycles.misses, self.overlay.cycles.hits), (2, 1))
+
+    def test_changed_flows_replace_items_and_clear(self):
+        self.overlay.set_flows(self.flows)
+        self.overlay.set_flows(self.flows[:1])
+        self.assertIn(("delete", "flow"), self.canvas.calls)
+        self.assertEqual(len(self.canvas.items), 4 + DOT_COUNT)
+        self.overlay.clear()
+        self.assertEqual(self.canvas.items, {})
+        self.assertEqual(self.overlay.flows, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""Unit tests for ui.frame_budget – cooperative per-frame time budget."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.frame_budget import PRIORITY_HIGH, PRIORITY_LOW, FrameScheduler
+
+
+class _FakeRoot:
+    def __init__(self):
+        self.idle = []
+        self.timers = []
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def after(self, ms, callback):
+        self.timers.append((ms, callback))
+        return len(self.timers)
+
+    def run_idle(self):
+        callbacks, self.idle = self.idle, []
+        for cb in callbacks:
+            cb()
+
+    def next_frame(self):
+        """Fire pending timers, then the idle callbacks they scheduled."""
+        timers, self.timers = self.timers, []
+        for _ms, cb in timers:
+            cb()
+        self.run_idle()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def spend(self, ms):
+        self.now += ms / 1000.0
+
+
+class TestFrameScheduler(unittest.TestCase):
+    def setUp(self):
+        self.root = _FakeRoot()
+        self.clock = _Clock()
+        self.sched = FrameScheduler(self.root, budget_ms=10.0, clock=self.clock)
+
+    def _job(self, log, name, ms):
+        def run():
+            self.clock.spend(ms)
+            log.append(name)
+        return run
+
+    def test_jobs_run_when_idle(self):
+        log = []
+        self.sched.submit("a", self._job(log, "a", 1))
+        self.assertEqual(log, [])
+        self.assertEqual(len(self.root.idle), 1)
+        self.root.run_idle()
+        self.assertEqual(log, ["a"])
+        self.assertEqual(self.sched.pending, 0)
+
+    def test_budget_splits_work_across_frames(self):
+        log = []
+        for name in "abc":
+            self.sched.submit(name, self._job(log, name, 6))
+        self.root.run_idle()
+        # a (6 ms) + b (12 ms >= budget) -> c waits for the next frame
+        self.assertEqual(log, ["a", "b"])
+        self.assertEqual(self.root.timers[0][0], 16)
+        self.root.next_frame()
+        self.assertEqual(log, ["a", "b", "c"])
+
+    def test_single_slow_job_still_runs_and_is_reported(self):
+        log = []
+        self.sched.submit("slow", self._job(log, "slow", 50))
+        self.sched.submit("fast", self._job(log, "fast", 1))
+        self.root.run_idle()
+        self.assertEqual(log, ["slow"])
+        worst = self.sched.worst(1)[0]
+        self.assertEqual((worst.name, worst.max_ms, worst.over_budget), ("slow", 50.0, 1))
+        with self.assertLogs("ui.frame_budget", level="INFO"):
+            self.sched.log_report()
+
+    def test_priority_order(self):
+        log = []
+        self.sched.submit("chart", self._job(log, "chart", 1), priority=PRIORITY_LOW)
+        self.sched.submit("flow", self._job(log, "flow", 1), priority=PRIORITY_HIGH)
+        self.root.run_idle()
+        self.assertEqual(log, ["flow", "chart"])
+
+    def test_generator_chunks_yield_between_frames(self):
+        log = []
+
+        def plot():
+            self.clock.spend(8)
+            log.append("load")
+            yield
+            self.clock.spend(8)
+            log.append("artists")
+            yield
+            self.clock.spend(8)
+            log.append("draw")
+
+        self.sched.submit("plot", plot)
+        self.root.run_idle()
+        self.assertEqual(log, ["load", "artists"])
+        self.root.next_frame()
+        self.assertEqual(log, ["load", "artists", "draw"])
+        self.assertEqual(self.sched.stats()["plot"].count, 3)
+        self.assertEqual(self.sched.pending, 0)
+
+    def test_same_key_replaces_pending_and_running_generator(self):
+        log = []
+        closed = []
+
+        def plot(tag):
+            def gen():
+                try:
+                    self.clock.spend(20)
+                    log.append(tag + ":load")
+                    yield
+                    log.append(tag + ":draw")
+                finally:
+                    closed.append(tag)
+            return gen
+
+        self.sched.submit("plot", plot("old"), key="plot")
+        self.root.run_idle()
+        self.assertEqual(log, ["old:load"])
+        self.sched.submit("plot", plot("new"), key="plot")
+        self.assertEqual(closed, ["old"])
+        self.root.next_frame()
+        self.root.next_frame()
+        self.assertEqual(log, ["old:load", "new:load", "new:draw"])
+
+    def test_failing_job_is_logged_and_removed(self):
+        def boom():
+            raise RuntimeError("x")
+
+        self.sched.submit("boom", boom)
+        with self.assertLogs("ui.frame_budget", level="ERROR"):
+            self.root.run_idle()
+        self.assertEqual(self.sched.pending, 0)
+
+    def test_after_and_measure(self):
+        log = []
+        self.sched.after(60000, "tick", self._job(log, "tick", 1), key="tick")
+        ms, cb = self.root.timers.pop()
+        self.assertEqual(ms, 60000)
+        cb()
+        self.root.run_idle()
+        self.assertEqual(log, ["tick"])
+        self.assertEqual(self.sched.measure("m", lambda x: x * 2, 21), 42)
+        self.assertEqual(self.sched.stats()["m"].count, 1)
+
+    def test_for_root_is_shared(self):
+        root = _FakeRoot()
+        self.assertIs(FrameScheduler.for_root(root), FrameScheduler.for_root(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Unit tests for core.health – stage timing statistics."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.health import HISTOGRAM_BOUNDS_MS, get_stage_snapshot, record_stage
+
+
+class TestStageTimings(unittest.TestCase):
+    def test_percentiles_and_histogram(self):
+        for ms in range(1, 101):
+            record_stage("test_stage_src", "fetch", float(ms))
+        stats = get_stage_snapshot()["test_stage_src"]["fetch"]
+        self.assertEqual(stats.count, 100)
+        self.assertEqual(stats.last_ms, 100.0)
+        self.assertAlmostEqual(stats.p50_ms, 50.0, delta=1.0)
+        self.assertAlmostEqual(stats.p95_ms, 95.0, delta=1.0)
+        self.assertEqual(stats.max_ms, 100.0)
+        self.assertEqual(sum(stats.histogram.values()), 100)
+        self.assertEqual(stats.histogram["<=1"], 1)
+        self.assertEqual(stats.histogram[f"<={HISTOGRAM_BOUNDS_MS[-1]}"], 0)
+
+    def test_window_is_bounded(self):
+        for _ in range(1000):
+            record_stage("test_stage_window", "parse", 0.5)
+        stats = get_stage_snapshot()["test_stage_window"]["parse"]
+        self.assertLess(stats.count, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for ui.lazy_tabs – deferred import and construction of tabs."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.lazy_tabs import LazyTabRegistry, TabSpec
+
+
+class _FakeTabview:
+    def __init__(self):
+        self.frames = {}
+
+    def add(self, name):
+        self.frames[name] = object()
+        return self.frames[name]
+
+    def tab(self, name):
+        return self.frames[name]
+
+
+class _FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, _ms, callback):
+        self.scheduled.append(callback)
+
+    def after_idle(self, callback):
+        self.scheduled.append(callback)
+
+    def run_all(self):
+        while self.scheduled:
+            self.scheduled.pop(0)()
+
+
+def _spec(name, module="collections", class_name="OrderedDict", eager=False, builds=None):
+    def build(cls, frame):
+        if builds is not None:
+            builds.append(name)
+        return cls(frame=frame)
+
+    return TabSpec(name, module, class_name, build, attr=name.lower(), eager=eager)
+
+
+class TestLazyTabRegistry(unittest.TestCase):
+    def test_add_is_cheap_until_ensure(self):
+        builds = []
+        registry = LazyTabRegistry(_FakeTabview())
+        registry.add(_spec("Spotify", builds=builds))
+        self.assertFalse(registry.is_built("Spotify"))
+        self.assertEqual(builds, [])
+
+        tab = registry.ensure("Spotify")
+        self.assertEqual(tab["frame"], registry._tabview.tab("Spotify"))
+        self.assertEqual(builds, ["Spotify"])
+        # second selection reuses the instance
+        self.assertIs(registry.ensure("Spotify"), tab)
+        self.assertEqual(builds, ["Spotify"])
+
+        (timing,) = registry.report()
+        self.assertEqual((timing.name, timing.trigger, timing.ok), ("Spotify", "select", True))
+        self.assertGreaterEqual(timing.import_ms, 0.0)
+
+    def test_eager_tab_built_on_add_and_reported(self):
+        built = []
+        prepared = []
+        registry = LazyTabRegistry(
+            _FakeTabview(),
+            prepare_frame=prepared.append,
+            on_built=lambda spec, tab: built.append(spec.attr),
+        )
+        registry.add(_spec("Licht", eager=True))
+        self.assertTrue(registry.is_built("Licht"))
+        self.assertEqual(built, ["licht"])
+        self.assertEqual(len(prepared), 1)
+
+    def test_import_failure_is_contained(self):
+        built = []
+        registry = LazyTabRegistry(_FakeTabview(), on_built=lambda spec, tab: built.append(spec))
+        registry.add(_spec("Tado", module="does_not_exist_xyz"))
+        with self.assertLogs("ui.lazy_tabs", level="WARNING"):
+            self.assertIsNone(registry.ensure("Tado"))
+        self.assertEqual(built, [])
+        self.assertFalse(registry.report()[0].ok)
+        # no retry on every selection
+        self.assertIsNone(registry.ensure("Tado"))
+        self.assertEqual(len(registry.report()), 1)
+
+    def test_unknown_name_is_ignored(self):
+        registry = LazyTabRegistry(_FakeTabview())
+        self.assertIsNone(registry.ensure("Dashboard"))
+        self.assertIsNone(registry.ensure(None))
+
+    def test_warm_up_builds_remaining_tabs_one_per_step(self):
+        builds = []
+        root = _FakeRoot()
+        registry = LazyTabRegistry(_FakeTabview())
+        for name in ("A", "B", "C"):
+            registry.add(_spec(name, builds=builds))
+        registry.ensure("B")
+        registry.warm_up(root, delay_ms=1000)
+        self.assertEqual(builds, ["B"])
+        root.scheduled.pop(0)()  # delay -> idle
+        root.scheduled.pop(0)()  # first step
+        self.assertEqual(builds, ["B", "A"])
+        root.run_all()
+        self.assertEqual(builds, ["B", "A", "C"])
+        self.assertEqual([t.trigger for t in registry.report()], ["select", "warmup", "warmup"])
+
+    def test_warm_up_disabled(self):
+        root = _FakeRoot()
+        registry = LazyTabRegistry(_FakeTabview())
+        registry.add(_spec("A"))
+        registry.warm_up(root, delay_ms=0)
+        self.assertEqual(root.scheduled, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Unit tests for core.lod – min/max/avg level-of-detail pyramid."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.lod import LodPyramid
+
+
+class TestLodPyramid(unittest.TestCase):
+    def setUp(self):
+        self.pyr = LodPyramid(["a", "b"], level_seconds=(60, 600), raw_seconds=3600)
+
+    def test_incremental_extend_merges_tail_bucket(self):
+        self.pyr.extend([0, 30], {"a": [1.0, 3.0], "b": [5.0, 5.0]})
+        self.pyr.extend([45, 90], {"a": [8.0, 2.0]})
+        out = self.pyr.query(0, 120, pixels=10, level=1)
+        self.assertEqual(out.bucket_s, 60)
+        self.assertEqual(out.t.tolist(), [30.0, 90.0])
+        self.assertEqual(out.avg["a"].tolist(), [4.0, 2.0])
+        self.assertEqual((out.min["a"][0], out.max["a"][0]), (1.0, 8.0))
+        # "b" missing in the second batch -> only the two first samples count
+        self.assertEqual(out.avg["b"][0], 5.0)
+        self.assertTrue(np.isnan(out.avg["b"][1]))
+
+    def test_known_timestamps_are_skipped(self):
+        self.assertEqual(self.pyr.extend([0, 10], {"a": [1.0, 2.0]}), 2)
+        self.assertEqual(self.pyr.extend([10, 20], {"a": [9.0, 3.0]}), 1)
+        self.assertEqual(self.pyr.raw_count, 3)
+        self.assertEqual(self.pyr.version, 2)
+
+    def test_level_choice_keeps_points_per_frame_bounded(self):
+        t = np.arange(0, 3600, 10, dtype=float)
+        self.pyr.extend(t, {"a": np.sin(t)})
+        self.assertEqual(self.pyr.choose_level(0, 600, pixels=100), 0)
+        self.assertEqual(self.pyr.choose_level(0, 3600, pixels=100), 1)
+        self.assertEqual(self.pyr.choose_level(0, 3600, pixels=5), 2)
+        out = self.pyr.query(0, 3600, pixels=100)
+        self.assertLessEqual(len(out), 100 + 2)
+        self.assertAlmostEqual(float(np.nanmax(out.max["a"])), float(np.sin(t).max()), places=5)
+
+    def test_raw_trimmed_but_levels_kept(self):
+        t = np.arange(0, 3 * 3600, 60, dtype=float)
+        self.pyr.extend(t, {"a": np.ones_like(t)})
+        self.assertLess(self.pyr.raw_count, len(t))
+        # raw no longer covers the start -> aggregated level even for few points
+        self.assertEqual(self.pyr.choose_level(0, 600, pixels=1000), 1)
+        self.assertEqual(len(self.pyr.query(0, 3 * 3600, pixels=1000, level=2)), 18)
+
+    def test_extend_buckets_backfills_levels(self):
+        starts = [0.0, 60.0, 120.0]
+        stats = {"a": (np.array([2.0, 0.0, 9.0]), np.array([2, 0, 3]), np.array([0.5, np.nan, 1.0]), np.array([1.5, np.nan, 5.0]))}
+        self.pyr.extend_buckets(60, starts, stats)
+        self.assertEqual(self.pyr.last_t, 179.0)
+        # raw samples continue after the backfilled buckets
+        self.assertEqual(self.pyr.extend([150, 180], {"a": [7.0, 4.0]}), 1)
+        fine = self.pyr.query(0, 240, pixels=10, level=1)
+        self.assertEqual(fine.avg["a"][0], 1.0)
+        self.assertTrue(np.isnan(fine.avg["a"][1]))
+        coarse = self.pyr.query(0, 600, pixels=10, level=2)
+        self.assertEqual(coarse.avg["a"].tolist(), [15.0 / 6])
+        self.assertEqual((coarse.min["a"][0], coarse.max["a"][0]), (0.5, 5.0))
+
+    def test_bins_from_level_or_raw(self):
+        t = np.arange(0, 1200, 30, dtype=float)
+        self.pyr.extend(t, {"a": np.where(t < 600, 1.0, 3.0)})
+        starts, avg = self.pyr.bins("a", 0, 1200, 600)
+        self.assertEqual((starts.tolist(), avg.tolist()), ([0.0, 600.0], [1.0, 3.0]))
+        starts, avg = self.pyr.bins("a", 300, 900, 300)
+        self.assertEqual((starts.tolist(), avg.tolist()), ([300.0, 600.0], [1.0, 3.0]))
+        self.assertEqual(self.pyr.bins("b", 0, 1200, 600)[0].tolist(), [])
+
+    def test_drop_before(self):
+        t = np.arange(0, 1200, 60, dtype=float)
+        self.pyr.extend(t, {"a": t})
+        self.pyr.drop_before(600)
+        self.assertEqual(self.pyr.first_t, 600.0)
+        self.assertEqual(self.pyr.query(0, 1200, pixels=100, level=2).t.tolist(), [900.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
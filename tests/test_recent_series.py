@@ -0,0 +1,137 @@
+"""Unit tests for core.recent_series – shared sparkline series."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.chart_data import ChartSource, clean_fronius, clean_heating
+from core.recent_series import RecentSeries, get_recent_series, smooth
+from core.schema import PV_POWER_KW
+from core.time_utils import db_timestamp_to_epoch, epoch_to_db_timestamp
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class _Table:
+    def __init__(self):
+        self.rows = []
+        self.calls = []
+
+    def since(self, since, hours):
+        self.calls.append(since)
+        cut = db_timestamp_to_epoch(since) if since else -np.inf
+        return [r for r in self.rows if db_timestamp_to_epoch(r["timestamp"]) > cut]
+
+    def latest(self):
+        return max((r["timestamp"] for r in self.rows), default=None)
+
+
+class TestSmooth(unittest.TestCase):
+    def test_matches_shrinking_window_mean(self):
+        values = [1.0, 2.0, 6.0, 4.0, 5.0, 9.0]
+        expected = []
+        for i in range(len(values)):
+            window = values[max(0, i - 2): i + 3]
+            expected.append(sum(window) / len(window))
+        np.testing.assert_allclose(smooth(values, 5), expected)
+        self.assertEqual(smooth([1.0, 2.0], 5).tolist(), [1.0, 2.0])
+
+
+class TestRecentSeries(unittest.TestCase):
+    def setUp(self):
+        self.now = db_timestamp_to_epoch("2026-03-10 12:00:00")
+        self.clock = _Clock(self.now)
+        self.fronius = _Table()
+        self.heating = _Table()
+        sources = {
+            "fronius": ChartSource(
+                self.fronius.since, ["pv"], clean_fronius, fetch_latest=self.fronius.latest,
+                retention_days=2, refresh_s=30, clock=self.clock,
+            ),
+            "heating": ChartSource(
+                self.heating.since, ["outdoor", "mid"], clean_heating, fetch_latest=self.heating.latest,
+                retention_days=2, refresh_s=30, clock=self.clock,
+            ),
+        }
+        self.service = RecentSeries(sources, clock=self.clock)
+
+    def _pv(self, offset, pv):
+        self.fronius.rows.append({"timestamp": epoch_to_db_timestamp(self.now + offset), "pv": pv})
+
+    def test_shared_result_until_new_data(self):
+        for i in range(8):
+            self._pv(-i * 900, float(i))
+        first = self.service.series("pv", hours=24, bin_minutes=15, smooth_window=1)
+        self.assertEqual([v for _, v in first], [7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0, 0.0])
+        self.assertIs(self.service.series("pv", hours=24, bin_minutes=15, smooth_window=1), first)
+        self.assertEqual((self.service.hits, self.service.misses), (1, 1))
+        # Neues Sample: nur nachgeladen, nicht neu gebinnt
+        self._pv(60, 5.0)
+        self.clock.now += 60
+        updated = self.service.series("pv", hours=24, bin_minutes=15, smooth_window=1)
+        self.assertIsNot(updated, first)
+        self.assertEqual(updated[-1][1], 2.5)
+        self.assertEqual(len(self.fronius.calls), 2)
+
+    def test_stale_data_anchors_window_at_newest_sample(self):
+        for i in range(4):
+            self._pv(-10 * 3600 - i * 900, 2.0)
+        series = self.service.series("pv", hours=2, bin_minutes=15)
+        self.assertEqual(len(series), 4)
+
+    def test_data_older_than_retention_still_shown(self):
+        # 200 Zeilen, 72 h alt: Fenster endet am jüngsten Sample statt jetzt
+        for i in range(200):
+            self._pv(-72 * 3600 - i * 900, 1.0)
+        series = self.service.series("pv", hours=48, bin_minutes=15, smooth_window=1)
+        self.assertEqual(len(series), 192)
+        self.assertEqual(self.fronius.calls[0], epoch_to_db_timestamp(self.now - 72 * 3600 - 48 * 3600))
+
+    def test_pause_keeps_full_window(self):
+        # Erfassung seit 30 h pausiert: trotzdem volle 48 h vor dem letzten Sample
+        for i in range(60 * 4):
+            self._pv(-30 * 3600 - i * 900, 1.0)
+        series = self.service.series("pv", hours=48, bin_minutes=15, smooth_window=1)
+        self.assertEqual(len(series), 192)
+        # Neue Daten: Fenster endet wieder jetzt, die älteren 18 h bleiben erhalten
+        self._pv(0, 3.0)
+        self.clock.now += 60
+        resumed = self.service.series("pv", hours=48, bin_minutes=15, smooth_window=1)
+        self.assertGreaterEqual(len(resumed), 72)
+        self.assertEqual(resumed[-1][1], 3.0)
+
+    def test_odd_bins_and_plausibility(self):
+        for i in range(6):
+            self.heating.rows.append({"timestamp": epoch_to_db_timestamp(self.now - 600 + i * 100), "outdoor": 99.0 if i == 0 else 4.0})
+        series = self.service.series("outdoor", hours=1, bin_minutes=10, smooth_window=1)
+        self.assertEqual([v for _, v in series], [4.0])
+
+    def test_live_fallback_is_throttled(self):
+        self.service.record({PV_POWER_KW: -0.5, "outdoor": 3.0})
+        self.service.record({PV_POWER_KW: 9.0, "outdoor": 9.0})
+        self.clock.now += 61
+        self.service.record({PV_POWER_KW: 2.0, "outdoor": "x"})
+        pv = self.service.live("pv", hours=6, bin_minutes=5, smooth_window=1)
+        self.assertEqual([v for _, v in pv], [1.0])
+        self.assertEqual([v for _, v in self.service.live("outdoor", smooth_window=1)], [3.0])
+
+    def test_one_service_per_store(self):
+        class _Store:
+            pass
+
+        store = _Store()
+        self.assertIs(get_recent_series(store), get_recent_series(store))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Unit tests for core.startup – cached startup probes and phase timeline."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.startup import (
+    ProbeCache, StartupTimeline, find_font, font_fingerprint, fontlist_is_valid,
+)
+
+
+class TestProbeCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "probes.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _counting_probe(self, value):
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return value
+
+        return probe, calls
+
+    def test_probe_runs_once_across_instances(self):
+        probe, calls = self._counting_probe(True)
+        self.assertTrue(ProbeCache(self.path, fingerprint="fp1").get("emoji", probe))
+        self.assertTrue(ProbeCache(self.path, fingerprint="fp1").get("emoji", probe))
+        self.assertEqual(len(calls), 1)
+
+    def test_fingerprint_change_reruns_probes(self):
+        probe, calls = self._counting_probe("DejaVuSans.ttf")
+        ProbeCache(self.path, fingerprint="fp1").get("font", probe)
+        ProbeCache(self.path, fingerprint="fp2").get("font", probe)
+        self.assertEqual(len(calls), 2)
+
+    def test_stamp_change_reruns_probe(self):
+        probe, calls = self._counting_probe(True)
+        cache = ProbeCache(self.path, fingerprint="fp")
+        cache.get("fontlist", probe, stamp=[1, 10])
+        cache.get("fontlist", probe, stamp=[1, 10])
+        cache.get("fontlist", probe, stamp=[2, 10])
+        self.assertEqual(len(calls), 2)
+
+    def test_corrupt_cache_file_is_ignored(self):
+        self.path.write_text("{not json", encoding="utf-8")
+        probe, calls = self._counting_probe(1)
+        with self.assertLogs("core.startup", level="WARNING"):
+            self.assertEqual(ProbeCache(self.path, fingerprint="fp").get("x", probe), 1)
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["probes"]["x"]["value"], 1)
+
+    def test_find_font_caches_first_loadable(self):
+        tried = []
+
+        def loader(name):
+            tried.append(name)
+            if name != "b.ttf":
+                raise OSError(name)
+
+        cache = ProbeCache(self.path, fingerprint="fp")
+        self.assertEqual(find_font(["a.ttf", "b.ttf", "c.ttf"], loader, cache), "b.ttf")
+        self.assertEqual(find_font(["a.ttf", "b.ttf", "c.ttf"], loader, cache), "b.ttf")
+        self.assertEqual(tried, ["a.ttf", "b.ttf"])
+
+
+class TestFontFingerprint(unittest.TestCase):
+    def test_changes_when_font_dir_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            (base / "truetype").mkdir()
+            before = font_fingerprint([base])
+            self.assertEqual(before, font_fingerprint([base]))
+            (base / "truetype" / "noto").mkdir()
+            self.assertNotEqual(before, font_fingerprint([base]))
+
+    def test_missing_dirs_are_skipped(self):
+        self.assertEqual(font_fingerprint([Path("/does/not/exist")]), font_fingerprint([]))
+
+
+class TestFontlistValidation(unittest.TestCase):
+    def test_valid_invalid_and_stale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            font = Path(tmp) / "font.ttf"
+            font.write_bytes(b"")
+            fontlist = Path(tmp) / "fontlist-v390.json"
+
+            fontlist.write_text(json.dumps({"ttflist": [{"fname": str(font)}], "afmlist": []}))
+            self.assertTrue(fontlist_is_valid(fontlist))
+
+            fontlist.write_text(json.dumps({"ttflist": [{"fname": "font.ttf"}]}))
+            self.assertTrue(fontlist_is_valid(fontlist, data_path=tmp))
+
+            fontlist.write_text(json.dumps({"ttflist": [{"fname": os.path.join(tmp, "gone.ttf")}]}))
+            self.assertFalse(fontlist_is_valid(fontlist))
+
+            fontlist.write_text('{"ttflist": [')
+            self.assertFalse(fontlist_is_valid(fontlist))
+
+
+class TestStartupTimeline(unittest.TestCase):
+    def test_marks_and_phases(self):
+        now = [0.0]
+        timeline = StartupTimeline(clock=lambda: now[0])
+        now[0] = 0.25
+        timeline.mark("imports")
+        with timeline.phase("datastore"):
+            now[0] = 0.5
+        now[0] = 0.75
+        timeline.mark("main_app")
+        self.assertEqual(
+            timeline.phases(),
+            [("imports", 250.0), ("datastore", 250.0), ("main_app", 250.0)],
+        )
+        self.assertEqual(timeline.total_ms(), 750.0)
+        with self.assertLogs("core.startup", level="INFO") as logs:
+            timeline.log()
+        self.assertIn("main_app", logs.output[0])
+        timeline.reset()
+        self.assertEqual(timeline.phases(), [])
+
+    def test_real_clock(self):
+        timeline = StartupTimeline()
+        time.sleep(0.001)
+        timeline.mark("x")
+        self.assertGreater(timeline.phases()[0][1], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Unit tests for ui.tab_lifecycle – visibility protocol for tabs."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.tab_lifecycle import TabLifecycle, TabLifecycleManager
+
+
+class _FakeTabview:
+    def __init__(self, selected):
+        self.selected = selected
+        self.command = None
+
+    def get(self):
+        return self.selected
+
+    def configure(self, command=None):
+        self.command = command
+
+    def click(self, name):
+        self.selected = name
+        if self.command:
+            self.command()
+
+
+class _PollingTab(TabLifecycle):
+    def __init__(self):
+        self.refreshes = 0
+
+    def tick(self):
+        if self.defer_while_hidden():
+            return
+        self.refreshes += 1
+
+    def on_catch_up(self):
+        self.tick()
+
+
+class TestTabLifecycle(unittest.TestCase):
+    def test_visible_by_default(self):
+        tab = _PollingTab()
+        self.assertTrue(tab.is_visible())
+        tab.tick()
+        self.assertEqual(tab.refreshes, 1)
+
+    def test_hidden_defers_and_catches_up_once(self):
+        tab = _PollingTab()
+        tab.on_hide()
+        tab.tick()
+        tab.tick()
+        self.assertEqual(tab.refreshes, 0)
+        tab.on_show()
+        self.assertEqual(tab.refreshes, 1)
+        tab.on_hide()
+        tab.on_show()  # nothing missed -> no extra refresh
+        self.assertEqual(tab.refreshes, 1)
+
+
+class TestTabLifecycleManager(unittest.TestCase):
+    def test_selection_drives_show_hide(self):
+        view = _FakeTabview("Energie")
+        history, health = _PollingTab(), _PollingTab()
+        manager = TabLifecycleManager(view)
+        manager.register("Historie", history)
+        manager.register("Health", health)
+        manager.start()
+        self.assertFalse(history.is_visible())
+        self.assertFalse(health.is_visible())
+
+        history.tick()
+        view.click("Historie")
+        self.assertTrue(history.is_visible())
+        self.assertEqual(history.refreshes, 1)
+
+        view.click("Health")
+        self.assertFalse(history.is_visible())
+        self.assertTrue(health.is_visible())
+
+    def test_sync_without_command(self):
+        view = _FakeTabview("Energie")
+        tab = _PollingTab()
+        manager = TabLifecycleManager(view)
+        manager.register("Status", tab)
+        manager.start()
+        view.selected = "Status"  # e.g. tabview.set() does not fire command
+        manager.sync()
+        self.assertTrue(tab.is_visible())
+        self.assertEqual(manager.current, "Status")
+
+    def test_tabs_without_protocol_and_none_ignored(self):
+        view = _FakeTabview("A")
+        manager = TabLifecycleManager(view)
+        manager.register("A", object())
+        manager.register("B", None)
+        manager.start()
+        view.click("B")
+        self.assertEqual(manager.current, "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
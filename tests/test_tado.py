@@ -0,0 +1,109 @@
+"""Unit tests for core.tado – shared connection and the app-level zone collector."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.collectors import CollectorScheduler, subscribe
+from core.datastore import DataStore
+from core.tado import TadoConnection, TadoZoneCollector, parse_zone_state
+
+
+class _FakeTado:
+    """PyTado-Ersatz: Device-Flow bereits abgeschlossen, eine Schlafzimmer-Zone."""
+
+    def __init__(self, token_file_path=None):
+        self.token_file_path = token_file_path
+
+    def device_activation_status(self):
+        return "COMPLETED"
+
+    def get_zones(self):
+        return [{"id": 1, "name": "Wohnen"}, {"id": 2, "name": "Schlafzimmer"}]
+
+    def get_zone_state(self, zone_id):
+        return {
+            "sensorDataPoints": {
+                "insideTemperature": {"celsius": 20.5},
+                "humidity": {"percentage": 51.0},
+            },
+            "setting": {"power": "ON", "temperature": {"celsius": 21.0}},
+            "activityDataPoints": {"heatingPower": {"percentage": 40}},
+            "overlay": None,
+        }
+
+
+class TestTadoConnection(unittest.TestCase):
+    def _connected(self):
+        conn = TadoConnection(tado_cls=_FakeTado, impl="pytado")
+        self.assertFalse(conn.ensure_connected())
+        conn._login_thread.join(timeout=2.0)
+        self.assertTrue(conn.ensure_connected())
+        return conn
+
+    def test_login_picks_bedroom_zone(self):
+        conn = self._connected()
+        seen = []
+        conn.subscribe_status(seen.append)
+        self.assertEqual(conn.zone_id, 2)
+        self.assertEqual(seen[-1]["status"], "Verbunden")
+        self.assertEqual(seen[-1]["zone"], "Schlafzimmer")
+
+    def test_missing_library_is_reported(self):
+        conn = TadoConnection()
+        with mock.patch("core.tado._load_tado_class", return_value=(None, None)):
+            conn.ensure_connected()
+            conn._login_thread.join(timeout=2.0)
+        self.assertEqual(conn.status()["status"], "python-tado nicht installiert")
+        self.assertFalse(conn.ensure_connected())
+
+    def test_parse_zone_state(self):
+        record = parse_zone_state(_FakeTado().get_zone_state(2))
+        self.assertEqual(record["temperature_c"], 20.5)
+        self.assertEqual(record["humidity_pct"], 51.0)
+        self.assertEqual(record["target_c"], 21.0)
+        self.assertEqual(record["heating_power_pct"], 40)
+        self.assertTrue(record["power_on"])
+        self.assertFalse(record["manual"])
+
+
+class TestTadoZoneCollector(unittest.TestCase):
+    def setUp(self):
+        self._tmpfile = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        self._tmpfile.close()
+        self.store = DataStore(db_path=self._tmpfile.name)
+
+    def tearDown(self):
+        self.store.close()
+        try:
+            os.unlink(self._tmpfile.name)
+        except Exception:
+            pass
+
+    def test_collects_without_tab(self):
+        conn = TadoConnection(tado_cls=_FakeTado, impl="pytado")
+        collector = TadoZoneCollector(conn)
+        scheduler = CollectorScheduler(store_getter=lambda: self.store)
+        received = []
+        unsubscribe = subscribe(collector.name, received.append)
+        try:
+            # Erster Zyklus stößt nur den Login an
+            self.assertIsNone(scheduler.run_once(collector))
+            conn._login_thread.join(timeout=2.0)
+            record = scheduler.run_once(collector)
+        finally:
+            unsubscribe()
+            scheduler.stop(timeout=1.0)
+        self.assertEqual(record["temperature_c"], 20.5)
+        self.assertEqual(received, [record])
+        rows = self.store.conn.execute("SELECT COUNT(*) FROM samples WHERE source = 'tado'").fetchone()[0]
+        self.assertEqual(rows, len(collector.schema))
+
+
+if __name__ == "__main__":
+    unittest.main()
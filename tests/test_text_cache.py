@@ -0,0 +1,110 @@
+"""Unit tests for ui.text_cache – shared fonts and cached text sprites."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui import text_cache
+from ui.text_cache import DEFAULT_FONT, FONT_CANDIDATES, FontRegistry, TextCache, TextSprite
+
+
+class _Registry(FontRegistry):
+    def __init__(self, available=("DejaVuSans.ttf", "DejaVuSans-Bold.ttf")):
+        self.loaded = []
+
+        def loader(name, size):
+            if name not in available:
+                raise OSError(name)
+            self.loaded.append((name, size))
+            return ("font", name, size)
+
+        def finder(names, probe):
+            for name in names:
+                try:
+                    probe(name)
+                    return name
+                except Exception:
+                    continue
+            return None
+
+        super().__init__(loader=loader, fallback=lambda: ("default",), finder=finder)
+
+
+class _Image:
+    def __init__(self):
+        self.pasted = []
+
+    def paste(self, image, pos, mask):
+        self.pasted.append((image, pos))
+
+
+class TestFontRegistry(unittest.TestCase):
+    def test_font_loaded_once_per_size(self):
+        fonts = _Registry()
+        first = fonts.get(24, bold=True)
+        self.assertEqual(first, ("font", "DejaVuSans-Bold.ttf", 24))
+        self.assertIs(fonts.get(24, bold=True), first)
+        fonts.get(10)
+        self.assertEqual(fonts.loads, 2)
+
+    def test_fallback_to_default_font(self):
+        fonts = _Registry(available=())
+        self.assertEqual(fonts.get(9, candidates=("segoeui.ttf",)), ("default",))
+        self.assertEqual(fonts.get(12, candidates=DEFAULT_FONT), ("default",))
+
+    def test_spec_uses_default_candidates(self):
+        self.assertEqual(FontRegistry.spec(12.0), (FONT_CANDIDATES[False], 12))
+        self.assertEqual(FontRegistry.spec(9, candidates=["a.ttf"]), (("a.ttf",), 9))
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        self.fonts = _Registry()
+        self.cache = TextCache(self.fonts, maxsize=2)
+
+    def test_get_builds_once_and_evicts_lru(self):
+        builds = []
+
+        def build(name):
+            builds.append(name)
+            return name
+
+        self.assertEqual(self.cache.get("a", lambda: build("a")), "a")
+        self.cache.get("b", lambda: build("b"))
+        self.cache.get("a", lambda: build("a"))
+        self.cache.get("c", lambda: build("c"))
+        self.cache.get("b", lambda: build("b"))
+        self.assertEqual(builds, ["a", "b", "c", "b"])
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+
+    def test_text_key_covers_font_color_anchor_outline(self):
+        rendered = []
+
+        def fake_render(font, text, color, anchor, outline, outline_width):
+            rendered.append((font, text, color, anchor, outline))
+            return TextSprite(object(), (1, 1), (10, 5))
+
+        cache = TextCache(self.fonts, maxsize=16)
+        with mock.patch.object(text_cache, "render_text", fake_render):
+            first = cache.text("65%", "#fff", size=26, outline="#000")
+            self.assertIs(cache.text("65%", "#fff", size=26, outline="#000"), first)
+            cache.text("65%", "#f00", size=26, outline="#000")
+            cache.text("65%", "#fff", size=26)
+            cache.text("65%", "#fff", size=26, bold=True, outline="#000")
+            cache.text("65%", "#fff", size=26, anchor="mm", outline="#000")
+        self.assertEqual(len(rendered), 5)
+        self.assertEqual(rendered[0][0], ("font", "DejaVuSans.ttf", 26))
+
+    def test_sprite_paste_aligns_origin(self):
+        img = _Image()
+        sprite = TextSprite("sprite", (3, 12), (20, 10))
+        sprite.paste_into(img, 100.4, 50.0)
+        self.assertEqual(img.pasted, [("sprite", (97, 38))])
+
+
+if __name__ == "__main__":
+    unittest.main()
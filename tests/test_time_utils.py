@@ -1,13 +1,42 @@
 """Unit tests for core.time_utils – timezone utilities."""
 
+import os
 import sys
+import time
 import unittest
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from core.time_utils import utc_now, ensure_utc, guard_alive
+from core.time_utils import (
+    db_timestamp_to_epoch,
+    ensure_utc,
+    epoch_to_db_timestamp,
+    guard_alive,
+    local_utc_offset,
+    normalize_db_timestamp,
+    sample_tick,
+    to_utc_datetime,
+    utc_now,
+)
+
+
+@contextmanager
+def _local_tz(name):
+    """Prozess-Zeitzone für die Dauer des Blocks umstellen."""
+    old = os.environ.get("TZ")
+    os.environ["TZ"] = name
+    time.tzset()
+    try:
+        yield
+    finally:
+        if old is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = old
+        time.tzset()
 
 
 class TestUtcNow(unittest.TestCase):
@@ -59,6 +88,51 @@ class TestEnsureUtc(unittest.TestCase):
         self.assertEqual(result.hour, 12)
 
 
+class TestSampleClock(unittest.TestCase):
+    """Tests for the shared sample clock and canonical timestamps."""
+
+    def test_tick_floors_to_interval(self):
+        self.assertEqual(sample_tick(10, now=1700000004.9), 1700000000)
+        self.assertEqual(sample_tick(10, now=1700000009.9), 1700000000)
+        self.assertEqual(sample_tick(10, now=1700000010.0), 1700000010)
+        self.assertEqual(sample_tick(60, now=1700000069.0), 1700000040)
+
+    def test_sources_share_ticks(self):
+        # Two sources polled a few hundred ms apart land on the same tick
+        self.assertEqual(sample_tick(10, now=1700000000.2), sample_tick(10, now=1700000001.4))
+
+    def test_epoch_roundtrip(self):
+        ts = epoch_to_db_timestamp(1700000000)
+        self.assertEqual(ts, "2023-11-14 22:13:20")
+        self.assertEqual(db_timestamp_to_epoch(ts), 1700000000.0)
+
+    def test_normalize_aware_and_epoch(self):
+        self.assertEqual(normalize_db_timestamp("2025-06-15T14:30:00+02:00"), "2025-06-15 12:30:00")
+        self.assertEqual(normalize_db_timestamp("2025-06-15T12:30:00Z"), "2025-06-15 12:30:00")
+        self.assertEqual(normalize_db_timestamp(1700000000), "2023-11-14 22:13:20")
+        self.assertEqual(normalize_db_timestamp("2025-06-15 12:30:00"), "2025-06-15 12:30:00")
+
+    def test_normalize_invalid(self):
+        self.assertIsNone(normalize_db_timestamp(None))
+        self.assertIsNone(normalize_db_timestamp("not-a-date"))
+
+
+    def test_to_utc_datetime_ignores_local_zone(self):
+        expected = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
+        with _local_tz("Europe/Vienna"):
+            self.assertEqual(to_utc_datetime("2025-06-15 12:00:00"), expected)
+            self.assertEqual(to_utc_datetime("2025-06-15T14:00:00+02:00"), expected)
+            self.assertEqual(to_utc_datetime(expected.timestamp()), expected)
+        self.assertIsNone(to_utc_datetime("kaputt"))
+
+    def test_local_offset_follows_dst(self):
+        # Umstellung Europa 2025-03-30 01:00 UTC
+        switch = datetime(2025, 3, 30, 1, 0, tzinfo=timezone.utc).timestamp()
+        with _local_tz("Europe/Vienna"):
+            self.assertEqual(local_utc_offset(switch - 60), 3600.0)
+            self.assertEqual(local_utc_offset(switch), 7200.0)
+
+
 class TestGuardAlive(unittest.TestCase):
     """Tests for the guard_alive method decorator."""
 
@@ -45,6 +45,11 @@ class TestParseTimestamp(unittest.TestCase):
         result = parse_timestamp(dt)
         self.assertGreater(result, 0)
 
+    def test_naive_string_is_utc(self):
+        expected = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc).timestamp()
+        self.assertEqual(parse_timestamp("2024-01-15 10:30:00"), expected)
+        self.assertEqual(parse_timestamp(datetime(2024, 1, 15, 10, 30)), expected)
+
     def test_none_returns_zero(self):
         self.assertEqual(parse_timestamp(None), 0.0)
 
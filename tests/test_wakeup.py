@@ -0,0 +1,116 @@
+"""Unit tests for ui.wakeup – event-driven Tk queue draining (without a display)."""
+
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ui.wakeup import UiWakeup, WakeupQueue, drain_queue, start_callback_pump
+
+
+class _FakeTk:
+    def __init__(self):
+        self.handlers = {}
+
+    def createfilehandler(self, fd, mask, handler):
+        self.handlers[fd] = handler
+
+    def deletefilehandler(self, fd):
+        self.handlers.pop(fd, None)
+
+
+class _FakeRoot:
+    """Minimal stand-in for tk.Tk: records binds/after and generated events."""
+
+    def __init__(self, with_filehandler=True):
+        self.tk = _FakeTk() if with_filehandler else object()
+        self.bindings = {}
+        self.generated = []
+        self.after_calls = []
+
+    def bind(self, sequence, func, add=None):
+        self.bindings.setdefault(sequence, []).append(func)
+
+    def after(self, ms, func):
+        self.after_calls.append((ms, func))
+        return f"after#{len(self.after_calls)}"
+
+    def after_cancel(self, _id):
+        pass
+
+    def event_generate(self, sequence, when=None):
+        self.generated.append(sequence)
+
+    def pump_files(self):
+        for fd, handler in list(self.tk.handlers.items()):
+            handler(fd, 0)
+
+
+@unittest.skipIf(os.name == "nt", "pipe wakeup is POSIX-only")
+class TestPipeWakeup(unittest.TestCase):
+    def setUp(self):
+        self.root = _FakeRoot()
+        self.q = WakeupQueue()
+        self.seen = []
+        self.wakeup = UiWakeup(self.root, lambda: drain_queue(self.q, self.seen.append))
+        self.q.bind(self.wakeup)
+
+    def tearDown(self):
+        self.wakeup.close()
+
+    def test_put_from_thread_wakes_and_drains(self):
+        self.assertTrue(self.wakeup.uses_pipe)
+        self.assertEqual(self.root.after_calls, [])  # no idle polling
+        t = threading.Thread(target=lambda: [self.q.put(i) for i in range(3)])
+        t.start()
+        t.join()
+        self.root.pump_files()
+        self.assertEqual(self.seen, [0, 1, 2])
+
+    def test_signals_coalesce_until_drain(self):
+        self.q.put("a")
+        self.q.put("b")
+        self.assertEqual(os.read(self.wakeup._rfd, 16), b"\0")
+        self.wakeup._run()
+        self.q.put("c")
+        self.root.pump_files()
+        self.assertEqual(self.seen, ["a", "b", "c"])
+
+    def test_close_releases_pipe(self):
+        self.wakeup.close()
+        self.assertFalse(self.wakeup.uses_pipe)
+        self.assertEqual(self.root.tk.handlers, {})
+        self.q.put("ignored")  # must not raise
+
+
+class TestEventFallback(unittest.TestCase):
+    def test_event_generate_and_callback_pump(self):
+        root = _FakeRoot(with_filehandler=False)
+        q = WakeupQueue()
+        wakeup = start_callback_pump(root, q)
+        calls = []
+        q.put(lambda: calls.append(1))
+        q.put(lambda: calls.append(2))
+        self.assertEqual(len(root.generated), 1)
+        for handler in root.bindings[root.generated[0]]:
+            handler(None)
+        self.assertEqual(calls, [1, 2])
+        # Safety poll registered for the non-pipe path
+        self.assertEqual(len(root.after_calls), 1)
+        wakeup.close()
+
+    def test_failing_callback_does_not_stop_drain(self):
+        q = WakeupQueue()
+        calls = []
+        q.put(lambda: 1 / 0)
+        q.put(lambda: calls.append("ok"))
+        with self.assertLogs("ui.wakeup", level="ERROR"):
+            self.assertEqual(drain_queue(q, lambda cb: cb()), 2)
+        self.assertEqual(calls, ["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Unit tests for core.watchdog – Tk main-loop stall detection."""
+
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.health import get_stall_snapshot, record_stall
+from core.watchdog import StallWatchdog, start_tk_heartbeat
+
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _blocking_call(entered, release):
+    entered.set()
+    release.wait(5.0)
+
+
+class TestStallWatchdog(unittest.TestCase):
+    def setUp(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.worker = threading.Thread(target=_blocking_call, args=(self.entered, self.release), daemon=True)
+        self.worker.start()
+        self.entered.wait(1.0)
+        self.clock = _Clock()
+        self.dog = StallWatchdog(
+            thread_id=self.worker.ident, threshold_s=1.0, clock=self.clock, source_root=_TESTS_DIR,
+        )
+
+    def tearDown(self):
+        self.release.set()
+        self.worker.join(1.0)
+
+    def test_not_armed_before_first_beat(self):
+        self.clock.now += 60
+        self.assertIsNone(self.dog.check())
+
+    def test_stall_detected_with_site_and_recorded_once_finished(self):
+        self.dog.beat()
+        self.clock.now += 0.5
+        self.assertIsNone(self.dog.check())
+
+        self.clock.now += 1.0
+        with self.assertLogs("core.watchdog", level="WARNING") as logs:
+            site = self.dog.check()
+        self.assertTrue(site.startswith("test_watchdog.py:"), site)
+        self.assertTrue(site.endswith("_blocking_call"), site)
+        self.assertIn("_blocking_call", logs.output[0])
+        # still blocked: reported only once
+        self.clock.now += 2.0
+        self.assertIsNone(self.dog.check())
+
+        self.dog.beat()
+        with self.assertLogs("core.watchdog", level="WARNING"):
+            self.dog.check()
+        stats = get_stall_snapshot()[site]
+        self.assertGreaterEqual(stats.count, 1)
+        self.assertAlmostEqual(stats.max_ms, 3500.0)
+
+    def test_regular_beats_no_stall(self):
+        for _ in range(10):
+            self.dog.beat()
+            self.clock.now += 0.25
+            self.assertIsNone(self.dog.check())
+
+    def test_start_stop_thread(self):
+        dog = StallWatchdog(thread_id=self.worker.ident, threshold_s=10.0, poll_s=0.01)
+        dog.start()
+        dog.beat()
+        dog.stop()
+
+
+class TestHeartbeatAndStats(unittest.TestCase):
+    def test_heartbeat_reschedules_via_after(self):
+        calls = []
+
+        class _Root:
+            def after(self, ms, cb):
+                calls.append((ms, cb))
+
+        dog = StallWatchdog(threshold_s=1.0)
+        start_tk_heartbeat(_Root(), dog, interval_ms=200)
+        self.assertIsNone(dog._last_beat)  # first beat only once the loop runs
+        ms, tick = calls.pop()
+        tick()
+        self.assertIsNotNone(dog._last_beat)
+        self.assertEqual(calls[0][0], 200)
+
+    def test_record_stall_aggregates(self):
+        record_stall("tabs/x.py:1 f", 1200.0)
+        record_stall("tabs/x.py:1 f", 800.0)
+        stats = get_stall_snapshot()["tabs/x.py:1 f"]
+        self.assertEqual((stats.count, stats.total_ms, stats.max_ms), (2, 2000.0, 1200.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
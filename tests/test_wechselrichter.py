@@ -0,0 +1,98 @@
+"""Unit tests for core.Wechselrichter – parsing and high-frequency aggregation."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core import Wechselrichter
+from core.collectors import PENDING
+from core.datastore import DataStore
+
+
+def _raw(pv_w, grid_w=0.0, akku_w=0.0, load_w=-500.0, soc=50.0):
+    return {
+        "Body": {
+            "Data": {
+                "Site": {"P_PV": pv_w, "P_Grid": grid_w, "P_Akku": akku_w, "P_Load": load_w},
+                "Inverters": {"1": {"SOC": soc}},
+            }
+        }
+    }
+
+
+class TestParse(unittest.TestCase):
+    def test_units_and_null_pv(self):
+        rec = Wechselrichter.parse(_raw(None, grid_w=1200.0), "2025-06-15 12:00:00")
+        self.assertEqual(rec["PV-Leistung (kW)"], 0.0)
+        self.assertAlmostEqual(rec["Netz-Leistung (kW)"], 1.2)
+        self.assertEqual(rec["Zeitstempel"], "2025-06-15 12:00:00")
+
+
+class TestFroniusAggregator(unittest.TestCase):
+    def test_bucket_avg_min_max(self):
+        agg = Wechselrichter.FroniusAggregator(bucket_s=10)
+        for i, pv in enumerate((1.0, 3.0, 2.0)):
+            self.assertIsNone(agg.add({"PV-Leistung (kW)": pv, "Batterieladestand (%)": 50 + i}, epoch=1000.0 + i))
+        done = agg.add({"PV-Leistung (kW)": 9.0}, epoch=1010.0)
+        self.assertEqual(done["samples"], 3)
+        self.assertAlmostEqual(done["PV-Leistung (kW)"], 2.0)
+        self.assertEqual((done["pv_min"], done["pv_max"]), (1.0, 3.0))
+        self.assertEqual((done["soc_min"], done["soc_max"]), (50.0, 52.0))
+        flushed = agg.flush()
+        self.assertEqual(flushed["samples"], 1)
+        self.assertIsNone(agg.flush())
+
+    def test_missing_values_not_counted(self):
+        agg = Wechselrichter.FroniusAggregator(bucket_s=10)
+        agg.add({"PV-Leistung (kW)": 2.0, "Batterieladestand (%)": 60.0}, epoch=1000.0)
+        agg.add({"PV-Leistung (kW)": 4.0, "Batterieladestand (%)": None}, epoch=1001.0)
+        agg.add({"PV-Leistung (kW)": float("nan"), "Batterieladestand (%)": 62.0}, epoch=1002.0)
+        done = agg.flush()
+        self.assertEqual(done["samples"], 3)
+        self.assertAlmostEqual(done["PV-Leistung (kW)"], 3.0)
+        self.assertAlmostEqual(done["Batterieladestand (%)"], 61.0)
+        self.assertEqual((done["soc_min"], done["soc_max"]), (60.0, 62.0))
+        self.assertIsNone(done["Netz-Leistung (kW)"])
+        self.assertIsNone(done["grid_min"])
+
+    def test_collector_pending_until_bucket_closes(self):
+        collector = Wechselrichter.FroniusCollector(sample_interval_s=1, bucket_s=10)
+        self.assertEqual(collector.interval_s, 1)
+        self.assertIs(collector.parse(_raw(1000.0)), PENDING)
+        # Beim Stoppen wird der angefangene Bucket noch geliefert
+        self.assertAlmostEqual(collector.on_stop()["PV-Leistung (kW)"], 1.0)
+        self.assertIsNone(collector.on_stop())
+        self.assertIsNone(Wechselrichter.FroniusCollector(sample_interval_s=10, bucket_s=10)._aggregator)
+
+
+class TestEnvelopeStorage(unittest.TestCase):
+    def setUp(self):
+        self._tmpfile = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        self._tmpfile.close()
+        self.store = DataStore(db_path=self._tmpfile.name)
+
+    def tearDown(self):
+        self.store.close()
+        try:
+            os.unlink(self._tmpfile.name)
+        except Exception:
+            pass
+
+    def test_envelope_roundtrip(self):
+        from datetime import datetime, timezone
+        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self.store.insert_fronius_record({
+            "Zeitstempel": ts, "PV-Leistung (kW)": 2.0, "pv_min": 1.0, "pv_max": 3.0, "samples": 10,
+        })
+        row = self.store.get_fronius_envelope(hours=1)[-1]
+        self.assertEqual((row["pv"], row["pv_min"], row["pv_max"], row["samples"]), (2.0, 1.0, 3.0, 10))
+        self.assertIsNone(row["grid"])
+        self.assertAlmostEqual(self.store.get_last_fronius_record()["pv_power_kw"], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
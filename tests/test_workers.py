@@ -0,0 +1,134 @@
+"""Unit tests for core.workers – shared bounded worker pool with lanes."""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.workers import LANE_IO, LANE_UI, WorkerPool
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool({LANE_UI: 1, LANE_IO: 2}, idle_timeout_s=0.2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_runs_tasks_and_counts(self):
+        done = []
+        for i in range(5):
+            self.pool.submit(lambda i=i: done.append(i), lane=LANE_IO)
+        self.assertTrue(_wait_until(lambda: len(done) == 5))
+        stats = self.pool.stats()[LANE_IO]
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_IO].completed == 5))
+        self.assertEqual(stats.submitted, 5)
+        self.assertLessEqual(stats.workers, 2)
+
+    def test_lane_concurrency_limit(self):
+        gate = threading.Event()
+        active = []
+        peak = []
+
+        def task():
+            active.append(1)
+            peak.append(len(active))
+            gate.wait(2.0)
+            active.pop()
+
+        for _ in range(5):
+            self.pool.submit(task, lane=LANE_IO)
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_IO].running == 2))
+        self.assertEqual(self.pool.stats()[LANE_IO].queued, 3)
+        gate.set()
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_IO].completed == 5))
+        self.assertEqual(max(peak), 2)
+
+    def test_busy_io_lane_does_not_block_ui_lane(self):
+        gate = threading.Event()
+        for _ in range(4):
+            self.pool.submit(lambda: gate.wait(2.0), lane=LANE_IO)
+        ran = threading.Event()
+        self.pool.submit(ran.set, lane=LANE_UI)
+        self.assertTrue(ran.wait(1.0))
+        gate.set()
+
+    def test_same_key_supersedes_queued_and_never_overlaps(self):
+        gate = threading.Event()
+        values = []
+        running = []
+
+        def set_brightness(pct):
+            def task():
+                running.append(pct)
+                self.assertEqual(len(running), 1)
+                if pct == 0:
+                    gate.wait(2.0)
+                values.append(pct)
+                running.pop()
+            return task
+
+        first = self.pool.submit(set_brightness(0), lane=LANE_IO, key="dimmer")
+        self.assertTrue(_wait_until(lambda: first.state == "running"))
+        handles = [self.pool.submit(set_brightness(p), lane=LANE_IO, key="dimmer") for p in (10, 20, 30)]
+        # second IO worker must not start a task with the running key
+        time.sleep(0.05)
+        self.assertEqual(values, [])
+        gate.set()
+        self.assertTrue(_wait_until(lambda: handles[-1].done))
+        self.assertEqual(values, [0, 30])
+        self.assertTrue(handles[0].cancelled and handles[1].cancelled)
+        self.assertEqual(self.pool.stats()[LANE_IO].superseded, 2)
+
+    def test_cancel_queued_task(self):
+        gate = threading.Event()
+        self.pool.submit(lambda: gate.wait(2.0), lane=LANE_UI)
+        ran = []
+        handle = self.pool.submit(lambda: ran.append(1), lane=LANE_UI)
+        self.assertTrue(self.pool.cancel(handle))
+        self.assertFalse(self.pool.cancel(handle))
+        gate.set()
+        time.sleep(0.05)
+        self.assertEqual(ran, [])
+        self.assertEqual(self.pool.stats()[LANE_UI].cancelled, 1)
+
+    def test_failure_is_logged_and_counted(self):
+        def boom():
+            raise RuntimeError("x")
+
+        with self.assertLogs("core.workers", level="ERROR"):
+            handle = self.pool.submit(boom, lane=LANE_UI)
+            self.assertTrue(_wait_until(lambda: handle.state == "failed"))
+        self.assertEqual(self.pool.stats()[LANE_UI].failed, 1)
+
+    def test_idle_workers_exit(self):
+        self.pool.submit(lambda: None, lane=LANE_IO)
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_IO].completed == 1))
+        self.assertTrue(_wait_until(lambda: self.pool.stats()[LANE_IO].workers == 0, timeout=2.0))
+        # pool stays usable after workers exited
+        ran = threading.Event()
+        self.pool.submit(ran.set, lane=LANE_IO)
+        self.assertTrue(ran.wait(1.0))
+
+    def test_unknown_lane_and_closed_pool(self):
+        with self.assertRaises(ValueError):
+            self.pool.submit(lambda: None, lane="nope")
+        self.pool.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.pool.submit(lambda: None, lane=LANE_UI)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,405 @@
+"""Lokaler Geräte-Simulator für Fronius und BMK plus HTTP-Recorder.
+
+Ersetzt die echten Geräte im LAN durch einen lokalen HTTP-Server, der
+synthetische oder aufgezeichnete Antworten liefert – mit einstellbarer
+Latenz, Fehler- und Timeout-Rate. Damit lassen sich Ingest-Lasttests,
+Pipeline-Benchmarks und Ausfälle offline reproduzieren.
+
+Befehle:
+    serve   Simulator starten (synthetisch oder --replay <datei.jsonl>)
+    record  Echte Geräteantworten als JSONL aufzeichnen
+    bench   Collector-Pipeline gegen den Simulator in eine Temp-DB laufen lassen
+
+Beispiele:
+    python tools/device_simulator.py serve --port 8089 --speed 100 --error-rate 0.05
+    FRONIUS_URL=http://127.0.0.1:8089/solar_api/v1/GetPowerFlowRealtimeData.fcgi \\
+    BMK_URL=http://127.0.0.1:8089/daqdata.cgi python src/main.py
+
+    python tools/device_simulator.py record --out data/recordings/devices.jsonl --interval 10
+    python tools/device_simulator.py serve --replay data/recordings/devices.jsonl
+    python tools/device_simulator.py bench --cycles 500 --speed 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+FRONIUS_PATH = "/solar_api/v1/GetPowerFlowRealtimeData.fcgi"
+BMK_PATH = "/daqdata.cgi"
+SOURCE_BY_PATH = {FRONIUS_PATH: "pv", BMK_PATH: "heating"}
+PATH_BY_SOURCE = {source: path for path, source in SOURCE_BY_PATH.items()}
+
+BMK_CHANNEL_COUNT = 73
+
+
+@dataclass
+class SimulatorConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_s: float = 30.0
+    speed: float = 1.0
+    seed: Optional[int] = None
+    replay_path: Optional[str] = None
+
+
+class SyntheticDevices:
+    """Plausible Tagesverläufe für PV, Last, Batterie und Heizung.
+
+    Die simulierte Uhr läuft ``speed``-mal schneller als die Wanduhr, so dass
+    z.B. bei speed=100 ein Tag in rund 15 Minuten durchlaufen wird.
+    """
+
+    def __init__(self, speed: float = 1.0, seed: Optional[int] = None, start: Optional[float] = None):
+        self.speed = max(0.0, float(speed))
+        self._rng = random.Random(seed)
+        self._real_start = time.monotonic()
+        self._sim_start = time.time() if start is None else float(start)
+        self._lock = threading.Lock()
+        self._soc = 55.0
+        self._last_sim: Optional[float] = None
+        self._betriebsstunden = 12000.0
+
+    def sim_time(self) -> float:
+        return self._sim_start + (time.monotonic() - self._real_start) * self.speed
+
+    @staticmethod
+    def _hour_of_day(sim_t: float) -> float:
+        lt = time.localtime(sim_t)
+        return lt.tm_hour + lt.tm_min / 60.0 + lt.tm_sec / 3600.0
+
+    def fronius_payload(self) -> dict:
+        with self._lock:
+            sim_t = self.sim_time()
+            hour = self._hour_of_day(sim_t)
+            daylight = math.sin(math.pi * (hour - 6.0) / 14.0) if 6.0 < hour < 20.0 else 0.0
+            pv_w = max(0.0, 9000.0 * daylight * self._rng.uniform(0.75, 1.0)) if daylight > 0 else None
+            load_w = 400.0 + 600.0 * self._rng.random() + (1500.0 if 17.0 < hour < 21.0 else 0.0)
+            surplus = (pv_w or 0.0) - load_w
+            if surplus > 0 and self._soc < 100.0:
+                akku_w = -min(surplus, 5000.0)  # negativ = Laden
+            elif surplus < 0 and self._soc > 5.0:
+                akku_w = min(-surplus, 5000.0)  # positiv = Entladen
+            else:
+                akku_w = 0.0
+            dt_h = 0.0 if self._last_sim is None else max(0.0, sim_t - self._last_sim) / 3600.0
+            self._last_sim = sim_t
+            self._soc = min(100.0, max(0.0, self._soc - akku_w * dt_h / 100.0))  # 10 kWh Akku
+            grid_w = load_w - (pv_w or 0.0) - akku_w
+            return {
+                "Body": {
+                    "Data": {
+                        "Site": {
+                            "Mode": "bidirectional",
+                            "P_PV": None if pv_w is None else round(pv_w, 1),
+                            "P_Grid": round(grid_w, 1),
+                            "P_Akku": round(akku_w, 1),
+                            "P_Load": round(-load_w, 1),
+                        },
+                        "Inverters": {"1": {"DT": 1, "P": round(pv_w or 0.0, 1), "SOC": round(self._soc, 1)}},
+                    }
+                },
+                "Head": {
+                    "Status": {"Code": 0, "Reason": "", "UserMessage": ""},
+                    "Timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(sim_t)),
+                },
+            }
+
+    def bmk_payload(self) -> str:
+        with self._lock:
+            sim_t = self.sim_time()
+            hour = self._hour_of_day(sim_t)
+            firing = 5.0 <= hour < 8.0 or 16.0 <= hour < 19.0
+            noise = self._rng.uniform(-0.3, 0.3)
+            values = [0.0] * BMK_CHANNEL_COUNT
+            values[0] = 2.0 if firing else 1.0                            # Betriebsmodus
+            values[1] = (78.0 if firing else 45.0) + noise                 # Kessel
+            values[2] = 4.0 + 6.0 * math.sin(math.pi * (hour - 9.0) / 12.0) + noise  # Außen
+            values[4] = (72.0 if firing else 62.0) + noise                 # Puffer oben
+            values[5] = (60.0 if firing else 52.0) + noise                 # Puffer Mitte
+            values[6] = (45.0 if firing else 40.0) + noise                 # Puffer unten
+            values[8] = (62.0 if firing else 40.0) + noise                 # Kesselrücklauf
+            values[9] = (165.0 if firing else 35.0) + 5 * noise            # Rauchgas
+            values[12] = 52.0 + noise                                      # Warmwasser
+            values[18] = values[22] = 1.0 if 6.0 <= hour < 22.0 else 0.0   # Heizkreispumpen
+            values[33] = values[43] = 1.0 if firing else 0.0               # Kesselpumpe, Brenner
+            if firing:
+                self._betriebsstunden += 1.0 / 360.0
+            values[52] = float(int(sim_t) % 65536)                         # Tick_Counter
+            values[53] = round(self._betriebsstunden, 1)                   # Betriebsstunden
+            return "\r\n".join(f"{v:.1f}" if v % 1 else f"{int(v)}" for v in values) + "\r\n"
+
+
+class ReplaySource:
+    """Liefert aufgezeichnete Antworten pro Quelle zyklisch aus."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._entries: Dict[str, List[dict]] = {}
+        self._pos: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self._entries.setdefault(entry.get("source", ""), []).append(entry)
+
+    def next(self, source: str) -> Optional[dict]:
+        with self._lock:
+            entries = self._entries.get(source)
+            if not entries:
+                return None
+            idx = self._pos.get(source, 0)
+            self._pos[source] = (idx + 1) % len(entries)
+            return entries[idx]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "DeviceSimulator"
+
+    def log_message(self, fmt, *args):  # noqa: D401 - ruhig bleiben
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        source = SOURCE_BY_PATH.get(path)
+        if source is None:
+            self._send(404, "text/plain", b"not found")
+            return
+        sim = self.server
+        sim.requests[source] = sim.requests.get(source, 0) + 1
+        cfg = sim.config
+        roll = sim.rng.random()
+        if roll < cfg.timeout_rate:
+            # Verbindung halten, bis der Client aufgibt
+            time.sleep(cfg.timeout_s)
+            return
+        delay_ms = cfg.latency_ms + (sim.rng.uniform(-cfg.jitter_ms, cfg.jitter_ms) if cfg.jitter_ms else 0.0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+        if roll < cfg.timeout_rate + cfg.error_rate:
+            self._send(500, "text/plain", b"simulated device error")
+            return
+
+        if sim.replay is not None:
+            entry = sim.replay.next(source)
+            if entry is None:
+                self._send(404, "text/plain", b"no recording for source")
+                return
+            body = str(entry.get("body", "")).encode("utf-8")
+            self._send(int(entry.get("status", 200)), entry.get("content_type") or "text/plain", body)
+        elif source == "pv":
+            self._send(200, "application/json", json.dumps(sim.synthetic.fronius_payload()).encode("utf-8"))
+        else:
+            self._send(200, "text/plain", sim.synthetic.bmk_payload().encode("utf-8"))
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class DeviceSimulator(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: SimulatorConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.synthetic = SyntheticDevices(speed=config.speed, seed=config.seed)
+        self.replay = ReplaySource(config.replay_path) if config.replay_path else None
+        self.requests: Dict[str, int] = {}
+
+    def url_for(self, source: str) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{PATH_BY_SOURCE[source]}"
+
+
+def start_simulator(host: str = "127.0.0.1", port: int = 0,
+                    config: Optional[SimulatorConfig] = None) -> tuple[DeviceSimulator, threading.Thread]:
+    """Simulator im Hintergrund-Thread starten (port=0 = freier Port)."""
+    server = DeviceSimulator((host, port), config or SimulatorConfig())
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05},
+                              name="DeviceSimulator", daemon=True)
+    thread.start()
+    return server, thread
+
+
+def record(out_path: str, urls: Dict[str, str], interval_s: float, count: int, timeout_s: float = 5.0) -> int:
+    """Echte Geräteantworten als JSONL anhängen. count<=0 = endlos."""
+    import requests
+
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    session = requests.Session()
+    written = 0
+    rounds = 0
+    with out.open("a", encoding="utf-8") as f:
+        while count <= 0 or rounds < count:
+            for source, url in urls.items():
+                start = time.perf_counter()
+                entry = {"ts": time.time(), "source": source, "url": url}
+                try:
+                    resp = session.get(url, timeout=timeout_s)
+                    entry.update(
+                        status=resp.status_code,
+                        content_type=resp.headers.get("Content-Type", ""),
+                        body=resp.text,
+                    )
+                except Exception as exc:
+                    entry.update(status=0, error=f"{type(exc).__name__}: {exc}", body="")
+                entry["elapsed_ms"] = round((time.perf_counter() - start) * 1000.0, 1)
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                written += 1
+            rounds += 1
+            if count <= 0 or rounds < count:
+                time.sleep(interval_s)
+    return written
+
+
+def bench(cycles: int, config: SimulatorConfig) -> dict:
+    """Collector-Pipeline (fetch -> parse -> persist) gegen den Simulator messen."""
+    sys.path.insert(0, str(SRC_DIR))
+    from core import BMKDATEN, Wechselrichter
+    from core.collectors import CollectorScheduler
+    from core.datastore import DataStore
+
+    server, _ = start_simulator(config=config)
+    Wechselrichter.FRONIUS_URL = server.url_for("pv")
+    BMKDATEN.BMK_URL = server.url_for("heating")
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    tmp.close()
+    store = DataStore(db_path=tmp.name)
+    scheduler = CollectorScheduler(store_getter=lambda: store)
+    collectors = [Wechselrichter.FroniusCollector(), BMKDATEN.BmkCollector()]
+    ok = 0
+    start = time.perf_counter()
+    try:
+        for _ in range(cycles):
+            for collector in collectors:
+                if scheduler.run_once(collector) is not None:
+                    ok += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        scheduler.stop(timeout=0.5)
+        store.close()
+        server.shutdown()
+        server.server_close()
+        os.unlink(tmp.name)
+    total = cycles * len(collectors)
+    return {
+        "samples": total,
+        "ok": ok,
+        "elapsed_s": round(elapsed, 3),
+        "samples_per_s": round(total / elapsed, 1) if elapsed > 0 else None,
+        "ms_per_sample": round(elapsed * 1000.0 / total, 3) if total else None,
+    }
+
+
+def _config_from_args(args: argparse.Namespace) -> SimulatorConfig:
+    return SimulatorConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_s=args.timeout_s,
+        speed=args.speed,
+        seed=args.seed,
+        replay_path=args.replay,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    def _sim_options(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--latency-ms", type=float, default=0.0)
+        p.add_argument("--jitter-ms", type=float, default=0.0)
+        p.add_argument("--error-rate", type=float, default=0.0, help="Anteil HTTP-500-Antworten (0..1)")
+        p.add_argument("--timeout-rate", type=float, default=0.0, help="Anteil hängender Anfragen (0..1)")
+        p.add_argument("--timeout-s", type=float, default=30.0, help="Haltedauer simulierter Timeouts")
+        p.add_argument("--speed", type=float, default=1.0, help="Zeitraffer der synthetischen Uhr")
+        p.add_argument("--seed", type=int, default=None)
+        p.add_argument("--replay", default=None, help="JSONL-Aufzeichnung statt synthetischer Daten")
+
+    p_serve = sub.add_parser("serve", help="Simulator starten")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8089)
+    _sim_options(p_serve)
+
+    p_record = sub.add_parser("record", help="Echte Antworten aufzeichnen")
+    p_record.add_argument("--out", required=True)
+    p_record.add_argument("--interval", type=float, default=10.0)
+    p_record.add_argument("--count", type=int, default=0, help="Anzahl Runden (0 = endlos)")
+    p_record.add_argument("--fronius-url", default=None)
+    p_record.add_argument("--bmk-url", default=None)
+
+    p_bench = sub.add_parser("bench", help="Ingest-Pipeline gegen Simulator messen")
+    p_bench.add_argument("--cycles", type=int, default=200)
+    _sim_options(p_bench)
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        server, thread = start_simulator(args.host, args.port, _config_from_args(args))
+        print(f"[SIM] Fronius: {server.url_for('pv')}")
+        print(f"[SIM] BMK:     {server.url_for('heating')}")
+        try:
+            thread.join()
+        except KeyboardInterrupt:
+            server.shutdown()
+        return 0
+
+    if args.cmd == "record":
+        sys.path.insert(0, str(SRC_DIR))
+        if args.fronius_url and args.bmk_url:
+            urls = {"pv": args.fronius_url, "heating": args.bmk_url}
+        else:
+            from core import BMKDATEN, Wechselrichter
+            urls = {
+                "pv": args.fronius_url or Wechselrichter.FRONIUS_URL,
+                "heating": args.bmk_url or BMKDATEN.BMK_URL,
+            }
+        try:
+            n = record(args.out, urls, args.interval, args.count)
+        except KeyboardInterrupt:
+            return 0
+        print(f"[REC] {n} Antworten nach {args.out} geschrieben")
+        return 0
+
+    if args.cmd == "bench":
+        result = bench(args.cycles, _config_from_args(args))
+        print(json.dumps(result, indent=2))
+        return 0
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())